@@ -825,11 +825,15 @@ MODULE_TAGS = {
     # Source+: as-built for Tony's review.
     'add_docstrings.py':                        ('devtool', 'dev_tools'),
     'apsidal_markers.py':                       ('computation', 'orrery'),
+    'ast_index.py':                             ('devtool', 'dev_tools'),
     'asteroid_belt_visualization_shells.py':    ('rendering/shells', 'orrery'),   # HEUR/MAP
+    'benchmark_suite.py':                       ('devtool', 'dev_tools'),
     'catalog_selection.py':                     ('computation', 'stars'),   # MAP/NEW
     'celestial_coordinates.py':                 ('computation', 'orrery'),
     'celestial_objects.py':                     ('data', 'orrery'),
     'climate_cache_manager.py':                 ('cache', 'earth_science'),
+    'climate_datasets.py':                      ('cache', 'earth_science'),
+    'climate_refresh.py':                       ('cache', 'earth_science'),
     'close_approach_data.py':                   ('data', 'orrery'),
     'comet_visualization_shells.py':            ('rendering/shells', 'orrery'),   # HEUR/MAP
     'constants_new.py':                         ('data', 'orrery'),
@@ -846,9 +850,11 @@ MODULE_TAGS = {
     'earth_system_common.py':                   ('utility', 'earth_science'),   # NEW/NEW
     'earth_system_controller.py':               ('gui', 'earth_science'),   # MAP/NEW
     'earth_system_generator.py':                ('devtool', 'earth_science'),   # CHANGED (was computation)
+    'earth_system_grid.py':                     ('computation', 'earth_science'),
     'earth_system_visualization_gui.py':        ('gui', 'earth_science'),   # MAP/NEW
     'earth_visualization_shells.py':            ('rendering/shells', 'earth_science'),   # HEUR/MAP
     'energy_imbalance.py':                      ('computation', 'earth_science'),
+    'era5_daily.py':                            ('cache', 'earth_science'),
     'eris_visualization_shells.py':             ('rendering/shells', 'orrery'),   # HEUR/MAP
     'examine_hot_csv.py':                       ('devtool', 'dev_tools'),
     'exoplanet_coordinates.py':                 ('data', 'stars'),
@@ -869,7 +875,9 @@ MODULE_TAGS = {
     'ledger_index.py':                          ('devtool', 'dev_tools'),   # NEW/MAP
     'mars_visualization_shells.py':             ('rendering/shells', 'orrery'),   # HEUR/MAP
     'measure_animation_html.py':                ('devtool', 'dev_tools'),   # NEW/NEW
+    'measure_html_writer.py':                   ('devtool', 'dev_tools'),
     'measure_perframe_elements.py':             ('devtool', 'dev_tools'),   # NEW/MAP
+    'measure_vot_sidecar.py':                   ('devtool', 'dev_tools'),
     'mercury_visualization_shells.py':          ('rendering/shells', 'orrery'),   # HEUR/MAP
     'messier_catalog.py':                       ('data', 'stars'),
     'messier_object_data_handler.py':           ('pipeline', 'stars'),
@@ -878,10 +886,13 @@ MODULE_TAGS = {
     'neptune_visualization_shells.py':          ('rendering/shells', 'orrery'),   # HEUR/MAP
     'object_type_analyzer.py':                  ('computation', 'orrery'),
     'orbit_data_manager.py':                    ('cache', 'orrery'),
+    'orbit_sampling.py':                        ('computation', 'orrery'),
+    'orbit_transforms.py':                      ('computation', 'orrery'),
     'orbital_elements.py':                      ('computation', 'orrery'),
     'orbital_param_viz.py':                     ('gui', 'orrery'),   # MAP/NEW
     'orrery_rendering.py':                      ('rendering', 'orrery'),   # NEW/NEW
     'osculating_cache_manager.py':              ('cache', 'orrery'),
+    'osculating_prefetch.py':                   ('cache', 'orrery'),
     'paleoclimate_dual_scale.py':               ('rendering', 'earth_science'),
     'paleoclimate_human_origins_full.py':       ('rendering', 'earth_science'),
     'paleoclimate_visualization.py':            ('rendering', 'earth_science'),
@@ -897,8 +908,11 @@ MODULE_TAGS = {
     'planetarium_distance.py':                  ('rendering', 'stars'),
     'plot_data_exchange.py':                    ('pipeline', 'utilities'),
     'plot_data_report_widget.py':               ('rendering', 'utilities'),
+    'plot_jobs.py':                             ('utility', 'orrery'),
+    'plot_profiler.py':                         ('utility', 'orrery'),
     'pluto_visualization_shells.py':            ('rendering/shells', 'orrery'),   # HEUR/MAP
     'provenance_scanner.py':                    ('devtool', 'dev_tools'),
+    'render_lod.py':                            ('utility', 'orrery'),
     'report_manager.py':                        ('utility', 'utilities'),
     'saturn_visualization_shells.py':           ('rendering/shells', 'orrery'),   # HEUR/MAP
     'save_utils.py':                            ('pipeline', 'utilities'),
@@ -922,13 +936,36 @@ MODULE_TAGS = {
     'spacecraft_encounters.py':                 ('data', 'orrery'),
     'star_notes.py':                            ('data', 'stars'),
     'star_properties.py':                       ('data', 'stars'),
+    'star_properties_store.py':                 ('cache', 'stars'),
     'star_sphere_builder.py':                   ('rendering', 'stars'),
     'star_visualization_gui.py':                ('gui', 'stars'),   # MAP/NEW
     'stellar_data_patches.py':                  ('data', 'stars'),
     'stellar_parameters.py':                    ('data', 'stars'),
+    'test_ast_index.py':                        ('devtool', 'dev_tools'),
+    'test_benchmark_suite.py':                  ('devtool', 'dev_tools'),
+    'test_camera_waypoints.py':                 ('devtool', 'dev_tools'),
+    'test_climate_datasets.py':                 ('devtool', 'dev_tools'),
+    'test_climate_refresh.py':                  ('devtool', 'dev_tools'),
+    'test_close_approach_bulk.py':              ('devtool', 'dev_tools'),
     'test_constants_provenance.py':             ('devtool', 'dev_tools'),
+    'test_earth_system_grid.py':                ('devtool', 'dev_tools'),
+    'test_era5_daily.py':                       ('devtool', 'dev_tools'),
+    'test_export_binary_positions.py':          ('devtool', 'dev_tools'),
+    'test_maintenance_schedule.py':             ('devtool', 'dev_tools'),
     'test_orbit_cache.py':                      ('devtool', 'dev_tools'),
+    'test_orbit_sampling.py':                   ('devtool', 'dev_tools'),
+    'test_orbit_transforms.py':                 ('devtool', 'dev_tools'),
+    'test_osculating_prefetch.py':              ('devtool', 'dev_tools'),
+    'test_osculating_store.py':                 ('devtool', 'dev_tools'),
+    'test_plot_jobs.py':                        ('devtool', 'dev_tools'),
+    'test_plot_profiler.py':                    ('devtool', 'dev_tools'),
+    'test_render_lod.py':                       ('devtool', 'dev_tools'),
     'test_reset_completeness.py':               ('devtool', 'dev_tools'),   # NEW/MAP
+    'test_star_properties_store.py':            ('devtool', 'dev_tools'),
+    'test_star_sphere_tiles.py':                ('devtool', 'dev_tools'),
+    'test_vizier_bands.py':                     ('devtool', 'dev_tools'),
+    'test_vot_sidecar.py':                      ('devtool', 'dev_tools'),
+    'test_worksheet_incremental.py':            ('devtool', 'dev_tools'),
     'uranus_visualization_shells.py':           ('rendering/shells', 'orrery'),   # HEUR/MAP
     'venus_visualization_shells.py':            ('rendering/shells', 'orrery'),   # HEUR/MAP
     'verify_orbit_cache.py':                    ('devtool', 'dev_tools'),
@@ -936,7 +973,9 @@ MODULE_TAGS = {
     'visualization_3d.py':                      ('rendering', 'stars'),
     'visualization_core.py':                    ('rendering', 'stars'),
     'visualization_utils.py':                   ('rendering', 'stars'),
+    'vizier_bands.py':                          ('cache', 'stars'),
     'vot_cache_manager.py':                     ('cache', 'stars'),   # MAP/NEW
+    'vot_sidecar.py':                           ('cache', 'stars'),
 
     # ---------- gallery repo (22 modules) ----------
     # Roles classified this session; domains from design Section 11.
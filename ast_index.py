@@ -0,0 +1,299 @@
+"""
+ast_index.py - Shared parse index for the dev tools that read every module.
+
+provenance_scanner.scan_project() used to parse each module five or six
+times per run: once in the atlas dependency graph, once for the name
+import map, once for its Role: tag, once for unit extraction, once for the
+shadow-constant walk and once more for the coverage-gap check. dep_trace
+and module_atlas did the same on their own. Every one of those parses read
+the same bytes.
+
+This module parses each file at most once per process and keeps, per
+file, the facts the tools derive from it, keyed by the file's content
+hash and persisted in data/ast_index.pkl:
+
+    - the index's own module facts (docstring, imports, from-import
+      names, non-blank line count), read by all three tools
+    - facts a tool computes through fact(), such as the scanner's
+      extracted units; those are also keyed by a hash of the computing
+      module's source and of the project modules it imports, so editing
+      the analysis discards what the old analysis produced
+
+A re-run with nothing edited parses nothing. After an edit only that file
+is re-read; the cross-file results (dependency graph, import map, shadow
+constants, duplicate detection) are rebuilt from the per-file facts,
+which is cheap.
+
+Parsed trees themselves are never persisted: unpickling a tree costs more
+than parsing the source again.
+
+Key functions:
+    open_index() - the index for a project directory (one per process)
+    source() - a file's bytes, lines and parsed tree, parsed once
+    module_facts() - docstring / imports / line count for a file
+    fact() - memoize any per-file computation in the index
+
+Consumed by: provenance_scanner.py, module_atlas.py, dep_trace.py,
+    worksheet_checker.py
+
+Role: devtool
+Domain: dev_tools
+
+Module created: October 2026
+"""
+
+import ast
+import hashlib
+import inspect
+import io
+import os
+import pickle
+import sys
+
+INDEX_PATH = os.path.join('data', 'ast_index.pkl')
+INDEX_VERSION = 1
+
+_INDEXES = {}           # absolute project root -> ASTIndex
+_CODE_VERSIONS = {}     # module name -> hash of its source and local imports
+
+
+class SourceFile:
+    """One file's bytes, with its lines and tree derived on first use."""
+
+    __slots__ = ('path', 'stat', 'source', 'digest', '_lines', '_tree',
+                 '_error', '_nodes')
+
+    def __init__(self, path, stat):
+        self.path = path
+        self.stat = stat
+        with open(path, 'rb') as handle:
+            self.source = handle.read()
+        self.digest = hashlib.md5(self.source).hexdigest()
+        self._lines = None
+        self._tree = None
+        self._error = None
+        self._nodes = None
+
+    @property
+    def lines(self):
+        """Lines as open(path, 'r', errors='replace').readlines() gives them."""
+        if self._lines is None:
+            self._lines = io.TextIOWrapper(
+                io.BytesIO(self.source), encoding='utf-8',
+                errors='replace').readlines()
+        return self._lines
+
+    @property
+    def tree(self):
+        """The parsed module. A parse error is raised again on every access."""
+        if self._tree is None and self._error is None:
+            try:
+                self._tree = ast.parse(self.source)
+            except Exception as exc:
+                self._error = exc
+        if self._error is not None:
+            raise self._error
+        return self._tree
+
+    @property
+    def nodes(self):
+        """Every node in ast.walk() order, walked once."""
+        if self._nodes is None:
+            self._nodes = list(ast.walk(self.tree))
+        return self._nodes
+
+
+class ASTIndex:
+    """Per-file facts for one project directory, keyed by content hash.
+
+    A root of None is the in-memory index for files outside every opened
+    project: parsed once per process, never written.
+    """
+
+    def __init__(self, root=None):
+        self.root = root
+        self._sources = {}
+        self._files = {}
+        self._dirty = False
+        if root is not None:
+            self._files = self._load()
+
+    def _load(self):
+        try:
+            with open(os.path.join(self.root, INDEX_PATH), 'rb') as handle:
+                stored = pickle.load(handle)
+        except Exception:
+            return {}
+        if (not isinstance(stored, dict)
+                or stored.get('version') != INDEX_VERSION
+                or stored.get('python') != sys.version):
+            return {}
+        return stored.get('files', {})
+
+    def _key(self, path):
+        if self.root is None:
+            return path
+        return os.path.relpath(path, self.root).replace(os.sep, '/')
+
+    def source(self, path):
+        """SourceFile for path, read again only when its mtime or size moves."""
+        path = os.path.abspath(path)
+        status = os.stat(path)
+        stat = (status.st_mtime_ns, status.st_size)
+        found = self._sources.get(path)
+        if found is None or found.stat != stat:
+            found = self._sources[path] = SourceFile(path, stat)
+        return found
+
+    def fact(self, path, name, compute, version='', refresh=False):
+        """compute(SourceFile) for path, or its stored result.
+
+        The stored result is reused while the file's content hash and
+        `version` both match, unless `refresh` asks for a new one.
+        Callers must not mutate what they get back.
+        """
+        src = self.source(path)
+        key = self._key(src.path)
+        entry = self._files.get(key)
+        if entry is None or entry['digest'] != src.digest:
+            entry = self._files[key] = {'digest': src.digest, 'facts': {}}
+        stored = entry['facts'].get(name)
+        if stored is not None and stored[0] == version and not refresh:
+            return stored[1]
+        value = compute(src)
+        entry['facts'][name] = (version, value)
+        self._dirty = True
+        return value
+
+    def save(self):
+        """Write the index if anything changed; drop files that are gone."""
+        if self.root is None:
+            return False
+        for key in [k for k in self._files
+                    if not os.path.exists(os.path.join(self.root, k))]:
+            del self._files[key]
+            self._dirty = True
+        if not self._dirty:
+            return False
+        path = os.path.join(self.root, INDEX_PATH)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + '.tmp', 'wb') as handle:
+            pickle.dump({'version': INDEX_VERSION, 'python': sys.version,
+                         'files': self._files}, handle,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(path + '.tmp', path)
+        self._dirty = False
+        return True
+
+
+def open_index(project_dir):
+    """The index for project_dir, loaded from disk on first use."""
+    root = os.path.abspath(project_dir)
+    index = _INDEXES.get(root)
+    if index is None:
+        index = _INDEXES[root] = ASTIndex(root)
+    return index
+
+
+def _index_for(path):
+    """The opened index whose project holds path, else the in-memory one."""
+    path = os.path.abspath(path)
+    best = None
+    for root, index in _INDEXES.items():
+        if root is not None and path.startswith(root + os.sep):
+            if best is None or len(root) > len(best.root):
+                best = index
+    if best is None:
+        best = _INDEXES.get(None)
+        if best is None:
+            best = _INDEXES[None] = ASTIndex()
+    return best
+
+
+def source(path):
+    """SourceFile for path from whichever index covers it."""
+    return _index_for(path).source(path)
+
+
+def code_version(module_name):
+    """Hash of a module's source and of the project modules it imports.
+
+    Imports are followed transitively: the worksheet checker's results
+    move when worksheet_keys or its alias store is edited, although the
+    checker imports neither of those directly. Stored facts computed by
+    a module are only as good as the code that computed them, so this is
+    their version.
+    """
+    found = _CODE_VERSIONS.get(module_name)
+    if found is not None:
+        return found
+    digest = hashlib.md5()
+    module = sys.modules.get(module_name)
+    path = getattr(module, '__file__', None)
+    if path:
+        directory = os.path.dirname(os.path.abspath(path))
+        paths = [os.path.abspath(path), os.path.abspath(__file__)]
+        cursor = 0
+        while cursor < len(paths):
+            for name in sorted(module_facts(paths[cursor])['imports']):
+                local = os.path.join(directory, name.split('.')[0] + '.py')
+                if local not in paths and os.path.exists(local):
+                    paths.append(local)
+            cursor += 1
+        for each in paths:
+            digest.update(source(each).digest.encode('ascii'))
+    found = _CODE_VERSIONS[module_name] = digest.hexdigest()
+    return found
+
+
+def fact(path, name, compute, refresh=False):
+    """Memoized compute(SourceFile) for path, versioned by compute's module."""
+    return _index_for(path).fact(path, name, compute,
+                                 code_version(compute.__module__), refresh)
+
+
+def _module_facts(src):
+    lines = src.lines
+    facts = {
+        'parsed': False,
+        'docstring': None,
+        'imports': [],
+        'from_imports': [],
+        'nonblank_lines': sum(1 for line in lines if line.strip()),
+    }
+    try:
+        tree = src.tree
+    except Exception:
+        return facts
+    imports = set()
+    from_imports = []
+    for node in src.nodes:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                imports.add(alias.name)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            imports.add(node.module)
+            from_imports.extend((node.module, alias.name)
+                                for alias in node.names)
+    facts.update(parsed=True,
+                 docstring=ast.get_docstring(tree, clean=False),
+                 imports=sorted(imports),
+                 from_imports=from_imports)
+    return facts
+
+
+def module_facts(path):
+    """{'parsed', 'docstring', 'imports', 'from_imports', 'nonblank_lines'}.
+
+    'docstring' is raw (ast.get_docstring(clean=False)); pass it through
+    docstring() for the cleaned form. 'imports' holds every module named
+    by an import or a from-import, dotted names intact; 'from_imports'
+    is (module, name) per from-imported name, in source walk order.
+    """
+    return _index_for(path).fact(path, 'module_facts', _module_facts,
+                                 source(__file__).digest)
+
+
+def docstring(raw):
+    """The cleaned docstring, as ast.get_docstring(clean=True) returns it."""
+    return inspect.cleandoc(raw) if raw is not None else None
@@ -0,0 +1,679 @@
+"""
+benchmark_suite.py - Offline timing benchmarks for the orrery hot paths.
+
+The correctness tests (test_orbit_cache.py, verify_orbit_cache.py) and the
+payload tools (measure_animation_html.py, measure_perframe_elements.py)
+say whether a change is right and how big its output is, not whether it
+made a hot path slower. This suite times the stages a plot goes through:
+
+    cache       orbit cache load / save (orbit_data_manager)
+    trajectory  cached trajectories -> plotting arrays -> figure traces
+    orbits      idealized-orbit generation (planets, the Jupiter, Saturn and
+                Uranus moon systems, a hyperbolic conic, clipped osculating
+                arcs for a crowd of interstellar objects and sungrazers)
+    shells      Earth and Jupiter shell building
+    animation   per-frame primitives for a 29-frame animation
+    html        streamed HTML write of an animation figure
+    stars       VOT sidecar read, star-property store, magnitude tiles
+
+Every benchmark runs against fixtures, never the network: socket connects
+are refused for the whole run. The fixtures are written deterministically
+to a temporary directory in the shape of the recorded responses the caches
+hold -- a Horizons vector cache (orbit_paths.json), a VizieR Hipparcos
+VOTable and a SIMBAD star-properties PKL. --fixtures DIR uses (and fills
+in) a persistent directory instead; copy real caches there under the same
+names to benchmark on recorded data.
+
+Results are JSON (commit, date, platform, per-benchmark best and median
+seconds). --save writes them to reports/benchmarks/; --compare checks a
+run against an earlier one and exits 1 when any benchmark's median grew
+by more than the threshold ratio (and by more than NOISE_FLOOR_S).
+
+Usage:
+    python benchmark_suite.py --list
+    python benchmark_suite.py --save
+    python benchmark_suite.py --only cache stars --repeat 7
+    python benchmark_suite.py --compare latest --threshold 1.25
+
+Key functions:
+    benchmark() - decorator registering a benchmark's setup function
+    run() - time the selected benchmarks, return the results dict
+    compare() - per-benchmark ratios against a baseline results dict
+    save_results() / load_results() - results JSON under reports/benchmarks/
+
+Consumed by: developers checking performance changes across commits
+
+Role: devtool
+Domain: dev_tools
+
+Module created: October 2026
+"""
+
+import argparse
+import contextlib
+import datetime as dt
+import glob
+import io
+import json
+import os
+import pickle
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+
+import numpy as np
+
+RESULTS_VERSION = 1
+FIXTURE_VERSION = 1
+RESULTS_DIR = os.path.join('reports', 'benchmarks')
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 1.25     # median may grow 25% before it counts as a regression
+NOISE_FLOOR_S = 0.002        # ... and by at least this much in absolute terms
+
+ORBIT_FILE = 'orbit_paths.json'
+VOT_FILE = 'hipparcos_data_distance.vot'
+PROPERTIES_FILE = 'star_properties_distance.pkl'
+
+PLANETS = ['Mercury', 'Venus', 'Earth', 'Mars', 'Jupiter', 'Saturn', 'Uranus', 'Neptune']
+
+
+# ============================================================
+# Registry
+# ============================================================
+
+@dataclass
+class Benchmark:
+    """A named stage: setup(fixtures) returns the zero-argument call to time."""
+    name: str
+    group: str
+    setup: Callable
+    description: str = ''
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(group):
+    """Register setup as benchmark '<group>/<function name without bench_>'."""
+    def register(setup):
+        name = f"{group}/{setup.__name__.replace('bench_', '', 1)}"
+        doc = (setup.__doc__ or '').strip().split('\n')[0]
+        BENCHMARKS[name] = Benchmark(name, group, setup, doc)
+        return setup
+    return register
+
+
+def select(patterns=None) -> List[Benchmark]:
+    """Benchmarks whose name or group matches any pattern (all when None)."""
+    if not patterns:
+        return list(BENCHMARKS.values())
+    chosen = [b for b in BENCHMARKS.values()
+              if any(p in (b.group, b.name) for p in patterns)]
+    unknown = [p for p in patterns
+               if not any(p in (b.group, b.name) for b in BENCHMARKS.values())]
+    if unknown:
+        raise ValueError(f"unknown benchmark(s): {', '.join(unknown)}")
+    return chosen
+
+
+# ============================================================
+# Fixtures
+# ============================================================
+
+class Fixtures:
+    """
+    Recorded-shaped input files in one directory, written on first use.
+
+    A file already present under the expected name (a copied real cache)
+    is used as-is; generated files are tagged with FIXTURE_VERSION in
+    fixtures.json and rewritten when the version changes.
+    """
+
+    def __init__(self, directory, orbits=24, days=366, stars=20000):
+        self.directory = directory
+        self.orbits = orbits
+        self.days = days
+        self.stars = stars
+        self._manifest_path = os.path.join(directory, 'fixtures.json')
+        os.makedirs(directory, exist_ok=True)
+        try:
+            with open(self._manifest_path) as f:
+                self._manifest = json.load(f)
+        except (OSError, ValueError):
+            self._manifest = {}
+        if self._manifest.get('version') != FIXTURE_VERSION:
+            self._manifest = {'version': FIXTURE_VERSION, 'generated': {}}
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def scratch(self, name):
+        """A per-run output path inside the fixture directory."""
+        directory = self.path('scratch')
+        os.makedirs(directory, exist_ok=True)
+        return os.path.join(directory, name)
+
+    def _ensure(self, name, writer, params):
+        path = self.path(name)
+        recorded = os.path.exists(path) and name not in self._manifest['generated']
+        if recorded or self._manifest['generated'].get(name) == params:
+            return path
+        writer(path)
+        self._manifest['generated'][name] = params
+        with open(self._manifest_path, 'w') as f:
+            json.dump(self._manifest, f, indent=2)
+        return path
+
+    def orbit_paths(self):
+        """Horizons vector cache: {'<body>_Sun': {'data_points', 'metadata'}}."""
+        return self._ensure(ORBIT_FILE, self._write_orbit_paths,
+                            {'orbits': self.orbits, 'days': self.days})
+
+    def hipparcos_vot(self):
+        """VizieR I/239 Hipparcos VOTable, Distance_ly column added."""
+        return self._ensure(VOT_FILE, self._write_vot, {'stars': self.stars})
+
+    def star_properties(self):
+        """SIMBAD star-properties PKL in the legacy column-list layout."""
+        return self._ensure(PROPERTIES_FILE, self._write_properties, {'stars': self.stars})
+
+    def _write_orbit_paths(self, path):
+        rng = np.random.default_rng(0)
+        start = dt.date(2026, 1, 1)
+        dates = [(start + dt.timedelta(days=d)).isoformat() for d in range(self.days)]
+        cache = {}
+        for k in range(self.orbits):
+            body = PLANETS[k] if k < len(PLANETS) else f"Body {k}"
+            a = 0.4 + 1.6 * k + rng.uniform(0, 0.5)
+            period = 365.25 * a ** 1.5
+            phase = rng.uniform(0, 2 * np.pi)
+            inc = np.radians(rng.uniform(0, 7))
+            theta = phase + 2 * np.pi * np.arange(self.days) / period
+            x, y = a * np.cos(theta), a * np.sin(theta) * np.cos(inc)
+            z = a * np.sin(theta) * np.sin(inc)
+            speed = 2 * np.pi * a / period
+            cache[f"{body}_Sun"] = {
+                'data_points': {
+                    date: {'x': float(x[i]), 'y': float(y[i]), 'z': float(z[i]),
+                           'vx': float(-speed * np.sin(theta[i])),
+                           'vy': float(speed * np.cos(theta[i]) * np.cos(inc)),
+                           'vz': float(speed * np.cos(theta[i]) * np.sin(inc))}
+                    for i, date in enumerate(dates)},
+                'metadata': {'start_date': dates[0], 'end_date': dates[-1],
+                             'center_body': 'Sun', 'last_updated': '2026-10-01',
+                             'interval': '1d'},
+            }
+        with open(path, 'w') as f:
+            json.dump(cache, f)
+
+    def _write_vot(self, path):
+        from measure_vot_sidecar import build_table
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            build_table(self.stars).write(path, format='votable', overwrite=True)
+
+    def _write_properties(self, path):
+        n = self.stars
+        uids = [f"HIP {i}" for i in range(1, n + 1)]
+        data = {
+            'unique_ids': uids,
+            'star_names': [f"* star {i}" if i % 7 else None for i in range(1, n + 1)],
+            'spectral_types': [('G2V', 'K1III', 'M0V', 'A0V')[i % 4] for i in range(n)],
+            'V_magnitudes': [round(6 + (i % 50) / 10, 2) if i % 5 else None for i in range(n)],
+            'B_magnitudes': [round(6.5 + (i % 50) / 10, 2) for i in range(n)],
+            'object_types': ['*'] * n,
+            'is_messier': [False] * n,
+            'distance_ly': [float(i) for i in range(1, n + 1)],
+            'notes': [''] * n,
+        }
+        with open(path, 'wb') as f:
+            pickle.dump(data, f)
+
+    def tile_stars(self):
+        """build_star_data-shaped list, brightest first."""
+        rng = np.random.default_rng(1)
+        n = self.stars
+        z = rng.uniform(-1, 1, n)
+        lon = rng.uniform(0, 2 * np.pi, n)
+        r = np.sqrt(1 - z ** 2)
+        vmag = np.round(rng.uniform(-1.5, 8.0, n), 2)
+        stars = [[float(r[i] * np.cos(lon[i])), float(r[i] * np.sin(lon[i])), float(z[i]),
+                  float(vmag[i]), f"HIP {i}"] for i in range(n)]
+        stars.sort(key=lambda s: s[3])
+        return stars
+
+
+# ============================================================
+# Benchmarks
+# ============================================================
+
+def _orbit_cache(fixtures):
+    with open(fixtures.orbit_paths()) as f:
+        return json.load(f)
+
+
+def _orbit_objects(cache):
+    return [{'name': key.rsplit('_', 1)[0], 'id': key, 'object_type': 'orbital'}
+            for key in cache]
+
+
+@benchmark('cache')
+def bench_orbit_load(fixtures):
+    """Load and validate the orbit cache."""
+    import orbit_data_manager as odm
+    path = fixtures.orbit_paths()
+    return lambda: odm.load_orbit_paths(path)
+
+
+@benchmark('cache')
+def bench_orbit_save(fixtures):
+    """Save the orbit cache (temp write, verify, backup rotation)."""
+    import orbit_data_manager as odm
+    data = _orbit_cache(fixtures)
+    path = fixtures.scratch(ORBIT_FILE)
+    return lambda: odm.save_orbit_paths(data, path)
+
+
+@benchmark('trajectory')
+def bench_plotting_arrays(fixtures):
+    """Cached data points -> per-body x/y/z/date arrays."""
+    import orbit_data_manager as odm
+    cache = _orbit_cache(fixtures)
+    objects = _orbit_objects(cache)
+
+    def call():
+        odm.orbit_paths_over_time = cache
+        return odm.get_orbit_data_for_plotting(objects, 'Sun')
+    return call
+
+
+@benchmark('trajectory')
+def bench_orbit_traces(fixtures):
+    """Cached trajectories drawn as figure traces."""
+    import plotly.graph_objects as go
+    import orbit_data_manager as odm
+    cache = _orbit_cache(fixtures)
+    objects = _orbit_objects(cache)
+
+    def call():
+        odm.orbit_paths_over_time = cache
+        return odm.plot_orbit_paths(go.Figure(), objects, 'Sun', color_map=lambda name: 'white')
+    return call
+
+
+@benchmark('orbits')
+def bench_idealized_planets(fixtures):
+    """Keplerian orbits of the eight planets around the Sun."""
+    import plotly.graph_objects as go
+    from orbital_elements import parent_planets, planetary_params
+    import idealized_orbits
+    objects = [{'name': name, 'id': name, 'object_type': 'orbital'} for name in PLANETS]
+    return lambda: idealized_orbits.plot_idealized_orbits(
+        go.Figure(), PLANETS, center_id='Sun', objects=objects,
+        planetary_params=planetary_params, parent_planets=parent_planets,
+        color_map=lambda name: 'white', date=dt.datetime(2026, 1, 1), days_to_plot=365)
+
+
+@benchmark('orbits')
+def bench_satellite_systems(fixtures):
+    """Idealized orbits of every Jupiter, Saturn and Uranus moon in one figure."""
+    import plotly.graph_objects as go
+    from orbital_elements import parent_planets, planetary_params
+    import idealized_orbits
+    moons = [(moon, planet) for planet in ('Jupiter', 'Saturn', 'Uranus')
+             for moon in parent_planets[planet] if moon in planetary_params]
+
+    def call():
+        fig = go.Figure()
+        for moon, planet in moons:
+            idealized_orbits.plot_satellite_orbit(
+                moon, planetary_params, planet, 'white', fig,
+                date=dt.datetime(2026, 1, 1))
+        return fig
+    return call
+
+
+@benchmark('orbits')
+def bench_hyperbolic_conic(fixtures):
+    """Hyperbolic trajectory points (an interstellar-object conic)."""
+    import idealized_orbits
+    return lambda: idealized_orbits.generate_hyperbolic_orbit_points(
+        -0.26, 6.14, 175.1, 128.0, 322.2, idealized_orbits.rotate_points, max_distance=50)
+
+
+
+@benchmark('orbits')
+def bench_osculating_arcs(fixtures):
+    """Clipped perihelion arcs for 200 hyperbolic and near-parabolic conics."""
+    import orbit_sampling
+    rng = np.random.default_rng(50)
+    e = np.concatenate((rng.uniform(1.0001, 8.0, 100), rng.uniform(0.95, 0.9999, 100)))
+    q = rng.uniform(0.005, 1.5, 200)
+    p = q * (1.0 + e)
+    limit = np.where(e > 1, np.arccos(-1.0 / np.maximum(e, 1.0)) - np.radians(0.1), np.pi)
+
+    def call():
+        theta = orbit_sampling.sinh_arms(
+            orbit_sampling.clip_anomaly(p, e, 7.5, limit), 300, 3.0)
+        r = p[:, None] / (1.0 + e[:, None] * np.cos(theta))
+        return r * np.cos(theta), r * np.sin(theta)
+    return call
+
+class _Selected:
+    """The shell checkbox stand-in: a tk variable that is always on."""
+    def get(self):
+        return 1
+
+
+def _shell_traces(planet, module):
+    import planet_visualization
+    prefix = f"create_{planet.lower()}_"
+    names = [n[len(prefix):-len('_shell')] for n in dir(module)
+             if n.startswith(prefix) and n.endswith('_shell')]
+    shell_vars = {f"{planet.lower()}_{n}": _Selected() for n in names}
+    return lambda: planet_visualization.create_planet_shell_traces(planet, shell_vars, (1.0, 0, 0))
+
+
+@benchmark('shells')
+def bench_earth(fixtures):
+    """Every Earth shell, core to Hill sphere."""
+    import earth_visualization_shells
+    return _shell_traces('Earth', earth_visualization_shells)
+
+
+@benchmark('shells')
+def bench_jupiter(fixtures):
+    """Every Jupiter shell, including the magnetosphere and radiation belts."""
+    import jupiter_visualization_shells
+    return _shell_traces('Jupiter', jupiter_visualization_shells)
+
+
+@benchmark('animation')
+def bench_perframe_primitives(fixtures):
+    """Rotation axis, dipole cone and bow shock for 29 frames."""
+    import plotly.graph_objects as go
+    from planet_visualization_utilities import (build_dipole_cone_traces,
+                                                build_rotation_axis_traces,
+                                                create_bow_shock_shape)
+    positions = [(np.cos(t), np.sin(t), 0.0) for t in np.linspace(0, 0.5, 29)]
+
+    def call():
+        frames = []
+        for k, origin in enumerate(positions):
+            traces = build_rotation_axis_traces(origin, planet_name='Earth', sun_position=(0, 0, 0))
+            traces += build_dipole_cone_traces(origin, planet_name='Earth', sun_position=(0, 0, 0))
+            x, y, z = create_bow_shock_shape(0.0008, 0.002)
+            traces.append(go.Scatter3d(x=x + origin[0], y=y + origin[1], z=z,
+                                       mode='markers', marker=dict(size=1)))
+            frames.append(go.Frame(data=traces, name=str(k)))
+        return frames
+    return call
+
+
+@benchmark('html')
+def bench_write_animation(fixtures):
+    """Stream a 60-frame animation figure to HTML."""
+    import save_utils
+    from measure_html_writer import build_figure
+    fig = build_figure(frames=60, movers=10, orbits=20, points=1000)
+    path = fixtures.scratch('animation.html')
+    return lambda: save_utils._write_html(fig, path)
+
+
+@benchmark('stars')
+def bench_vot_sidecar_read(fixtures):
+    """Stars within 100 ly from the Hipparcos cache (sidecar warm)."""
+    import vot_sidecar
+    path = fixtures.hipparcos_vot()
+    vot_sidecar.read_vot(path, 'Distance_ly', 100.0)        # builds the sidecar once
+    return lambda: vot_sidecar.read_vot(path, 'Distance_ly', 100.0)
+
+
+@benchmark('stars')
+def bench_properties_lookup(fixtures):
+    """Open the star-property store and gather properties for every star."""
+    import star_properties_store
+    path = fixtures.star_properties()
+    star_properties_store.open_store(path)                  # imports the PKL once
+    uids = [f"HIP {i}" for i in range(1, fixtures.stars + 1)]
+
+    def call():
+        store = star_properties_store.open_store(path)
+        idx = store.lookup(uids)
+        return store.gather('V_magnitude', idx), store.gather('spectral_type', idx)
+    return call
+
+
+@benchmark('stars')
+def bench_tiles_load(fixtures):
+    """Cold load of the magnitude tiles down to Vmag 6.5."""
+    import star_sphere_builder as ssb
+    tile_dir = fixtures.path('star_sphere_tiles')
+    ssb.build_tiles(fixtures.tile_stars(), tile_dir=tile_dir)
+
+    def call():
+        ssb._tile_cache.update(manifest=None, stamp=None, rows={}, names={})
+        return ssb.load_star_tiles(6.5, names=True, tile_dir=tile_dir)
+    return call
+
+
+# ============================================================
+# Running
+# ============================================================
+
+@contextlib.contextmanager
+def no_network():
+    """Refuse socket connects, so a benchmark that reaches for the network fails."""
+    def refuse(self, address):
+        raise OSError(f"network disabled during benchmarks (connect to {address})")
+    saved = socket.socket.connect, socket.socket.connect_ex
+    socket.socket.connect = socket.socket.connect_ex = refuse
+    try:
+        yield
+    finally:
+        socket.socket.connect, socket.socket.connect_ex = saved
+
+
+@contextlib.contextmanager
+def _quiet():
+    """Silence the progress output the pipeline stages print."""
+    # Byte-backed: some modules rewrap sys.stdout.buffer when imported
+    sink = io.TextIOWrapper(io.BytesIO(), encoding='utf-8')
+    with contextlib.redirect_stdout(sink), warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        yield
+
+
+def time_call(func, repeat=DEFAULT_REPEAT, warmup=1):
+    """Wall times of repeat calls after warmup untimed ones."""
+    for _ in range(warmup):
+        func()
+    runs = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        runs.append(time.perf_counter() - t0)
+    return runs
+
+
+def _commit():
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                             text=True, timeout=10, cwd=os.path.dirname(os.path.abspath(__file__)))
+        return out.stdout.strip() or 'unknown'
+    except (OSError, subprocess.SubprocessError):
+        return 'unknown'
+
+
+def run(patterns=None, repeat=DEFAULT_REPEAT, fixtures_dir=None, progress=None):
+    """
+    Time the selected benchmarks offline and return the results dict.
+
+    A benchmark that raises is recorded with its error instead of times.
+    progress, if given, is called with (benchmark, entry) after each one.
+    """
+    chosen = select(patterns)
+    results = {
+        'version': RESULTS_VERSION,
+        'commit': _commit(),
+        'date': dt.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'benchmarks': {},
+    }
+    with contextlib.ExitStack() as stack:
+        if fixtures_dir is None:
+            fixtures_dir = stack.enter_context(tempfile.TemporaryDirectory())
+        fixtures = Fixtures(fixtures_dir)
+        stack.enter_context(no_network())
+        for bench in chosen:
+            entry = {'group': bench.group}
+            try:
+                with _quiet():
+                    runs = time_call(bench.setup(fixtures), repeat)
+                entry.update(best_s=min(runs), median_s=statistics.median(runs), runs=runs)
+            except Exception as e:
+                entry['error'] = f"{type(e).__name__}: {e}"
+            results['benchmarks'][bench.name] = entry
+            if progress:
+                progress(bench, entry)
+    return results
+
+
+# ============================================================
+# Results files
+# ============================================================
+
+def save_results(results, path=None):
+    """Write results JSON (default reports/benchmarks/<date>_<commit>.json)."""
+    if path is None:
+        stamp = results['date'].replace(':', '').replace('-', '')
+        path = os.path.join(RESULTS_DIR, f"{stamp}_{results['commit']}.json")
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+    return path
+
+
+def load_results(path):
+    """Results JSON; 'latest' means the newest file in RESULTS_DIR."""
+    if path == 'latest':
+        candidates = sorted(glob.glob(os.path.join(RESULTS_DIR, '*.json')), key=os.path.getmtime)
+        if not candidates:
+            raise FileNotFoundError(f"no saved results in {RESULTS_DIR}")
+        path = candidates[-1]
+    with open(path) as f:
+        results = json.load(f)
+    if results.get('version') != RESULTS_VERSION:
+        raise ValueError(f"{path}: results version {results.get('version')}, "
+                         f"expected {RESULTS_VERSION}")
+    return results
+
+
+def compare(current, baseline, threshold=DEFAULT_THRESHOLD, noise_floor=NOISE_FLOOR_S):
+    """
+    One row per benchmark in either run: name, baseline and current median,
+    ratio and status -- 'regression', 'improved', 'ok', 'new', 'missing'
+    or 'error'. A regression is a median above threshold x the baseline's
+    that is also more than noise_floor seconds slower.
+    """
+    rows = []
+    names = list(current['benchmarks']) + [n for n in baseline['benchmarks']
+                                           if n not in current['benchmarks']]
+    for name in names:
+        now = current['benchmarks'].get(name)
+        base = baseline['benchmarks'].get(name)
+        row = {'name': name, 'baseline_s': None, 'current_s': None, 'ratio': None}
+        if now is None:
+            row['status'] = 'missing'
+        elif 'error' in now:
+            row['status'] = 'error'
+        elif base is None or 'error' in base:
+            row.update(current_s=now['median_s'], status='new')
+        else:
+            ratio = now['median_s'] / base['median_s'] if base['median_s'] > 0 else float('inf')
+            slower = now['median_s'] - base['median_s']
+            if ratio > threshold and slower > noise_floor:
+                status = 'regression'
+            elif ratio < 1 / threshold and -slower > noise_floor:
+                status = 'improved'
+            else:
+                status = 'ok'
+            row.update(baseline_s=base['median_s'], current_s=now['median_s'],
+                       ratio=ratio, status=status)
+        rows.append(row)
+    return rows
+
+
+def _ms(seconds):
+    return '-' if seconds is None else f"{seconds * 1e3:.2f}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--only', nargs='+', metavar='NAME',
+                        help='groups or benchmark names to run (default: all)')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT)
+    parser.add_argument('--fixtures', metavar='DIR',
+                        help='persistent fixture directory (recorded caches go here)')
+    parser.add_argument('--list', action='store_true', help='list benchmarks and exit')
+    parser.add_argument('--save', action='store_true', help=f'save results under {RESULTS_DIR}/')
+    parser.add_argument('--output', metavar='FILE', help='save results to FILE')
+    parser.add_argument('--compare', metavar='FILE',
+                        help="baseline results JSON, or 'latest'")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='median ratio counted as a regression (default %(default)s)')
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for bench in BENCHMARKS.values():
+            print(f"{bench.name:<30} {bench.description}")
+        return 0
+
+    try:
+        chosen = select(args.only)
+        baseline = load_results(args.compare) if args.compare else None
+    except (ValueError, OSError) as e:
+        print(f"[ERROR] {e}")
+        return 2
+
+    print(f"{len(chosen)} benchmark(s), best/median of {args.repeat}, network disabled\n")
+    print(f"{'benchmark':<30} {'best ms':>10} {'median ms':>10}")
+
+    def progress(bench, entry):
+        if 'error' in entry:
+            print(f"{bench.name:<30} FAILED  {entry['error']}")
+        else:
+            print(f"{bench.name:<30} {_ms(entry['best_s']):>10} {_ms(entry['median_s']):>10}")
+
+    results = run(args.only, args.repeat, args.fixtures, progress)
+    failed = any('error' in e for e in results['benchmarks'].values())
+
+    if args.save or args.output:
+        print(f"\nResults saved: {save_results(results, args.output)}")
+
+    regressed = False
+    if baseline is not None:
+        print(f"\nAgainst {baseline['commit']} ({baseline['date']}), "
+              f"threshold {args.threshold:g}x:")
+        print(f"{'benchmark':<30} {'base ms':>10} {'now ms':>10} {'ratio':>7}  status")
+        for row in compare(results, baseline, args.threshold):
+            ratio = '-' if row['ratio'] is None else f"{row['ratio']:.2f}"
+            print(f"{row['name']:<30} {_ms(row['baseline_s']):>10} {_ms(row['current_s']):>10} "
+                  f"{ratio:>7}  {row['status']}")
+            regressed |= row['status'] == 'regression'
+
+    return 1 if failed or regressed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
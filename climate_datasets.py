@@ -0,0 +1,370 @@
+"""
+climate_datasets.py - Shared parsed-dataset layer for the climate figures.
+
+The paleoclimate figures (paleoclimate_visualization, the three *_full
+variants, paleoclimate_dual_scale) and energy_imbalance each carried their
+own copy of the LR04, Scotese, Kaufman Holocene and GISS loaders, and every
+figure re-parsed the JSON/CSV sources -- the GISS annual means with a
+per-year scan of all 1,700 monthly records. This module parses each source
+once into typed NumPy arrays and keeps them:
+
+    - in memory, for the rest of the session (arrays are read-only)
+    - on disk, as data/parsed_cache/<name>.npz with a <name>.json manifest
+      recording the SHA-256, size and mtime of the source it came from
+
+A cached copy is trusted only while it matches its source: same size, and
+either the same mtime or the same SHA-256 (a touched but unchanged file is
+re-hashed once and the manifest refreshed). Anything else re-parses. A
+cache that cannot be written is logged and skipped; the figure still gets
+its arrays.
+
+Datasets (name: source -> arrays):
+    lr04:      lr04_benthic_stack.json -> age_ka_bp, d18o_permil, d18o_error
+    scotese:   8c__Phanerozoic_...csv  -> ages_ma, temp_global
+    holocene:  temp12k_allmethods_percentiles.csv
+                                       -> ages_ma, temp_median, temp_5th, temp_95th
+    giss:      temperature_giss_monthly.json
+                                       -> year, month, anomaly_c (NaN = missing),
+                                          annual_year, annual_mean
+    ohc:       ohc2000m_levitus_climdash_seasonal.csv
+                                       -> decimal_year, ohc
+
+Key functions:
+    load_dataset() - arrays for one dataset name (None if its source is absent)
+    load_lr04_data() / load_scotese_phanerozoic_data() / load_holocene_data()
+        - the figure loaders, now shared; dicts of arrays
+    load_modern_temperature_data() - GISS annual means as (ages_ma, temps) lists
+    calculate_preindustrial_offset() - 1850-1900 baseline of the Holocene record
+
+Consumed by: paleoclimate_visualization.py, paleoclimate_visualization_full.py,
+             paleoclimate_wet_bulb_full.py, paleoclimate_human_origins_full.py,
+             paleoclimate_dual_scale.py, energy_imbalance.py
+
+Role: cache
+Domain: earth_science
+
+Module created: October 2026
+"""
+
+import csv
+import hashlib
+import json
+import logging
+import os
+from typing import Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+
+DATA_DIR = 'data'
+CACHE_DIR = os.path.join(DATA_DIR, 'parsed_cache')
+
+LR04_FILE = os.path.join(DATA_DIR, 'lr04_benthic_stack.json')
+SCOTESE_FILE = os.path.join(DATA_DIR, '8c__Phanerozoic_Pole_to_Equator_Temperatures.csv')
+HOLOCENE_FILE = os.path.join(DATA_DIR, 'temp12k_allmethods_percentiles.csv')
+GISS_FILE = os.path.join(DATA_DIR, 'temperature_giss_monthly.json')
+OHC_FILE = os.path.join(DATA_DIR, 'ohc2000m_levitus_climdash_seasonal.csv')
+
+
+# ============================================================
+# Parsers: source file -> dict of arrays
+# ============================================================
+
+def _parse_lr04(path):
+    with open(path, 'r') as f:
+        records = json.load(f)['data']
+
+    def column(key):
+        return np.array([np.nan if r.get(key) is None else r[key] for r in records], dtype=float)
+
+    return {
+        'age_ka_bp': column('age_ka_bp'),
+        'd18o_permil': column('d18o_permil'),
+        'd18o_error': column('d18o_error'),
+    }
+
+
+def _parse_scotese(path):
+    """Global mean of the pole-to-equator grid: one temperature per age."""
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        ages = [float(age) for age in header[1:]]   # skip the 'latitude/age' label
+        temp_grid = []
+        for row in reader:
+            if row and row[0]:
+                try:
+                    temps = [float(t) for t in row[1:] if t]
+                    if temps:
+                        temp_grid.append(temps)
+                except (ValueError, IndexError):
+                    continue
+    if not ages or not temp_grid:
+        raise ValueError(f"no temperature rows in {path}")
+    return {
+        'ages_ma': np.array(ages, dtype=float),
+        'temp_global': np.mean(np.array(temp_grid), axis=0),
+    }
+
+
+def _parse_holocene(path):
+    with open(path, 'r') as f:
+        reader = csv.DictReader(f)
+        reader.fieldnames = [name.strip() for name in reader.fieldnames]
+        rows = [(float(r['ages']), float(r['global_median']),
+                 float(r['global_5']), float(r['global_95'])) for r in reader]
+    table = np.array(rows, dtype=float).reshape(-1, 4)
+    return {
+        'ages_ma': table[:, 0] / 1_000_000,          # years BP -> Ma BP
+        'temp_median': table[:, 1],
+        'temp_5th': table[:, 2],
+        'temp_95th': table[:, 3],
+    }
+
+
+def _parse_giss(path):
+    """Monthly anomalies plus the annual means of years with any valid month."""
+    with open(path, 'r') as f:
+        records = json.load(f)['data']
+    year = np.array([r['year'] for r in records], dtype=np.int64)
+    month = np.array([r['month'] for r in records], dtype=np.int64)
+    anomaly = np.array([np.nan if r['anomaly_c'] is None else r['anomaly_c'] for r in records],
+                       dtype=float)
+
+    # Years in order of first appearance, each month in record order
+    _, first = np.unique(year, return_index=True)
+    annual_year, annual_mean = [], []
+    for y in year[np.sort(first)]:
+        values = anomaly[(year == y) & ~np.isnan(anomaly)]
+        if len(values):
+            annual_year.append(y)
+            annual_mean.append(np.mean(values))
+    return {
+        'year': year,
+        'month': month,
+        'anomaly_c': anomaly,
+        'annual_year': np.array(annual_year, dtype=np.int64),
+        'annual_mean': np.array(annual_mean, dtype=float),
+    }
+
+
+def _parse_ohc(path):
+    """NOAA 0-2000 m heat content; rows are 'YYYY-M,value' (10^22 J)."""
+    years, months, ohc = [], [], []
+    with open(path, 'r') as f:
+        for row in csv.reader(f):
+            if not row or not row[0].strip():
+                continue
+            y, m = row[0].split('-')[:2]
+            years.append(int(y))
+            months.append(int(m))
+            ohc.append(float(row[1]))
+    years = np.array(years, dtype=np.int64)
+    months = np.array(months, dtype=np.int64)
+    return {
+        'decimal_year': years + (months - 1) / 12.0,
+        'ohc': np.array(ohc, dtype=float),
+    }
+
+
+DATASETS = {
+    'lr04': (LR04_FILE, _parse_lr04),
+    'scotese': (SCOTESE_FILE, _parse_scotese),
+    'holocene': (HOLOCENE_FILE, _parse_holocene),
+    'giss': (GISS_FILE, _parse_giss),
+    'ohc': (OHC_FILE, _parse_ohc),
+}
+
+
+# ============================================================
+# Binary cache
+# ============================================================
+
+_memo: Dict[str, tuple] = {}
+
+
+def _source_path(relative):
+    """A data file relative to the working directory, else to this module."""
+    if os.path.exists(relative):
+        return relative
+    beside = os.path.join(os.path.dirname(os.path.abspath(__file__)), relative)
+    return beside if os.path.exists(beside) else relative
+
+
+def cache_paths(name: str) -> dict:
+    base = os.path.join(CACHE_DIR, name)
+    return {'arrays': base + '.npz', 'manifest': base + '.json'}
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_cache(name, source, st):
+    paths = cache_paths(name)
+    try:
+        with open(paths['manifest'], 'r') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (manifest.get('version') != CACHE_VERSION
+            or manifest.get('source') != os.path.abspath(source)
+            or manifest.get('source_size') != st.st_size):
+        return None
+    if manifest.get('source_mtime_ns') != st.st_mtime_ns:
+        # Same size, different mtime: trust the content hash, not the clock.
+        if _sha256(source) != manifest.get('source_sha256'):
+            return None
+        manifest['source_mtime_ns'] = st.st_mtime_ns
+        try:
+            _write_manifest(paths['manifest'], manifest)
+        except OSError as e:
+            logger.warning(f"Could not refresh dataset manifest {paths['manifest']}: {e}")
+    try:
+        with np.load(paths['arrays']) as npz:
+            return {key: npz[key] for key in npz.files}
+    except Exception as e:
+        logger.warning(f"Unreadable dataset cache {paths['arrays']}: {e}")
+        return None
+
+
+def _write_manifest(path, manifest):
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp, path)
+
+
+def _write_cache(name, source, st, arrays):
+    paths = cache_paths(name)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = paths['arrays'] + '.tmp'
+        with open(tmp, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(tmp, paths['arrays'])
+        _write_manifest(paths['manifest'], {
+            'version': CACHE_VERSION,
+            'source': os.path.abspath(source),
+            'source_size': st.st_size,
+            'source_mtime_ns': st.st_mtime_ns,
+            'source_sha256': _sha256(source),
+            'arrays': {key: [str(a.dtype), list(a.shape)] for key, a in arrays.items()},
+        })
+    except Exception as e:
+        logger.warning(f"Could not write dataset cache for {name}: {e}")
+
+
+def load_dataset(name: str) -> Optional[Dict[str, np.ndarray]]:
+    """
+    Arrays of one dataset, parsed at most once per source version.
+
+    Returns None if the source file does not exist; a source that exists
+    but cannot be parsed raises the parser's error. The arrays are shared
+    between callers and read-only.
+    """
+    relative, parser = DATASETS[name]
+    source = _source_path(relative)
+    try:
+        st = os.stat(source)
+    except OSError:
+        return None
+    stamp = (os.path.abspath(source), st.st_size, st.st_mtime_ns)
+    memo = _memo.get(name)
+    if memo is not None and memo[0] == stamp:
+        return memo[1]
+
+    arrays = _read_cache(name, source, st)
+    if arrays is None:
+        arrays = parser(source)
+        _write_cache(name, source, st, arrays)
+    for a in arrays.values():
+        a.flags.writeable = False
+    _memo[name] = (stamp, arrays)
+    return arrays
+
+
+# ============================================================
+# Figure loaders
+# ============================================================
+
+def _require(name):
+    data = load_dataset(name)
+    if data is None:
+        raise FileNotFoundError(f"No such file: {DATASETS[name][0]}")
+    return data
+
+
+def load_lr04_data():
+    """LR04 benthic stack: {'age_ka_bp', 'd18o_permil', 'd18o_error'} arrays, or None."""
+    try:
+        return _require('lr04')
+    except (FileNotFoundError, ValueError, KeyError):
+        return None
+
+
+def load_scotese_phanerozoic_data():
+    """
+    Scotese et al. (2021) Phanerozoic temperature data
+
+    Returns {'ages_ma', 'temp_global'}: global average temperatures from
+    540 Ma to 0 Ma, the mean of the pole-to-equator reconstruction rows.
+    """
+    try:
+        return _require('scotese')
+    except Exception as e:
+        print(f"Warning: Could not load Scotese Phanerozoic data: {e}")
+        return None
+
+
+def load_holocene_data():
+    """Kaufman et al. (2020) Holocene reconstruction: ages_ma and global percentiles."""
+    try:
+        return _require('holocene')
+    except (FileNotFoundError, KeyError) as e:
+        print(f"Warning: Could not load Holocene data: {e}")
+        return None
+
+
+def calculate_preindustrial_offset(holocene_data):
+    """
+    Calculate offset to normalize to pre-industrial (1850-1900) baseline
+
+    The Kaufman data is relative to 19th century. We need to find what
+    the temperature was during 1850-1900 period (roughly 75-125 years BP)
+    and use that as our zero point.
+    """
+    if not holocene_data:
+        return 0.0
+
+    ages_years = np.asarray(holocene_data['ages_ma']) * 1_000_000
+    temps = np.asarray(holocene_data['temp_median'], dtype=float)
+
+    # Find temperatures for 1850-1900 period (75-175 years BP to be safe)
+    window = (ages_years >= 75) & (ages_years <= 175)
+    if window.any():
+        return np.mean(temps[window])
+    # Otherwise the point closest to 100 years BP
+    return temps[np.argmin(np.abs(ages_years - 100))]
+
+
+def load_modern_temperature_data(current_year=2025):
+    """
+    GISS annual mean anomalies as ages before current_year.
+
+    Returns (ages_ma, temps) lists, or (None, None) if the file is missing.
+    """
+    try:
+        giss = _require('giss')
+    except (FileNotFoundError, ValueError, KeyError) as e:
+        print(f"Warning: Could not load modern temperature data: {e}")
+        return None, None
+    ages_ma = (current_year - giss['annual_year']) / 1_000_000
+    return ages_ma.tolist(), giss['annual_mean'].tolist()
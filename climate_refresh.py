@@ -0,0 +1,263 @@
+"""
+climate_refresh.py - Concurrent, conditional refresh of the climate caches.
+
+fetch_climate_data.main() and climate_cache_manager.update_climate_data()
+used to download CO2, GISS temperature, Arctic ice and ocean pH one after
+another, re-parse every file in full and rewrite each cache through
+save_cache, even when the upstream file had not changed since the last
+run. This module refreshes the sources concurrently and does as little
+work as each one allows:
+
+    - conditional GET: the ETag and Last-Modified a server sent are kept
+      in the cache's metadata['http'] and sent back as If-None-Match /
+      If-Modified-Since; a 304 costs one round trip and the cache file
+      is not touched
+    - merge, not replace: a changed download is parsed and merged into
+      the cached records by (year, month). New months are appended,
+      revised values (GISS re-homogenises recent months, NOAA revises
+      the last few CO2 months) are updated in place, and months missing
+      from the download are kept, so a truncated response can never
+      shrink the cache
+    - the file is rewritten only when a record or a validator changed,
+      with a .backup of the previous copy and a tmp + os.replace write
+
+At most MAX_WORKERS sources download at once. Each source keeps its own
+fallback URLs (ocean pH tries BCO-DMO, then the HOT files). A source that
+fails leaves its cache exactly as it was.
+
+Sea level is not refreshed here: it is converted from a manually
+downloaded file (fetch_nasa_sea_level) and still goes through save_cache.
+
+Key classes:
+    Source - one dataset: URLs, parser, metadata function, cache file
+    RefreshResult - what happened to one source
+
+Key functions:
+    default_sources() - the CO2, temperature, ice and pH sources
+    refresh_source() - conditional fetch + merge for one source
+    refresh() - refresh several sources concurrently
+
+Consumed by: fetch_climate_data.py (main), climate_cache_manager.py
+
+Role: cache
+Domain: earth_science
+
+Module created: October 2026
+"""
+
+import json
+import logging
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence
+
+import requests
+
+import fetch_climate_data as fcd
+
+logger = logging.getLogger(__name__)
+
+MAX_WORKERS = 4
+TIMEOUT = 60
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+
+@dataclass
+class Source:
+    """
+    One refreshable dataset.
+
+    parse(response) -> records turns a 200 response into cache records; an
+    empty list means "not data" and the next URL is tried.
+    """
+    name: str
+    label: str
+    output_file: str
+    urls: Sequence[str]
+    parse: Callable[[requests.Response], List[Dict]]
+    metadata_func: Callable[[List[Dict]], Dict]
+    headers: Dict[str, str] = field(default_factory=dict)
+    timeout: float = TIMEOUT
+
+
+@dataclass
+class RefreshResult:
+    """Outcome of one source: status is 'unchanged', 'updated' or 'failed'."""
+    name: str
+    label: str
+    status: str
+    added: int = 0
+    revised: int = 0
+    records: int = 0
+    first: Optional[Dict] = None
+    latest: Optional[Dict] = None
+    error: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        return self.status != 'failed'
+
+
+def record_key(record: Dict) -> tuple:
+    return record['year'], record['month']
+
+
+def _parse_ph(response):
+    text = response.text
+    if text.lstrip().startswith('<'):
+        return []                     # an HTML page, not a data file
+    source = 'BCO-DMO' if 'bco-dmo' in response.url else 'HOT'
+    return fcd.parse_carbonate_data(text.split('\n'), source=source)
+
+
+def default_sources() -> List[Source]:
+    """The datasets fetch_climate_data maintains from live URLs."""
+    return [
+        Source('co2', 'CO2', fcd.CO2_OUTPUT_FILE, [fcd.MAUNA_LOA_URL],
+               lambda r: fcd.parse_mauna_loa_co2(r.text), fcd.create_co2_metadata),
+        Source('temperature', 'Temperature', fcd.TEMP_OUTPUT_FILE, [fcd.NASA_GISS_URL],
+               lambda r: fcd.parse_giss_temperature(r.text), fcd.create_temperature_metadata,
+               headers={'User-Agent': USER_AGENT}),
+        Source('ice', 'Arctic Ice', fcd.ICE_OUTPUT_FILE, [fcd.NSIDC_V4_URL],
+               lambda r: fcd.parse_arctic_ice_xlsx(r.content), fcd.create_ice_metadata),
+        Source('ph', 'Ocean pH', fcd.PH_OUTPUT_FILE,
+               ["https://www.bco-dmo.org/dataset/3773.csv"] + list(fcd.HOT_DIRECT_DATA_URLS),
+               _parse_ph, fcd.create_ph_metadata),
+    ]
+
+
+def _read_cache(path):
+    """(records, http validators) of an existing cache; empty if absent or unreadable."""
+    try:
+        with open(path, 'r') as f:
+            cached = json.load(f)
+        return cached.get('data', []), cached.get('metadata', {}).get('http', {})
+    except (OSError, ValueError, AttributeError):
+        return [], {}
+
+
+def merge_records(cached: List[Dict], fresh: List[Dict]):
+    """
+    Merge fresh records into cached ones by (year, month).
+
+    Returns (merged, added, revised). Cached months absent from fresh are
+    kept; the result is ordered by (year, month).
+    """
+    merged = list(cached)
+    index = {record_key(r): i for i, r in enumerate(merged)}
+    added = revised = 0
+    for record in fresh:
+        key = record_key(record)
+        i = index.get(key)
+        if i is None:
+            index[key] = len(merged)
+            merged.append(record)
+            added += 1
+        elif merged[i] != record:
+            merged[i] = record
+            revised += 1
+    if added:
+        merged.sort(key=record_key)
+    return merged, added, revised
+
+
+def _write_cache(path, records, metadata):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    if os.path.exists(path):
+        shutil.copy2(path, f"{path}.backup")
+    tmp = f"{path}.tmp"
+    with open(tmp, 'w') as f:
+        json.dump({'metadata': metadata, 'data': records}, f, indent=2)
+    os.replace(tmp, path)
+
+
+def _conditional_get(source, url, validators):
+    headers = dict(source.headers)
+    if validators.get('url') == url:
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+    response = requests.get(url, headers=headers, timeout=source.timeout)
+    response.raise_for_status()
+    return response
+
+
+def refresh_source(source: Source) -> RefreshResult:
+    """Conditionally fetch one source and merge it into its cache file."""
+    cached, validators = _read_cache(source.output_file)
+    errors = []
+    for url in source.urls:
+        try:
+            response = _conditional_get(source, url, validators)
+            if response.status_code == 304:
+                return _result(source, 'unchanged', cached)
+            fresh = source.parse(response)
+        except Exception as e:
+            errors.append(f"{url}: {e}")
+            continue
+        if not fresh:
+            errors.append(f"{url}: no records")
+            continue
+
+        merged, added, revised = merge_records(cached, fresh)
+        http = {'url': url,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified')}
+        if added or revised or http != validators:
+            metadata = source.metadata_func(merged)
+            metadata['http'] = http
+            _write_cache(source.output_file, merged, metadata)
+        status = 'updated' if added or revised else 'unchanged'
+        return _result(source, status, merged, added, revised)
+
+    return RefreshResult(source.name, source.label, 'failed',
+                         records=len(cached), error='; '.join(errors) or 'no URLs')
+
+
+def _result(source, status, records, added=0, revised=0):
+    return RefreshResult(source.name, source.label, status, added, revised, len(records),
+                         records[0] if records else None, records[-1] if records else None)
+
+
+def describe(result: RefreshResult) -> str:
+    """One status line for a result."""
+    if result.status == 'failed':
+        return f"[FAIL] {result.label}: {result.error}"
+    if result.status == 'unchanged':
+        return f"[OK] {result.label}: unchanged ({result.records} records)"
+    return (f"[OK] {result.label}: {result.added} new, {result.revised} revised "
+            f"({result.records} records)")
+
+
+def refresh(sources: Optional[Sequence[Source]] = None,
+            status_callback: Optional[Callable[[str], None]] = None,
+            max_workers: int = MAX_WORKERS) -> List[RefreshResult]:
+    """
+    Refresh sources concurrently; results come back in the sources' order.
+
+    status_callback(msg) is called from the calling thread as each source
+    finishes.
+    """
+    sources = default_sources() if sources is None else list(sources)
+    if not sources:
+        return []
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(sources))) as pool:
+        futures = {pool.submit(refresh_source, s): s for s in sources}
+        for future in as_completed(futures):
+            source = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = RefreshResult(source.name, source.label, 'failed', error=str(e))
+            results[source.name] = result
+            msg = describe(result)
+            logger.info(msg)
+            if status_callback:
+                status_callback(msg)
+    return [results[s.name] for s in sources]
@@ -9,11 +9,18 @@ any small body against any major planet (plus Moon, Pluto).
 Motivated by Apophis (99942) Earth flyby on April 13, 2029 (Friday the 13th).
 
 API endpoint: https://ssd-api.jpl.nasa.gov/cad.api
-Cache: data/close_approach_cache.json under 'close_approach:DESIGNATION:BODY' keys.
+Cache: data/close_approach_cache.jsonl, an append-only log. Per-object
+results are stored under 'close_approach:DESIGNATION:BODY' keys, and bulk
+windows hold every approach to a body in a date range; overlapping
+windows are merged and old ones evicted at compaction. The legacy
+data/close_approach_cache.json is migrated into the log once.
 
 Key functions:
     get_close_approaches(designation, body, date_min, date_max) - all approaches
     get_closest_approach(designation, body, date_min, date_max) - single closest
+    prefetch_close_approaches(designations, body, date_min, date_max) - one
+        bulk query covering many designations
+    compact_cache() - rewrite the log without superseded records
 
 Usage:
     from close_approach_data import get_closest_approach
@@ -38,10 +45,15 @@ from constants_new.py. The previous local radii dict had pre-April-16
 volumetric-mean values, so Jupiter surface distances were off by ~1,580 km
 and Saturn by ~2,000 km under the current Hybrid Radius Convention.
 Consolidation fixes that staleness.)
+Module updated: October 2026 (bulk prefetch: one CAD query per body and
+date window, results indexed by designation, body and date; the cache is
+an append-only log instead of a full rewrite with two backups per fetch)
 """
 
 import json
 import os
+import re
+import threading
 import urllib.request
 import urllib.parse
 from datetime import datetime, date
@@ -86,7 +98,7 @@ _BODY_CANONICAL['Earth'] = 'Earth'   # already canonical
 
 # ---------------------------------------------------------------------------
 # Cache helpers
-# CAD data lives in its OWN file (data/close_approach_cache.json), NOT in
+# CAD data lives in its OWN file (data/close_approach_cache.jsonl), NOT in
 # orbit_paths.json. The orbit_paths validator expects data_points or x/y/z
 # arrays -- our close approach dicts have neither, which triggers the cache
 # repair logic and removes the entry, reducing the count by 1, which then
@@ -94,7 +106,30 @@ _BODY_CANONICAL['Earth'] = 'Earth'   # already canonical
 # Separate file = no collision with orbit_paths validation.
 # ---------------------------------------------------------------------------
 
-CAD_CACHE_FILENAME = 'close_approach_cache.json'
+CAD_CACHE_FILENAME = 'close_approach_cache.json'    # legacy, read once for migration
+CAD_LOG_FILENAME = 'close_approach_cache.jsonl'
+
+# Bulk mode: a broad query pays off once this many designations need data
+# and its answer is expected to stay small (see _expected_rows). A bulk
+# answer has every small body near the body in the window, so its size
+# grows with the window length and roughly with dist_max squared; a
+# per-object answer is a few rows whatever the window.
+BULK_MIN_OBJECTS = 2
+BULK_ROWS_PER_OBJECT = 250      # expected rows worth one request saved
+BULK_MAX_ROWS = 2000            # never more than this in one window record
+
+# Approaches per year within BULK_RATE_DIST_AU of each body, all cataloged
+# small bodies (order of magnitude; CNEOS lists ~130 Earth approaches
+# inside 0.05 AU per 60 days). Bodies not listed use the default.
+BULK_RATE_DIST_AU = 0.05
+APPROACHES_PER_YEAR = {'Earth': 800, 'Moon': 800}
+DEFAULT_APPROACHES_PER_YEAR = 100
+
+# Bulk windows kept at compaction, most recently fetched first
+MAX_WINDOWS = 8
+
+# The log is compacted when it holds this many superseded records
+COMPACT_AFTER = 200
 
 
 def _get_cache_path():
@@ -112,45 +147,243 @@ def _get_cache_path():
     return default
 
 
-def _load_cache():
-    cache_path = _get_cache_path()
-    if cache_path.exists():
-        try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"[CAD] Warning: Could not load cache from {cache_path}: {e}", flush=True)
-    return {}
+def _get_log_path():
+    """Return path to close_approach_cache.jsonl (next to the legacy cache)."""
+    return _get_cache_path().with_name(CAD_LOG_FILENAME)
+
+
+# In-process view of the log. 'objects' holds per-object entries by cache
+# key; 'windows' holds bulk windows by (body, date_min, date_max, dist_max);
+# 'index' maps (designation alias, body) -> {jd: approach} across all bulk
+# windows. 'offset' is how far the log has been read, so records appended
+# by another process are picked up without re-reading the whole file.
+_store = {'path': None, 'offset': 0, 'objects': {}, 'windows': {}, 'index': {},
+          'superseded': 0, 'mergeable': 0}
+_store_lock = threading.RLock()
+
+
+def _reset_store(path=None):
+    _store.update(path=path, offset=0, objects={}, windows={}, index={}, superseded=0,
+                  mergeable=0)
+
+
+def _aliases(designation, fullname=None):
+    """Names a CAD row may be asked for: designation, number, name, provisional."""
+    names = {designation.strip()}
+    full = ' '.join(str(fullname or '').split())
+    if full:
+        names.add(full)
+        match = re.match(r'^(.*?)\s*\(([^)]*)\)$', full)
+        outer = match.group(1).strip() if match else full
+        if outer:
+            names.add(outer)
+        if '/' not in designation:
+            # Asteroids: '99942 Apophis (2004 MN4)' -> 99942, Apophis, 2004 MN4.
+            # Comet parentheses hold discoverer names shared by many comets.
+            if match and match.group(2).strip():
+                names.add(match.group(2).strip())
+            number, _, name = outer.partition(' ')
+            if number.isdigit():
+                names.update(filter(None, (number, name.strip())))
+    names.discard('')
+    return names
+
+
+def _apply_record(record):
+    """Fold one log record into the in-process store."""
+    kind = record.get('kind')
+    if kind == 'object':
+        key = record['key']
+        if key in _store['objects']:
+            _store['superseded'] += 1
+        _store['objects'][key] = record['entry']
+    elif kind == 'window':
+        window = (record['body'], record['date_min'], record['date_max'],
+                  str(record['dist_max']))
+        if window in _store['windows']:
+            _store['superseded'] += 1
+        elif any(_mergeable(record, other) for other in _store['windows'].values()):
+            _store['mergeable'] += 1
+        _store['windows'][window] = record
+        for approach in record.get('approaches', []):
+            for alias in _aliases(approach.get('des', ''), approach.get('fullname')):
+                by_jd = _store['index'].setdefault((alias, record['body']), {})
+                by_jd[round(approach['jd'], 6)] = approach
+
+
+def _read_log(path, offset):
+    """Records appended to the log after offset, and the new offset."""
+    records = []
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        for raw in f:
+            if not raw.endswith(b'\n'):
+                break                       # a record still being written
+            offset += len(raw)
+            try:
+                records.append(json.loads(raw))
+            except json.JSONDecodeError as e:
+                print(f"[CAD] Warning: skipping unreadable cache record: {e}", flush=True)
+    return records, offset
+
+
+def _migrate_legacy(log_path):
+    """Write the legacy JSON cache's entries as the log's first records."""
+    legacy_path = _get_cache_path()
+    if not legacy_path.exists():
+        return
+    try:
+        with open(legacy_path, 'r', encoding='utf-8') as f:
+            legacy = json.load(f)
+    except (json.JSONDecodeError, IOError) as e:
+        print(f"[CAD] Warning: Could not load cache from {legacy_path}: {e}", flush=True)
+        return
+    _write_log(log_path, [{'kind': 'object', 'key': key, 'entry': entry}
+                          for key, entry in legacy.items()])
+    print(f"[CAD] Migrated {len(legacy)} cache entries to {log_path}", flush=True)
+
+
+def _refresh():
+    """Bring the store up to date with the log (caller holds _store_lock)."""
+    path = _get_log_path()
+    if _store['path'] != path:
+        _reset_store(path)
+        if not path.exists():
+            _migrate_legacy(path)
+    if not path.exists():
+        return
+    if path.stat().st_size < _store['offset']:
+        _reset_store(path)                  # compacted by another process
+    try:
+        records, _store['offset'] = _read_log(path, _store['offset'])
+    except IOError as e:
+        print(f"[CAD] Warning: Could not read cache log {path}: {e}", flush=True)
+        return
+    for record in records:
+        _apply_record(record)
 
 
-def _save_cache(cache):
-    """Save cache with two-generation backup protection."""
-    import shutil
-    cache_path = _get_cache_path()
-    cache_path.parent.mkdir(parents=True, exist_ok=True)
+def _load_cache():
+    """Per-object cache entries by key (the shared in-process dict)."""
+    with _store_lock:
+        _refresh()
+        return _store['objects']
+
+
+def _append_record(record):
+    """Append one record to the log and fold it into the store."""
+    with _store_lock:
+        _refresh()
+        path = _store['path']
+        path.parent.mkdir(parents=True, exist_ok=True)
+        line = (json.dumps(record, separators=(',', ':')) + '\n').encode('utf-8')
+        try:
+            with open(path, 'ab') as f:
+                f.write(line)
+        except IOError as e:
+            print(f"[CAD] Error: Could not save cache: {e}", flush=True)
+            return
+        _store['offset'] += len(line)
+        _apply_record(record)
+        if (_store['superseded'] >= COMPACT_AFTER or _store['mergeable']
+                or len(_store['windows']) > MAX_WINDOWS):
+            compact_cache()
+
+
+def _write_log(path, records):
+    """Write records as a fresh log (temp file, then replace)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = path.with_suffix('.jsonl.tmp')
+    with open(temp, 'w', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record, separators=(',', ':')) + '\n')
+    os.replace(temp, path)
+
+
+def _overlapping(window, other):
+    """True if two bulk windows for one body share dates and could be merged."""
+    return (window['body'] == other['body']
+            and window['date_min'] <= other['date_max']
+            and other['date_min'] <= window['date_max'])
+
+
+def _contains(window, other):
+    """True if window answers everything other does (dates and distance)."""
+    return (window['body'] == other['body']
+            and window['date_min'] <= other['date_min']
+            and other['date_max'] <= window['date_max']
+            and float(window['dist_max']) >= float(other['dist_max']))
+
+
+def _mergeable(window, other):
+    """True if compaction would fold one of the two windows into the other."""
+    return ((float(window['dist_max']) == float(other['dist_max'])
+             and _overlapping(window, other))
+            or _contains(window, other) or _contains(other, window))
+
+
+def _merge_windows(windows):
+    """
+    Bulk windows with overlaps folded together, at most MAX_WINDOWS of them.
+
+    A window inside another is dropped. Windows for the same body and
+    distance that overlap become one window over both date ranges, with
+    the union of their approaches (the newer fetch wins for a repeated
+    designation and date) -- unless the union would pass BULK_MAX_ROWS,
+    when only the newer window is kept. The most recently fetched
+    windows are kept.
+    """
+    merged = []
+    for window in sorted(windows, key=lambda w: (w['body'], float(w['dist_max']),
+                                                 w['date_min'])):
+        last = merged[-1] if merged else None
+        if (last is not None and float(last['dist_max']) == float(window['dist_max'])
+                and _overlapping(last, window)):
+            newer, older = ((window, last) if window.get('fetched', '') >= last.get('fetched', '')
+                            else (last, window))
+            rows = {(a.get('des'), round(a['jd'], 6)): a
+                    for a in older.get('approaches', []) + newer.get('approaches', [])}
+            if len(rows) > BULK_MAX_ROWS:
+                merged[-1] = newer          # too big to merge: the older one goes
+                continue
+            merged[-1] = dict(newer,
+                              date_min=min(last['date_min'], window['date_min']),
+                              date_max=max(last['date_max'], window['date_max']),
+                              approaches=[rows[k] for k in sorted(rows, key=lambda k: k[1])])
+        else:
+            merged.append(window)
+    kept = [w for i, w in enumerate(merged)
+            if not any(j != i and _contains(other, w) for j, other in enumerate(merged))]
+    kept.sort(key=lambda w: (w.get('fetched', ''), w['date_max']), reverse=True)
+    return kept[:MAX_WINDOWS]
 
-    # Two-generation backup (bak1 = previous run, bak2 = one before that)
-    backup1 = cache_path.with_suffix('.json.bak1')
-    backup2 = cache_path.with_suffix('.json.bak2')
 
-    if backup1.exists():
-        try:
-            shutil.copy2(backup1, backup2)
-        except Exception as e:
-            print(f"[CAD] Warning: Could not rotate backup: {e}", flush=True)
+def compact_cache():
+    """Rewrite the log with only the live records, keeping one backup.
 
-    if cache_path.exists():
+    Overlapping bulk windows are merged and old ones evicted
+    (_merge_windows), so shifted date ranges do not pile up windows.
+    """
+    import shutil
+    with _store_lock:
+        _refresh()
+        path = _store['path']
+        records = [{'kind': 'object', 'key': key, 'entry': entry}
+                   for key, entry in _store['objects'].items()]
+        records += _merge_windows(_store['windows'].values())
+        if path.exists():
+            try:
+                shutil.copy2(path, path.with_suffix('.jsonl.bak'))
+            except Exception as e:
+                print(f"[CAD] Warning: Could not create backup: {e}", flush=True)
         try:
-            shutil.copy2(cache_path, backup1)
-        except Exception as e:
-            print(f"[CAD] Warning: Could not create backup: {e}", flush=True)
-
-    try:
-        with open(cache_path, 'w', encoding='utf-8') as f:
-            json.dump(cache, f, indent=2)
-        print(f"[CAD] Cache saved: {cache_path}", flush=True)
-    except IOError as e:
-        print(f"[CAD] Error: Could not save cache: {e}", flush=True)
+            _write_log(path, records)
+        except IOError as e:
+            print(f"[CAD] Error: Could not compact cache: {e}", flush=True)
+            return
+        _reset_store(path)
+        _refresh()
+        print(f"[CAD] Cache compacted: {len(records)} record(s) in {path}", flush=True)
 
 
 def _cache_key(designation, body):
@@ -160,6 +393,70 @@ def _cache_key(designation, body):
     return f"close_approach:{designation}:{canonical_body}"
 
 
+def _canonical_body(body):
+    return _BODY_CANONICAL.get(CAD_BODY_NAMES.get(body, body), body)
+
+
+def _jd(day):
+    """Julian Date at 00:00 of a 'YYYY-MM-DD' date (UTC; TDB offset ignored)."""
+    dt = datetime.strptime(str(day)[:10], '%Y-%m-%d')
+    return (dt - datetime(2000, 1, 1, 12)).total_seconds() / 86400.0 + 2451545.0
+
+
+def _covering_window(body, date_min, date_max, dist_max):
+    """A bulk window for body that covers the dates and distance, else None."""
+    if not date_min or not date_max:
+        return None
+    body = _canonical_body(body)
+    for (w_body, w_min, w_max, w_dist), record in _store['windows'].items():
+        if (w_body == body and w_min <= str(date_min)[:10] and str(date_max)[:10] <= w_max
+                and float(w_dist) >= float(dist_max)):
+            return record
+    return None
+
+
+def _cached_entry(cache, key, date_min, date_max, dist_max):
+    """The per-object entry for key if it answers the request, else None.
+
+    Entries written from a bulk window ('from_window') only hold what the
+    window held, so they answer only requests inside their dates and
+    distance. Entries from a per-object query answer as they always have.
+    """
+    entry = cache.get(key)
+    if entry is None or not entry.get('from_window'):
+        return entry
+    if (date_min and date_max and entry['date_min'] <= str(date_min)[:10]
+            and str(date_max)[:10] <= entry['date_max']
+            and float(entry['dist_max']) >= float(dist_max)):
+        return entry
+    return None
+
+
+def _entry_approaches(entry, date_min, date_max, dist_max):
+    """An entry's approaches; a window-derived entry's limited to the request."""
+    approaches = entry.get('approaches', [])
+    if not entry.get('from_window'):
+        return approaches
+    jd_min, jd_max = _jd(date_min), _jd(date_max)
+    return [a for a in approaches
+            if jd_min <= a['jd'] <= jd_max and a['dist_au'] <= float(dist_max)]
+
+
+def _expected_rows(body, date_min, date_max, dist_max):
+    """Rough row count of a bulk query: rate x years x (dist_max / rate distance)^2."""
+    rate = APPROACHES_PER_YEAR.get(_canonical_body(body), DEFAULT_APPROACHES_PER_YEAR)
+    years = max(_jd(date_max) - _jd(date_min), 1.0) / 365.25
+    return rate * years * (float(dist_max) / BULK_RATE_DIST_AU) ** 2
+
+
+def _indexed_approaches(designation, body, date_min, date_max, dist_max):
+    """Approaches from bulk windows for one designation, in date order."""
+    by_jd = _store['index'].get((designation.strip(), _canonical_body(body)), {})
+    jd_min, jd_max = _jd(date_min), _jd(date_max)
+    return [by_jd[jd] for jd in sorted(by_jd)
+            if jd_min <= jd <= jd_max and by_jd[jd]['dist_au'] <= float(dist_max)]
+
+
 # ---------------------------------------------------------------------------
 # Raw API fetch
 # ---------------------------------------------------------------------------
@@ -192,6 +489,40 @@ def _fetch_from_api(designation, body='Earth', date_min=None, date_max=None,
     if date_max:
         params['date-max'] = date_max
 
+    data = _query(params)
+    if data is None:
+        return None
+    return _parse_response(data, body, designation)
+
+
+def _fetch_bulk_from_api(body='Earth', date_min=None, date_max=None, dist_max='0.5'):
+    """
+    Query JPL CAD API for every small body approaching body in a date range.
+
+    One request replaces a per-designation request for each object in a
+    plot. neo=false widens the query from NEOs to all small bodies, as a
+    designation query does.
+
+    Returns:
+        list[dict] | None: Parsed approach list (each with 'des' and
+                           'fullname') or None on failure
+    """
+    params = {
+        'body':      CAD_BODY_NAMES.get(body, body),
+        'date-min':  date_min,
+        'date-max':  date_max,
+        'dist-max':  dist_max,
+        'neo':       'false',
+        'fullname':  '1',
+    }
+    data = _query(params)
+    if data is None:
+        return None
+    return _parse_response(data, body, f"all small bodies ({date_min} to {date_max})")
+
+
+def _query(params):
+    """GET the CAD API with params; decoded JSON, or None on failure."""
     url = CAD_API_URL + '?' + urllib.parse.urlencode(params)
     print(f"[CAD] Querying: {url}", flush=True)
 
@@ -203,18 +534,23 @@ def _fetch_from_api(designation, body='Earth', date_min=None, date_max=None,
         return None
 
     try:
-        data = json.loads(raw)
+        return json.loads(raw)
     except json.JSONDecodeError as e:
         print(f"[CAD] JSON parse error: {e}", flush=True)
         return None
 
+
+def _parse_response(data, body, label):
+    """Approach dicts from a decoded CAD response; label names the query in logs."""
+    cad_body = CAD_BODY_NAMES.get(body, body)
+
     # Check for API-level error
     if 'message' in data and data.get('count', 1) == 0:
         print(f"[CAD] API message: {data['message']}", flush=True)
         return []
 
     if 'data' not in data or not data['data']:
-        print(f"[CAD] No close approach data returned for {designation} near {body}", flush=True)
+        print(f"[CAD] No close approach data returned for {label} near {body}", flush=True)
         return []
 
     # Parse fields header
@@ -239,6 +575,8 @@ def _fetch_from_api(designation, body='Earth', date_min=None, date_max=None,
     i_v_inf    = field_idx('v_inf')
     i_h        = field_idx('h')
     i_orbit_id = field_idx('orbit_id')
+    i_des      = field_idx('des')
+    i_fullname = field_idx('fullname')
 
     def safe_float(row, idx):
         if idx is None or idx >= len(row):
@@ -288,9 +626,11 @@ def _fetch_from_api(designation, body='Earth', date_min=None, date_max=None,
             'v_inf_kms':   v_inf,
             'h_mag':       h_mag,
             'orbit_id':    orbit_id,
+            'des':         row[i_des] if i_des is not None else None,
+            'fullname':    row[i_fullname].strip() if i_fullname is not None and row[i_fullname] else None,
         })
 
-    print(f"[CAD] Parsed {len(approaches)} approach(es) for {designation} near {body}", flush=True)
+    print(f"[CAD] Parsed {len(approaches)} approach(es) for {label} near {body}", flush=True)
     return approaches
 
 
@@ -303,8 +643,10 @@ def get_close_approaches(designation, body='Earth', date_min=None, date_max=None
     """
     Return list of close approach events for a small body near a major body.
 
-    Results are cached in data/close_approach_cache.json under 'close_approach:DES:BODY'.
-    Cache is used unless force_refresh=True.
+    Results are cached in data/close_approach_cache.jsonl under 'close_approach:DES:BODY'.
+    A bulk window (prefetch_close_approaches) covering the dates and
+    distance answers without a request too. Cache is used unless
+    force_refresh=True.
 
     Parameters:
         designation (str): Small body designation (e.g. '99942' for Apophis,
@@ -330,17 +672,22 @@ def get_close_approaches(designation, body='Earth', date_min=None, date_max=None
             v_inf_kms   - Asymptotic velocity (km/s), None if not returned
             h_mag       - Absolute magnitude H, may be None
             orbit_id    - JPL orbit solution ID
+            des, fullname - CAD designation and full name
         Returns [] if no approaches found, None if fetch failed.
     """
     key = _cache_key(designation, body)
 
     if not force_refresh:
-        cache = _load_cache()
-        if key in cache:
-            entry = cache[key]
-            print(f"[CAD] Cache hit: {key} ({len(entry.get('approaches', []))} approach(es))",
-                  flush=True)
-            return entry.get('approaches', [])
+        with _store_lock:
+            entry = _cached_entry(_load_cache(), key, date_min, date_max, dist_max)
+            if entry is not None:
+                approaches = _entry_approaches(entry, date_min, date_max, dist_max)
+                print(f"[CAD] Cache hit: {key} ({len(approaches)} approach(es))", flush=True)
+                return approaches
+            if _covering_window(body, date_min, date_max, dist_max):
+                approaches = _indexed_approaches(designation, body, date_min, date_max, dist_max)
+                print(f"[CAD] Bulk cache hit: {key} ({len(approaches)} approach(es))", flush=True)
+                return approaches
 
     # Not in cache (or forced refresh) -- fetch from API
     approaches = _fetch_from_api(designation, body, date_min, date_max, dist_max)
@@ -349,21 +696,106 @@ def get_close_approaches(designation, body='Earth', date_min=None, date_max=None
         return None
 
     # Cache the result
-    cache = _load_cache()
-    cache[key] = {
+    _append_record({'kind': 'object', 'key': key, 'entry': {
         'designation':  designation,
-        'body':         _BODY_CANONICAL.get(CAD_BODY_NAMES.get(body, body), body),
+        'body':         _canonical_body(body),
         'approaches':   approaches,
         'date_min':     date_min,
         'date_max':     date_max,
         'dist_max':     dist_max,
         'fetched':      datetime.now().strftime('%Y-%m-%d'),
-    }
-    _save_cache(cache)
+    }})
 
     return approaches
 
 
+def prefetch_close_approaches(designations, body='Earth', date_min=None, date_max=None,
+                              dist_max='0.5', force_refresh=False):
+    """
+    Cover many designations near one body with a single bulk CAD query.
+
+    Designations that already have a per-object entry, or that fall in a
+    cached bulk window for body, need nothing. If at least
+    BULK_MIN_OBJECTS others remain and the bulk answer is expected to be
+    small -- at most BULK_ROWS_PER_OBJECT rows per designation and
+    BULK_MAX_ROWS in all (_expected_rows) -- every approach to body
+    between date_min and date_max is fetched in one request and stored as
+    a bulk window, and each of those designations gets its own per-object
+    entry from it. A designation with no approach there gets [] with no
+    further request. Otherwise (few designations, or a long window or a
+    wide distance near a crowded body) nothing is fetched and the
+    per-object path is used as before.
+
+    Parameters:
+        designations (list[str]): Small body designations
+        body, date_min, date_max, dist_max: as for get_close_approaches()
+            (date_min and date_max are required for a bulk query)
+        force_refresh (bool): Re-fetch the window even if one covers it
+
+    Returns:
+        dict: {designation: list[dict]} for every designation now covered
+              by the cache (empty if nothing could be covered)
+    """
+    if not date_min or not date_max:
+        return {}
+    designations = list(dict.fromkeys(designations))
+
+    def covered():
+        cache = _load_cache()
+        in_window = _covering_window(body, date_min, date_max, dist_max)
+        found = {}
+        for d in designations:
+            entry = _cached_entry(cache, _cache_key(d, body), date_min, date_max, dist_max)
+            if entry is not None:
+                found[d] = _entry_approaches(entry, date_min, date_max, dist_max)
+            elif in_window:
+                found[d] = _indexed_approaches(d, body, date_min, date_max, dist_max)
+        return found
+
+    with _store_lock:
+        found = covered()
+    missing = [d for d in designations if force_refresh or d not in found]
+    if len(missing) < BULK_MIN_OBJECTS:
+        return found
+    expected = _expected_rows(body, date_min, date_max, dist_max)
+    if expected > min(BULK_MAX_ROWS, BULK_ROWS_PER_OBJECT * len(missing)):
+        print(f"[CAD] Bulk query near {body} would return ~{expected:,.0f} rows "
+              f"-- using per-object queries", flush=True)
+        return found
+
+    print(f"[CAD] Bulk prefetch: {len(missing)} designation(s) near {body}, "
+          f"{date_min} to {date_max}", flush=True)
+    approaches = _fetch_bulk_from_api(body, date_min, date_max, dist_max)
+    if approaches is None:
+        print(f"[CAD] Bulk fetch failed near {body} -- using per-object queries", flush=True)
+        return found
+
+    _append_record({
+        'kind':        'window',
+        'body':        _canonical_body(body),
+        'date_min':    str(date_min)[:10],
+        'date_max':    str(date_max)[:10],
+        'dist_max':    str(dist_max),
+        'approaches':  approaches,
+        'fetched':     datetime.now().strftime('%Y-%m-%d'),
+    })
+    # Per-object entries, so these designations no longer depend on the
+    # window surviving compaction.
+    with _store_lock:
+        for d in missing:
+            _append_record({'kind': 'object', 'key': _cache_key(d, body), 'entry': {
+                'designation':  d,
+                'body':         _canonical_body(body),
+                'approaches':   _indexed_approaches(d, body, date_min, date_max, dist_max),
+                'date_min':     str(date_min)[:10],
+                'date_max':     str(date_max)[:10],
+                'dist_max':     str(dist_max),
+                'from_window':  True,
+                'fetched':      datetime.now().strftime('%Y-%m-%d'),
+            }})
+        return covered()
+
+
 def get_closest_approach(designation, body='Earth', date_min=None, date_max=None,
                           dist_max='0.5', force_refresh=False):
     """
@@ -12,6 +12,8 @@ Key points:
 
 Role: computation
 Domain: stars
+
+Module updated: October 2026 (single-range VizieR query for banded cache expansion)
 """
 
 import os
@@ -23,6 +25,9 @@ from astropy.coordinates import Angle
 from astropy.io import votable
 from astropy.io.votable import parse_single_table
 
+HIPPARCOS_CATALOG = "I/239/hip_main"
+GAIA_CATALOG = "I/350/gaiaedr3"
+
 # Optional: If big queries often fail, increase the default timeout or choose a different mirror.
 # Vizier.TIMEOUT = 300
 # Vizier.MIRROR = 'cdsarc.u-strasbg.fr'
@@ -52,6 +57,18 @@ def initialize_vizier(timeout=120):
     except Exception as e:
         raise RuntimeError(f"Failed to initialize Vizier: {e}")
 
+def fetch_catalog_range(v, catalog, column, constraint):
+    """
+    One VizieR query restricted to a single column range, e.g.
+    fetch_catalog_range(v, HIPPARCOS_CATALOG, 'Plx', '6.5..32.6').
+    Nothing is written to disk. Returns an empty table if the range holds
+    no stars; query errors propagate so the caller can retry the range.
+    """
+    result = v.query_constraints(catalog=catalog, **{column: constraint})
+    if not result:
+        return Table()
+    return result[0]
+
 def load_or_fetch_hipparcos_data(v, hip_data_file, mode='distance',
                                  mag_limit=None, parallax_constraint=None):
     """
@@ -79,7 +96,7 @@ def load_or_fetch_hipparcos_data(v, hip_data_file, mode='distance',
         elif mode == 'distance' and parallax_constraint is not None:
             constraints['Plx'] = parallax_constraint
 
-        result = v.query_constraints(catalog="I/239/hip_main", **constraints)
+        result = v.query_constraints(catalog=HIPPARCOS_CATALOG, **constraints)
         if not result:
             print("No data found in Hipparcos catalog for these constraints.")
             return None
@@ -125,7 +142,7 @@ def load_or_fetch_gaia_data(v, gaia_data_file, mode='distance',
             # Optionally enforce parallax error <2 mas, if desired:
             # constraints['e_Plx'] = '<2'
 
-        result = v.query_constraints(catalog="I/350/gaiaedr3", **constraints)
+        result = v.query_constraints(catalog=GAIA_CATALOG, **constraints)
         if not result:
             print("No data found in Gaia EDR3 for these constraints.")
             return None
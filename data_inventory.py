@@ -16,6 +16,7 @@ Role: devtool
 Domain: dev_tools
 
 Module updated: July 2026 with Anthropic's Claude Opus 4.6
+Module updated: October 2026 (peek the columnar star properties store)
 """
 
 import os, json, pickle, sys, argparse
@@ -135,6 +136,18 @@ def peek_pickle(path):
     return "\n".join(out)
 
 
+def peek_property_store(path):
+    """Peek at a star_properties_*.store manifest: generation, rows, segments."""
+    with open(os.path.join(path, "MANIFEST.json"), "r") as f:
+        manifest = json.load(f)
+    return "\n".join([
+        f"- rows: {manifest.get('rows')}",
+        f"- generation: {manifest.get('generation')} (base {manifest.get('base')})",
+        f"- segments: {len(manifest.get('segments', []))}",
+        f"- updated: {manifest.get('updated')}",
+    ])
+
+
 def peek_gallery_metadata(gallery_path):
     """Peek at gallery_metadata.json: entry count, fields, categories."""
     meta_path = os.path.join(gallery_path, "gallery", "gallery_metadata.json")
@@ -206,7 +219,9 @@ def main():
         for label, path, fn in [
             ("orbit_paths.json", "data/orbit_paths.json", peek_orbit),
             ("star_properties_magnitude.pkl",
-             "star_data/star_properties_magnitude.pkl", peek_pickle)]:
+             "star_data/star_properties_magnitude.pkl", peek_pickle),
+            ("star_properties_magnitude.store",
+             "star_data/star_properties_magnitude.store", peek_property_store)]:
             out.write(f"\n## {label}\n\n")
             try:
                 out.write(fn(path) + "\n")
@@ -23,16 +23,20 @@ import-failure fallback cascade removed -- duplicated _shells heuristic,
 silent 'other' default, and an unreachable ROLE_MAP branch -- replaced by
 a visible one-time warning).
 
+Module updated: October 2026 (imports and docstrings are read through
+ast_index, which keeps them per content hash between runs).
+
 Role: devtool
 Domain: dev_tools
 """
 
-import ast
 import os
 import sys
 import json
 from pathlib import Path
 
+import ast_index
+
 
 # ── Configuration ─────────────────────────────────────────────────────────────
 
@@ -83,23 +87,14 @@ CATEGORY_COLORS = {
 def get_imports(filepath):
     """Extract local module imports from a Python file using AST."""
     try:
-        with open(filepath, 'rb') as f:
-            tree = ast.parse(f.read())
+        return set(ast_index.module_facts(filepath)['imports'])
     except Exception:
         return set()
-    imports = set()
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                imports.add(alias.name)
-        elif isinstance(node, ast.ImportFrom):
-            if node.module:
-                imports.add(node.module)
-    return imports
 
 
 def build_graph(project_dir='.'):
     """Build full bidirectional dependency graph for all local modules."""
+    ast_index.open_index(project_dir)
     local_mods = {
         os.path.splitext(f)[0]
         for f in os.listdir(project_dir)
@@ -193,11 +188,9 @@ def get_category(mod):
 def get_module_description(filepath):
     """Extract the first meaningful line of the module docstring."""
     try:
-        with open(filepath, 'rb') as f:
-            tree = ast.parse(f.read())
+        doc = ast_index.docstring(ast_index.module_facts(filepath)['docstring'])
     except Exception:
         return ''
-    doc = ast.get_docstring(tree)
     if not doc:
         return ''
     # Find the first meaningful line (skip filename-only lines)
@@ -478,6 +471,7 @@ def main():
     # Write HTML
     ensure_vis_network(project_dir)
     html = to_html(target, nodes, edges, hubs, deps, consumers, project_dir)
+    ast_index.open_index(project_dir).save()
     out_path = f"dep_trace_{target}.html"
     with open(out_path, 'w', encoding='utf-8') as f:
         f.write(html)
@@ -20,6 +20,9 @@ Module updated: June 2026 with Anthropic's Claude Opus 4.8
   (create_info_placemark). Population-exposure key folded into the balloon;
   risk-scale colorbar repositioned off the bottom chrome. Cards now reflow on
   mobile Google Earth instead of colliding with the search bar / toolbar.
+
+Module updated: October 2026 (shared gridding stage: one interpolated
+field per scenario, cached triangulations, via earth_system_grid)
 """
 import re
 import os
@@ -33,11 +36,11 @@ import simplekml
 import plotly.graph_objects as go
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
-from scipy.interpolate import griddata
 import tkinter as tk
 from tkinter import ttk, messagebox
 
 from earth_system_common import create_info_placemark, ScenarioPicker
+from earth_system_grid import grid_field, GRID_RESOLUTION
 
 DATA_DIR = "data"
 if not os.path.exists(DATA_DIR):
@@ -105,6 +108,11 @@ def run_scenario(scenario, status_callback=None):
     if '[TO-FETCH]' in scenario.get('briefing', ''):
         scenario['briefing'] = scenario['briefing'].replace('[TO-FETCH]', f"{max(values):.1f}")
 
+    # Interpolate once; the contour overlay and the teaser share the field.
+    # Scenarios may set 'overlay_resolution' (grid nodes per axis).
+    field = grid_field(lats, lons, values,
+                       scenario.get('overlay_resolution', GRID_RESOLUTION))
+
     # 2. GENERATE LEGEND AND INTEL CARDS
     if status_callback:
         status_callback("Generating Intel Cards...")
@@ -121,7 +129,8 @@ def run_scenario(scenario, status_callback=None):
                                         thresholds, intel_path, legend_risk_path,
                                         pin_stations=scenario.get('pin_stations'),
                                         name=name, briefing=scenario.get('briefing', ''))
-    heat_filename = build_heatmap_kml(scenario_id, date, lats, lons, values, thresholds)
+    heat_filename = build_heatmap_kml(scenario_id, date, lats, lons, values, thresholds,
+                                      field=field)
     impact_filename = build_impact_kml(scenario_id, date, scenario.get('populations', []),
                                         None, thresholds)
 
@@ -131,7 +140,8 @@ def run_scenario(scenario, status_callback=None):
                            briefing=scenario.get('briefing', ''), 
                            description=scenario.get('description', ''),
                            mobile_briefing=scenario.get('mobile_briefing', ''),
-                           encyclopedia=scenario.get('encyclopedia', ''))    
+                           encyclopedia=scenario.get('encyclopedia', ''),
+                           field=field)
 
     # 5. PACKAGE KMZ
     img_path = os.path.join(DATA_DIR, f"{date}_heatmap_{scenario_id}.png")
@@ -256,11 +266,15 @@ def build_spikes_kml(scenario_id, date, lats, lons, values, thresholds,
     return spikes_filename
 
 
-def build_heatmap_kml(scenario_id, date, lats, lons, values, thresholds):
-    """Builds the ground overlay heatmap KML layer with contour PNG."""
-    # Generate contour PNG
-    grid_x, grid_y = np.mgrid[min(lons):max(lons):100j, min(lats):max(lats):100j]
-    grid_z = griddata((lons, lats), values, (grid_x, grid_y), method='linear')
+def build_heatmap_kml(scenario_id, date, lats, lons, values, thresholds, field=None):
+    """Builds the ground overlay heatmap KML layer with contour PNG.
+
+    field is the scenario's GriddedField (earth_system_grid); it is built
+    here at the default resolution when not passed in.
+    """
+    if field is None:
+        field = grid_field(lats, lons, values)
+    grid_x, grid_y, grid_z = field.grid_x, field.grid_y, field.grid_z
 
     img_name = f"{date}_heatmap_{scenario_id}.png"
     img_path = os.path.join(DATA_DIR, img_name)
@@ -287,10 +301,11 @@ def build_heatmap_kml(scenario_id, date, lats, lons, values, thresholds):
     kml_heat.document.name = f"{scenario_id} Heatmap ({date})"
     ground = kml_heat.newgroundoverlay(name="Thermal Overlay")
     ground.icon.href = img_name
-    ground.latlonbox.north = max(lats)
-    ground.latlonbox.south = min(lats)
-    ground.latlonbox.east = max(lons)
-    ground.latlonbox.west = min(lons)
+    south, north, west, east = field.bounds
+    ground.latlonbox.north = north
+    ground.latlonbox.south = south
+    ground.latlonbox.east = east
+    ground.latlonbox.west = west
 
     heat_filename = os.path.join(DATA_DIR, f"{date}_heatmap_{scenario_id}.kml")
     kml_heat.save(heat_filename)
@@ -353,15 +368,18 @@ def build_impact_kml(scenario_id, date, populations, legend_pop_path, thresholds
 
 def generate_plotly_teaser(scenario_id, title, lats, lons, values, output_dir,
                            thresholds, briefing="", description="",
-                           mobile_briefing="", encyclopedia=""):    
+                           mobile_briefing="", encyclopedia="", field=None):
     """Generates the fast-loading 2D Plotly Teaser for Web Gallery use.
     
     Colorscale, value range, and colorbar title are driven by thresholds config.
+    field, when given, is the GriddedField run_scenario built for the
+    overlay; its peak and center are reused here.
     """
     print("Building Plotly Teaser...")
 
     if briefing and values:
-        briefing = briefing.replace('[TO-FETCH]', f"{max(values):.1f}")
+        peak = field.peak if field is not None else max(values)
+        briefing = briefing.replace('[TO-FETCH]', f"{peak:.1f}")
 
     colorscale = thresholds.get('colorscale', 'YlOrRd')
     cmin = thresholds.get('cmin', 0)
@@ -445,8 +463,11 @@ def generate_plotly_teaser(scenario_id, title, lats, lons, values, output_dir,
             hoverinfo='text'
         ))
 
-    center_lat = sum(lats) / len(lats) if lats else 0
-    center_lon = sum(lons) / len(lons) if lons else 0
+    if field is not None:
+        center_lat, center_lon = field.center
+    else:
+        center_lat = sum(lats) / len(lats) if lats else 0
+        center_lon = sum(lons) / len(lons) if lons else 0
 
     # Build briefing annotation for bottom-left of map
     annotations = []
@@ -0,0 +1,132 @@
+"""
+earth_system_grid.py - Shared gridding stage for the Earth System engine.
+
+build_heatmap_kml ran scipy.griddata on a fixed 100 x 100 grid for every
+scenario: a fresh Delaunay triangulation of the point cloud, a fresh
+point-location of all 10,000 grid nodes, then the interpolation itself.
+Scenario series repeat their point sets -- the Western Heat Dome
+snapshots share three synthetic grids across nine dates, ERA5 days of
+the same box share a grid -- so most of that work was repeated.
+
+grid_field() builds one GriddedField per scenario, at a configurable
+resolution, and run_scenario hands it to both the PNG contour overlay and
+the Plotly teaser. For each distinct (point set, resolution) it keeps:
+
+    - the Delaunay triangulation of the points
+    - for every grid node, its containing simplex and barycentric weights
+
+so a repeated point set is interpolated by one gather and weighted sum
+(exactly griddata's piecewise-linear result, NaN outside the hull).
+Point sets are recognised by a digest of their coordinates; the last
+CACHE_SIZE are kept.
+
+Key classes:
+    GriddedField - point cloud plus its interpolated grid
+
+Key functions:
+    grid_field() - interpolate a scenario's point cloud onto its grid
+
+Consumed by: earth_system_generator.py (run_scenario, build_heatmap_kml,
+             generate_plotly_teaser)
+
+Role: computation
+Domain: earth_science
+
+Module created: October 2026
+"""
+
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+from scipy.spatial import Delaunay
+
+GRID_RESOLUTION = 100      # nodes per axis, as the fixed 100j mgrid used
+CACHE_SIZE = 8
+
+_interpolators = OrderedDict()
+
+
+@dataclass
+class GriddedField:
+    """A scenario's point cloud and its interpolation onto a regular grid."""
+    lats: np.ndarray
+    lons: np.ndarray
+    values: np.ndarray
+    grid_x: np.ndarray       # lon, shape (resolution, resolution), np.mgrid order
+    grid_y: np.ndarray       # lat
+    grid_z: np.ndarray       # NaN outside the convex hull of the points
+
+    @property
+    def bounds(self):
+        """(south, north, west, east) of the point cloud."""
+        return (float(self.lats.min()), float(self.lats.max()),
+                float(self.lons.min()), float(self.lons.max()))
+
+    @property
+    def center(self):
+        """Mean (lat, lon) of the points."""
+        return float(self.lats.mean()), float(self.lons.mean())
+
+    @property
+    def peak(self):
+        return float(np.nanmax(self.values))
+
+
+class _Interpolator:
+    """Triangulation plus per-node simplex vertices and barycentric weights."""
+
+    def __init__(self, points, grid_x, grid_y):
+        self.tri = Delaunay(points)
+        nodes = np.column_stack([grid_x.ravel(), grid_y.ravel()])
+        simplex = self.tri.find_simplex(nodes)
+        self.outside = simplex < 0
+        transform = self.tri.transform[simplex]
+        b = np.einsum('nij,nj->ni', transform[:, :2], nodes - transform[:, 2])
+        self.weights = np.column_stack([b, 1.0 - b.sum(axis=1)])
+        self.vertices = self.tri.simplices[simplex]
+        self.shape = grid_x.shape
+
+    def __call__(self, values):
+        z = np.einsum('ni,ni->n', values[self.vertices], self.weights)
+        z[self.outside] = np.nan
+        return z.reshape(self.shape)
+
+
+def _digest(lons, lats, resolution):
+    h = hashlib.sha1()
+    h.update(np.ascontiguousarray(lons).tobytes())
+    h.update(np.ascontiguousarray(lats).tobytes())
+    h.update(str(resolution).encode())
+    return h.hexdigest()
+
+
+def _grid(lons, lats, resolution):
+    n = complex(0, resolution)
+    return np.mgrid[lons.min():lons.max():n, lats.min():lats.max():n]
+
+
+def grid_field(lats, lons, values, resolution=GRID_RESOLUTION):
+    """
+    Interpolate a point cloud linearly onto a resolution x resolution grid.
+
+    The triangulation and node weights are reused for any point set seen
+    among the last CACHE_SIZE calls.
+    """
+    lats = np.asarray(lats, dtype=float)
+    lons = np.asarray(lons, dtype=float)
+    values = np.asarray(values, dtype=float)
+    grid_x, grid_y = _grid(lons, lats, resolution)
+
+    key = _digest(lons, lats, resolution)
+    interpolator = _interpolators.get(key)
+    if interpolator is None:
+        interpolator = _Interpolator(np.column_stack([lons, lats]), grid_x, grid_y)
+        _interpolators[key] = interpolator
+        while len(_interpolators) > CACHE_SIZE:
+            _interpolators.popitem(last=False)
+    else:
+        _interpolators.move_to_end(key)
+
+    return GriddedField(lats, lons, values, grid_x, grid_y, interpolator(values))
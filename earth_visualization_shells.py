@@ -42,6 +42,7 @@ May 28, 2026: Phase 1 re-pipe (Opus 4.7). 1 live inline info marker
     marked them acceptable.
 """
 import numpy as np
+import render_lod
 import math
 import plotly.graph_objs as go
 from planet_visualization_utilities import (EARTH_RADIUS_AU, create_sphere_points, create_magnetosphere_shape, create_bow_shock_shape)
@@ -368,7 +369,7 @@ def create_earth_crust_shell(center_position=(0, 0, 0)):
     center_x, center_y, center_z = center_position
     
     # Create mesh with reasonable resolution for performance
-    resolution = 24  # Reduced from typical 50 for markers
+    resolution = render_lod.linear(24)  # Reduced from typical 50 for markers
     
     # Create a UV sphere
     phi = np.linspace(0, 2*np.pi, resolution)
@@ -455,7 +456,7 @@ def create_earth_crust_shell(center_position=(0, 0, 0)):
         return points
     
     # Generate fibonacci sphere points
-    fib_points = fibonacci_sphere(samples=50)  # Originally, 50 hover points evenly distributed
+    fib_points = fibonacci_sphere(samples=render_lod.count(50))  # Originally, 50 hover points evenly distributed
     
     # Scale and offset the points
     x_hover = [p[0] * radius + center_x for p in fib_points]
@@ -9,12 +9,13 @@ Data Preservation is Climate Action
 
 Role: computation
 Domain: earth_science
+
+Module updated: October 2026 (data loaders served by climate_datasets)
 """
 
-import json
-import os
 import numpy as np
-import pandas as pd
+
+from climate_datasets import GISS_FILE as GISS_TEMP_FILE, OHC_FILE, load_dataset
 
 try:
     import plotly.graph_objects as go
@@ -30,10 +31,6 @@ try:
 except ImportError:
     SAVE_UTILS_AVAILABLE = False
 
-# Data files
-DATA_DIR = 'data'
-GISS_TEMP_FILE = os.path.join(DATA_DIR, 'temperature_giss_monthly.json')
-OHC_FILE = os.path.join(DATA_DIR, 'ohc2000m_levitus_climdash_seasonal.csv')
 
 def load_ocean_heat_content():
     """
@@ -43,18 +40,16 @@ def load_ocean_heat_content():
         tuple: (decimal_years, ohc_anomaly_zj, imbalance_watts_per_m2)
     """
     try:
-        # Load CSV (no header, format: YYYY-M,value)
-        df = pd.read_csv(OHC_FILE, header=None, names=['date', 'ohc'])
-        
-        # Parse date
-        df['year'] = df['date'].str.split('-').str[0].astype(int)
-        df['month'] = df['date'].str.split('-').str[1].astype(int)
-        df['decimal_year'] = df['year'] + (df['month'] - 1) / 12.0
+        ohc = load_dataset('ohc')
+        if ohc is None:
+            raise FileNotFoundError(f"No such file: {OHC_FILE}")
+        decimal_year = ohc['decimal_year']
+        ohc_zj = ohc['ohc']
         
         # OHC is in units of 10^22 Joules (Zettajoules)
         # Calculate rate of change for energy imbalance
         # Using gradient (centered difference)
-        ohc_rate_zj_per_year = np.gradient(df['ohc'].values, df['decimal_year'].values)
+        ohc_rate_zj_per_year = np.gradient(ohc_zj, decimal_year)
         
         # Convert to W/m^2
         # 1 ZJ = 10^22 J
@@ -68,38 +63,19 @@ def load_ocean_heat_content():
         watts = ohc_rate_zj_per_year * zj_to_joules / seconds_per_year
         imbalance_w_per_m2 = watts / earth_surface_m2
         
-        return df['decimal_year'].values, df['ohc'].values, imbalance_w_per_m2
+        return decimal_year, ohc_zj, imbalance_w_per_m2
         
     except Exception as e:
         print(f"Warning: Could not load ocean heat content data: {e}")
         return None, None, None
 
 def load_modern_temperature_data():
-    """Load NASA GISS instrumental temperature data (1880-2025)"""
+    """Load NASA GISS instrumental temperature data (1880-2025) as annual means"""
     try:
-        with open(GISS_TEMP_FILE, 'r') as f:
-            data = json.load(f)
-        
-        records = data['data']
-        
-        # Convert to arrays and get annual averages
-        years = []
-        temps = []
-        
-        for record in records:
-            year = record['year']
-            
-            if year not in years:
-                years.append(year)
-                # Get all months for this year that have valid data
-                year_temps = [r['anomaly_c'] for r in records 
-                             if r['year'] == year and r['anomaly_c'] is not None]
-                if year_temps:
-                    temps.append(np.mean(year_temps))
-                else:
-                    years.pop()
-        
-        return np.array(years), np.array(temps)
+        giss = load_dataset('giss')
+        if giss is None:
+            raise FileNotFoundError(f"No such file: {GISS_TEMP_FILE}")
+        return giss['annual_year'], giss['annual_mean']
         
     except Exception as e:
         print(f"Warning: Could not load modern temperature data: {e}")
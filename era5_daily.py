@@ -0,0 +1,279 @@
+"""
+era5_daily.py - Lazy ERA5 NetCDF reader and compact per-day heat products.
+
+The Western Heat Dome snapshots (scenarios_western_heatwave_march_2026)
+used to read each hourly era5_raw_<date>.nc and its 30-year
+era5_clim_march_dayNN.nc whole into memory, reduce them to a daily-max
+anomaly, and keep only a CSV of (lat, lon, anomaly_f) rows. A changed grid
+extent, a refreshed ERA5T file or any new derived field meant reading the
+full climatology again. This module:
+
+    - opens the NetCDF files lazily and reads only the scenario bounding
+      box and the hours asked for
+    - reduces the climatology one year (24 hourly steps) at a time, so
+      memory holds one bounding-box slab, never the whole 30-year cube
+    - computes daily-max 2 m temperature and, when the file carries
+      2 m dewpoint (d2m), daily-max wet-bulb temperature (Stull 2011 on
+      Magnus relative humidity), each with its anomaly
+    - writes the results as compact float32 .npz products under
+      data/era5_daily/: one per climatology file and box (reused by any
+      event day with that day-of-month and box) and one per event day
+
+A product records the size and mtime of the NetCDF files it came from and
+is rebuilt when they change; it is trusted as-is when they are gone (the
+raw downloads are large and may be cleaned up). Products are memoized for
+the session and their arrays are read-only.
+
+Key functions:
+    bbox_window() - index slices of a lat/lon box in a grid
+    daily_max_fields() - daily max T (and wet-bulb) of one day, lazily sliced
+    climatology_fields() - mean daily max over the years of a climatology file
+    daily_product() - load or build the per-day product for a snapshot
+
+Consumed by: scenarios_western_heatwave_march_2026.py
+
+Role: cache
+Domain: earth_science
+
+Module created: October 2026
+"""
+
+import json
+import logging
+import os
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+PRODUCT_VERSION = 1
+PRODUCT_DIR = 'era5_daily'
+STEPS_PER_DAY = 24
+
+_memo: Dict[str, tuple] = {}   # path -> (manifest, arrays)
+
+
+# ============================================================
+# Lazy reads
+# ============================================================
+
+def bbox_window(lats, lons, lat_range, lon_range):
+    """
+    (lat_slice, lon_slice) of the grid cells inside the box.
+
+    Works for ERA5's descending latitudes as well as ascending ones.
+    """
+    lats = np.asarray(lats, dtype=float)
+    lons = np.asarray(lons, dtype=float)
+    lat_idx = np.nonzero((lats >= min(lat_range)) & (lats <= max(lat_range)))[0]
+    lon_idx = np.nonzero((lons >= min(lon_range)) & (lons <= max(lon_range)))[0]
+    if not len(lat_idx) or not len(lon_idx):
+        raise ValueError(f"box {lat_range} x {lon_range} is outside the grid")
+    return (slice(int(lat_idx[0]), int(lat_idx[-1]) + 1),
+            slice(int(lon_idx[0]), int(lon_idx[-1]) + 1))
+
+
+def _steps(t0, hours):
+    if hours is None:
+        return slice(t0, t0 + STEPS_PER_DAY)
+    return [t0 + h for h in hours]
+
+
+def _read(var, steps, window):
+    """One hyperslab as float, masked/fill values as NaN."""
+    block = var[steps, window[0], window[1]]
+    return np.ma.filled(np.ma.asarray(block, dtype=float), np.nan)
+
+
+def wet_bulb_c(t2m_k, d2m_k):
+    """Wet-bulb temperature (deg C) from 2 m temperature and dewpoint (K)."""
+    t = np.asarray(t2m_k, dtype=float) - 273.15
+    td = np.asarray(d2m_k, dtype=float) - 273.15
+    rh = 100.0 * np.exp(17.625 * td / (243.04 + td) - 17.625 * t / (243.04 + t))
+    rh = np.clip(rh, 1.0, 100.0)
+    return (t * np.arctan(0.151977 * np.sqrt(rh + 8.313659))
+            + np.arctan(t + rh) - np.arctan(rh - 1.676331)
+            + 0.00391838 * rh ** 1.5 * np.arctan(0.023101 * rh)
+            - 4.686035)
+
+
+def daily_max_fields(variables, window, t0=0, hours: Optional[Sequence[int]] = None):
+    """
+    Daily max of one day starting at time step t0.
+
+    variables maps NetCDF variable names to lazily sliceable arrays
+    (netCDF4 variables or NumPy arrays). Returns {'tmax_k'} plus
+    'wetbulb_max_c' when 'd2m' is present.
+    """
+    steps = _steps(t0, hours)
+    t2m = _read(variables['t2m'], steps, window)
+    fields = {'tmax_k': np.nanmax(t2m, axis=0)}
+    if 'd2m' in variables:
+        d2m = _read(variables['d2m'], steps, window)
+        fields['wetbulb_max_c'] = np.nanmax(wet_bulb_c(t2m, d2m), axis=0)
+    return fields
+
+
+def climatology_fields(variables, window, hours: Optional[Sequence[int]] = None):
+    """
+    Mean over years of the daily max, reading one year's day at a time.
+
+    The climatology file holds STEPS_PER_DAY hourly steps per year, years
+    in order (the layout the CDS request produces).
+    """
+    n_years = variables['t2m'].shape[0] // STEPS_PER_DAY
+    if n_years == 0:
+        raise ValueError("climatology holds less than one day")
+    totals = None
+    for year in range(n_years):
+        day = daily_max_fields(variables, window, year * STEPS_PER_DAY, hours)
+        if totals is None:
+            totals = {k: np.zeros_like(v) for k, v in day.items()}
+        for k, v in day.items():
+            totals[k] += v
+    return {'clim_' + k: v / n_years for k, v in totals.items()}, n_years
+
+
+def _open(path):
+    import netCDF4
+    return netCDF4.Dataset(path, 'r')
+
+
+def _grid(ds):
+    return np.asarray(ds.variables['latitude'][:], float), np.asarray(ds.variables['longitude'][:], float)
+
+
+# ============================================================
+# Products
+# ============================================================
+
+def _tag(lat_range, lon_range):
+    return (f"{min(lat_range):+06.1f}_{max(lat_range):+06.1f}_"
+            f"{min(lon_range):+07.1f}_{max(lon_range):+07.1f}")
+
+
+def product_path(data_dir, name, lat_range, lon_range):
+    return os.path.join(data_dir, PRODUCT_DIR, f"{name}_{_tag(lat_range, lon_range)}.npz")
+
+
+def _signature(paths):
+    sig = {}
+    for path in paths:
+        st = os.stat(path)
+        sig[os.path.basename(path)] = [st.st_size, st.st_mtime_ns]
+    return sig
+
+
+def _current(manifest, sources, hours):
+    """A product built with these hours from these sources, as they are now.
+
+    Each source still on disk must match its own manifest entry; only
+    sources that are gone (raw downloads cleaned up) are waived.
+    """
+    if manifest.get('version') != PRODUCT_VERSION or manifest.get('hours') != hours:
+        return False
+    recorded = manifest.get('sources') or {}
+    present = [p for p in sources if os.path.exists(p)]
+    return all(recorded.get(name) == sig for name, sig in _signature(present).items())
+
+
+def _load(path, sources, hours):
+    """Product arrays, or None if absent, unreadable, or built from other sources."""
+    if path in _memo:
+        manifest, fields = _memo[path]
+        return fields if _current(manifest, sources, hours) else None
+    try:
+        with np.load(path, allow_pickle=False) as npz:
+            manifest = json.loads(str(npz['manifest']))
+            fields = {k: npz[k] for k in npz.files if k != 'manifest'}
+    except (OSError, ValueError, KeyError) as e:
+        if os.path.exists(path):
+            logger.warning(f"ERA5 product {path} unreadable ({e}); rebuilding")
+        return None
+    if not _current(manifest, sources, hours):
+        return None
+    return _keep(path, manifest, fields)
+
+
+def _keep(path, manifest, fields):
+    for array in fields.values():
+        array.flags.writeable = False
+    _memo[path] = (manifest, fields)
+    return fields
+
+
+def _save(path, fields, sources, hours):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    manifest = {'version': PRODUCT_VERSION, 'sources': _signature(sources), 'hours': hours}
+    arrays = {k: np.asarray(v, dtype=np.float32) for k, v in fields.items()}
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        np.savez(f, manifest=np.array(json.dumps(manifest)), **arrays)
+    os.replace(tmp, path)
+    return _keep(path, manifest, arrays)
+
+
+def climatology_product(clim_nc, lat_range, lon_range, data_dir, hours=None):
+    """Mean daily-max fields of a climatology file over a box (built once)."""
+    name = os.path.splitext(os.path.basename(clim_nc))[0]
+    path = product_path(data_dir, name, lat_range, lon_range)
+    hours = None if hours is None else list(hours)
+    fields = _load(path, [clim_nc], hours)
+    if fields is not None or not os.path.exists(clim_nc):
+        return fields
+    ds = _open(clim_nc)
+    try:
+        lats, lons = _grid(ds)
+        window = bbox_window(lats, lons, lat_range, lon_range)
+        fields, n_years = climatology_fields(ds.variables, window, hours)
+    finally:
+        ds.close()
+    logger.info(f"ERA5 climatology reduced: {name}, {n_years} years")
+    return _save(path, fields, [clim_nc], hours)
+
+
+def daily_product(date_str, event_nc, clim_nc, lat_range, lon_range, data_dir, hours=None):
+    """
+    Per-day product for a snapshot: lat, lon (1-D), tmax_k, anomaly_f and,
+    with dewpoint, wetbulb_max_c and wetbulb_anomaly_c.
+
+    Loaded from data/era5_daily/ when current, otherwise built from the
+    raw NetCDF files. None when neither is available (or netCDF4 is not
+    installed and no product exists).
+    """
+    path = product_path(data_dir, f"era5_western_{date_str}", lat_range, lon_range)
+    hours = None if hours is None else list(hours)
+    fields = _load(path, [event_nc, clim_nc], hours)
+    if fields is not None:
+        return fields
+    if not (os.path.exists(event_nc) and os.path.exists(clim_nc)):
+        return None
+    try:
+        clim = climatology_product(clim_nc, lat_range, lon_range, data_dir, hours)
+        ds = _open(event_nc)
+    except ImportError as e:
+        logger.warning(f"ERA5 product for {date_str} not built (missing package: {e})")
+        return None
+    try:
+        lats, lons = _grid(ds)
+        window = bbox_window(lats, lons, lat_range, lon_range)
+        day = daily_max_fields(ds.variables, window, 0, hours)
+    finally:
+        ds.close()
+
+    fields = {'lat': lats[window[0]], 'lon': lons[window[1]], 'tmax_k': day['tmax_k'],
+              # Kelvin difference -> Fahrenheit; only heat matters here
+              'anomaly_f': np.clip((day['tmax_k'] - clim['clim_tmax_k']) * 9.0 / 5.0, 0, None)}
+    if 'wetbulb_max_c' in day and 'clim_wetbulb_max_c' in clim:
+        fields['wetbulb_max_c'] = day['wetbulb_max_c']
+        fields['wetbulb_anomaly_c'] = day['wetbulb_max_c'] - clim['clim_wetbulb_max_c']
+    return _save(path, fields, [event_nc, clim_nc], hours)
+
+
+def point_cloud(fields, key='anomaly_f'):
+    """(lats, lons, values) lists in lat-major order: the engine's contract."""
+    lon_grid, lat_grid = np.meshgrid(fields['lon'], fields['lat'])
+    return (lat_grid.ravel().astype(float).tolist(),
+            lon_grid.ravel().astype(float).tolist(),
+            np.asarray(fields[key], dtype=float).ravel().tolist())
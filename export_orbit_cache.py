@@ -30,9 +30,14 @@ Commands:
   #    bare run can never overwrite the live gallery data by accident.
   python export_orbit_cache.py --output-dir ../tonyquintanilla.github.io/data/solar-system/
 
-  # 4. (follow-on) Export the whole catalog, not just the 9-object tranche.
-  #    Tranche-scoped in this build -- prints a notice and exports the tranche.
-  python export_orbit_cache.py --full-catalog
+  # 4. Binary position files: quantized, delta-encoded, error-bounded
+  #    decimation, plus positions/manifest.json -- the small gallery payload.
+  python export_orbit_cache.py --format binary
+
+  # 5. Export the whole catalog, not just the tranche: every other
+  #    orbit_paths.json pair goes to positions/catalog/ and the manifest (the
+  #    coverage index stays tranche-scoped).
+  python export_orbit_cache.py --format binary --full-catalog
 
 Flags:
   --output-dir <path>   where files are written (default: ./_export_out -- a
@@ -40,7 +45,10 @@ Flags:
                         Pass the gallery data path explicitly, as in (3), to
                         deploy. The default NEVER writes to the gallery.)
   --preflight-only      run Step 0 diagnostics + Step 0-STOP, then stop
-  --full-catalog        follow-on; tranche-scoped for now
+  --full-catalog        also export every other cache pair (see 5)
+  --format json|binary  position file format (default: json, as before)
+  --max-error-km <km>   binary error budget (default: DEFAULT_ERROR_FRACTION
+                        of each trace's max |r|)
 
 Operational order (the double-helix loop): (1) --preflight-only and read it;
 (2) export to the scratch default and INSPECT (positions/*.json km+JD, the
@@ -78,6 +86,10 @@ OUTPUT STRUCTURE (schema aligned to PHASE1B_DATA_SERVING_DESIGN_HANDOFF v0.6)
   coverage_index.json
   feature_configs.json
   positions/<slug>.json      one per object with a served trace
+  positions/<slug>.bin       the same, with --format binary
+  positions/catalog/*        --full-catalog: every other cache pair
+  positions/manifest.json    --format binary or --full-catalog: layout and
+                             one entry per position file
   presets/<slug>.json        (none in this tranche -- Apophis 2029 data absent)
 
 coverage_index.json (top level):
@@ -111,7 +123,9 @@ coverage_index objects.<slug>:
   osculating       obj|null        {center, epoch_jd, a_au, e, i_deg, node_deg,
                                    peri_deg, M0_deg, source}; null for spacecraft
   positions        obj|null        {file, start, end, step_hours, n_points,
-                                   size_kb}; null when no trace is served
+                                   size_kb}; null when no trace is served.
+                                   Binary adds format, source_points,
+                                   max_error_km
   presets          [obj]|null      self-contained Tier-2 sets; null in tranche
   features         [str]|null      visual-feature slugs (params in feature_configs)
 
@@ -123,6 +137,15 @@ position file <slug>.json (column-oriented, self-documenting):
   source {query_target, center, epoch, retrieved},
   data  {t:[JD...], x:[km...], y:[km...], z:[km...]}
 
+position file <slug>.bin (format 'opos1', little-endian; see the Binary
+position files section for the exact layout):
+  40-byte header {magic, version, n, source points, t0 JD, quantum km,
+  max error km}, then int32 columns t, x, y, z, each delta-encoded fixed
+  point (seconds from t0; km / quantum). Points are decimated so linear
+  interpolation in time stays within max_error_km of every cached point.
+  The manifest entry carries the same fields plus object, center, frame,
+  source, size_bytes and the measured error.
+
 preset object (documented; none emitted this tranche):
   {name, slug, description, tier, positions:{...positions..., center,
    canonical_frame}} -- built from close_approach_data.py when data exists.
@@ -149,6 +172,9 @@ Key functions:
     run_export()             - Steps 1-6: osculating + position files + index
     build_osculating_entry() - Step 4: elements -> coverage-index osculating block
     write_position_file()    - Step 3: a direct relative pair -> a position file
+    encode_positions()       - decimate + quantize + delta-encode a trace
+    decode_positions()       - the reference decoder for .bin files
+    export_catalog()         - --full-catalog position files
     resolve_center_slug()    - Horizons center (@id or name) -> schema slug
 
 Consumed by: Tony's desktop (manual run); output copied to
@@ -165,6 +191,10 @@ design handoff v0.6; subtraction path retired).
 Module updated: July 2026 with Anthropic's Claude Opus 5 (L-163 Phase 3:
 corrected stale 'add a ROLE_MAP entry' step -- roles are docstring tags now).
 
+Module updated: October 2026 (binary position files with error-bounded
+decimation and a manifest; vectorized km/JD conversion; --full-catalog
+exports every cache pair).
+
 Role: devtool
 Domain: dev_tools
 """
@@ -173,12 +203,16 @@ import argparse
 import json
 import math
 import os
+import re
+import struct
 import sys
 from collections import namedtuple
 from datetime import datetime, timezone
 from pathlib import Path
 from statistics import median
 
+import numpy as np
+
 # Authoritative constants from the codebase (NOT recalled).
 from constants_new import KM_PER_AU, KNOWN_ORBITAL_PERIODS
 
@@ -475,33 +509,39 @@ def build_osculating_entry(osc_cache, obj, warn):
 # ---------------------------------------------------------------------------
 # Step 3: write a position file from a DIRECT relative pair (no subtraction)
 # ---------------------------------------------------------------------------
-def write_position_file(cache, obj, out_dir, warn):
-    entry = cache.get(obj.position_pair_key)
+def _track_arrays(dp, dates):
+    """Sorted date keys -> (JD array, (n, 3) km array), without a per-point loop.
+
+    numpy parses both cache key formats ('YYYY-MM-DD', 'YYYY-MM-DD HH:MM[:SS]')
+    to whole seconds; the JD arithmetic matches _dt_to_jd, so the values are
+    identical to the per-point conversion this replaced.
+    """
+    try:
+        secs = (np.array(dates, dtype='datetime64[s]')
+                - np.datetime64('1970-01-01T00:00:00', 's')).astype(np.int64)
+        t = 2440587.5 + secs / 86400.0
+    except ValueError:
+        t = np.array([_dt_to_jd(_parse_calendar(d)) for d in dates])
+    xyz = np.array([(p['x'], p['y'], p['z']) for p in map(dp.get, dates)],
+                   dtype=float) * KM_PER_AU
+    return t, xyz
+
+
+def _read_track(cache, pair_key, slug, frame, warn):
+    """A cache pair -> (dates, metadata, t, xyz) or None (missing/empty/contaminated)."""
+    entry = cache.get(pair_key)
     if not entry:
-        warn("position pair %r missing for %s -> positions:null"
-             % (obj.position_pair_key, obj.slug))
+        warn("position pair %r missing for %s -> positions:null" % (pair_key, slug))
         return None
     dp = entry.get('data_points', {})
     dates = sorted(dp.keys())
     if not dates:
-        warn("position pair %r empty for %s" % (obj.position_pair_key, obj.slug))
+        warn("position pair %r empty for %s" % (pair_key, slug))
         return None
 
     md = entry.get('metadata', {})
-    mcb = md.get('center_body')  # informational only -- unreliable label (many
-                                 # writer paths default to 'Sun'); NOT trusted
-                                 # for the frame check (see the guard below).
-
-    t, xs, ys, zs = [], [], [], []
-    max_r_km = 0.0
-    for d in dates:
-        p = dp[d]
-        t.append(_dt_to_jd(_parse_calendar(d)))
-        x, y, z = p['x'] * KM_PER_AU, p['y'] * KM_PER_AU, p['z'] * KM_PER_AU
-        xs.append(x); ys.append(y); zs.append(z)
-        r = (x * x + y * y + z * z) ** 0.5
-        if r > max_r_km:
-            max_r_km = r
+    t, xyz = _track_arrays(dp, dates)
+    max_r_km = float(np.sqrt((xyz * xyz).sum(axis=1)).max())
 
     # Frame-contamination guard (replaces the center_body-string check, which
     # false-alarmed on stale labels AND missed real contamination). A parent-
@@ -513,18 +553,65 @@ def write_position_file(cache, obj, out_dir, warn):
     # heliocentric radius (>= the system's AU distance). If tripped, drop the
     # whole trace to osculating-only -- a half-contaminated trace renders as a
     # broken orbit; the osculating conic renders clean. Repair the cache source.
-    if obj.canonical_frame not in ('heliocentric', 'arc-natural'):
+    if frame not in (None, 'heliocentric', 'arc-natural'):
         max_r_au = max_r_km / KM_PER_AU
         if max_r_au > 0.5:
             warn("%s: FRAME CONTAMINATION -- %s trace reaches %.2f AU "
                  "(heliocentric-scale) in pair %r; the cache pair mixes frames. "
                  "Trace DROPPED to osculating-only. Repair the cache source."
-                 % (obj.slug, obj.canonical_frame, max_r_au, obj.position_pair_key))
+                 % (slug, frame, max_r_au, pair_key))
             return None
+    return dates, md, t, xyz
+
+
+def _step_hours(t):
+    if len(t) < 2:
+        return None
+    return int(round(float(np.median(np.diff(t))) * 24))
+
 
+def write_position_file(cache, obj, out_dir, warn, fmt='json', max_error_km=None,
+                        manifest=None):
+    """Write obj's trace as positions/<slug>.json, or .bin with fmt='binary'.
+
+    Binary files are also entered in manifest (a dict of manifest entries).
+    Returns the coverage-index positions block, or None when no trace is served.
+    """
+    track = _read_track(cache, obj.position_pair_key, obj.slug, obj.canonical_frame, warn)
+    if track is None:
+        return None
+    dates, md, t, xyz = track
     start, end = dates[0][:10], dates[-1][:10]
-    spacing = _median_spacing_days(dates)
-    step_hours = int(round(spacing * 24)) if spacing is not None else None
+    source = {
+        'query_target': md.get('horizons_id'),
+        'center': md.get('center_body'),   # informational only -- unreliable
+                                           # label (many writer paths default
+                                           # to 'Sun'); NOT trusted for the
+                                           # frame check (see _read_track).
+        'epoch': "%s to %s" % (start, end),
+        'retrieved': md.get('last_updated'),
+    }
+    (out_dir / 'positions').mkdir(parents=True, exist_ok=True)
+
+    if fmt == 'binary':
+        try:
+            entry = write_binary_positions(out_dir, obj.slug, obj.stored_center,
+                                           obj.canonical_frame, source, t, xyz, max_error_km)
+        except ValueError as exc:
+            warn("%s: %s -- positions not served" % (obj.slug, exc))
+            return None
+        if manifest is not None:
+            manifest[obj.slug] = entry
+        return {
+            'file': entry['file'],
+            'format': BINARY_FORMAT,
+            'start': start, 'end': end,
+            'step_hours': _step_hours(t),
+            'n_points': entry['n_points'],
+            'source_points': entry['source_points'],
+            'max_error_km': entry['max_error_km'],
+            'size_kb': int(round(entry['size_bytes'] / 1024.0)),
+        }
 
     payload = {
         'object': obj.slug,
@@ -532,28 +619,249 @@ def write_position_file(cache, obj, out_dir, warn):
         'frame': obj.canonical_frame,
         'unit': 'km',
         'epoch_type': 'JD',
-        'source': {
-            'query_target': md.get('horizons_id'),
-            'center': mcb,
-            'epoch': "%s to %s" % (start, end),
-            'retrieved': md.get('last_updated'),
-        },
-        'data': {'t': t, 'x': xs, 'y': ys, 'z': zs},
+        'source': source,
+        'data': {'t': t.tolist(), 'x': xyz[:, 0].tolist(),
+                 'y': xyz[:, 1].tolist(), 'z': xyz[:, 2].tolist()},
     }
-    (out_dir / 'positions').mkdir(parents=True, exist_ok=True)
     path = out_dir / 'positions' / ("%s.json" % obj.slug)
     with open(path, 'w') as fh:
-        json.dump(payload, fh)
+        fh.write(json.dumps(payload))
     size_kb = int(round(os.path.getsize(path) / 1024.0))
     return {
         'file': "positions/%s.json" % obj.slug,
         'start': start, 'end': end,
-        'step_hours': step_hours,
+        'step_hours': _step_hours(t),
         'n_points': len(t),
         'size_kb': size_kb,
     }
 
 
+# ---------------------------------------------------------------------------
+# Binary position files (--format binary)
+# ---------------------------------------------------------------------------
+# A gallery payload that parses with four typed-array views instead of a JSON
+# float parse. Layout (little-endian), BINARY_HEADER then four int32 columns
+# of n values each, in the order t, x, y, z:
+#   header  magic 'OPOS', u16 version, u16 reserved, u32 n, u32 source points,
+#           f64 t0 (JD), f64 quantum (km), f64 max error (km)   -- 40 bytes
+#   t       seconds since t0, delta-encoded (first value 0)
+#   x y z   round(km / quantum), delta-encoded (first value absolute)
+# Decoding is a running sum per column (times TIME_QUANTUM_S, quantum).
+# Points are first thinned by time-parametric Douglas-Peucker: a dropped point
+# is one that linear interpolation in time between its kept neighbours
+# reproduces to within the error budget, so both the drawn polyline and a
+# marker interpolated at any cached time stay within max_error_km.
+BINARY_FORMAT = 'opos1'
+BINARY_MAGIC = b'OPOS'
+BINARY_VERSION = 1
+BINARY_HEADER = struct.Struct('<4sHHIIddd')
+TIME_QUANTUM_S = 1
+# Default error budget as a fraction of the trace's max |r| (Moon ~40 km,
+# Earth ~15000 km, Voyager 1 at 170 AU ~0.02 AU): a tenth of a pixel on a
+# 1000-pixel view framing the trace.
+DEFAULT_ERROR_FRACTION = 1e-4
+# Share of the budget spent on fixed-point rounding (worst case sqrt(3)/2
+# quanta per point); the rest goes to decimation.
+QUANTUM_PER_ERROR = 1.0 / 8.0
+_INT32 = 2 ** 31 - 1
+
+
+def decimate_track(t, xyz, max_error):
+    """Indices of the points to keep so that linear interpolation in time
+    through them is within max_error of every dropped point (endpoints kept).
+
+    Douglas-Peucker, one vectorized pass per level: every segment whose worst
+    point is over budget is split at that point, all segments at once.
+    """
+    n = len(t)
+    idx = np.arange(n)
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    pending = idx[1:-1]
+    while len(pending):
+        left = np.maximum.accumulate(np.where(keep, idx, 0))[pending]
+        right = np.minimum.accumulate(np.where(keep, idx, n - 1)[::-1])[::-1][pending]
+        span = t[right] - t[left]
+        f = np.divide(t[pending] - t[left], span, out=np.zeros(len(pending)), where=span > 0)
+        predicted = xyz[left] + f[:, None] * (xyz[right] - xyz[left])
+        err = np.sqrt(((xyz[pending] - predicted) ** 2).sum(axis=1))
+        over = err > max_error
+        if not over.any():
+            break
+        order = np.flatnonzero(over)
+        order = order[np.lexsort((-err[order], left[order]))]
+        worst = np.r_[True, left[order][1:] != left[order][:-1]]
+        keep[pending[order[worst]]] = True
+        # only segments that were split need another look
+        pending = pending[np.isin(left, left[order[worst]]) & ~keep[pending]]
+    return np.flatnonzero(keep)
+
+
+def encode_positions(t, xyz, max_error_km=None):
+    """(t JD, (n, 3) km) -> (file bytes, manifest fields).
+
+    max_error_km defaults to DEFAULT_ERROR_FRACTION of the largest |r|.
+    Raises ValueError if the budget is not a positive finite number, is
+    too fine for int32 fixed point, or is exceeded by the decoded track.
+    """
+    t = np.asarray(t, dtype=float)
+    xyz = np.asarray(xyz, dtype=float)
+    if max_error_km is None:
+        r_max = float(np.sqrt((xyz * xyz).sum(axis=1)).max()) if len(t) else 0.0
+        max_error_km = DEFAULT_ERROR_FRACTION * max(r_max, 1.0)
+    if not (math.isfinite(max_error_km) and max_error_km > 0):
+        raise ValueError("max error must be a positive number of km, got %r" % max_error_km)
+    quantum = max_error_km * QUANTUM_PER_ERROR
+    keep = decimate_track(t, xyz, max_error_km - math.sqrt(3) / 2 * quantum)
+
+    q = np.rint(xyz[keep] / quantum).astype(np.int64)
+    secs = np.rint((t[keep] - t[keep[0]]) * 86400.0 / TIME_QUANTUM_S).astype(np.int64)
+    columns = np.vstack([np.diff(secs, prepend=0)]
+                        + [np.diff(q[:, k], prepend=0) for k in range(3)])
+    if np.abs(columns).max() > _INT32:
+        raise ValueError("max error %.3g km too fine for int32 fixed point "
+                         "(|r| up to %.3g km)" % (max_error_km, np.abs(xyz).max()))
+
+    decoded_t, decoded = _decode_columns(float(t[keep[0]]), quantum, columns)
+    error = np.sqrt(sum((np.interp(t, decoded_t, decoded[:, k]) - xyz[:, k]) ** 2
+                        for k in range(3)))
+    if error.max() > max_error_km:
+        raise ValueError("decoded track is off by %.3g km, over the %.3g km budget"
+                         % (error.max(), max_error_km))
+    header = BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, 0, len(keep), len(t),
+                                float(t[keep[0]]), quantum, max_error_km)
+    data = header + columns.astype('<i4').tobytes()
+    return data, {
+        'n_points': int(len(keep)),
+        'source_points': int(len(t)),
+        't0_jd': float(t[keep[0]]),
+        'quantum_km': quantum,
+        'max_error_km': max_error_km,
+        'measured_error_km': float(error.max()),
+    }
+
+
+def _decode_columns(t0, quantum, columns):
+    sums = np.cumsum(columns.astype(np.int64), axis=1)
+    t = t0 + sums[0] * (TIME_QUANTUM_S / 86400.0)
+    return t, sums[1:].T * quantum
+
+
+def decode_positions(data):
+    """File bytes -> {'t': JD array, 'xyz': (n, 3) km array, header fields}.
+
+    The reference decoder for the gallery loader.
+    """
+    magic, version, _, n, source_points, t0, quantum, max_error = \
+        BINARY_HEADER.unpack_from(data)
+    if magic != BINARY_MAGIC or version != BINARY_VERSION:
+        raise ValueError("not an %s position file" % BINARY_FORMAT)
+    columns = np.frombuffer(data, dtype='<i4', count=4 * n,
+                            offset=BINARY_HEADER.size).reshape(4, n)
+    t, xyz = _decode_columns(t0, quantum, columns)
+    return {'t': t, 'xyz': xyz, 'source_points': source_points,
+            'quantum_km': quantum, 'max_error_km': max_error}
+
+
+def _error_budget(text):
+    """argparse type for --max-error-km: a positive, finite number of km."""
+    try:
+        value = float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError("not a number: %r" % text)
+    if not (math.isfinite(value) and value > 0):
+        raise argparse.ArgumentTypeError("must be a positive number of km, got %r" % text)
+    return value
+
+
+def write_binary_positions(out_dir, name, center, frame, source, t, xyz, max_error_km=None):
+    """Write positions/<name>.bin; returns its manifest entry."""
+    data, fields = encode_positions(t, xyz, max_error_km)
+    rel = "positions/%s.bin" % name
+    path = out_dir / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'wb') as fh:
+        fh.write(data)
+    entry = {'file': rel, 'object': name, 'center': center, 'frame': frame,
+             'source': source, 'size_bytes': len(data)}
+    entry.update(fields)
+    return entry
+
+
+def _catalog_slug(pair_key):
+    return re.sub(r'[^a-z0-9]+', '_', pair_key.lower()).strip('_')
+
+
+def export_catalog(cache, out_dir, warn, exclude=(), fmt='binary', max_error_km=None):
+    """--full-catalog: a position file under positions/catalog/ for every cache
+    pair not in exclude. Returns {slug: manifest entry}.
+
+    Catalog pairs carry no canonical frame, so the frame guard does not apply;
+    the center is the label after the last '_' of the pair key.
+    """
+    entries = {}
+    for pair_key in sorted(cache):
+        if pair_key in exclude:
+            continue
+        slug = "catalog/" + _catalog_slug(pair_key)
+        track = _read_track(cache, pair_key, slug, None, warn)
+        if track is None:
+            continue
+        dates, md, t, xyz = track
+        center = pair_key.rsplit('_', 1)[-1]
+        source = {'query_target': md.get('horizons_id'), 'center': center,
+                  'epoch': "%s to %s" % (dates[0][:10], dates[-1][:10]),
+                  'retrieved': md.get('last_updated')}
+        if fmt == 'binary':
+            try:
+                entries[slug] = write_binary_positions(out_dir, slug, center, None, source,
+                                                       t, xyz, max_error_km)
+            except ValueError as exc:
+                warn("%s: %s -- skipped" % (pair_key, exc))
+            continue
+        rel = "positions/%s.json" % slug
+        (out_dir / rel).parent.mkdir(parents=True, exist_ok=True)
+        with open(out_dir / rel, 'w') as fh:
+            fh.write(json.dumps({'object': slug, 'center': center, 'frame': None, 'unit': 'km',
+                       'epoch_type': 'JD', 'source': source,
+                       'data': {'t': t.tolist(), 'x': xyz[:, 0].tolist(),
+                                'y': xyz[:, 1].tolist(), 'z': xyz[:, 2].tolist()}}))
+        entries[slug] = {'file': rel, 'object': slug, 'center': center, 'frame': None,
+                         'source': source, 'n_points': len(t),
+                         'size_bytes': os.path.getsize(out_dir / rel)}
+    return entries
+
+
+def write_manifest(out_dir, files, fmt):
+    """positions/manifest.json: the layout and one entry per position file."""
+    manifest = {
+        'schema_version': SCHEMA_VERSION,
+        'generated': datetime.now(timezone.utc).isoformat(),
+        'generator': GENERATOR,
+        'format': BINARY_FORMAT if fmt == 'binary' else 'json',
+        'files': files,
+    }
+    if fmt == 'binary':
+        manifest['layout'] = {
+            'byte_order': 'little',
+            'header_bytes': BINARY_HEADER.size,
+            'header': ['magic:4s', 'version:u16', 'reserved:u16', 'n:u32',
+                       'source_points:u32', 't0_jd:f64', 'quantum_km:f64',
+                       'max_error_km:f64'],
+            'columns': ['t', 'x', 'y', 'z'],
+            'column_type': 'int32',
+            'encoding': 'delta',
+            'time_quantum_s': TIME_QUANTUM_S,
+            'unit': 'km',
+            'interpolation': 'linear-in-time',
+        }
+    path = out_dir / 'positions' / 'manifest.json'
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as fh:
+        json.dump(manifest, fh, indent=2)
+    return path
+
+
 # ---------------------------------------------------------------------------
 # Step 5: assemble the coverage index + assert invariants (v4 set)
 # ---------------------------------------------------------------------------
@@ -605,9 +913,7 @@ def write_feature_configs(out_dir, warn):
     print("  feature_configs.json: %d feature(s)" % len(configs))
 
 
-def run_export(output_dir, full_catalog):
-    if full_catalog:
-        print("[note] --full-catalog is a follow-on; this build is tranche-scoped.")
+def run_export(output_dir, full_catalog, fmt='json', max_error_km=None):
     out_dir = Path(output_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
 
@@ -623,11 +929,13 @@ def run_export(output_dir, full_catalog):
 
     objects = {}
     files_written = 0
+    manifest = {}
     for obj in TEST_OBJECTS:
         osc_block = build_osculating_entry(osc_cache, obj, warn) if obj.osc_key else None
         pos_block = None
         if obj.trace_policy == 'serve' and obj.position_pair_key is not None:
-            pos_block = write_position_file(cache, obj, out_dir, warn)
+            pos_block = write_position_file(cache, obj, out_dir, warn, fmt,
+                                            max_error_km, manifest)
             if pos_block is not None:
                 files_written += 1
         objects[obj.slug] = {
@@ -660,6 +968,8 @@ def run_export(output_dir, full_catalog):
         },
         'objects': objects,
     }
+    if fmt == 'binary' or full_catalog:
+        index['positions_manifest'] = 'positions/manifest.json'
 
     print("Asserting invariants...")
     assert_invariants(index, out_dir)
@@ -668,12 +978,27 @@ def run_export(output_dir, full_catalog):
         json.dump(index, fh, indent=2)
     write_feature_configs(out_dir, warn)
 
+    catalog = {}
+    if full_catalog:
+        served = {o.position_pair_key for o in TEST_OBJECTS if objects[o.slug]['positions']}
+        catalog = export_catalog(cache, out_dir, warn, served, fmt, max_error_km)
+        manifest.update(catalog)
+    if fmt == 'binary' or full_catalog:
+        write_manifest(out_dir, manifest, fmt)
+
     served = [s for s, o in objects.items() if o['positions']]
     osc_only = [s for s, o in objects.items()
                 if o['osculating'] and not o['positions']]
     print("\nSummary")
     print("  objects:          %d" % len(objects))
     print("  position files:   %d  (%s)" % (files_written, ", ".join(served)))
+    if catalog:
+        print("  catalog files:    %d  (positions/catalog/)" % len(catalog))
+    if fmt == 'binary':
+        points = sum(e['n_points'] for e in manifest.values())
+        source = sum(e['source_points'] for e in manifest.values())
+        size = sum(e['size_bytes'] for e in manifest.values())
+        print("  binary payload:   %d of %d points, %.1f kB" % (points, source, size / 1024.0))
     print("  osculating-only:  %s" % ", ".join(osc_only))
     print("  coverage_index.json + feature_configs.json written")
     if warnings_log:
@@ -691,13 +1016,20 @@ def main(argv=None):
     parser.add_argument('--output-dir', default='./_export_out',
                         help='output dir (default: ./_export_out scratch; pass '
                              'the gallery data path explicitly to deploy)')
-    parser.add_argument('--full-catalog', action='store_true')
+    parser.add_argument('--full-catalog', action='store_true',
+                        help='also write every other orbit_paths.json pair to '
+                             'positions/catalog/ and the manifest')
+    parser.add_argument('--format', choices=('json', 'binary'), default='json',
+                        help='position file format (default: json)')
+    parser.add_argument('--max-error-km', type=_error_budget, default=None,
+                        help='binary error budget per file (default: %g of the '
+                             "trace's max |r|)" % DEFAULT_ERROR_FRACTION)
     parser.add_argument('--preflight-only', action='store_true')
     args = parser.parse_args(argv)
     if args.preflight_only:
         run_preflight()
         return 0
-    return run_export(args.output_dir, args.full_catalog)
+    return run_export(args.output_dir, args.full_catalog, args.format, args.max_error_km)
 
 
 if __name__ == '__main__':
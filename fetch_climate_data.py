@@ -6,6 +6,9 @@ Data preservation is climate action.
 
 Role: computation
 Domain: earth_science
+
+Module updated: October 2026 (parsers split from the fetch functions;
+main() refreshes CO2, temperature, ice and pH through climate_refresh)
 """
 
 import urllib.request
@@ -349,6 +352,135 @@ def status_print(msg):
     print(f"  {msg}")
 
 
+def parse_mauna_loa_co2(text):
+    """
+    Parse NOAA's co2_mm_mlo.txt into cache records.
+    Rows with CO2 marked missing (-99.99) are skipped.
+    """
+    records = []
+    
+    for line in text.strip().split('\n'):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+            
+        parts = line.split()
+        if len(parts) >= 5:
+            try:
+                year = int(parts[0])
+                month = int(parts[1])
+                decimal_date = float(parts[2])
+                average = float(parts[3])
+                deseasonalized = float(parts[4])
+                
+                # Skip rows where CO2 is marked as missing (-99.99)
+                if average < 0:
+                    continue
+                
+                # Always include all fields (matching cached format)
+                # Use placeholder values if data is missing, just like NOAA does
+                record = {
+                    'year': year,
+                    'month': month,
+                    'decimal_date': round(decimal_date, 4),
+                    'co2_ppm': round(average, 2),  # <- Field name MUST be 'co2_ppm'
+                    'co2_deseasonalized': round(deseasonalized, 2),  # <- Field name MUST be 'co2_deseasonalized'
+                    # Always include these fields (even if missing = -1, -9.99, -0.99)
+                    'days': int(parts[5]) if len(parts) >= 6 else -1,
+                    'std_dev': round(float(parts[6]), 2) if len(parts) >= 7 else -9.99,
+                    'uncertainty': round(float(parts[7]), 2) if len(parts) >= 8 else -0.99
+                }
+                
+                records.append(record)
+                
+            except (ValueError, IndexError):
+                continue
+    
+    return records
+
+def parse_giss_temperature(text):
+    """
+    Parse GISTEMP's GLB.Ts+dSST.txt table into monthly anomaly records (deg C).
+    Months shown as '***' (not yet published) are skipped.
+    """
+    records = []
+    
+    for line in text.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        
+        try:
+            parts = line.split()
+            if len(parts) >= 13 and parts[0].isdigit():
+                year = int(parts[0])
+                
+                for month_idx in range(12):
+                    temp_str = parts[month_idx + 1]
+                    if temp_str != '***':
+                        anomaly = float(temp_str) / 100.0
+                        
+                        records.append({
+                            'year': year,
+                            'month': month_idx + 1,
+                            'anomaly_c': anomaly
+                        })
+        except (ValueError, IndexError):
+            continue
+    
+    return records
+
+def parse_arctic_ice_xlsx(content):
+    """
+    Parse the NSIDC V4 monthly workbook (bytes) into extent records.
+    Reads the 'NH-Extent' sheet; raises ValueError if it is missing.
+    """
+    import io
+    import openpyxl
+    
+    workbook = openpyxl.load_workbook(io.BytesIO(content), data_only=True)
+    
+    # Use NH-Extent sheet (Northern Hemisphere extent)
+    if 'NH-Extent' not in workbook.sheetnames:
+        raise ValueError(f"'NH-Extent' sheet not found. Available sheets: {workbook.sheetnames}")
+    
+    sheet = workbook['NH-Extent']
+    months = [
+        ('January', 1), ('February', 2), ('March', 3), ('April', 4),
+        ('May', 5), ('June', 6), ('July', 7), ('August', 8),
+        ('September', 9), ('October', 10), ('November', 11), ('December', 12)
+    ]
+    
+    records = []
+    
+    # Skip header rows (first 2 rows are headers)
+    for row in sheet.iter_rows(min_row=3, values_only=True):
+        if not row or not row[0]:  # Skip empty rows
+            continue
+        
+        try:
+            year = int(row[0])  # First column is year
+            
+            # Columns 1-12 are monthly extent values (million km^2)
+            for i, (month_name, month_num) in enumerate(months, start=1):
+                if i < len(row) and row[i] is not None:
+                    try:
+                        extent = float(row[i])
+                        
+                        records.append({
+                            'year': year,
+                            'month': month_num,
+                            'month_name': month_name,
+                            'extent_million_km2': round(extent, 2)
+                        })
+                    except (ValueError, TypeError):
+                        continue
+                        
+        except (ValueError, IndexError, TypeError):
+            continue
+    
+    return records
+
 def fetch_mauna_loa_co2(status_callback=None):     
     """
     Fetch Mauna Loa CO2 monthly data
@@ -373,44 +505,7 @@ def fetch_mauna_loa_co2(status_callback=None):
         lines = response.text.strip().split('\n')
         print(f"[OK] Download successful ({len(lines)} lines)")
         
-        records = []
-        
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-                
-            parts = line.split()
-            if len(parts) >= 5:
-                try:
-                    year = int(parts[0])
-                    month = int(parts[1])
-                    decimal_date = float(parts[2])
-                    average = float(parts[3])
-                    deseasonalized = float(parts[4])
-                    
-                    # Skip rows where CO2 is marked as missing (-99.99)
-                    if average < 0:
-                        continue
-                    
-                    # Always include all fields (matching cached format)
-                    # Use placeholder values if data is missing, just like NOAA does
-                    record = {
-                        'year': year,
-                        'month': month,
-                        'decimal_date': round(decimal_date, 4),
-                        'co2_ppm': round(average, 2),  # <- Field name MUST be 'co2_ppm'
-                        'co2_deseasonalized': round(deseasonalized, 2),  # <- Field name MUST be 'co2_deseasonalized'
-                        # Always include these fields (even if missing = -1, -9.99, -0.99)
-                        'days': int(parts[5]) if len(parts) >= 6 else -1,
-                        'std_dev': round(float(parts[6]), 2) if len(parts) >= 7 else -9.99,
-                        'uncertainty': round(float(parts[7]), 2) if len(parts) >= 8 else -0.99
-                    }
-                    
-                    records.append(record)
-                    
-                except (ValueError, IndexError):
-                    continue
+        records = parse_mauna_loa_co2(response.text)
         
         print(f"[OK] Parsed {len(records)} records")
         return records
@@ -444,32 +539,7 @@ def fetch_nasa_giss_temperature(status_callback=None):
         status("[OK] Download complete")
         status("Parsing temperature data...")
         
-        # Rest of the function stays the same...
-        records = []
-        lines = data.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            try:
-                parts = line.split()
-                if len(parts) >= 13 and parts[0].isdigit():
-                    year = int(parts[0])
-                    
-                    for month_idx in range(12):
-                        temp_str = parts[month_idx + 1]
-                        if temp_str != '***':
-                            anomaly = float(temp_str) / 100.0
-                            
-                            records.append({
-                                'year': year,
-                                'month': month_idx + 1,
-                                'anomaly_c': anomaly
-                            })
-            except (ValueError, IndexError):
-                continue
+        records = parse_giss_temperature(data)
         
         status(f"[OK] Parsed {len(records)} temperature records")
         
@@ -500,59 +570,8 @@ def fetch_arctic_ice():
         response.raise_for_status()
         print(f"[OK] Download successful ({len(response.content)} bytes)")
         
-        # Save to temporary file
-        temp_file = "temp_ice_data.xlsx"
-        with open(temp_file, 'wb') as f:
-            f.write(response.content)
-        
-        # Load workbook
-        workbook = openpyxl.load_workbook(temp_file, data_only=True)
-        
-        # Use NH-Extent sheet (Northern Hemisphere extent)
-        if 'NH-Extent' not in workbook.sheetnames:
-            print(f"[FAIL] 'NH-Extent' sheet not found. Available sheets: {workbook.sheetnames}")
-            os.remove(temp_file)
-            return []
-        
-        sheet = workbook['NH-Extent']
         print("[OK] Parsing monthly data from 'NH-Extent' sheet...")
-        
-        records = []
-        
-        # Skip header rows (first 2 rows are headers)
-        for row_num, row in enumerate(sheet.iter_rows(min_row=3, values_only=True), start=3):
-            if not row or not row[0]:  # Skip empty rows
-                continue
-            
-            try:
-                year = int(row[0])  # First column is year
-                
-                # Columns 1-12 are monthly extent values (million km^2)
-                months = [
-                    ('January', 1), ('February', 2), ('March', 3), ('April', 4),
-                    ('May', 5), ('June', 6), ('July', 7), ('August', 8),
-                    ('September', 9), ('October', 10), ('November', 11), ('December', 12)
-                ]
-                
-                for i, (month_name, month_num) in enumerate(months, start=1):
-                    if i < len(row) and row[i] is not None:
-                        try:
-                            extent = float(row[i])
-                            
-                            records.append({
-                                'year': year,
-                                'month': month_num,
-                                'month_name': month_name,
-                                'extent_million_km2': round(extent, 2)
-                            })
-                        except (ValueError, TypeError):
-                            continue
-                            
-            except (ValueError, IndexError, TypeError):
-                continue
-        
-        # Clean up temp file
-        os.remove(temp_file)
+        records = parse_arctic_ice_xlsx(response.content)
         
         print(f"[OK] Parsed {len(records)} records (all 12 months)")
         return records
@@ -562,8 +581,6 @@ def fetch_arctic_ice():
         return []
     except Exception as e:
         print(f"[FAIL] Error parsing Excel file: {e}")
-        if os.path.exists("temp_ice_data.xlsx"):
-            os.remove("temp_ice_data.xlsx")
         return []
 
 def create_co2_metadata(records):
@@ -797,70 +814,53 @@ def main():
     
     results = []
     
-    # 1. Fetch CO2 data
-    print("1. Fetching Mauna Loa CO2 monthly data...")
-    co2_records = fetch_mauna_loa_co2()
+    # CO2, temperature, Arctic ice and pH are refreshed concurrently with
+    # conditional requests; only new or revised months are merged in.
+    from climate_refresh import refresh
+    print("Refreshing CO2, temperature, Arctic ice and ocean pH...")
+    refreshed = {r.name: r for r in refresh(status_callback=status_print)}
+    print()
     
-    if co2_records:
-        success = save_cache(CO2_OUTPUT_FILE, co2_records, create_co2_metadata)
-        results.append(("CO2", len(co2_records), success))
-        
-        if success and co2_records:
-            latest = co2_records[-1]
-            first = co2_records[0]
-    #        increase = latest['trend'] - first['trend']
-            increase = latest['co2_ppm'] - first['co2_ppm']
-            years = latest['year'] - first['year']
-            
-    #        print(f"\nLatest CO2 measurement: {latest['trend']} ppm")
-            print(f"Latest CO2 measurement: {latest['co2_ppm']:.2f} ppm")
-            print(f"{years}-year increase: +{increase:.2f} ppm\n")
-    else:
-        results.append(("CO2", 0, False))
-    
-    # 2. Fetch temperature data
-    print("2. Fetching NASA GISS temperature data...")
-#    temp_records = fetch_nasa_giss_temperature()
-    temp_records, temp_metadata = fetch_nasa_giss_temperature()
-    
-    if temp_records:
-        success = save_cache(TEMP_OUTPUT_FILE, temp_records, create_temperature_metadata)
-        results.append(("Temperature", len(temp_records), success))
-        
-        if success and temp_records:
-            latest = temp_records[-1]
-            first = temp_records[0]
-    #        warming = latest['anomaly_celsius'] - first['anomaly_celsius']
-            warming = latest['anomaly_c'] - first['anomaly_c']
+    # 1. CO2 data
+    co2 = refreshed['co2']
+    results.append(("CO2", co2.records, co2.success))
+    if co2.success and co2.records:
+        latest = co2.latest
+        first = co2.first
+        increase = latest['co2_ppm'] - first['co2_ppm']
+        years = latest['year'] - first['year']
+        
+        print(f"Latest CO2 measurement: {latest['co2_ppm']:.2f} ppm")
+        print(f"{years}-year increase: +{increase:.2f} ppm\n")
+    
+    # 2. Temperature data
+    temp = refreshed['temperature']
+    results.append(("Temperature", temp.records, temp.success))
+    if temp.success and temp.records:
+        latest = temp.latest
+        first = temp.first
+        warming = latest['anomaly_c'] - first['anomaly_c']
+        years = latest['year'] - first['year']
+        
+        print(f"Latest temperature anomaly: +{latest['anomaly_c']:.2f} degC")
+        print(f"{years}-year warming: +{warming:.2f} degC\n")
+    
+    # 3. Arctic ice data
+    ice = refreshed['ice']
+    results.append(("Arctic Ice", ice.records, ice.success))
+    if ice.success and ice.records:
+        # Find September records (minimum extent)
+        with open(ICE_OUTPUT_FILE, 'r') as f:
+            ice_records = json.load(f)['data']
+        sept_records = [r for r in ice_records if r['month'] == 9]
+        if sept_records:
+            latest = sept_records[-1]
+            first = sept_records[0]
+            change = latest['extent_million_km2'] - first['extent_million_km2']
             years = latest['year'] - first['year']
             
-    #        print(f"\nLatest temperature anomaly: +{latest['anomaly_celsius']} degC")
-            print(f"Latest temperature anomaly: +{latest['anomaly_c']:.2f} degC")
-            print(f"{years}-year warming: +{warming:.2f} degC\n")
-    else:
-        results.append(("Temperature", 0, False))
-    
-    # 3. Fetch Arctic ice data
-    print("3. Fetching NSIDC Arctic sea ice extent data...")
-    ice_records = fetch_arctic_ice()
-    
-    if ice_records:
-        success = save_cache(ICE_OUTPUT_FILE, ice_records, create_ice_metadata)
-        results.append(("Arctic Ice", len(ice_records), success))
-        
-        if success and ice_records:
-            # Find September records (minimum extent)
-            sept_records = [r for r in ice_records if r['month'] == 9]
-            if sept_records:
-                latest = sept_records[-1]
-                first = sept_records[0]
-                change = latest['extent_million_km2'] - first['extent_million_km2']
-                years = latest['year'] - first['year']
-                
-                print(f"\nLatest September ice extent: {latest['extent_million_km2']} million km^2")
-                print(f"{years}-year change: {change:.2f} million km^2 ({change/first['extent_million_km2']*100:.1f}%)\n")
-    else:
-        results.append(("Arctic Ice", 0, False))
+            print(f"Latest September ice extent: {latest['extent_million_km2']} million km^2")
+            print(f"{years}-year change: {change:.2f} million km^2 ({change/first['extent_million_km2']*100:.1f}%)\n")
     
     # 4. Fetch sea level data
     print("4. Fetching NOAA STAR global mean sea level data...")
@@ -887,25 +887,21 @@ def main():
     else:
         results.append(("Sea Level", 0, False))
     
-    # 5. Fetch ocean pH data
-    print("5. Fetching ocean pH data...")
-    ph_records = fetch_ocean_ph()
-    
-    if ph_records:
-        success = save_cache(PH_OUTPUT_FILE, ph_records, create_ph_metadata)
-        results.append(("Ocean pH", len(ph_records), success))
-        
-        if success and ph_records:
-            latest = ph_records[-1]
-            first = ph_records[0]
-            ph_change = latest['ph_total'] - first['ph_total']
-            years = latest['year'] - first['year']
-            
-            print(f"\nLatest ocean pH: {latest['ph_total']:.4f}")
-            print(f"{years}-year change: {ph_change:+.4f} pH units\n")
-    else:
-        results.append(("Ocean pH", 0, False))
+    # 5. Ocean pH data
+    ph = refreshed['ph']
+    results.append(("Ocean pH", ph.records, ph.success))
+    if ph.success and ph.records:
+        latest = ph.latest
+        first = ph.first
+        ph_change = latest['ph_total'] - first['ph_total']
+        years = latest['year'] - first['year']
+        
+        print(f"\nLatest ocean pH: {latest['ph_total']:.4f}")
+        print(f"{years}-year change: {ph_change:+.4f} pH units\n")
+    elif not ph.success:
         print("Note: Ocean pH requires manual download")
+        print("  Visit https://www.bco-dmo.org/dataset/3773, download the CSV,")
+        print("  save as 'hot_carbonate_data.txt' and run convert_hot_ph_to_json.py")
 
     # Summary
     print("=" * 60)
@@ -29,7 +29,8 @@ from data_processing import (
     calculate_cartesian_coordinates, align_coordinate_systems
 )
 from star_properties import (
-    load_existing_properties, generate_unique_ids, query_simbad_for_star_properties, assign_properties_to_data
+    load_existing_properties, generate_unique_ids, query_simbad_for_star_properties, assign_properties_to_data,
+    missing_property_ids
 )
 from stellar_parameters import calculate_stellar_parameters
 # from visualization import analyze_magnitude_distribution, prepare_2d_data, create_hr_diagram
@@ -156,7 +157,8 @@ def process_stars(hip_data, gaia_data, mag_limit):
         load_existing_properties, 
         generate_unique_ids, 
         query_simbad_for_star_properties,
-        assign_properties_to_data
+        assign_properties_to_data,
+        missing_property_ids
     )
     
     properties_file = 'star_data/star_properties_magnitude.pkl'
@@ -164,7 +166,7 @@ def process_stars(hip_data, gaia_data, mag_limit):
     unique_ids = generate_unique_ids(combined_data)
     
     # Find which stars need SIMBAD queries
-    missing_ids = [uid for uid in unique_ids if uid not in existing_properties]
+    missing_ids = missing_property_ids(unique_ids, existing_properties)
     
     if missing_ids:
         print(f"Querying SIMBAD for {len(missing_ids)} stars...")
@@ -336,7 +338,7 @@ def main():
         existing_properties = load_existing_properties(properties_file)
         unique_ids = generate_unique_ids(combined_data)
         
-        missing_ids = [uid for uid in unique_ids if uid not in existing_properties]
+        missing_ids = missing_property_ids(unique_ids, existing_properties)
         if missing_ids:
             existing_properties = query_simbad_for_star_properties(
                 missing_ids, existing_properties, properties_file
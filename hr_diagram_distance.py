@@ -31,7 +31,8 @@ from data_processing import (
 )
 from star_properties import (
     load_existing_properties, generate_unique_ids, query_simbad_for_star_properties,
-    assign_properties_to_data
+    assign_properties_to_data,
+    missing_property_ids
 )
 from stellar_parameters import calculate_stellar_parameters
 
@@ -160,7 +161,8 @@ def process_stars(hip_data, gaia_data, max_light_years):
         load_existing_properties, 
         generate_unique_ids, 
         query_simbad_for_star_properties,
-        assign_properties_to_data
+        assign_properties_to_data,
+        missing_property_ids
     )
     
     properties_file = 'star_data/star_properties_distance.pkl'
@@ -168,7 +170,7 @@ def process_stars(hip_data, gaia_data, max_light_years):
     unique_ids = generate_unique_ids(combined_data)
     
     # Find which stars need SIMBAD queries
-    missing_ids = [uid for uid in unique_ids if uid not in existing_properties]
+    missing_ids = missing_property_ids(unique_ids, existing_properties)
     
     if missing_ids:
         print(f"Querying SIMBAD for {len(missing_ids)} stars...")
@@ -318,7 +320,7 @@ def main():
         existing_properties = load_existing_properties(properties_file)
         unique_ids = generate_unique_ids(combined_data)
         
-        missing_ids = [uid for uid in unique_ids if uid not in existing_properties]
+        missing_ids = missing_property_ids(unique_ids, existing_properties)
         if missing_ids:
             existing_properties = query_simbad_for_star_properties(
                 missing_ids, existing_properties, properties_file
@@ -11,6 +11,16 @@ Key functions:
     plot_idealized_orbits() - Master orbit renderer for all object types
     add_mean_orbit_trace() - Simple Keplerian ellipse from mean elements
     calculate_*_satellite_elements() - Per-system satellite orbit models
+Module updated: October 2026
+(osculating-arc clip angles in closed form via orbit_sampling.clip_anomaly,
+in place of the 80-step bisections; both arms built in one pass)
+Module updated: October 2026
+(rotation chains -- element angles, then the parent planet's frame -- are
+composed once into a cached matrix by orbit_transforms and applied in one
+product; planet pole matrices are cached per planet)
+Module updated: October 2026
+(true anomalies come from orbit_sampling: chord-error-adaptive samples in
+place of the fixed 360-point, 181+180 and perihelion grids)
 Module updated: June 2026 with Anthropic's Claude Sonnet 4.6
 (osculating vs mean element labeling correction in Keplerian orbit hover text)
 Module updated: May 2026 with Anthropic's Claude Opus 4.7
@@ -21,12 +31,15 @@ Role: computation
 Domain: orrery
 """
 # idealized_orbits.py
+import functools
 import numpy as np
 import math
 import plotly.graph_objs as go
 import traceback  # Add this import
 from datetime import datetime, timedelta
 from osculating_cache_manager import get_elements_with_prompt
+import orbit_sampling
+import orbit_transforms
 from constants_new import color_map, KNOWN_ORBITAL_PERIODS, KM_PER_AU
 from orbital_elements import planetary_params as ORIGINAL_planetary_params
 from apsidal_markers import (
@@ -312,12 +325,7 @@ def add_mean_orbit_trace(fig, obj_name, mean_params, color_func):
             orbit_info = f"q={q_mean:.6f} AU"
         elif mean_e >= 0:
             # Elliptical mean orbit
-            if mean_e > 0.99:
-                theta_first = np.linspace(0, np.pi, 181)
-                theta_second = np.linspace(np.pi, 2*np.pi, 181)[1:]
-                theta = np.concatenate([theta_first, theta_second])
-            else:
-                theta = np.linspace(0, 2*np.pi, 360)
+            theta = orbit_sampling.ellipse_anomalies(mean_a, mean_e)
             
             r = mean_a * (1 - mean_e**2) / (1 + mean_e * np.cos(theta))
             x_orbit = r * np.cos(theta)
@@ -328,9 +336,9 @@ def add_mean_orbit_trace(fig, obj_name, mean_params, color_func):
             omega_rad = np.radians(mean_omega)
             Omega_rad = np.radians(mean_Omega)
             
-            x_temp, y_temp, z_temp = rotate_points(x_orbit, y_orbit, z_orbit, omega_rad, 'z')
-            x_temp, y_temp, z_temp = rotate_points(x_temp, y_temp, z_temp, i_rad, 'x')
-            x_mean, y_mean, z_mean = rotate_points(x_temp, y_temp, z_temp, Omega_rad, 'z')
+            x_mean, y_mean, z_mean = orbit_transforms.rotate_sequence(
+                x_orbit, y_orbit, z_orbit,
+                ((omega_rad, 'z'), (i_rad, 'x'), (Omega_rad, 'z')))
             
             orbit_type = "Elliptical"
             orbit_info = f"a={mean_a:.6f} AU"
@@ -568,7 +576,7 @@ def test_mars_rotations(satellite_name, planetary_params, color, fig=None):
         Omega = orbital_params.get('Omega', 0)
         
         # Generate ellipse in orbital plane
-        theta = np.linspace(0, 2*np.pi, 360)
+        theta = orbit_sampling.ellipse_anomalies(a, e)
         r = a * (1 - e**2) / (1 + e * np.cos(theta))
         
         x_orbit = r * np.cos(theta)
@@ -683,7 +691,7 @@ def test_uranus_equatorial_transformations(satellite_name, planetary_params, col
         Omega = orbital_params.get('Omega', 0)
         
         # Generate ellipse in orbital plane
-        theta = np.linspace(0, 2*np.pi, 360)
+        theta = orbit_sampling.ellipse_anomalies(a, e)
         r = a * (1 - e**2) / (1 + e * np.cos(theta))
         
         x_orbit = r * np.cos(theta)
@@ -794,7 +802,7 @@ def test_uranus_rotation_combinations(satellite_name, planetary_params, color, f
         Omega = orbital_params.get('Omega', 0)
         
         # Generate ellipse in orbital plane
-        theta = np.linspace(0, 2*np.pi, 360)
+        theta = orbit_sampling.ellipse_anomalies(a, e)
         r = a * (1 - e**2) / (1 + e * np.cos(theta))
         
         x_orbit = r * np.cos(theta)
@@ -1063,7 +1071,7 @@ def test_mars_negative_tilt(fig, satellites_data):          # test function only
             Omega = params.get('Omega', 0)
             
             # Standard orbital transformation
-            theta = np.linspace(0, 2*np.pi, 360)
+            theta = orbit_sampling.ellipse_anomalies(a, e)
             r = a * (1 - e**2) / (1 + e * np.cos(theta))
             
             x_orbit = r * np.cos(theta)
@@ -1154,34 +1162,11 @@ def rotate_points(x, y, z, angle, axis='z'):
         
     Returns:
         tuple: (xr, yr, zr) rotated coordinates
+
+    The matrix comes from orbit_transforms' cache; a chain of these calls
+    is better written as one orbit_transforms.rotate_sequence().
     """
-    # Convert inputs to numpy arrays if they aren't already
-    x = np.array(x, copy=True)
-    y = np.array(y, copy=True)
-    z = np.array(z, copy=True)
-    # Initialize rotated coordinates
-    xr = x.copy()
-    yr = y.copy()
-    zr = z.copy()
-    # Perform rotation based on specified axis
-    if axis == 'z':
-        # Rotate about z-axis
-        xr = x * np.cos(angle) - y * np.sin(angle)
-        yr = x * np.sin(angle) + y * np.cos(angle)
-        # zr remains the same
-    elif axis == 'x':
-        # Rotate about x-axis
-        yr = y * np.cos(angle) - z * np.sin(angle)
-        zr = y * np.sin(angle) + z * np.cos(angle)
-        # xr remains the same
-    elif axis == 'y':
-        # Rotate about y-axis
-        zr = z * np.cos(angle) - x * np.sin(angle)
-        xr = z * np.sin(angle) + x * np.cos(angle)
-        # yr remains the same
-    else:
-        raise ValueError(f"Unknown rotation axis: {axis}. Use 'x', 'y', or 'z'.")
-    return xr, yr, zr
+    return orbit_transforms.rotate(x, y, z, angle, axis)
 def plot_jupiter_moon_osculating_orbit(fig, satellite_name, date, color, show_apsidal_markers=False):
     """
     Plot osculating orbit for Jupiter satellites.
@@ -1257,7 +1242,7 @@ def plot_jupiter_moon_osculating_orbit(fig, satellite_name, date, color, show_ap
         print(f"  Epoch: {epoch}", flush=True)
         
         # Generate orbit points
-        theta = np.linspace(0, 2*np.pi, 360)
+        theta = orbit_sampling.ellipse_anomalies(a, e)
         r = a * (1 - e**2) / (1 + e * np.cos(theta))
         
         x_orbit = r * np.cos(theta)
@@ -1274,13 +1259,11 @@ def plot_jupiter_moon_osculating_orbit(fig, satellite_name, date, color, show_ap
         # This is the "inside-out" sequence
         
         # 1. Argument of periapsis (omega) around z-axis
-        x_temp, y_temp, z_temp = rotate_points(x_orbit, y_orbit, z_orbit, omega_rad, 'z')
-        
         # 2. Inclination (i) around x-axis
-        x_temp, y_temp, z_temp = rotate_points(x_temp, y_temp, z_temp, i_rad, 'x')
-        
         # 3. Longitude of ascending node (Omega) around z-axis
-        x_final, y_final, z_final = rotate_points(x_temp, y_temp, z_temp, Omega_rad, 'z')
+        x_final, y_final, z_final = orbit_transforms.rotate_sequence(
+            x_orbit, y_orbit, z_orbit,
+            ((omega_rad, 'z'), (i_rad, 'x'), (Omega_rad, 'z')))
         
         # CRITICAL: NO Jupiter rotation!
         # Osculating elements already in ecliptic frame
@@ -1438,7 +1421,7 @@ def plot_saturn_moon_osculating_orbit(fig, satellite_name, date, color, show_aps
        
         print(f"  Plotting osculating: i={i:.4f} deg (ecliptic), epoch={epoch}", flush=True)
         
-        theta = np.linspace(0, 2*np.pi, 360)
+        theta = orbit_sampling.ellipse_anomalies(a, e)
         r = a * (1 - e**2) / (1 + e * np.cos(theta))
         
         x_orbit = r * np.cos(theta)
@@ -1450,9 +1433,9 @@ def plot_saturn_moon_osculating_orbit(fig, satellite_name, date, color, show_aps
         Omega_rad = np.radians(Omega)
         
         # Rotation sequence: omega, i, Omega (inside-out for osculating)
-        x_temp, y_temp, z_temp = rotate_points(x_orbit, y_orbit, z_orbit, omega_rad, 'z')
-        x_temp, y_temp, z_temp = rotate_points(x_temp, y_temp, z_temp, i_rad, 'x')
-        x_final, y_final, z_final = rotate_points(x_temp, y_temp, z_temp, Omega_rad, 'z')
+        x_final, y_final, z_final = orbit_transforms.rotate_sequence(
+            x_orbit, y_orbit, z_orbit,
+            ((omega_rad, 'z'), (i_rad, 'x'), (Omega_rad, 'z')))
         
         # NO Saturn rotation - osculating already in ecliptic!
         # (Saturn analytical orbits not shown due to reference frame complexity)        
@@ -1562,7 +1545,7 @@ def plot_uranus_moon_osculating_orbit(fig, satellite_name, date, color, show_aps
        
         print(f"  Plotting osculating: i={i:.4f} deg (ecliptic), epoch={epoch}", flush=True)
         
-        theta = np.linspace(0, 2*np.pi, 360)
+        theta = orbit_sampling.ellipse_anomalies(a, e)
         r = a * (1 - e**2) / (1 + e * np.cos(theta))
         
         x_orbit = r * np.cos(theta)
@@ -1574,9 +1557,9 @@ def plot_uranus_moon_osculating_orbit(fig, satellite_name, date, color, show_aps
         Omega_rad = np.radians(Omega)
         
         # Standard Keplerian rotation sequence: omega, i, Omega
-        x_temp, y_temp, z_temp = rotate_points(x_orbit, y_orbit, z_orbit, omega_rad, 'z')
-        x_temp, y_temp, z_temp = rotate_points(x_temp, y_temp, z_temp, i_rad, 'x')
-        x_final, y_final, z_final = rotate_points(x_temp, y_temp, z_temp, Omega_rad, 'z')
+        x_final, y_final, z_final = orbit_transforms.rotate_sequence(
+            x_orbit, y_orbit, z_orbit,
+            ((omega_rad, 'z'), (i_rad, 'x'), (Omega_rad, 'z')))
         
         # NO Uranus rotation - osculating already in ecliptic!
         # (Uranus analytical orbits not shown due to extreme 98 deg tilt complexity)
@@ -1680,7 +1663,7 @@ def plot_neptune_moon_osculating_orbit(fig, satellite_name, date, color, show_ap
        
         print(f"  Plotting osculating: i={i:.4f} deg (ecliptic), epoch={epoch}", flush=True)
         
-        theta = np.linspace(0, 2*np.pi, 360)
+        theta = orbit_sampling.ellipse_anomalies(a, e)
         r = a * (1 - e**2) / (1 + e * np.cos(theta))
         
         x_orbit = r * np.cos(theta)
@@ -1693,9 +1676,9 @@ def plot_neptune_moon_osculating_orbit(fig, satellite_name, date, color, show_ap
         
         # Standard Keplerian rotation sequence: omega, i, Omega
         # Retrograde orbits (i > 90 deg) handled automatically
-        x_temp, y_temp, z_temp = rotate_points(x_orbit, y_orbit, z_orbit, omega_rad, 'z')
-        x_temp, y_temp, z_temp = rotate_points(x_temp, y_temp, z_temp, i_rad, 'x')
-        x_final, y_final, z_final = rotate_points(x_temp, y_temp, z_temp, Omega_rad, 'z')
+        x_final, y_final, z_final = orbit_transforms.rotate_sequence(
+            x_orbit, y_orbit, z_orbit,
+            ((omega_rad, 'z'), (i_rad, 'x'), (Omega_rad, 'z')))
         
         # NO Neptune rotation - osculating already in ecliptic!
         
@@ -1963,7 +1946,7 @@ def plot_pluto_barycenter_orbit(fig, object_name, date, color, show_apsidal_mark
         print(f"  Plotting: a={a:.7f} AU, i={i:.4f} deg (ecliptic), epoch={epoch}", flush=True)
         
         # Generate orbital path
-        theta = np.linspace(0, 2*np.pi, 360)
+        theta = orbit_sampling.ellipse_anomalies(a, e)
         r = a * (1 - e**2) / (1 + e * np.cos(theta))
         
         x_orbit = r * np.cos(theta)
@@ -1975,9 +1958,9 @@ def plot_pluto_barycenter_orbit(fig, object_name, date, color, show_apsidal_mark
         Omega_rad = np.radians(Omega)
         
         # Standard Keplerian rotation sequence
-        x_temp, y_temp, z_temp = rotate_points(x_orbit, y_orbit, z_orbit, omega_rad, 'z')
-        x_temp, y_temp, z_temp = rotate_points(x_temp, y_temp, z_temp, i_rad, 'x')
-        x_final, y_final, z_final = rotate_points(x_temp, y_temp, z_temp, Omega_rad, 'z')
+        x_final, y_final, z_final = orbit_transforms.rotate_sequence(
+            x_orbit, y_orbit, z_orbit,
+            ((omega_rad, 'z'), (i_rad, 'x'), (Omega_rad, 'z')))
         
         # Build hover text based on mode and object
         if is_barycenter_mode:
@@ -2231,13 +2214,8 @@ def plot_tno_satellite_orbit(fig, satellite_name, parent_name, date, color, show
         # Generate orbit points
     #    theta = np.linspace(0, 2*np.pi, 360)
                 
-        # For eccentric orbits (e > 0.1), ensure theta=pi is included for accurate apoapsis
-        if e > 0.1:
-            theta_first_half = np.linspace(0, np.pi, 181)
-            theta_second_half = np.linspace(np.pi, 2*np.pi, 181)[1:]
-            theta = np.concatenate([theta_first_half, theta_second_half])
-        else:
-            theta = np.linspace(0, 2*np.pi, 360)
+        # Adaptive samples; theta=pi is always included for accurate apoapsis
+        theta = orbit_sampling.ellipse_anomalies(a, e)
         # Skip if semi-major axis is invalid
         if a <= 0:
             print(f"  [WARN] Invalid semi-major axis for {satellite_name}", flush=True)
@@ -2659,7 +2637,7 @@ def plot_orcus_barycenter_orbit(fig, object_name, date, color, show_apsidal_mark
         print(f"  Plotting: a={a:.7f} AU, i={i:.4f} deg (ecliptic), epoch={epoch}", flush=True)
         
         # Generate orbital path
-        theta = np.linspace(0, 2*np.pi, 360)
+        theta = orbit_sampling.ellipse_anomalies(a, e)
         r = a * (1 - e**2) / (1 + e * np.cos(theta))
         
         x_orbit = r * np.cos(theta)
@@ -2671,9 +2649,9 @@ def plot_orcus_barycenter_orbit(fig, object_name, date, color, show_apsidal_mark
         Omega_rad = np.radians(Omega)
         
         # Standard Keplerian rotation sequence
-        x_temp, y_temp, z_temp = rotate_points(x_orbit, y_orbit, z_orbit, omega_rad, 'z')
-        x_temp, y_temp, z_temp = rotate_points(x_temp, y_temp, z_temp, i_rad, 'x')
-        x_final, y_final, z_final = rotate_points(x_temp, y_temp, z_temp, Omega_rad, 'z')
+        x_final, y_final, z_final = orbit_transforms.rotate_sequence(
+            x_orbit, y_orbit, z_orbit,
+            ((omega_rad, 'z'), (i_rad, 'x'), (Omega_rad, 'z')))
         
         # Build hover text based on mode
         if is_barycenter_mode:
@@ -2888,7 +2866,7 @@ def plot_gonggong_xiangliu_orbit(fig, object_name, date, color, show_apsidal_mar
         print(f"  e = {e:.4f}, i = {i:.1f} deg, Omega = {Omega:.1f} deg", flush=True)
         
         # Generate ellipse points
-        theta = np.linspace(0, 2*np.pi, 360)
+        theta = orbit_sampling.ellipse_anomalies(a, e)
         r = a * (1 - e**2) / (1 + e * np.cos(theta))
         
         # Orbital plane coordinates
@@ -3177,7 +3155,7 @@ def plot_patroclus_barycenter_orbit(fig, object_name, date, color, show_apsidal_
         
         # Generate ellipse points starting from current phase
         # This ensures the orbit is drawn in the correct orientation
-        theta = np.linspace(0, 2*np.pi, 360)
+        theta = orbit_sampling.ellipse_anomalies(a, e)
         r = a * (1 - e**2) / (1 + e * np.cos(theta))
         
         # Orbital plane coordinates (periapsis along x-axis)
@@ -3304,6 +3282,17 @@ def plot_patroclus_barycenter_orbit(fig, object_name, date, color, show_apsidal_
     
     return fig
 def create_planet_transformation_matrix(planet_name):
+    """
+    Transformation matrix from a planet's equatorial frame to the ecliptic.
+
+    The matrix is built once per planet by _planet_transformation_matrix();
+    this returns a copy the caller may modify.
+    """
+    return _planet_transformation_matrix(planet_name).copy()
+
+
+@functools.lru_cache(maxsize=None)
+def _planet_transformation_matrix(planet_name):
     # REVIVED 2026-06-01 (Opus 4.8): math core for orient_to_planet_pole() below,
     # which routes Uranus belt/ring geometry (U3). Was dead after per-planet inline
     # rotate_points blocks superseded it; unfudged general construction, render-validated on revival.
@@ -3367,7 +3356,9 @@ def create_planet_transformation_matrix(planet_name):
     
     # Construct the transformation matrix
     transform_matrix = np.vstack((x_basis, y_basis, z_basis)).T
-    
+    # Built once per planet and shared: orient_to_planet_pole() applies it
+    # to every ring, belt and torus, so callers get copies, never this.
+    transform_matrix.setflags(write=False)
     return transform_matrix
 
 def orient_to_planet_pole(x, y, z, planet_name):
@@ -3390,12 +3381,8 @@ def orient_to_planet_pole(x, y, z, planet_name):
 
     Module updated: June 2026 with Anthropic's Claude Opus 4.8
     """
-    matrix = create_planet_transformation_matrix(planet_name)
-    pts = np.vstack((np.asarray(x, dtype=float),
-                     np.asarray(y, dtype=float),
-                     np.asarray(z, dtype=float)))
-    rot = matrix @ pts
-    return rot[0], rot[1], rot[2]
+    return orbit_transforms.apply(_planet_transformation_matrix(planet_name),
+                                  x, y, z)
 def plot_satellite_orbit(satellite_name, planetary_params, parent_planet, color, fig=None, 
                          date=None, days_to_plot=None, current_position=None,
                          show_apsidal_markers=False):
@@ -3462,12 +3449,11 @@ def plot_satellite_orbit(satellite_name, planetary_params, parent_planet, color,
             max_angle = 2 * np.pi * orbital_fraction
             
             # Generate orbit points only for the requested time range
-            num_points = max(30, int(360 * min(orbital_fraction, 1.0)))  # At least 30 points
-            theta = np.linspace(0, max_angle, num_points)
+            theta = orbit_sampling.arc_anomalies(a, e, 0, max_angle)
             print(f"  Plotting {days_to_plot} days = {orbital_fraction:.2f} orbits (period: {period_days:.3f} days)", flush=True)
         else:
             # Full orbit
-            theta = np.linspace(0, 2*np.pi, 360)  # 360 points for smoothness
+            theta = orbit_sampling.ellipse_anomalies(a, e)
         # Generate ellipse in orbital plane
         r = a * (1 - e**2) / (1 + e * np.cos(theta))
         
@@ -3480,11 +3466,11 @@ def plot_satellite_orbit(satellite_name, planetary_params, parent_planet, color,
         Omega_rad = np.radians(Omega)
         # Standard orbital element rotation sequence
         # 1. Longitude of ascending node (Omega) around z-axis
-        x_temp, y_temp, z_temp = rotate_points(x_orbit, y_orbit, z_orbit, Omega_rad, 'z')
         # 2. Inclination (i) around x-axis
-        x_temp, y_temp, z_temp = rotate_points(x_temp, y_temp, z_temp, i_rad, 'x')
         # 3. Argument of periapsis (omega) around z-axis
-        x_temp, y_temp, z_temp = rotate_points(x_temp, y_temp, z_temp, omega_rad, 'z')
+        # Each branch below appends its planet's frame rotations; the whole
+        # chain is one matrix from orbit_transforms, applied once at the end.
+        element_steps = ((Omega_rad, 'z'), (i_rad, 'x'), (omega_rad, 'z'))
         
         # Transformation from a planet's equatorial frame to ecliptic frame:
         # 
@@ -3552,7 +3538,7 @@ def plot_satellite_orbit(satellite_name, planetary_params, parent_planet, color,
                 
                 print(f"  Time-varying: a={a:.6f} AU, e={e:.6f}, i={i:.2f} deg, omega={omega:.2f} deg, Omega={Omega:.2f} deg", flush=True)
                 # Regenerate the orbit with new elements
-                theta = np.linspace(0, 2*np.pi, 360)
+                theta = orbit_sampling.ellipse_anomalies(a, e)
                 r = a * (1 - e**2) / (1 + e * np.cos(theta))
                 
                 x_orbit = r * np.cos(theta)
@@ -3565,9 +3551,7 @@ def plot_satellite_orbit(satellite_name, planetary_params, parent_planet, color,
                 Omega_rad = np.radians(Omega)
                 
                 # Apply standard orbital rotations with updated elements
-                x_temp, y_temp, z_temp = rotate_points(x_orbit, y_orbit, z_orbit, Omega_rad, 'z')
-                x_temp, y_temp, z_temp = rotate_points(x_temp, y_temp, z_temp, i_rad, 'x')
-                x_temp, y_temp, z_temp = rotate_points(x_temp, y_temp, z_temp, omega_rad, 'z')
+                element_steps = ((Omega_rad, 'z'), (i_rad, 'x'), (omega_rad, 'z'))
             # The Y-rotation of 25.19 deg suggests the node reference is already 
             # aligned with the ecliptic in some way. However, there's still
             # a visible offset in your plot.
@@ -3579,7 +3563,7 @@ def plot_satellite_orbit(satellite_name, planetary_params, parent_planet, color,
             
             # 2. Then apply the Mars tilt
             mars_y_rotation = np.radians(25.19)
-            x_final, y_final, z_final = rotate_points(x_temp, y_temp, z_temp, mars_y_rotation, 'y')
+            frame_steps = ((mars_y_rotation, 'y'),)
             print(f"Transformation applied: Mars with Y-axis rotation of 25.19 deg", flush=True)   
     #        z_adjustment = np.radians(10)  # Shift the z adjustment after the y adjustment -- does not improve the discrepancy
     #        x_temp, y_temp, z_temp = rotate_points(x_temp, y_temp, z_temp, z_adjustment, 'z') 
@@ -3605,7 +3589,7 @@ def plot_satellite_orbit(satellite_name, planetary_params, parent_planet, color,
                     print(f"  Mean elements: a={a:.6f} AU, e={e:.6f}, i={i:.4f} deg (Jupiter eq)", flush=True)
                     
                     # Regenerate orbit with updated elements
-                    theta = np.linspace(0, 2*np.pi, 360)
+                    theta = orbit_sampling.ellipse_anomalies(a, e)
                     r = a * (1 - e**2) / (1 + e * np.cos(theta))
                     
                     x_orbit = r * np.cos(theta)
@@ -3617,13 +3601,11 @@ def plot_satellite_orbit(satellite_name, planetary_params, parent_planet, color,
                     omega_rad = np.radians(omega)
                     Omega_rad = np.radians(Omega)
                     
-                    x_temp, y_temp, z_temp = rotate_points(x_orbit, y_orbit, z_orbit, Omega_rad, 'z')
-                    x_temp, y_temp, z_temp = rotate_points(x_temp, y_temp, z_temp, i_rad, 'x')
-                    x_temp, y_temp, z_temp = rotate_points(x_temp, y_temp, z_temp, omega_rad, 'z')
+                    element_steps = ((Omega_rad, 'z'), (i_rad, 'x'), (omega_rad, 'z'))
             
             # Transform from Jupiter equatorial to ecliptic
             jupiter_tilt = np.radians(3.13)
-            x_final, y_final, z_final = rotate_points(x_temp, y_temp, z_temp, jupiter_tilt, 'x')
+            frame_steps = ((jupiter_tilt, 'x'),)
             print(f"  Transform: Jupiter equatorial [OK] ecliptic (3.13 deg X-rotation)", flush=True)
         elif parent_planet == 'Saturn':
             if satellite_name == 'Phoebe':
@@ -3644,15 +3626,15 @@ def plot_satellite_orbit(satellite_name, planetary_params, parent_planet, color,
                 node_correction = np.radians(-30.0)  # Empirical adjustment
                 
                 # Apply transformations in sequence:
-                # a) Rotate from Laplace plane toward Saturn's orbital plane
-                x_rot1, y_rot1, z_rot1 = rotate_points(x_temp, y_temp, z_temp, -laplace_tilt, 'x')
-                
-                # b) Apply node correction to align ascending nodes
-                x_rot2, y_rot2, z_rot2 = rotate_points(x_rot1, y_rot1, z_rot1, node_correction, 'z')
-                
-                # c) Transform to ecliptic using Saturn's orbital elements
-                x_rot3, y_rot3, z_rot3 = rotate_points(x_rot2, y_rot2, z_rot2, -saturn_orbit_node, 'z')
-                x_final, y_final, z_final = rotate_points(x_rot3, y_rot3, z_rot3, -saturn_orbit_inc, 'x')
+                frame_steps = (
+                    # a) Rotate from Laplace plane toward Saturn's orbital plane
+                    (-laplace_tilt, 'x'),
+                    # b) Apply node correction to align ascending nodes
+                    (node_correction, 'z'),
+                    # c) Transform to ecliptic using Saturn's orbital elements
+                    (-saturn_orbit_node, 'z'),
+                    (-saturn_orbit_inc, 'x'),
+                )
                 
                 print(f"Transformation applied: Phoebe from Laplace plane to ecliptic (enhanced)", flush=True)
 # Saturn moons (except Phoebe) - follows Jupiter pattern. The calculate_saturn_satellite_elements() function currently only has 
@@ -3676,7 +3658,7 @@ def plot_satellite_orbit(satellite_name, planetary_params, parent_planet, color,
                         print(f"  Mean elements: a={a:.6f} AU, e={e:.6f}, i={i:.4f} deg (Saturn eq)", flush=True)
                         
                         # Regenerate FULL orbit with updated elements
-                        theta = np.linspace(0, 2*np.pi, 360)
+                        theta = orbit_sampling.ellipse_anomalies(a, e)
                         r = a * (1 - e**2) / (1 + e * np.cos(theta))
                         
                         x_orbit = r * np.cos(theta)
@@ -3688,13 +3670,11 @@ def plot_satellite_orbit(satellite_name, planetary_params, parent_planet, color,
                         omega_rad = np.radians(omega)
                         Omega_rad = np.radians(Omega)
                         
-                        x_temp, y_temp, z_temp = rotate_points(x_orbit, y_orbit, z_orbit, Omega_rad, 'z')
-                        x_temp, y_temp, z_temp = rotate_points(x_temp, y_temp, z_temp, i_rad, 'x')
-                        x_temp, y_temp, z_temp = rotate_points(x_temp, y_temp, z_temp, omega_rad, 'z')
+                        element_steps = ((Omega_rad, 'z'), (i_rad, 'x'), (omega_rad, 'z'))
                 
                 # Transform from Saturn equatorial to ecliptic (same as Jupiter pattern)
                 saturn_tilt = np.radians(-26.73)  # Saturn's axial tilt (negative for correct direction)
-                x_final, y_final, z_final = rotate_points(x_temp, y_temp, z_temp, saturn_tilt, 'x')
+                frame_steps = ((saturn_tilt, 'x'),)
                 print(f"  Transform: Saturn equatorial [OK] ecliptic (-26.73 deg X-rotation)", flush=True)
         elif parent_planet == 'Uranus':
             # Transformation from Uranus's equatorial frame to ecliptic frame:
@@ -3723,11 +3703,10 @@ def plot_satellite_orbit(satellite_name, planetary_params, parent_planet, color,
             # in space, where its equatorial plane is nearly perpendicular to its orbital plane.
             uranus_tilt = 105  # uranus tilt is 97.77 degrees            
             
-            # First apply rotation around x-axis
-            x_rot1, y_rot1, z_rot1 = rotate_points(x_temp, y_temp, z_temp, np.radians(uranus_tilt), 'x')
-            
-            # Then apply rotation around y-axis with the same angle
-            x_final, y_final, z_final = rotate_points(x_rot1, y_rot1, z_rot1, np.radians(uranus_tilt), 'y')
+            # First apply rotation around x-axis,
+            # then apply rotation around y-axis with the same angle
+            frame_steps = ((np.radians(uranus_tilt), 'x'),
+                           (np.radians(uranus_tilt), 'y'))
             
             print(f"Transformation applied: Uranus with X and Y rotations of {uranus_tilt} deg", flush=True)
             
@@ -3742,23 +3721,21 @@ def plot_satellite_orbit(satellite_name, planetary_params, parent_planet, color,
                 # Step 1: Rotate around z-axis by Neptune's pole Right Ascension
                 # This aligns the x-axis with the line of nodes (intersection of Neptune's equator and the ecliptic)
                 ra_pole = np.radians(planet_poles['Neptune']['ra'])
-                x_rot1, y_rot1, z_rot1 = rotate_points(x_temp, y_temp, z_temp, ra_pole, 'z')
                 
                 # Step 2: Rotate around x-axis by (90 deg - Neptune's pole Declination)
                 # This tilts the orbital plane to match Neptune's equatorial tilt relative to the ecliptic
                 dec_pole = np.radians(90 - planet_poles['Neptune']['dec'])
-                x_rot2, y_rot2, z_rot2 = rotate_points(x_rot1, y_rot1, z_rot1, dec_pole, 'x')
                 
                 # Step 3: Fine-tuning with a 3 deg z-axis rotation
                 # This small adjustment compensates for reference frame differences between
                 # Neptune's pole coordinates and Triton's orbital elements
-                x_final, y_final, z_final = rotate_points(x_rot2, y_rot2, z_rot2, np.radians(3), 'z')
+                frame_steps = ((ra_pole, 'z'), (dec_pole, 'x'), (np.radians(3), 'z'))
                 
                 print(f"Transformation applied: Triton with Neptune pole orientation + 3 deg z-axis adjustment", flush=True)
             else:
                 # Standard transformation for other Neptune satellites
                 tilt_rad = np.radians(planet_tilts['Neptune'])
-                x_final, y_final, z_final = rotate_points(x_temp, y_temp, z_temp, tilt_rad, 'x')
+                frame_steps = ((tilt_rad, 'x'),)
         elif parent_planet == 'Pluto':
             # Special case for Pluto's satellites
             # Apply the optimized transformation: X-Tilt->Y-Tilt->Z-105
@@ -3768,24 +3745,25 @@ def plot_satellite_orbit(satellite_name, planetary_params, parent_planet, color,
             pluto_tilt_rad = np.radians(pluto_tilt)
             
             # 1. X-axis rotation by Pluto's tilt
-            x_rotated, y_rotated, z_rotated = rotate_points(x_temp, y_temp, z_temp, pluto_tilt_rad, 'x')
             # 2. Y-axis rotation by Pluto's tilt
-            x_rotated, y_rotated, z_rotated = rotate_points(x_rotated, y_rotated, z_rotated, pluto_tilt_rad, 'y')
             # 3. Z-axis rotation by -105 degrees
             z_angle = np.radians(-105)
-            x_final, y_final, z_final = rotate_points(x_rotated, y_rotated, z_rotated, z_angle, 'z')
+            frame_steps = ((pluto_tilt_rad, 'x'), (pluto_tilt_rad, 'y'), (z_angle, 'z'))
             
             print(f"Transformation applied: Pluto X-Tilt->Y-Tilt->Z-105", flush=True)
         elif parent_planet in planet_tilts:
             # Use recorded tilt for other planets
             tilt_rad = np.radians(planet_tilts[parent_planet])
-            x_final, y_final, z_final = rotate_points(x_temp, y_temp, z_temp, tilt_rad, 'x')
+            frame_steps = ((tilt_rad, 'x'),)
             print(f"Transformation applied: {parent_planet} with tilt={planet_tilts[parent_planet]} deg", flush=True)
             
         else:
             # No transformation for planets without tilt data
-            x_final, y_final, z_final = x_temp, y_temp, z_temp
+            frame_steps = ()
             print(f"No transformation applied for {parent_planet} (no tilt data available)", flush=True)
+
+        x_final, y_final, z_final = orbit_transforms.rotate_sequence(
+            x_orbit, y_orbit, z_orbit, element_steps + frame_steps)
         
         # Create hover text for the orbit
         # Check if epoch exists in orbital_params (from planetary_params)
@@ -4063,7 +4041,7 @@ def plot_mars_moon_osculating_orbit(fig, satellite_name, horizons_id, date, colo
     print(f"  Omega = {Omega_osc:.2f} deg", flush=True)
     
     # Generate orbit points (full orbit)
-    theta = np.linspace(0, 2*np.pi, 360)
+    theta = orbit_sampling.ellipse_anomalies(a_osc, e_osc)
     
     # Calculate radius for each point
     r_osc = a_osc * (1 - e_osc**2) / (1 + e_osc * np.cos(theta))
@@ -4084,11 +4062,11 @@ def plot_mars_moon_osculating_orbit(fig, satellite_name, horizons_id, date, colo
     # Therefore we do NOT apply the Mars Y-rotation here!
     
     # 1. Rotate by argument of periapsis (omega) around z-axis
-    x_temp, y_temp, z_temp = rotate_points(x_orbit_osc, y_orbit_osc, z_orbit_osc, omega_rad_osc, 'z')
     # 2. Rotate by inclination (i) around x-axis  
-    x_temp, y_temp, z_temp = rotate_points(x_temp, y_temp, z_temp, i_rad_osc, 'x')
     # 3. Rotate by longitude of ascending node (Omega) around z-axis
-    x_final_osc, y_final_osc, z_final_osc = rotate_points(x_temp, y_temp, z_temp, Omega_rad_osc, 'z')
+    x_final_osc, y_final_osc, z_final_osc = orbit_transforms.rotate_sequence(
+        x_orbit_osc, y_orbit_osc, z_orbit_osc,
+        ((omega_rad_osc, 'z'), (i_rad_osc, 'x'), (Omega_rad_osc, 'z')))
     
     # NO Mars Y-rotation needed - elements are already in ecliptic frame!
     print(f"  Note: Osculating elements are in ecliptic frame (i={i_osc:.2f} deg), no Mars rotation applied", flush=True)
@@ -4178,10 +4156,9 @@ def plot_moon_ideal_orbit(fig, date, center_object_name='Earth', color=None, day
     else:
         orbital_fraction = 1.0
     
-    num_points = int(360 * orbital_fraction)
-    num_points = min(num_points, 7200)
-    
-    theta = np.linspace(0, 2 * np.pi * orbital_fraction, num_points)
+    # Fixed elements retrace the same ellipse each revolution, so at most 20
+    # are drawn (the old 7200-point cap at 360 points per orbit)
+    max_angle = 2 * np.pi * min(orbital_fraction, 20.0)
     
     # ==================== PLOT ANALYTICAL ORBIT ====================
     # Always plot the analytical orbit (time-averaged elements)
@@ -4201,10 +4178,11 @@ def plot_moon_ideal_orbit(fig, date, center_object_name='Earth', color=None, day
     print(f"  Omega = {Omega_ana:.2f} deg", flush=True)
     
     # Calculate analytical orbit
-    r_ana = a_ana * (1 - e_ana**2) / (1 + e_ana * np.cos(theta))
-    x_orbit_ana = r_ana * np.cos(theta)
-    y_orbit_ana = r_ana * np.sin(theta)
-    z_orbit_ana = np.zeros_like(theta)
+    theta_ana = orbit_sampling.arc_anomalies(a_ana, e_ana, 0, max_angle)
+    r_ana = a_ana * (1 - e_ana**2) / (1 + e_ana * np.cos(theta_ana))
+    x_orbit_ana = r_ana * np.cos(theta_ana)
+    y_orbit_ana = r_ana * np.sin(theta_ana)
+    z_orbit_ana = np.zeros_like(theta_ana)
     
     # Apply rotations for analytical orbit
     i_rad_ana = np.radians(i_ana)
@@ -4280,6 +4258,7 @@ def plot_moon_ideal_orbit(fig, date, center_object_name='Earth', color=None, day
         print(f"  Omega = {Omega_osc:.2f} deg", flush=True)
         
         # Calculate osculating orbit
+        theta = orbit_sampling.arc_anomalies(a_osc, e_osc, 0, max_angle)
         r_osc = a_osc * (1 - e_osc**2) / (1 + e_osc * np.cos(theta))
         x_orbit_osc = r_osc * np.cos(theta)
         y_orbit_osc = r_osc * np.sin(theta)
@@ -4342,7 +4321,7 @@ def plot_moon_ideal_orbit(fig, date, center_object_name='Earth', color=None, day
     if show_apsidal_markers:
         # Use analytical elements for apsidal marker positions
         # Calculate positions using analytical orbit
-        r_ana = a_ana * (1 - e_ana**2) / (1 + e_ana * np.cos(theta))
+        r_ana = a_ana * (1 - e_ana**2) / (1 + e_ana * np.cos(theta_ana))
         
         # Find periapsis (closest approach - perigee for Moon)
         periapsis_idx = np.argmin(r_ana)
@@ -4537,7 +4516,7 @@ def plot_earth_moon_barycenter_orbit(fig, object_name, date, color, show_apsidal
         print(f"  Plotting: a={a:.7f} AU, i={i:.4f} deg (ecliptic), epoch={epoch}", flush=True)
         
         # Generate orbital path
-        theta = np.linspace(0, 2*np.pi, 360)
+        theta = orbit_sampling.ellipse_anomalies(a, e)
         r = a * (1 - e**2) / (1 + e * np.cos(theta))
         
         x_orbit = r * np.cos(theta)
@@ -4549,9 +4528,9 @@ def plot_earth_moon_barycenter_orbit(fig, object_name, date, color, show_apsidal
         Omega_rad = np.radians(Omega)
         
         # Standard Keplerian rotation sequence
-        x_temp, y_temp, z_temp = rotate_points(x_orbit, y_orbit, z_orbit, omega_rad, 'z')
-        x_temp, y_temp, z_temp = rotate_points(x_temp, y_temp, z_temp, i_rad, 'x')
-        x_final, y_final, z_final = rotate_points(x_temp, y_temp, z_temp, Omega_rad, 'z')
+        x_final, y_final, z_final = orbit_transforms.rotate_sequence(
+            x_orbit, y_orbit, z_orbit,
+            ((omega_rad, 'z'), (i_rad, 'x'), (Omega_rad, 'z')))
         
         # Build hover text based on mode and object
         if is_barycenter_mode:
@@ -4742,48 +4721,29 @@ def generate_hyperbolic_orbit_points(a, e, i, omega, Omega, rotate_points, max_d
     # For hyperbolic orbits, the true anomaly range is limited
     theta_inf = np.arccos(-1/e)  # Asymptotic true anomaly
     
-    # For very high eccentricity, we need special handling
-    if e > 5:
-        # High eccentricity: focus on the visible region
-        # Calculate the true anomaly where r = max_distance
+    # Stay clear of the asymptote (tighter margin for very high eccentricity)
+    theta_limit = theta_inf - (0.01 if e > 5 else 0.1)
+    
+    if q <= max_distance:
+        # Adaptive samples out to max_distance, dense through perihelion.
+        # The true anomaly where r = max_distance:
         # r = a(e^2 - 1) / (1 + e*cos(theta))
         # Solving for theta: cos(theta) = (a(e^2 - 1)/r - 1) / e
-        
-        cos_theta_max = ((abs(a) * (e**2 - 1) / max_distance) - 1) / e
-        
-        if cos_theta_max >= -1 and cos_theta_max <= 1:
-            theta_visible = np.arccos(cos_theta_max)
-            # Use the smaller angle
-            theta_limit = min(theta_inf - 0.01, theta_visible)
-        else:
-            # Very extreme case - just show near perihelion
-            theta_limit = min(theta_inf - 0.01, np.pi/4)  # Max 45 degrees
-        
-        # Use more points for smoother curve
-        num_points = 1000
+        theta_limit = orbit_sampling.clip_anomaly(
+            abs(a) * (e**2 - 1), e, max_distance, theta_limit)
+        theta = orbit_sampling.hyperbola_anomalies(a, e, theta_limit)
+        r = abs(a) * (e**2 - 1) / (1 + e * np.cos(theta))
+        valid_mask = (r > 0) & (r <= max_distance * (1 + 1e-9))
+        theta = theta[valid_mask]
+        r = r[valid_mask]
     else:
-        # Standard approach for moderate eccentricity
-        theta_limit = theta_inf - 0.1  # Use 0.1 radian margin
-        num_points = 500
-    
-    # Create array of true anomaly values
-    theta = np.linspace(-theta_limit, theta_limit, num_points)
-    
-    # Calculate radius for each true anomaly
-    r = abs(a) * (e**2 - 1) / (1 + e * np.cos(theta))
-    
-    # Filter out points that are too far from the Sun
-    valid_mask = (r > 0) & (r <= max_distance)
-    
-    # Check if we have enough valid points
-    if np.sum(valid_mask) < 50:
-        # If too few points, focus on perihelion region
+        # Perihelion lies beyond max_distance: show the perihelion region
         if e > 10:
             # For extremely high eccentricity, use very small angle range
-            theta_perihelion = np.linspace(-0.05, 0.05, 200)  # +/-2.9 degrees
+            theta_perihelion = orbit_sampling.hyperbola_anomalies(a, e, min(0.05, theta_limit))  # +/-2.9 degrees
         else:
             # For high eccentricity, use small angle range
-            theta_perihelion = np.linspace(-np.pi/6, np.pi/6, 500)  # +/-30 degrees
+            theta_perihelion = orbit_sampling.hyperbola_anomalies(a, e, min(np.pi/6, theta_limit))  # +/-30 degrees
         
         r_perihelion = abs(a) * (e**2 - 1) / (1 + e * np.cos(theta_perihelion))
         valid_perihelion = (r_perihelion > 0) & (r_perihelion <= max_distance * 1.5)
@@ -4796,9 +4756,6 @@ def generate_hyperbolic_orbit_points(a, e, i, omega, Omega, rotate_points, max_d
             print(f"Warning: Extremely high eccentricity (e={e:.6f}), showing minimal trajectory", flush=True)
             theta = np.linspace(-0.01, 0.01, 20)
             r = abs(a) * (e**2 - 1) / (1 + e * np.cos(theta))
-    else:
-        theta = theta[valid_mask]
-        r = r[valid_mask]
     
     # Convert to Cartesian coordinates in orbital plane
     x_orbit = r * np.cos(theta)
@@ -5695,15 +5652,10 @@ def plot_idealized_orbits(fig, objects_to_plot, center_id='Sun', objects=None,
             
             # For elliptical orbits (e <= 1), continue with existing code:
             # Generate ellipse in orbital plane
-            # CRITICAL FIX: For near-parabolic orbits (e > 0.99), ensure theta=pi is included
-            # Otherwise the orbit trace won't pass through the exact apoapsis point
-            if e > 0.99:
-                # For near-parabolic: create array that includes exactly 0, pi, and 2*pi
-                theta_first_half = np.linspace(0, np.pi, 181)  # 0 to pi, including both endpoints
-                theta_second_half = np.linspace(np.pi, 2*np.pi, 181)[1:]  # pi to 2*pi, excluding pi (already included)
-                theta = np.concatenate([theta_first_half, theta_second_half])
-            else:
-                theta = np.linspace(0, 2*np.pi, 360)  # 360 points for smoothness
+            # Adaptive samples (dense through perihelion for near-parabolic
+            # orbits); 0, pi and 2*pi are always included, so the trace passes
+            # through the exact apoapsis point
+            theta = orbit_sampling.ellipse_anomalies(a, e)
             r = a * (1 - e**2) / (1 + e * np.cos(theta))
             x_orbit = r * np.cos(theta)
             y_orbit = r * np.sin(theta)
@@ -6174,7 +6126,7 @@ def test_triton_rotations(satellite_name, planetary_params, color, fig=None):
         Omega = orbital_params.get('Omega', 0)
         
         # Generate ellipse in orbital plane
-        theta = np.linspace(0, 2*np.pi, 360)
+        theta = orbit_sampling.ellipse_anomalies(a, e)
         r = a * (1 - e**2) / (1 + e * np.cos(theta))
         
         x_orbit = r * np.cos(theta)
@@ -6341,7 +6293,7 @@ def test_pluto_moon_rotations(satellite_name, planetary_params, color, fig=None)
         print(f"Orbital elements: a={a}, e={e}, i={i} deg, omega={omega} deg, Omega={Omega} deg", flush=True)
         
         # Generate ellipse in orbital plane
-        theta = np.linspace(0, 2*np.pi, 360)
+        theta = orbit_sampling.ellipse_anomalies(a, e)
         r = a * (1 - e**2) / (1 + e * np.cos(theta))
         
         x_orbit = r * np.cos(theta)
@@ -6596,7 +6548,7 @@ def very_fine_pluto_rotations(satellite_name, planetary_params, color, fig=None,
         print(f"X range: {x_range}, Y range: {y_range}, Z range: {z_range}, Step: {step}", flush=True)
         
         # Generate ellipse in orbital plane
-        theta = np.linspace(0, 2*np.pi, 360)
+        theta = orbit_sampling.ellipse_anomalies(a, e)
         r = a * (1 - e**2) / (1 + e * np.cos(theta))
         
         x_orbit = r * np.cos(theta)
@@ -6748,7 +6700,7 @@ def pluto_system_final_transform(satellite_name, planetary_params, color, fig=No
         print(f"Transformation: X={transform['x_angle']} deg, Y={transform['y_angle']} deg, Z={transform['z_angle']} deg, Order={transform['order']}", flush=True)
         
         # Generate ellipse in orbital plane
-        theta = np.linspace(0, 2*np.pi, 360)
+        theta = orbit_sampling.ellipse_anomalies(a, e)
         r = a * (1 - e**2) / (1 + e * np.cos(theta))
         
         x_orbit = r * np.cos(theta)
@@ -6992,31 +6944,21 @@ def plot_hyperbolic_osculating_orbit(fig, obj_name, obj_info, center_id, color_m
     clip_distance = axis_range * 1.5   # 50% beyond visible edge
     # ---- Asymptote angle -----------------------------------------------------
     asymptote_angle = np.arccos(-1.0 / e_osc)   # radians -- r -> inf at this angle
-    # ---- Binary search for theta where r = clip_distance ---------------------
+    # ---- Closed-form theta where r = clip_distance ---------------------------
     def r_hyp(th):
         return abs_a * (e_osc**2 - 1.0) / (1.0 + e_osc * np.cos(th))
-    th_lo, th_hi = 0.0, asymptote_angle - 1e-8
-    for _ in range(80):
-        th_mid = (th_lo + th_hi) / 2.0
-        if r_hyp(th_mid) < clip_distance:
-            th_lo = th_mid
-        else:
-            th_hi = th_mid
-    theta_clip = min(th_lo, asymptote_angle - np.radians(0.1))
+    theta_clip = orbit_sampling.clip_anomaly(
+        abs_a * (e_osc**2 - 1.0), e_osc, clip_distance,
+        asymptote_angle - np.radians(0.1))
     print(f"[HypOsc] Asymptote: {np.degrees(asymptote_angle):.1f} deg | "
           f"Clip theta: {np.degrees(theta_clip):.1f} deg "
           f"(r={r_hyp(theta_clip) * KM_PER_AU:,.0f} km)", flush=True)
     # ---- Nonlinear (sinh) sampling: dense near periapsis (theta=0) ----------
     # sinh spacing: t in [0,1] -> sinh(scale*t)/sinh(scale) in [0,1]
     # scale=3 gives ~10x more points near center than at edge.
+    # Full arc, both arms in one pass: [-theta_clip .. 0 .. +theta_clip]
     N = 300   # points per arm
-    scale = 3.0
-    t = np.linspace(0, 1, N)
-    t_sinh = np.sinh(scale * t) / np.sinh(scale)   # nonlinear 0..1
-    theta_arm = t_sinh * theta_clip   # 0 .. theta_clip
-    # Full arc: [-theta_clip .. 0 .. +theta_clip]
-    # Reverse the negative arm so points run in order from -theta_clip to +theta_clip
-    theta_full = np.concatenate([-theta_arm[::-1], theta_arm])
+    theta_full = orbit_sampling.sinh_arms(theta_clip, N, 3.0)
     r_full = r_hyp(theta_full)
     # Guard non-positive r
     valid = r_full > 0
@@ -7031,9 +6973,9 @@ def plot_hyperbolic_osculating_orbit(fig, obj_name, obj_info, center_id, color_m
     i_rad     = np.radians(i_osc)
     omega_rad = np.radians(omega_osc)
     Omega_rad = np.radians(Omega_osc)
-    x_t, y_t, z_t = rotate_points(x_orbit, y_orbit, z_orbit, omega_rad, 'z')
-    x_t, y_t, z_t = rotate_points(x_t, y_t, z_t, i_rad, 'x')
-    x_final, y_final, z_final = rotate_points(x_t, y_t, z_t, Omega_rad, 'z')
+    x_final, y_final, z_final = orbit_transforms.rotate_sequence(
+        x_orbit, y_orbit, z_orbit,
+        ((omega_rad, 'z'), (i_rad, 'x'), (Omega_rad, 'z')))
     # ---- Hover text ----------------------------------------------------------
     asymptote_deg = np.degrees(asymptote_angle)
     pert_note = (
@@ -7108,7 +7050,7 @@ def plot_perihelion_osculating_orbit(fig, obj_name, obj_info, color_map,
        Elements fetched at Tp give the osculating conic AT perihelion.
        Three-path Tp resolution: osculating cache -> analytical elements -> fetch.
     2. Arc bounded by the plotted cube (spatial clipping).
-       Same approach as Capability C: binary search for theta where r = clip_distance.
+       Same approach as Capability C: closed-form theta where r = clip_distance.
        Works for both hyperbolic (asymptote-bounded) and elliptical (full orbit clipped).
     3. Point density highest at perihelion (sinh spacing for hyperbolic,
        uniform with extra density near perihelion for elliptical).
@@ -7256,24 +7198,14 @@ def plot_perihelion_osculating_orbit(fig, obj_name, obj_info, color_map,
         asymptote_angle = np.arccos(-1.0 / e_osc)
         def r_hyp(th):
             return abs_a * (e_osc**2 - 1.0) / (1.0 + e_osc * np.cos(th))
-        # Binary search for theta where r = clip_distance
-        th_lo, th_hi = 0.0, asymptote_angle - 1e-8
-        for _ in range(80):
-            th_mid = (th_lo + th_hi) / 2.0
-            if r_hyp(th_mid) < clip_distance:
-                th_lo = th_mid
-            else:
-                th_hi = th_mid
-        theta_clip = min(th_lo, asymptote_angle - np.radians(0.1))
+        # Closed-form theta where r = clip_distance
+        theta_clip = orbit_sampling.clip_anomaly(
+            abs_a * (e_osc**2 - 1.0), e_osc, clip_distance,
+            asymptote_angle - np.radians(0.1))
         print(f"[PeriOsc] Asymptote: {np.degrees(asymptote_angle):.1f} deg | "
               f"Clip theta: {np.degrees(theta_clip):.1f} deg", flush=True)
-        # Sinh spacing: dense near perihelion
-        N = 300
-        scale = 3.0
-        t = np.linspace(0, 1, N)
-        t_sinh = np.sinh(scale * t) / np.sinh(scale)
-        theta_arm = t_sinh * theta_clip
-        theta_full = np.concatenate([-theta_arm[::-1], theta_arm])
+        # Sinh spacing: dense near perihelion, both arms in one pass
+        theta_full = orbit_sampling.sinh_arms(theta_clip, 300, 3.0)
         r_full = r_hyp(theta_full)
         # Guard non-positive r
         valid = r_full > 0
@@ -7298,9 +7230,9 @@ def plot_perihelion_osculating_orbit(fig, obj_name, obj_info, color_map,
             return semi_latus / (1.0 + e_osc * np.cos(th))
         # Find the theta range where r <= clip_distance
         # For high-e ellipses, most of the orbit is beyond clip_distance.
-        # Binary search for the clip angle from perihelion (theta=0).
         # At theta=0, r=q (minimum). At theta=pi, r=aphelion (maximum).
-        # We want the largest theta where r <= clip_distance.
+        # We want the largest theta where r <= clip_distance; r grows
+        # monotonically between, so cos(theta) = (p / clip_distance - 1) / e.
         r_apo = a_osc * (1.0 + e_osc)  # aphelion distance
         if r_apo <= clip_distance:
             # Entire ellipse fits in the plot
@@ -7308,15 +7240,8 @@ def plot_perihelion_osculating_orbit(fig, obj_name, obj_info, color_map,
             print(f"[PeriOsc] Full ellipse fits within clip distance "
                   f"(aphelion {r_apo:.4f} AU <= clip {clip_distance:.4f} AU)", flush=True)
         else:
-            # Binary search for clip angle
-            th_lo, th_hi = 0.0, np.pi
-            for _ in range(80):
-                th_mid = (th_lo + th_hi) / 2.0
-                if r_ell(th_mid) < clip_distance:
-                    th_lo = th_mid
-                else:
-                    th_hi = th_mid
-            theta_clip = th_lo
+            # Closed-form clip angle
+            theta_clip = orbit_sampling.clip_anomaly(semi_latus, e_osc, clip_distance)
             print(f"[PeriOsc] Ellipse clipped at theta: {np.degrees(theta_clip):.1f} deg "
                   f"(r={r_ell(theta_clip):.4f} AU)", flush=True)
         # Generate points: symmetric about perihelion
@@ -7324,14 +7249,11 @@ def plot_perihelion_osculating_orbit(fig, obj_name, obj_info, color_map,
         N = 500
         if e_osc > 0.95:
             # Sinh spacing for near-parabolic: dense at perihelion
-            scale = 2.0
-            t = np.linspace(0, 1, N)
-            t_spaced = np.sinh(scale * t) / np.sinh(scale)
-            theta_arm = t_spaced * theta_clip
+            theta_full = orbit_sampling.sinh_arms(theta_clip, N, 2.0)
         else:
             # Uniform spacing for moderate eccentricity
             theta_arm = np.linspace(0, theta_clip, N)
-        theta_full = np.concatenate([-theta_arm[::-1], theta_arm])
+            theta_full = np.concatenate([-theta_arm[::-1], theta_arm])
         r_full = r_ell(theta_full)
         # Guard non-positive r (shouldn't happen for ellipse but be safe)
         valid = r_full > 0
@@ -7352,9 +7274,9 @@ def plot_perihelion_osculating_orbit(fig, obj_name, obj_info, color_map,
     i_rad     = np.radians(i_osc)
     omega_rad = np.radians(omega_osc)
     Omega_rad = np.radians(Omega_osc)
-    x_t, y_t, z_t = rotate_points(x_orbit, y_orbit, z_orbit, omega_rad, 'z')
-    x_t, y_t, z_t = rotate_points(x_t, y_t, z_t, i_rad, 'x')
-    x_final, y_final, z_final = rotate_points(x_t, y_t, z_t, Omega_rad, 'z')
+    x_final, y_final, z_final = orbit_transforms.rotate_sequence(
+        x_orbit, y_orbit, z_orbit,
+        ((omega_rad, 'z'), (i_rad, 'x'), (Omega_rad, 'z')))
     # ---- Hover text ----------------------------------------------------------
     pert_note = (
         "<br><br><i>Osculating orbit: instantaneous Keplerian fit<br>"
@@ -3,8 +3,18 @@
 Smart incremental cache manager for VizieR catalog data and SIMBAD properties.
 Handles incremental fetching when query parameters change, avoiding redundant queries.
 
+Cached VOTs are read through vot_sidecar, which serves them from a binary
+columnar copy (sorted by distance or magnitude) instead of parsing the XML.
+
+Expanding a cache fetches only the new range, in parallax or magnitude
+bands (vizier_bands), persisting each band as it arrives so an interrupted
+expansion resumes where it stopped.
+
 Role: cache
 Domain: stars
+
+Module updated: October 2026 (VOT reads go through the vot_sidecar columnar cache)
+Module updated: October 2026 (banded, resumable incremental fetch)
 """
 
 import os
@@ -19,6 +29,8 @@ from astropy.table import Table, vstack
 from astropy.io import votable
 import logging
 
+import vot_sidecar
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,6 +56,10 @@ class CacheMetadata:
     actual_min_magnitude: Optional[float] = None
     actual_max_magnitude: Optional[float] = None
     
+    # Bands of an unfinished expansion already saved under <cache>.bands/
+    # ({'lo', 'hi', 'file', 'rows'}, limits in ly or mag)
+    bands: Optional[List[Dict[str, Any]]] = None
+    
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization."""
         return asdict(self)
@@ -202,29 +218,21 @@ class IncrementalCacheManager:
         data_path = os.path.join(self.cache_dir, data_filename)
         
         try:
-            # Load cached data
+            # Load cached data; a "subset" is one contiguous slice of the
+            # sorted columnar sidecar rather than an XML parse plus mask
             logger.info(f"Loading cached data from {data_filename}")
-            data = Table.read(data_path, format='votable')
-            
-            # Filter if needed
+            key = None
             if mode == 'distance' and limit_value < metadata.limit_value:
-                if 'Distance_ly' in data.colnames:
-                    mask = data['Distance_ly'] <= limit_value
-                    data = data[mask]
-                    logger.info(f"Filtered to {len(data)} stars within {limit_value} ly")
-                    
+                key = vot_sidecar.DISTANCE_COLUMN
             elif mode == 'magnitude' and limit_value < metadata.limit_value:
-                # Find appropriate magnitude column
-                mag_col = None
-                for col in ['Vmag', 'Gmag', 'Estimated_Vmag']:
-                    if col in data.colnames:
-                        mag_col = col
-                        break
-                
-                if mag_col:
-                    mask = data[mag_col] <= limit_value
-                    data = data[mask]
-                    logger.info(f"Filtered to {len(data)} stars brighter than {limit_value}")
+                key = vot_sidecar.MAGNITUDE_COLUMNS
+            data = vot_sidecar.read_vot(data_path, key,
+                                        limit_value if key else None, mode=mode)
+
+            if mode == 'distance' and key:
+                logger.info(f"Filtered to {len(data)} stars within {limit_value} ly")
+            elif mode == 'magnitude' and key:
+                logger.info(f"Filtered to {len(data)} stars brighter than {limit_value}")
             
             return data
             
@@ -262,6 +270,74 @@ class IncrementalCacheManager:
         
         return {}
     
+    def expand_in_bands(self, v, data_filename: str, catalog: str, mode: str,
+                        metadata: CacheMetadata, limit_value: float,
+                        fetch_band=None) -> Optional[Table]:
+        """
+        Widen a cache from metadata.limit_value to limit_value band by band.
+        
+        Bands already saved by an interrupted run are reused; the rest are
+        fetched concurrently (vizier_bands.BandedFetch) and recorded in the
+        metadata as each completes. Returns the merged table, saved with
+        the new limit, or None if some band failed (rerun to resume).
+        
+        Args:
+            v: Vizier instance (its timeout is used for the worker queries)
+            fetch_band: Optional callable(Band) -> Table replacing the
+                VizieR query (tests, other catalogs)
+        """
+        from vizier_bands import BandedFetch, plan_bands
+        
+        if fetch_band is None:
+            fetch_band = self._vizier_band_fetcher(v, catalog)
+        
+        banded = BandedFetch(self.cache_dir, data_filename, fetch_band)
+        records = [r for r in banded.completed(metadata.bands)
+                   if r['lo'] >= metadata.limit_value - 1e-9 and r['hi'] <= limit_value + 1e-9]
+        bands = plan_bands(catalog, mode, metadata.limit_value, limit_value, records)
+        logger.info(f"Expanding {data_filename} {metadata.limit_value} -> {limit_value}: "
+                    f"{len(bands)} bands to fetch, {len(records)} already saved")
+        
+        def record_progress(done):
+            metadata.bands = done
+            self.save_metadata(data_filename, metadata)
+        
+        complete, records = banded.run(bands, records, record_progress)
+        if not complete:
+            logger.warning(f"Expansion of {data_filename} incomplete; "
+                           f"{len(records)} bands saved for the next run")
+            return None
+        
+        existing_data = vot_sidecar.read_vot(
+            os.path.join(self.cache_dir, data_filename), mode=mode)
+        combined = self.merge_tables(existing_data, banded.load_segments(records), mode)
+        
+        min_parallax = None
+        if mode == 'distance':
+            min_parallax = (1 / (limit_value / 3.26156)) * 1000
+        self.save_data_with_metadata(combined, data_filename, catalog, mode,
+                                     limit_value, min_parallax)
+        banded.cleanup()
+        return combined
+    
+    @staticmethod
+    def _vizier_band_fetcher(v, catalog: str):
+        """Band query against VizieR, one Vizier instance per worker thread."""
+        import threading
+        from data_acquisition import (
+            GAIA_CATALOG, HIPPARCOS_CATALOG, fetch_catalog_range, initialize_vizier)
+        
+        vizier_catalog = HIPPARCOS_CATALOG if catalog == 'hipparcos' else GAIA_CATALOG
+        timeout = getattr(v, 'TIMEOUT', 120)
+        local = threading.local()
+        
+        def fetch_band(band):
+            if not hasattr(local, 'vizier'):
+                local.vizier = initialize_vizier(timeout=timeout)
+            return fetch_catalog_range(local.vizier, vizier_catalog, band.column, band.constraint)
+        
+        return fetch_band
+    
     def merge_tables(self, existing_data: Table, new_data: Table,
                     mode: str) -> Table:
         """
@@ -343,6 +419,8 @@ class IncrementalCacheManager:
         try:
             data.write(data_path, format='votable', overwrite=True)
             logger.info(f"Saved {len(data)} entries to {data_filename}")
+            vot_sidecar.write_sidecar(
+                data, data_path, vot_sidecar.default_sort_key(data.colnames, mode))
             
             # Save metadata
             self.save_metadata(data_filename, metadata)
@@ -447,17 +525,14 @@ def smart_load_or_fetch_hipparcos(v, hip_data_file: str, mode: str,
             if mode == 'magnitude' and limit_value <= 10.0:
                 logger.info(f"Using comprehensive Hipparcos magnitude cache (size: {file_size/1e6:.1f}MB)")
                 try:
-                    data = Table.read(cache_path, format='votable')
+                    data = vot_sidecar.read_vot(cache_path, 'Vmag', limit_value, mode=mode)
                     
-                    # Filter to requested magnitude
+                    # Filtered to requested magnitude (unfiltered without Vmag)
                     if 'Vmag' in data.colnames:
-                        mask = data['Vmag'] <= limit_value
-                        filtered = data[mask]
-                        logger.info(f"Filtered Hipparcos cache from {len(data)} to {len(filtered)} stars <= mag {limit_value}")
-                        return filtered
+                        logger.info(f"Filtered Hipparcos cache to {len(data)} stars <= mag {limit_value}")
                     else:
                         logger.warning("No Vmag column found in Hipparcos cache")
-                        return data
+                    return data
                         
                 except Exception as e:
                     logger.warning(f"Could not read Hipparcos cache, falling back to normal logic: {e}")
@@ -466,17 +541,14 @@ def smart_load_or_fetch_hipparcos(v, hip_data_file: str, mode: str,
             elif mode == 'distance' and limit_value <= 150:  # Within 150 light-years
                 logger.info(f"Using comprehensive Hipparcos distance cache (size: {file_size/1e6:.1f}MB)")
                 try:
-                    data = Table.read(cache_path, format='votable')
+                    data = vot_sidecar.read_vot(cache_path, 'Distance_ly', limit_value, mode=mode)
                     
-                    # Filter to requested distance
+                    # Filtered to requested distance (unfiltered without Distance_ly)
                     if 'Distance_ly' in data.colnames:
-                        mask = data['Distance_ly'] <= limit_value
-                        filtered = data[mask]
-                        logger.info(f"Filtered Hipparcos cache from {len(data)} to {len(filtered)} stars <= {limit_value} ly")
-                        return filtered
+                        logger.info(f"Filtered Hipparcos cache to {len(data)} stars <= {limit_value} ly")
                     else:
                         logger.warning("No Distance_ly column found in Hipparcos cache")
-                        return data
+                    return data
                         
                 except Exception as e:
                     logger.warning(f"Could not read Hipparcos cache, falling back to normal logic: {e}")
@@ -495,47 +567,21 @@ def smart_load_or_fetch_hipparcos(v, hip_data_file: str, mode: str,
         return cache_mgr.load_and_filter_cache(hip_data_file, metadata, mode, limit_value)
     
     elif status == 'expand':
-        # Need to fetch additional data
+        # Need to fetch additional data: only the new range, in bands
         logger.info(f"Incremental fetch needed: {metadata.limit_value} -> {limit_value}")
         
-        # Load existing data
-        existing_data = Table.read(os.path.join(cache_mgr.cache_dir, hip_data_file),
-                                  format='votable')
-        
-        # Calculate parameters for incremental fetch
         params = cache_mgr.calculate_incremental_query_params(
             mode, metadata.limit_value, limit_value
         )
-        
         logger.info(f"Fetching {params['description']}")
         
-        # Fetch only new data
-        # This would need modification of the original fetch function
-        # to accept min/max constraints
-        # For now, we'll fall back to full fetch
-        new_data = load_or_fetch_hipparcos_data(
-            v, f"temp_{hip_data_file}", mode=mode,
-            mag_limit=limit_value if mode == 'magnitude' else None,
-            parallax_constraint=kwargs.get('parallax_constraint')
-        )
-        
-        # Merge old and new data
-        if new_data is not None:
-            combined = cache_mgr.merge_tables(existing_data, new_data, mode)
-            
-            # Save merged data
-            min_parallax = None
-            if mode == 'distance':
-                min_parallax = (1 / (limit_value / 3.26156)) * 1000
-            
-            cache_mgr.save_data_with_metadata(
-                combined, hip_data_file, 'hipparcos', mode, 
-                limit_value, min_parallax
-            )
-            
+        combined = cache_mgr.expand_in_bands(
+            v, hip_data_file, 'hipparcos', mode, metadata, limit_value)
+        if combined is not None:
             return combined
         
-        return existing_data
+        # Some band failed: serve what is cached, resume on the next run
+        return cache_mgr.load_and_filter_cache(hip_data_file, metadata, mode, limit_value)
     
     else:  # 'missing' or 'invalid'
         # Need full fetch
@@ -583,23 +629,15 @@ def smart_load_or_fetch_gaia(v, gaia_data_file: str, mode: str,
             if mode == 'magnitude' and limit_value <= 9.0:
                 logger.info(f"Using comprehensive Gaia magnitude cache (size: {file_size/1e6:.1f}MB)")
                 try:
-                    data = Table.read(cache_path, format='votable')
-                    
-                    # Filter to requested magnitude
-                    mag_col = None
-                    for col in ['Gmag', 'Estimated_Vmag']:
-                        if col in data.colnames:
-                            mag_col = col
-                            break
+                    mag_cols = ('Gmag', 'Estimated_Vmag')
+                    data = vot_sidecar.read_vot(cache_path, mag_cols, limit_value, mode=mode)
                     
-                    if mag_col:
-                        mask = data[mag_col] <= limit_value
-                        filtered = data[mask]
-                        logger.info(f"Filtered Gaia cache from {len(data)} to {len(filtered)} stars <= mag {limit_value}")
-                        return filtered
+                    # Filtered to requested magnitude (unfiltered without one)
+                    if any(col in data.colnames for col in mag_cols):
+                        logger.info(f"Filtered Gaia cache to {len(data)} stars <= mag {limit_value}")
                     else:
                         logger.warning("No magnitude column found in Gaia cache")
-                        return data
+                    return data
                         
                 except Exception as e:
                     logger.warning(f"Could not read Gaia cache, falling back to normal logic: {e}")
@@ -608,17 +646,14 @@ def smart_load_or_fetch_gaia(v, gaia_data_file: str, mode: str,
             elif mode == 'distance' and limit_value <= 150:  # Within 150 light-years
                 logger.info(f"Using comprehensive Gaia distance cache (size: {file_size/1e6:.1f}MB)")
                 try:
-                    data = Table.read(cache_path, format='votable')
+                    data = vot_sidecar.read_vot(cache_path, 'Distance_ly', limit_value, mode=mode)
                     
-                    # Filter to requested distance
+                    # Filtered to requested distance (unfiltered without Distance_ly)
                     if 'Distance_ly' in data.colnames:
-                        mask = data['Distance_ly'] <= limit_value
-                        filtered = data[mask]
-                        logger.info(f"Filtered Gaia cache from {len(data)} to {len(filtered)} stars <= {limit_value} ly")
-                        return filtered
+                        logger.info(f"Filtered Gaia cache to {len(data)} stars <= {limit_value} ly")
                     else:
                         logger.warning("No Distance_ly column found in Gaia cache")
-                        return data
+                    return data
                         
                 except Exception as e:
                     logger.warning(f"Could not read Gaia cache, falling back to normal logic: {e}")
@@ -647,42 +682,18 @@ def smart_load_or_fetch_gaia(v, gaia_data_file: str, mode: str,
         # For distance mode, continue with incremental fetch
         logger.info(f"Incremental fetch needed: {metadata.limit_value} -> {limit_value}")
         
-        # Load existing data
-        existing_data = Table.read(os.path.join(cache_mgr.cache_dir, gaia_data_file),
-                                  format='votable')
-        
-        # Calculate parameters for incremental fetch
         params = cache_mgr.calculate_incremental_query_params(
             mode, metadata.limit_value, limit_value
         )
-        
         logger.info(f"Fetching {params['description']}")
         
-        # Fetch only new data
-        # For now, fall back to full fetch (would need API modification)
-        new_data = load_or_fetch_gaia_data(
-            v, f"temp_{gaia_data_file}", mode=mode,
-            mag_limit=limit_value if mode == 'magnitude' else None,
-            parallax_constraint=kwargs.get('parallax_constraint')
-        )
-        
-        # Merge old and new data
-        if new_data is not None:
-            combined = cache_mgr.merge_tables(existing_data, new_data, mode)
-            
-            # Save merged data
-            min_parallax = None
-            if mode == 'distance':
-                min_parallax = (1 / (limit_value / 3.26156)) * 1000
-            
-            cache_mgr.save_data_with_metadata(
-                combined, gaia_data_file, 'gaia', mode,
-                limit_value, min_parallax
-            )
-            
+        combined = cache_mgr.expand_in_bands(
+            v, gaia_data_file, 'gaia', mode, metadata, limit_value)
+        if combined is not None:
             return combined
         
-        return existing_data
+        # Some band failed: serve what is cached, resume on the next run
+        return cache_mgr.load_and_filter_cache(gaia_data_file, metadata, mode, limit_value)
     
     else:  # 'missing' or 'invalid'
         # Need full fetch
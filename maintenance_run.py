@@ -2,17 +2,25 @@
 
 RUN COMMAND
 -----------
-Open this file in VS Code and click Run. It takes no arguments.
+Open this file in VS Code and click Run. It needs no arguments.
 
     python maintenance_run.py
+    python maintenance_run.py --all        # re-run every tool
+    python maintenance_run.py --jobs 1     # one tool at a time
 
 Run it after any edit session and before a push.
 
 WHAT IT DOES
 ------------
 Runs the four GENERATORS, then the CHECKERS, and prints one summary at
-the end. Nothing stops on a failure -- every tool runs every time, so a
-single pass shows the whole picture rather than the first problem in it.
+the end. Nothing stops on a failure -- every tool is accounted for every
+time, so a single pass shows the whole picture rather than the first
+problem in it.
+
+Tools that do not touch each other's files run side by side, one per
+core, and a tool is not re-run when nothing it reads or writes has moved
+since a run of it that passed: its row quotes that run and says so. See
+SCHEDULING below for how inputs are found and why the order still holds.
 
 The staleness report comes FIRST, before anything else runs. That
 ordering is load-bearing: this runner runs provenance_scanner.py, so
@@ -29,7 +37,9 @@ without fixing it has only added a step. The output files are
 fingerprinted before and after, so the summary says which ones actually
 moved -- that is the regenerate-then-read-back half, and it is there
 because generated documents went stale four separate times in one
-evening while nothing noticed.
+evening while nothing noticed. A generator is skipped only when neither
+what it reads nor the documents it wrote have moved since, which is
+exactly the case where regenerating would write the same bytes.
 
 CHECKERS report a problem and inform the push call. They run last so
 their verdict is the last thing on screen.
@@ -95,13 +105,21 @@ Role: devtool
 Domain: dev_tools
 
 Module created: August 2026 with Anthropic's Claude Opus 5.
+Module updated: October 2026 (dependency-aware parallel scheduling;
+tools whose inputs are unchanged since a passing run are not re-run).
 """
 
+import argparse
+import ast
+import fnmatch
 import hashlib
+import json
 import os
 import subprocess
 import sys
 import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 # ============================================================
 # THE SUITE
@@ -136,6 +154,27 @@ CHECKERS = [
     ('Reset completeness', ['test_reset_completeness.py'],
      'RESET COMPLETENESS:'),
     ('Orbit cache', ['test_orbit_cache.py'], None),
+    ('Plot profiler', ['test_plot_profiler.py'], None),
+    ('Plot jobs', ['test_plot_jobs.py'], None),
+    ('Camera waypoints', ['test_camera_waypoints.py'], None),
+    ('Render LOD', ['test_render_lod.py'], None),
+    ('VOT sidecar', ['test_vot_sidecar.py'], None),
+    ('Star properties store', ['test_star_properties_store.py'], None),
+    ('VizieR bands', ['test_vizier_bands.py'], None),
+    ('Star sphere tiles', ['test_star_sphere_tiles.py'], None),
+    ('Climate datasets', ['test_climate_datasets.py'], None),
+    ('Climate refresh', ['test_climate_refresh.py'], None),
+    ('ERA5 daily products', ['test_era5_daily.py'], None),
+    ('Earth system grid', ['test_earth_system_grid.py'], None),
+    ('Benchmark suite', ['test_benchmark_suite.py'], None),
+    ('Osculating store', ['test_osculating_store.py'], None),
+    ('Osculating prefetch', ['test_osculating_prefetch.py'], None),
+    ('Orbit sampling', ['test_orbit_sampling.py'], None),
+    ('Orbit transforms', ['test_orbit_transforms.py'], None),
+    ('Close approach bulk', ['test_close_approach_bulk.py'], None),
+    ('Export binary positions', ['test_export_binary_positions.py'], None),
+    ('Maintenance schedule', ['test_maintenance_schedule.py'], None),
+    ('AST index', ['test_ast_index.py'], None),
     # A fourth field marks a tool REPORT-ONLY: it exits 0 whatever it
     # finds, so "passed" says only that it ran. Exactly two are, and
     # both are deliberate -- their numbers are the verdict, not their
@@ -144,6 +183,7 @@ CHECKERS = [
     ('Worksheet checker', ['worksheet_checker.py'], 'WORKSHEET CHECK:',
      True),
     ('Worksheet checker tests', ['test_worksheet_checker.py'], None),
+    ('Worksheet incremental', ['test_worksheet_incremental.py'], None),
     ('Worksheet key round trip', ['test_worksheet_keys.py'], None),
     ('Builder marker join', ['test_worksheet_request_builder.py'], None),
     ('Extractor pins', ['test_extractor_pins.py'], None),
@@ -153,6 +193,51 @@ CHECKERS = [
 
 TOOL_TIMEOUT_SECONDS = 900
 
+# label -> (inputs, outputs), read by the scheduler.
+#
+# Every tool already reads its own script and, found by parsing it, each
+# project module it imports (transitively) and each project file it names
+# in a string literal. These entries add what that cannot see: glob
+# patterns, relative to the project, for files read by listing a folder,
+# and the files a tool writes into the tree. A generator's own row already
+# names its documents. A row with no entry is a hermetic test -- it reads
+# only its imports and writes only to temp folders.
+#
+# ALWAYS in place of the inputs marks a tool that reads something the tree
+# cannot fingerprint -- git, the gallery repo, the clock -- or whose run is
+# itself the record (the scanner's history is what the staleness report
+# reads). It is never skipped, and for ordering it counts as reading every
+# file in the tree.
+#
+# A CACHE is written and read like any output, so it orders tools, but it
+# is left out of every fingerprint: its content follows from the files it
+# caches, and counting it would re-run the atlas whenever the scanner
+# added its own facts to the shared AST index.
+ALWAYS = None
+WORKSHEETS = 'documentation/worksheets/*'
+AST_INDEX = 'data/ast_index.pkl'
+CACHES = (AST_INDEX,)
+TOOL_IO = {
+    'Skill manifest':           (['skills/*/SKILL.md'], []),
+    'Module atlas':             (['*.py'], ['provenance_scanner.py',
+                                            AST_INDEX]),
+    'Data inventory':           (ALWAYS, []),
+    'Constants change':         (ALWAYS, []),
+    'Orbit cache':              ([], ['test_output/*']),
+    'Worksheet checker':        (['*.py', WORKSHEETS],
+                                 ['WORKSHEET_CHECK.md',
+                                  'data/worksheet_check_state.json',
+                                  'data/worksheet_routed.json',
+                                  'documentation/prompts/citation_review.jsonl',
+                                  AST_INDEX]),
+    'Worksheet key round trip': (['*.py', WORKSHEETS], []),
+    'Builder marker join':      (['*.py', WORKSHEETS], []),
+    'Extractor pins':           (['*.py', WORKSHEETS], []),
+    'Provenance scanner':       (ALWAYS, ['PROVENANCE_AUDIT.md',
+                                          'data/provenance_history.json',
+                                          AST_INDEX]),
+}
+
 
 # ============================================================
 # HELPERS
@@ -223,13 +308,19 @@ SKIP_DIRS = ('.git', '__pycache__', '.venv', 'venv', '.pytest_cache',
              'node_modules')
 
 
-def tree_snapshot(project_dir):
+def tree_snapshot(project_dir, previous=None):
     """{relative path: (mtime_ns, size, hash or None)} for the tree.
 
     The hash is LF-normalized, like every other fingerprint in this
     project, because a CRLF working copy is not a content change.
+
+    With `previous`, a file whose mtime and size both match its entry
+    there keeps that hash instead of being read again. The scheduler
+    re-snapshots each time a tool becomes ready, and this is what makes
+    that a stat walk rather than a second full read of the tree.
     """
     seen = {}
+    previous = previous or {}
     for root, dirs, files in os.walk(project_dir):
         dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
         for name in files:
@@ -238,6 +329,11 @@ def tree_snapshot(project_dir):
                 stat = os.stat(path)
             except OSError:
                 continue
+            key = os.path.relpath(path, project_dir).replace(os.sep, '/')
+            was = previous.get(key)
+            if was is not None and was[:2] == (stat.st_mtime_ns, stat.st_size):
+                seen[key] = was
+                continue
             digest = None
             if stat.st_size <= HASH_LIMIT_BYTES:
                 try:
@@ -247,7 +343,6 @@ def tree_snapshot(project_dir):
                         ).hexdigest()
                 except OSError:
                     digest = None
-            key = os.path.relpath(path, project_dir).replace(os.sep, '/')
             seen[key] = (stat.st_mtime_ns, stat.st_size, digest)
     return seen
 
@@ -286,8 +381,13 @@ def tree_diff(before, after):
     return written, created, removed, touched, unhashed
 
 
-def print_files_written(before, after):
-    """Name every file the run changed. Printed on every run."""
+def print_files_written(before, after, undeclared=()):
+    """Name every file the run changed. Printed on every run.
+
+    `undeclared` names changed files that no tool declares as an output:
+    the scheduler cannot order a parallel run around a write it does not
+    know about, so the report says which ones to add to TOOL_IO.
+    """
     written, created, removed, touched, unhashed = tree_diff(
         before, after)
 
@@ -312,6 +412,10 @@ def print_files_written(before, after):
     if unhashed:
         print('    %d file(s) over %d MB compared by size and mtime '
               'only' % (unhashed, HASH_LIMIT_BYTES // (1024 * 1024)))
+    if undeclared:
+        print('    not a declared output of any tool -- add it to TOOL_IO:')
+        for path in undeclared:
+            print('      %s' % path)
     if not (written or created or removed):
         print('    nothing changed on disk')
 
@@ -416,11 +520,361 @@ def staleness_report(project_dir):
     return lines
 
 
+# ============================================================
+# SCHEDULING -- parallel where independent, skipped when unchanged
+# ============================================================
+#
+# A routine pass used to run every tool one after another, each a fresh
+# interpreter, whether or not anything it reads had moved since the last
+# pass. Two changes, neither of which moves a verdict.
+#
+# ORDER COMES FROM WHAT THE TOOLS TOUCH, NOT WHERE THEY SIT. A tool's
+# inputs are its script, the project modules it imports (found by
+# parsing, so a new import is a new input without anyone declaring it),
+# the project files it names in a string literal, and its TOOL_IO
+# patterns. A tool waits for every tool above it in the tables that writes
+# what it reads, reads what it writes, or writes what it writes -- exactly
+# the orderings the one-at-a-time run guaranteed. Everything else runs
+# side by side, one tool per core.
+#
+# A TOOL WHOSE INPUTS HAVE NOT MOVED IS NOT RE-RUN. After each run, a
+# fingerprint of its inputs and declared outputs goes into STATE_PATH
+# beside its note. When the fingerprint still matches and that run
+# passed, the row is printed from the record and marked as not re-run.
+# A failure is never skipped, so its output under the table is always
+# fresh. ALWAYS tools are never skipped. --all ignores the record.
+#
+# Rows still print in table order, so the scanner's verdict is still the
+# last thing on screen. The files-written report still comes from the
+# two tree snapshots -- measured, not declared -- and it names any change
+# no tool declared, because that is a write the scheduler cannot order
+# around.
+
+STATE_PATH = 'data/maintenance_run_state.json'
+
+# One tool in the schedule. `documents` are the generator outputs its row
+# fingerprints for the note; `inputs` is ALWAYS (None) or TOOL_IO patterns;
+# `outputs` is every file it is declared to write.
+Tool = namedtuple('Tool', 'label argv_tail is_checker hint report_only '
+                          'documents inputs outputs')
+
+
+def suite():
+    """GENERATORS then CHECKERS as Tools, in table order."""
+    tools = []
+    for label, argv_tail, documents in GENERATORS:
+        inputs, outputs = TOOL_IO.get(label, ([], []))
+        tools.append(Tool(label, argv_tail, False, None, False, documents,
+                          inputs, list(documents) + list(outputs)))
+    for entry in CHECKERS:
+        inputs, outputs = TOOL_IO.get(entry[0], ([], []))
+        tools.append(Tool(entry[0], entry[1], True, entry[2],
+                          entry[3] if len(entry) > 3 else False, [],
+                          inputs, list(outputs)))
+    return tools
+
+
+def expand(patterns, tree):
+    """Tree paths matching any pattern, plus any literal path not present.
+
+    A pattern matches within one folder level: '*.py' is the top-level
+    modules, not every .py file below them.
+    """
+    found = set()
+    for pattern in patterns:
+        if not any(ch in pattern for ch in '*?['):
+            found.add(pattern)
+            continue
+        depth = pattern.count('/')
+        found.update(path for path in tree
+                     if path.count('/') == depth
+                     and fnmatch.fnmatchcase(path, pattern))
+    return found
+
+
+def basenames(tree):
+    """{file name: [tree paths]}, for string literals naming a file."""
+    names = {}
+    for path in tree:
+        names.setdefault(path.rsplit('/', 1)[-1], []).append(path)
+    return names
+
+
+def references(path, tree, names, cache):
+    """(modules, files) a project source refers to.
+
+    Modules are the top-level project modules it imports. Files are the
+    project files a string literal names, by path or by file name --
+    including a module named for importlib. Cached by content hash, so a
+    pass re-parses only sources that changed.
+    """
+    digest = tree.get(path, (None, None, None))[2]
+    hit = cache.get(path)
+    if digest is not None and hit and hit[0] == digest:
+        return hit[1], hit[2]
+    modules, files = set(), set()
+    try:
+        with open(path, 'rb') as handle:
+            parsed = ast.parse(handle.read())
+    except (OSError, SyntaxError, ValueError):
+        parsed = ast.Module(body=[], type_ignores=[])
+    for node in ast.walk(parsed):
+        if isinstance(node, ast.Import):
+            tops = [alias.name.split('.')[0] for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module \
+                and not node.level:
+            tops = [node.module.split('.')[0]]
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str) \
+                and len(node.value) < 200:
+            value = node.value.replace('\\', '/')
+            if value + '.py' in tree:
+                files.add(value + '.py')
+            elif value in tree:
+                files.add(value)
+            elif value in names:
+                files.update(names[value])
+            continue
+        else:
+            continue
+        modules.update(top + '.py' for top in tops if top + '.py' in tree)
+    modules.discard(path)
+    result = (sorted(modules), sorted(files))
+    if digest is not None:
+        cache[path] = [digest, result[0], result[1]]
+    return result
+
+
+def input_paths(tool, tree, names, cache):
+    """Every tree path the tool reads, or None for an ALWAYS tool.
+
+    Imports are followed all the way down; file names in literals count
+    only in the tool's own script. A library module's literals are mostly
+    the files it WRITES -- the scanner names its audit -- and following
+    them would re-run every test that imports it on every pass.
+    """
+    if tool.inputs is ALWAYS:
+        return None
+    script = tool.argv_tail[0]
+    paths = set(expand(tool.inputs, tree))
+    paths.update(arg for arg in tool.argv_tail if arg in tree)
+    paths.update(references(script, tree, names, cache)[1])
+    queue = [script]
+    seen = set()
+    while queue:
+        module = queue.pop()
+        if module in seen:
+            continue
+        seen.add(module)
+        queue.extend(references(module, tree, names, cache)[0])
+    paths |= seen
+    paths.discard(STATE_PATH)
+    return paths
+
+
+def fingerprint(paths, tree):
+    """One hash over the paths' content (size and mtime when unhashed)."""
+    digest = hashlib.md5()
+    for path in sorted(paths):
+        entry = tree.get(path)
+        if entry is None:
+            fact = 'absent'
+        elif entry[2] is None:
+            fact = '%d:%d' % (entry[1], entry[0])
+        else:
+            fact = entry[2]
+        digest.update(('%s\0%s\n' % (path, fact)).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def run_key(tool, tree, names, cache):
+    """Fingerprint of the tool's inputs and outputs; None when ALWAYS."""
+    reads = input_paths(tool, tree, names, cache)
+    if reads is None:
+        return None
+    return fingerprint((reads | expand(tool.outputs, tree)) - set(CACHES),
+                       tree)
+
+
+def dependencies(tools, tree, names, cache):
+    """{index: indices of earlier tools it must wait for}."""
+    reads = [input_paths(tool, tree, names, cache) for tool in tools]
+    writes = [expand(tool.outputs, tree) for tool in tools]
+
+    def overlap(read, written):
+        return bool(written) if read is None else bool(read & written)
+
+    deps = {}
+    for i in range(len(tools)):
+        deps[i] = set(
+            j for j in range(i)
+            if overlap(reads[i], writes[j]) or overlap(reads[j], writes[i])
+            or writes[i] & writes[j])
+    return deps
+
+
+def load_state(project_dir):
+    """The record of the last pass; empty when absent, unreadable, or
+    written by a different interpreter."""
+    try:
+        with open(os.path.join(project_dir, STATE_PATH),
+                  encoding='utf-8') as handle:
+            state = json.load(handle)
+    except (OSError, ValueError):
+        state = {}
+    if not isinstance(state, dict) or state.get('python') != sys.version:
+        state = {}
+    state['python'] = sys.version
+    state.setdefault('tools', {})
+    state.setdefault('references', {})
+    return state
+
+
+def save_state(project_dir, state):
+    path = os.path.join(project_dir, STATE_PATH)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + '.tmp', 'w', encoding='utf-8', newline='\n') as handle:
+        json.dump(state, handle, indent=1, sort_keys=True)
+    os.replace(path + '.tmp', path)
+
+
+def generator_note(rc, documents, before, after):
+    """A generator's row note: which of its documents actually moved."""
+    moved = [path for path in documents
+             if before[path][1] != after[path][1]]
+    written = [path for path in documents
+               if before[path][0] != after[path][0]]
+    if rc is None:
+        return 'DID NOT RUN'
+    if rc != 0:
+        return 'exit %d' % rc
+    if moved:
+        return 'rewrote ' + ', '.join(moved)
+    if written:
+        return ('unchanged (%d of %d rewritten, content identical)'
+                % (len(written), len(documents)))
+    return 'unchanged (%d checked, not written)' % len(documents)
+
+
+def checker_note(rc, output, hint):
+    """A checker's row note: its verdict line, or its failure."""
+    verdict = line_containing(output, hint) if hint else ''
+    # The row already carries the label; a verdict that opens by
+    # repeating the hint spends the column on it twice. Stripped only
+    # when the hint is a genuine prefix, so a hint matched mid-line
+    # (the scanner's 'TIER-1 FINDINGS') is left exactly as printed.
+    if hint and verdict.startswith(hint):
+        verdict = verdict[len(hint):].strip()
+    if rc is None:
+        return 'DID NOT RUN'
+    if rc == 0:
+        return (verdict or last_meaningful_line(output)) or 'passed'
+    note = 'FAILED (exit %d)' % rc
+    if verdict:
+        note += ' -- ' + fit(verdict, 30)
+    return note
+
+
+def result_row(tool, rc, output, seconds, note):
+    """(label, rc, seconds, note, output, is_checker[, report_only])."""
+    if tool.is_checker:
+        return (tool.label, rc, seconds, note, output, True,
+                tool.report_only)
+    return (tool.label, rc, seconds, note, output, False)
+
+
+def run_suite(project_dir, tools, tree, state, jobs, force, emit):
+    """Run the schedule. Returns (result rows in table order, skipped).
+
+    emit(index, row) is called in table order as soon as a row and every
+    row above it are final, so the console reads as it always did.
+    """
+    cache = state['references']
+    names = basenames(tree)
+    deps = dependencies(tools, tree, names, cache)
+    rows = [None] * len(tools)
+    pending = list(range(len(tools)))
+    running = {}
+    skipped = []
+    shown = 0
+
+    def start_ready(ready):
+        for i in ready:
+            pending.remove(i)
+            tool = tools[i]
+            last = state['tools'].get(tool.label) or {}
+            key = run_key(tool, tree, names, cache)
+            if (not force and key is not None and last.get('rc') == 0
+                    and last.get('key') == key):
+                # A checker's verdict still holds and is quoted; a
+                # generator's last note describes writes that did not
+                # happen this time, so it is not.
+                note = (last.get('note', 'passed') if tool.is_checker
+                        else 'unchanged (nothing it reads has moved)')
+                rows[i] = result_row(tool, 0, '', 0.0,
+                                     note + ' [not re-run]')
+                skipped.append(tool.label)
+                continue
+            before = dict((path, snapshot(path)) for path in tool.documents)
+            future = pool.submit(run_tool, project_dir, tool.argv_tail)
+            running[future] = (i, before)
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        while pending or running:
+            # Skipped rows finish at once and can ready the rows below
+            # them, so keep going until nothing new is ready.
+            while True:
+                ready = [i for i in pending
+                         if all(rows[d] is not None for d in deps[i])]
+                if not ready:
+                    break
+                tree = tree_snapshot(project_dir, tree)
+                names = basenames(tree)
+                start_ready(ready)
+            while shown < len(rows) and rows[shown] is not None:
+                emit(shown, rows[shown])
+                shown += 1
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            tree = tree_snapshot(project_dir, tree)
+            names = basenames(tree)
+            for future in done:
+                i, before = running.pop(future)
+                tool = tools[i]
+                rc, output, seconds = future.result()
+                if tool.is_checker:
+                    note = checker_note(rc, output, tool.hint)
+                else:
+                    after = dict((path, snapshot(path))
+                                 for path in tool.documents)
+                    note = generator_note(rc, tool.documents, before, after)
+                rows[i] = result_row(tool, rc, output, seconds, note)
+                # Recorded from the tree as the tool left it, so a tool
+                # that rewrites its own input is not re-run next pass for
+                # its own write.
+                state['tools'][tool.label] = {
+                    'key': run_key(tool, tree, names, cache),
+                    'rc': rc, 'note': note, 'seconds': round(seconds, 2)}
+        while shown < len(rows) and rows[shown] is not None:
+            emit(shown, rows[shown])
+            shown += 1
+    return rows, skipped
+
+
 # ============================================================
 # MAIN
 # ============================================================
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Run the whole maintenance suite.')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help='tools run at once (default: one per core)')
+    parser.add_argument('--all', action='store_true',
+                        help='re-run every tool, ignoring the record of '
+                             'the last pass')
+    args = parser.parse_args(argv)
+
     project_dir = os.path.dirname(os.path.abspath(__file__))
     os.chdir(project_dir)
 
@@ -440,60 +894,25 @@ def main():
     # (label, rc, seconds, note, output, is_checker[, report_only])
     # Checker rows carry the seventh field; generator rows stop at six.
     # Read it with a length guard, never by unpacking a fixed width.
-    results = []
+    tools = suite()
+    state = load_state(project_dir)
+
+    def emit(index, row):
+        if index == 0:
+            print('GENERATORS -- regenerate every time; a no-op when '
+                  'nothing moved')
+            print('-' * 70)
+        if index == len(GENERATORS):
+            print()
+            print('CHECKERS -- verdict informs the push call')
+            print('-' * 70)
+        print_row(row[0], row[2], row[3])
+        sys.stdout.flush()
 
-    # ---- generators ---------------------------------------------------
-    print('GENERATORS -- regenerate every time; a no-op when nothing moved')
-    print('-' * 70)
-    for label, argv_tail, outputs in GENERATORS:
-        before = dict((path, snapshot(path)) for path in outputs)
-        rc, output, seconds = run_tool(project_dir, argv_tail)
-        after = dict((path, snapshot(path)) for path in outputs)
-        moved = [path for path in outputs
-                 if before[path][1] != after[path][1]]
-        written = [path for path in outputs
-                   if before[path][0] != after[path][0]]
-        if rc is None:
-            note = 'DID NOT RUN'
-        elif rc != 0:
-            note = 'exit %d' % rc
-        elif moved:
-            note = 'rewrote ' + ', '.join(moved)
-        elif written:
-            note = ('unchanged (%d of %d rewritten, content identical)'
-                    % (len(written), len(outputs)))
-        else:
-            note = ('unchanged (%d checked, not written)'
-                    % len(outputs))
-        print_row(label, seconds, note)
-        results.append((label, rc, seconds, note, output, False))
-    print()
-
-    # ---- checkers -----------------------------------------------------
-    print('CHECKERS -- verdict informs the push call')
-    print('-' * 70)
-    for entry in CHECKERS:
-        label, argv_tail, hint = entry[0], entry[1], entry[2]
-        report_only = entry[3] if len(entry) > 3 else False
-        rc, output, seconds = run_tool(project_dir, argv_tail)
-        verdict = line_containing(output, hint) if hint else ''
-        # The row already carries the label; a verdict that opens by
-        # repeating the hint spends the column on it twice. Stripped only
-        # when the hint is a genuine prefix, so a hint matched mid-line
-        # (the scanner's 'TIER-1 FINDINGS') is left exactly as printed.
-        if hint and verdict.startswith(hint):
-            verdict = verdict[len(hint):].strip()
-        if rc is None:
-            note = 'DID NOT RUN'
-        elif rc == 0:
-            note = (verdict or last_meaningful_line(output)) or 'passed'
-        else:
-            note = 'FAILED (exit %d)' % rc
-            if verdict:
-                note += ' -- ' + fit(verdict, 30)
-        print_row(label, seconds, note)
-        results.append((label, rc, seconds, note, output, True,
-                        report_only))
+    started = time.time()
+    results, skipped = run_suite(project_dir, tools, tree_before, state,
+                                 args.jobs, args.all, emit)
+    elapsed = time.time() - started
     print()
 
     # ---- summary ------------------------------------------------------
@@ -508,11 +927,17 @@ def main():
     print('=' * 70)
     if failed:
         print('  %d of %d checkers FAILED -- %.1fs total'
-              % (len(failed), len(checkers), total))
+              % (len(failed), len(checkers), elapsed))
         print('  ' + ', '.join(row[0] for row in failed))
     else:
         print('  %d of %d gating checkers passed -- %.1fs total'
-              % (len(gating), len(gating), total))
+              % (len(gating), len(gating), elapsed))
+    # Wall clock above, the tools' own time here: the gap is what running
+    # side by side and skipping unchanged tools saved.
+    print('  %d run, %d not re-run (inputs unchanged) -- %.1fs of tool '
+          'time, %d at once'
+          % (len(results) - len(skipped), len(skipped), total,
+             max(1, args.jobs)))
 
     # Printed in BOTH branches on purpose. The scanner's count is the
     # number the push call turns on, so hiding it behind a failure
@@ -532,7 +957,17 @@ def main():
     # call turns on. Printed whether or not anything changed: a run
     # that wrote nothing should say so rather than leaving the reader
     # to infer it from an absence.
-    print_files_written(tree_before, tree_snapshot(project_dir))
+    tree_after = tree_snapshot(project_dir, tree_before)
+    written, created, removed, _, _ = tree_diff(tree_before, tree_after)
+    declared = set()
+    for tool in tools:
+        declared |= expand(tool.outputs, tree_after)
+        declared |= expand(tool.outputs, tree_before)
+    undeclared = sorted(set(written + created + removed) - declared)
+    print_files_written(tree_before, tree_after, undeclared)
+
+    # After the after-snapshot, so the record never reports itself.
+    save_state(project_dir, state)
 
     # ---- detail for failures only -------------------------------------
     # Indexed rather than unpacked: checker rows carry a seventh field
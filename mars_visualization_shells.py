@@ -30,6 +30,7 @@ May 29, 2026: Crustal Magnetic Fields info marker (magnetosphere builder)
     (Mode 5). Magnetosphere and bow-shock markers keep factory red.
 """
 import numpy as np
+import render_lod
 import math
 import plotly.graph_objs as go
 from planet_visualization_utilities import (MARS_RADIUS_AU, create_sphere_points, create_magnetosphere_shape, create_bow_shock_shape)
@@ -314,7 +315,7 @@ def create_mars_crust_shell(center_position=(0, 0, 0)):
     center_x, center_y, center_z = center_position
     
     # Create mesh with reasonable resolution for performance
-    resolution = 24  # Reduced from typical 50 for markers
+    resolution = render_lod.linear(24)  # Reduced from typical 50 for markers
     
     # Create a UV sphere
     phi = np.linspace(0, 2*np.pi, resolution)
@@ -401,7 +402,7 @@ def create_mars_crust_shell(center_position=(0, 0, 0)):
         return points
     
     # Generate fibonacci sphere points
-    fib_points = fibonacci_sphere(samples=50)  # Originally, 50 hover points evenly distributed
+    fib_points = fibonacci_sphere(samples=render_lod.count(50))  # Originally, 50 hover points evenly distributed
     
     # Scale and offset the points
     x_hover = [p[0] * radius + center_x for p in fib_points]
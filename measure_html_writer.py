@@ -0,0 +1,132 @@
+"""
+measure_html_writer.py - Peak memory and time of the HTML writers in save_utils.
+
+Builds a synthetic orrery-shaped animation (static orbit lines plus moving
+single-point markers carried in every frame), then writes it twice -- once
+with save_utils._write_html_buffered() (fig.to_html() plus string
+injection, the pre-streaming path) and once with the streaming
+save_utils._write_html() -- and reports, for each, wall time, peak traced
+Python memory (tracemalloc) and file size. Also confirms the two files are
+identical apart from plotly's random div id.
+
+Usage:
+    python measure_html_writer.py
+    python measure_html_writer.py --frames 400 --movers 30 --orbits 40 --points 2000
+
+The defaults produce roughly a 6 MB export. Buffered peak grows with the
+export size; streaming peak stays near the cost of the page skeleton
+(plotly.js plus layout), so raise --frames toward the 50-100 MB range that
+long animation exports reach to see the gap widen.
+
+Key functions:
+    build_figure() - synthetic animation with the requested shape
+    measure() - run one writer under tracemalloc, return the numbers
+
+Consumed by: developers checking save_utils HTML writer changes
+
+Role: devtool
+Domain: dev_tools
+
+Module created: October 2026
+"""
+
+import argparse
+import os
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import plotly.graph_objs as go
+
+import save_utils
+
+_UUID_RE = re.compile(rb'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}')
+
+
+def build_figure(frames=300, movers=25, orbits=40, points=2000):
+    """Animation shaped like animate_objects output.
+
+    orbits static Scatter3d lines of `points` samples each, then `movers`
+    single-point markers that every frame updates (the 21/51 sparse-frame
+    layout: frames carry only the moving traces).
+    """
+    rng = np.random.default_rng(0)
+    fig = go.Figure()
+    theta = np.linspace(0, 2 * np.pi, points)
+    for k in range(orbits):
+        r = 0.4 + 0.8 * k
+        fig.add_trace(go.Scatter3d(
+            x=r * np.cos(theta), y=r * np.sin(theta), z=0.01 * r * np.sin(3 * theta),
+            mode='lines', name=f'Orbit {k}', hoverinfo='skip'))
+    first_mover = len(fig.data)
+    for m in range(movers):
+        fig.add_trace(go.Scatter3d(x=[0.0], y=[0.0], z=[0.0], mode='markers',
+                                   name=f'Body {m}'))
+    mover_idx = list(range(first_mover, first_mover + movers))
+
+    frame_list = []
+    for f in range(frames):
+        data = []
+        for m in range(movers):
+            p = rng.normal(size=3)
+            data.append(go.Scatter3d(
+                x=[p[0]], y=[p[1]], z=[p[2]], mode='markers',
+                text=[f'Body {m} frame {f}: ' + 'x' * 200],
+                hovertemplate='%{text}<extra></extra>'))
+        frame_list.append(go.Frame(data=data, traces=mover_idx, name=f'2026-01-{f:04d}'))
+    fig.frames = frame_list
+    return fig
+
+
+def measure(writer, fig, path):
+    """Run writer(fig, path) under tracemalloc; return (seconds, peak_bytes, size)."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    t0 = time.perf_counter()
+    writer(fig, path)
+    seconds = time.perf_counter() - t0
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak, os.path.getsize(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--movers', type=int, default=25)
+    parser.add_argument('--orbits', type=int, default=40)
+    parser.add_argument('--points', type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    print(f"Building synthetic animation: {args.frames} frames x {args.movers} movers, "
+          f"{args.orbits} orbits x {args.points} points ...")
+    fig = build_figure(args.frames, args.movers, args.orbits, args.points)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        paths = {}
+        for label, writer in (('buffered', save_utils._write_html_buffered),
+                              ('streaming', save_utils._write_html)):
+            paths[label] = os.path.join(tmp, f'{label}.html')
+            results[label] = measure(writer, fig, paths[label])
+
+        with open(paths['buffered'], 'rb') as fa, open(paths['streaming'], 'rb') as fb:
+            identical = _UUID_RE.sub(b'ID', fa.read()) == _UUID_RE.sub(b'ID', fb.read())
+
+    print()
+    print(f"{'writer':<10} {'seconds':>9} {'peak MB':>9} {'file MB':>9}")
+    for label, (seconds, peak, size) in results.items():
+        print(f"{label:<10} {seconds:>9.2f} {peak / 1e6:>9.1f} {size / 1e6:>9.1f}")
+    b_peak = results['buffered'][1]
+    s_peak = results['streaming'][1]
+    print()
+    print(f"Peak memory ratio (streaming / buffered): {s_peak / b_peak:.2f}")
+    print(f"Output identical apart from div id: {'yes' if identical else 'NO'}")
+    return 0 if identical else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""
+measure_vot_sidecar.py - Cold load time of a star cache: VOTable XML vs columnar sidecar.
+
+Writes a synthetic Hipparcos-shaped VOT (default 118,218 rows, the size of
+the full catalogue) to a temporary directory, then times:
+
+    xml        Table.read(..., format='votable') plus the boolean mask the
+               cache managers used to apply (the pre-sidecar path)
+    build      first vot_sidecar.read_vot(): XML parse plus sidecar write
+               (paid once per VOT, when it is saved or first read)
+    sidecar    vot_sidecar.read_vot() (nothing held in memory between
+               reads): manifest check, memory-mapped .npy, one contiguous slice
+
+for a distance subset, a magnitude subset (not the sort key: a masked
+gather instead of a slice) and the full table, and checks that the sidecar
+rows match the XML rows.
+
+Usage:
+    python measure_vot_sidecar.py
+    python measure_vot_sidecar.py --rows 500000 --limit-ly 50 --limit-mag 6
+
+Key functions:
+    build_table() - synthetic catalogue with Hipparcos column names
+    timed() - best-of-N wall time of one call
+
+Consumed by: developers checking vot_sidecar changes
+
+Role: devtool
+Domain: dev_tools
+
+Module created: October 2026
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import warnings
+
+import numpy as np
+from astropy.table import MaskedColumn, Table
+
+import vot_sidecar
+
+
+def build_table(rows, seed=0):
+    """Catalogue with the columns the star pipelines read, a few cells masked."""
+    rng = np.random.default_rng(seed)
+    plx = rng.lognormal(mean=1.2, sigma=1.0, size=rows)          # mas
+    table = Table()
+    table['HIP'] = np.arange(1, rows + 1, dtype=np.int32)
+    table['RAICRS'] = rng.uniform(0, 360, rows)
+    table['DEICRS'] = np.degrees(np.arcsin(rng.uniform(-1, 1, rows)))
+    table['Vmag'] = MaskedColumn(rng.normal(8.5, 1.8, rows), mask=rng.random(rows) < 0.002)
+    table['B-V'] = MaskedColumn(rng.normal(0.7, 0.5, rows), mask=rng.random(rows) < 0.01)
+    table['Plx'] = plx
+    table['e_Plx'] = rng.uniform(0.5, 2.0, rows)
+    table['pmRA'] = rng.normal(0, 50, rows)
+    table['pmDE'] = rng.normal(0, 50, rows)
+    table['SpType'] = np.array(['G2V', 'K1III', 'M0V', 'A0V', 'F5IV-V', 'B9.5Vn'],
+                               dtype=object)[rng.integers(0, 6, rows)]
+    table['Distance_ly'] = 1000.0 / plx * 3.26156
+    for name, unit in (('RAICRS', 'deg'), ('DEICRS', 'deg'), ('Vmag', 'mag'),
+                       ('B-V', 'mag'), ('Plx', 'mas'), ('e_Plx', 'mas'),
+                       ('pmRA', 'mas / yr'), ('pmDE', 'mas / yr'), ('Distance_ly', 'lyr')):
+        table[name].unit = unit
+    return table
+
+
+def timed(func, repeat=3):
+    """Best wall time of repeat calls; returns (seconds, last result)."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def _xml(path, key, limit):
+    table = Table.read(path, format='votable')
+    if key is None:
+        return table
+    return table[np.ma.filled(np.ma.asarray(table[key], dtype=float), np.nan) <= limit]
+
+
+def _same_rows(a, b):
+    return len(a) == len(b) and np.array_equal(np.asarray(a['HIP']), np.asarray(b['HIP']))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--rows', type=int, default=118218)
+    parser.add_argument('--limit-ly', type=float, default=100.0)
+    parser.add_argument('--limit-mag', type=float, default=6.0)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    warnings.simplefilter('ignore')
+    print(f"Writing synthetic catalogue: {args.rows:,} rows ...")
+    table = build_table(args.rows)
+
+    cases = (
+        (f'distance <= {args.limit_ly:g} ly', 'Distance_ly', args.limit_ly),
+        (f'Vmag <= {args.limit_mag:g}', 'Vmag', args.limit_mag),
+        ('full table', None, None),
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'hipparcos_data_distance.vot')
+        table.write(path, format='votable')
+        vot_mb = os.path.getsize(path) / 1e6
+
+        build_s, _ = timed(lambda: (vot_sidecar.write_sidecar(
+            Table.read(path, format='votable'), path, 'Distance_ly')), repeat=1)
+        side_mb = sum(os.path.getsize(p) for p in vot_sidecar.sidecar_paths(path).values()
+                      if os.path.exists(p)) / 1e6
+
+        print(f"VOT {vot_mb:.1f} MB, sidecar {side_mb:.1f} MB, "
+              f"one-off sidecar build {build_s:.2f} s\n")
+        print(f"{'read':<22} {'rows':>8} {'xml s':>8} {'sidecar s':>10} {'speedup':>8}  match")
+
+        all_match = True
+        for label, key, limit in cases:
+            xml_s, xml_rows = timed(lambda: _xml(path, key, limit), args.repeat)
+            side_s, side_rows = timed(
+                lambda: vot_sidecar.read_vot(path, key, limit), args.repeat)
+            match = _same_rows(xml_rows, side_rows)
+            all_match &= match
+            print(f"{label:<22} {len(side_rows):>8,} {xml_s:>8.3f} {side_s:>10.4f} "
+                  f"{xml_s / side_s:>7.0f}x  {'yes' if match else 'NO'}")
+
+    return 0 if all_match else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -63,6 +63,10 @@ as `patch` and is reported under "Patch scripts awaiting archive"
 with the action named, instead of landing in `undetermined` -- which
 had been carrying two unrelated meanings at once.
 
+Module updated: October 2026 (docstrings, imports, public functions and
+line counts come from ast_index, so a file is parsed at most once per run
+and not at all when it is unchanged since the last one).
+
 Role: devtool
 Domain: dev_tools
 """
@@ -75,6 +79,8 @@ import textwrap
 from datetime import datetime
 from pathlib import Path
 
+import ast_index
+
 
 # ============================================================
 # ROLE CLASSIFICATION
@@ -159,11 +165,14 @@ ROLE_MAP = {
     'data_acquisition':                       'computation',
     'data_acquisition_distance':              'computation',
     'data_processing':                        'computation',
+    'earth_system_grid':                      'computation',
     'energy_imbalance':                       'computation',
     'fetch_climate_data':                     'computation',
     'fetch_paleoclimate_data':                'computation',
     'idealized_orbits':                       'computation',
     'object_type_analyzer':                   'computation',
+    'orbit_sampling':                         'computation',
+    'orbit_transforms':                       'computation',
     'orbital_elements':                       'computation',
     'simbad_manager':                         'computation',
 
@@ -186,10 +195,17 @@ ROLE_MAP = {
 
     # cache
     'climate_cache_manager':                  'cache',
+    'climate_datasets':                       'cache',
+    'climate_refresh':                        'cache',
+    'era5_daily':                             'cache',
     'incremental_cache_manager':              'cache',
     'orbit_data_manager':                     'cache',
     'osculating_cache_manager':               'cache',
+    'osculating_prefetch':                    'cache',
+    'star_properties_store':                  'cache',
+    'vizier_bands':                           'cache',
     'vot_cache_manager':                      'cache',
+    'vot_sidecar':                            'cache',
 
     # pipeline
     'messier_object_data_handler':            'pipeline',
@@ -208,12 +224,17 @@ ROLE_MAP = {
     'earth_system_common':                    'utility',
     'formatting_utils':                       'utility',
     'palomas_orrery_helpers':                 'utility',
+    'plot_jobs':                              'utility',
+    'plot_profiler':                          'utility',
+    'render_lod':                             'utility',
     'report_manager':                         'utility',
     'shared_utilities':                       'utility',
     'shutdown_handler':                       'utility',
 
     # devtool
     'add_docstrings':                         'devtool',
+    'ast_index':                              'devtool',
+    'benchmark_suite':                        'devtool',
     'constants_change_report':                'devtool',
     'convert_hot_ph_to_json':                 'devtool',
     'create_cache_backups':                   'devtool',
@@ -228,18 +249,42 @@ ROLE_MAP = {
     'ledger_index':                           'devtool',
     'maintenance_run':                        'devtool',
     'measure_animation_html':                 'devtool',
+    'measure_html_writer':                    'devtool',
     'measure_perframe_elements':              'devtool',
+    'measure_vot_sidecar':                    'devtool',
     'module_atlas':                           'devtool',
     'provenance_history':                     'devtool',
     'provenance_scanner':                     'devtool',
     'skills_index':                           'devtool',
+    'test_ast_index':                         'devtool',
+    'test_benchmark_suite':                   'devtool',
+    'test_camera_waypoints':                  'devtool',
     'test_citation_inheritance':              'devtool',
+    'test_climate_datasets':                  'devtool',
+    'test_climate_refresh':                   'devtool',
+    'test_close_approach_bulk':               'devtool',
     'test_constants_provenance':              'devtool',
     'test_cross_checked':                     'devtool',
+    'test_earth_system_grid':                 'devtool',
+    'test_era5_daily':                        'devtool',
+    'test_export_binary_positions':           'devtool',
+    'test_maintenance_schedule':              'devtool',
     'test_orbit_cache':                       'devtool',
+    'test_orbit_sampling':                    'devtool',
+    'test_orbit_transforms':                  'devtool',
+    'test_osculating_prefetch':               'devtool',
+    'test_osculating_store':                  'devtool',
+    'test_plot_jobs':                         'devtool',
+    'test_plot_profiler':                     'devtool',
     'test_provenance_1d':                     'devtool',
+    'test_render_lod':                        'devtool',
     'test_reset_completeness':                'devtool',
+    'test_star_properties_store':             'devtool',
+    'test_star_sphere_tiles':                 'devtool',
+    'test_vizier_bands':                      'devtool',
+    'test_vot_sidecar':                       'devtool',
     'test_worksheet_checker':                 'devtool',
+    'test_worksheet_incremental':             'devtool',
     'test_worksheet_request_builder':         'devtool',
     'verify_orbit_cache':                     'devtool',
     'worksheet_checker':                      'devtool',
@@ -315,12 +360,10 @@ def parse_module_tags(filepath):
     the file cannot be mistaken for the docstring.
     """
     try:
-        with open(filepath, 'rb') as handle:
-            tree = ast.parse(handle.read())
+        doc = ast_index.module_facts(filepath)['docstring']
     except Exception:
         return UNDETERMINED, UNDETERMINED
 
-    doc = ast.get_docstring(tree, clean=False)
     if not doc:
         return UNDETERMINED, UNDETERMINED
 
@@ -414,14 +457,14 @@ ROLE_SECTION_TITLES = {
 def get_module_docstring(filepath):
     """Extract module-level docstring, falling back to leading comments."""
     try:
-        with open(filepath, 'rb') as f:
-            source = f.read()
-        tree = ast.parse(source)
+        facts = ast_index.module_facts(filepath)
     except Exception:
         return '(parse error)'
+    if not facts['parsed']:
+        return '(parse error)'
 
     # Try AST docstring first
-    doc = ast.get_docstring(tree)
+    doc = ast_index.docstring(facts['docstring'])
     if doc:
         # Split into paragraphs
         paras = doc.split('\n\n')
@@ -462,7 +505,7 @@ def get_module_docstring(filepath):
 
     # Fall back to leading comments (lines starting with #)
     try:
-        text = source.decode('utf-8', errors='replace')
+        text = ast_index.source(filepath).source.decode('utf-8', errors='replace')
     except Exception:
         return '(no description)'
 
@@ -501,13 +544,14 @@ def get_module_docstring(filepath):
 def get_public_functions(filepath):
     """Extract public function/class names with their docstrings."""
     try:
-        with open(filepath, 'rb') as f:
-            tree = ast.parse(f.read())
+        return ast_index.fact(filepath, 'public_functions', _public_functions)
     except Exception:
         return []
 
+
+def _public_functions(src):
     functions = []
-    for node in ast.iter_child_nodes(tree):
+    for node in ast.iter_child_nodes(src.tree):
         if isinstance(node, ast.FunctionDef) and not node.name.startswith('_'):
             doc = ast.get_docstring(node) or ''
             # First line only
@@ -532,31 +576,16 @@ def get_public_functions(filepath):
 def get_local_imports(filepath, local_modules):
     """Extract project-local imports from a Python file."""
     try:
-        with open(filepath, 'rb') as f:
-            tree = ast.parse(f.read())
+        imported = ast_index.module_facts(filepath)['imports']
     except Exception:
         return set()
-
-    imports = set()
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                base = alias.name.split('.')[0]
-                if base in local_modules:
-                    imports.add(base)
-        elif isinstance(node, ast.ImportFrom):
-            if node.module:
-                base = node.module.split('.')[0]
-                if base in local_modules:
-                    imports.add(base)
-    return imports
+    return {name.split('.')[0] for name in imported} & set(local_modules)
 
 
 def count_lines(filepath):
     """Count non-blank lines in a file."""
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-            return sum(1 for line in f if line.strip())
+        return ast_index.module_facts(filepath)['nonblank_lines']
     except Exception:
         return 0
 
@@ -602,6 +631,7 @@ def build_dependency_graph(project_dir):
     modules live in package directories (the gallery) is walked the same
     way as a flat one (the orrery).
     """
+    ast_index.open_index(project_dir)
     paths, collisions = iter_module_files(project_dir)
     local_modules = set(paths)
 
@@ -1105,6 +1135,7 @@ def main():
         sys.exit(1)
 
     modules = scan_modules(project_dir)
+    ast_index.open_index(project_dir).save()
 
     # ROLE_MAP is a mirror of the tags now, so refresh it from this scan
     # before writing the reports. Hand-editing it is what Phase 3 retired.
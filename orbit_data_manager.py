@@ -21,6 +21,7 @@ from astropy.time import Time
 import plotly.graph_objs as go
 
 from constants_new import KM_PER_AU
+import plot_profiler
 
         # Track which orbits we've already shown conversion messages for
 _conversion_messages_shown = set()
@@ -686,6 +687,7 @@ def fetch_orbit_path(obj_info, start_date, end_date, interval, center_id='@0', i
         }
 
         # Create Horizons object and fetch vectors        
+        plot_profiler.count(plot_profiler.HORIZONS_CALLS)
         obj = Horizons(id=object_id, id_type=id_type, location=location, epochs=epochs)
         eph = obj.vectors()
         
@@ -1799,6 +1801,8 @@ def query_horizons_elements(horizons_id, id_type='smallbody', date_str=None, cen
         
         # Define the query with proper ID and ID type
     #    obj = Horizons(id=horizons_id, id_type=id_type, location='@sun', epochs=epoch_jd)
+        plot_profiler.count(plot_profiler.HORIZONS_CALLS)
+        plot_profiler.count(plot_profiler.OSCULATING_FETCHES)
         obj = Horizons(id=horizons_id, id_type=id_type, location=location, epochs=epoch_jd)
         
         # Fetch ELEMENTS
@@ -0,0 +1,221 @@
+"""
+orbit_sampling.py - Adaptive true-anomaly sampling for conic orbit curves.
+
+The plot_* orbit functions in idealized_orbits.py drew every ellipse from a
+fixed np.linspace(0, 2*pi, 360) in true anomaly (with 181+180 splits where
+apoapsis had to land on a sample, and special perihelion grids for
+hyperbolae). That spends the same 360 points on a near-circular moon orbit
+that fills a few pixels as on a sungrazer whose perihelion turn is a
+fraction of a degree wide.
+
+This module picks the anomalies so that every chord of the drawn polyline
+stays within a tolerance in AU of the true conic:
+
+    - the chord error of a short arc is kappa * ds^2 / 8, so points are
+      spread with density sqrt(kappa / (8 * tol)) per unit arc length;
+      per unit of eccentric anomaly E (hyperbolic anomaly F) that is
+
+          sqrt(p / (8 * tol)) / ((1 - e^2) (1 - e^2 cos^2 E))^(1/4)
+          sqrt(p / (8 * tol)) / ((e^2 - 1) (e^2 cosh^2 F - 1))^(1/4)
+
+      which stays smooth even at e -> 1, where the same density per unit
+      of true anomaly spikes near apoapsis; samples are placed in E (F)
+      and converted to true anomaly
+    - the tolerance is a fraction (render_lod 'orbit_chord_fraction') of
+      the current axis half-range, or of the orbit's own extent when no
+      axis scale has been set; a ring that is a speck on a 50 AU view gets
+      the minimum count, a comet plotted at 2 AU gets its perihelion
+      resolved
+    - full ellipses are sampled as two mirrored halves, so 0, pi and 2*pi
+      (periapsis, apoapsis, closure) are always exact samples
+
+The osculating-arc plotters clip a conic where it leaves the view. r
+grows monotonically from periapsis, so the clip anomaly has the closed
+form arccos((p / r_clip - 1) / e); clip_anomaly() evaluates it for one
+conic or a whole array of them at once, where an 80-step bisection per
+object used to run. sinh_arms() builds both arms of the sinh-spaced arc
+(or every object's arms) in one outer product.
+
+The GUI sets the axis scale once per plot or animation build, before the
+idealized orbits are drawn.
+
+Key functions:
+    set_axis_scale() / axis_scale() - the current view half-range in AU
+    chord_tolerance() - chord error allowed for an orbit of a given extent
+    ellipse_anomalies() - closed ellipse, 0..2*pi
+    arc_anomalies() - any true-anomaly interval (partial or multi-orbit arcs)
+    hyperbola_anomalies() - symmetric arc -theta_limit..theta_limit
+    clip_anomaly() - anomaly where a conic reaches a clip radius (batched)
+    sinh_arms() - symmetric sinh-spaced arc anomalies (batched)
+
+Consumed by: idealized_orbits.py, palomas_orrery.py
+
+Role: computation
+Domain: orrery
+
+Module created: October 2026
+"""
+
+import numpy as np
+
+import render_lod
+
+MIN_POINTS = 32           # samples on a full ellipse, however small it looks
+MAX_POINTS = 2048         # samples on a full ellipse, however large
+FINE_GRID = 2048          # quadrature intervals per 2*pi for the point density
+
+_axis_scale = None
+
+
+def set_axis_scale(scale):
+    """Set the view half-range in AU (a number, an [lo, hi] range, or None)."""
+    global _axis_scale
+    if scale is None:
+        _axis_scale = None
+    else:
+        values = np.abs(np.atleast_1d(np.asarray(scale, dtype=float)))
+        values = values[np.isfinite(values) & (values > 0)]
+        _axis_scale = float(values.max()) if values.size else None
+    return _axis_scale
+
+
+def axis_scale():
+    """Current view half-range in AU, or None when no build has set one."""
+    return _axis_scale
+
+
+def chord_tolerance(extent, level=None):
+    """Chord error in AU allowed for an orbit reaching extent AU from its focus."""
+    fraction = render_lod.preset(level)['orbit_chord_fraction']
+    scale = _axis_scale if _axis_scale is not None else extent
+    return fraction * max(scale, 1e-12)
+
+
+def _equidistribute(density, start, stop, scale, minimum, maximum):
+    """start..stop (inclusive) split into segments of equal integrated density.
+
+    The segment count is scale times the integral, clipped to
+    [minimum, maximum].
+    """
+    fine = max(16, int(np.ceil(FINE_GRID * abs(stop - start) / (2 * np.pi))))
+    grid = np.linspace(start, stop, fine + 1)
+    g = density(grid)
+    cdf = np.concatenate(([0.0], np.cumsum(0.5 * (g[1:] + g[:-1]) * np.diff(grid))))
+    segments = int(np.ceil(scale * abs(cdf[-1])))
+    segments = int(np.clip(segments, minimum, maximum))
+    u = np.interp(np.linspace(0.0, cdf[-1], segments + 1), cdf, grid)
+    u[0], u[-1] = start, stop
+    return u
+
+
+def _bound(a, e, tolerance):
+    """(e, density per unit E, sqrt(p / (8 tol)), beta) for an ellipse."""
+    e = min(max(float(e), 0.0), 0.999999)
+    one_e2 = 1.0 - e * e
+    if tolerance is None:
+        tolerance = chord_tolerance(abs(a) * (1.0 + e))
+    scale = np.sqrt(abs(a) * one_e2 / (8.0 * tolerance))
+    beta = e / (1.0 + np.sqrt(one_e2))
+
+    def density(E):
+        return (one_e2 * (1.0 - e * e * np.cos(E) ** 2)) ** -0.25
+
+    return density, scale, beta
+
+
+def _true_from_eccentric(E, beta):
+    """True anomaly, continuous across revolutions."""
+    return E + 2.0 * np.arctan2(beta * np.sin(E), 1.0 - beta * np.cos(E))
+
+
+def _eccentric_from_true(theta, beta):
+    return theta - 2.0 * np.arctan2(beta * np.sin(theta), 1.0 + beta * np.cos(theta))
+
+
+def ellipse_anomalies(a, e, tolerance=None):
+    """
+    True anomalies for a closed ellipse, 0..2*pi inclusive.
+
+    Periapsis (0), apoapsis (pi) and the closing point (2*pi) are exact
+    samples, and the two halves mirror each other.
+    """
+    density, scale, beta = _bound(a, e, tolerance)
+    E = _equidistribute(density, 0.0, np.pi, scale, MIN_POINTS // 2, MAX_POINTS // 2)
+    half = _true_from_eccentric(E, beta)
+    half[-1] = np.pi
+    return np.concatenate((half, 2 * np.pi - half[-2::-1]))
+
+
+def arc_anomalies(a, e, start, stop, tolerance=None):
+    """True anomalies from start to stop (inclusive) for a bound orbit.
+
+    Spans longer than 2*pi (several revolutions) get proportionally more
+    points; the per-revolution limits of ellipse_anomalies apply.
+    """
+    density, scale, beta = _bound(a, e, tolerance)
+    turns = abs(stop - start) / (2 * np.pi)
+    minimum = max(4, int(np.ceil(MIN_POINTS * min(turns, 1.0))))
+    maximum = max(minimum, int(np.ceil(MAX_POINTS * max(turns, 1.0))))
+    E = _equidistribute(density, _eccentric_from_true(start, beta),
+                        _eccentric_from_true(stop, beta), scale, minimum, maximum)
+    theta = _true_from_eccentric(E, beta)
+    theta[0], theta[-1] = start, stop
+    return theta
+
+
+def hyperbola_anomalies(a, e, theta_limit, tolerance=None):
+    """
+    True anomalies -theta_limit..theta_limit for a hyperbola (e > 1).
+
+    theta_limit must stay inside the asymptote, arccos(-1/e). Perihelion
+    (0) is an exact sample and the two branches mirror each other.
+    """
+    e = float(e)
+    e2_1 = e * e - 1.0
+    p = abs(a) * e2_1
+    if tolerance is None:
+        tolerance = chord_tolerance(p / (1.0 + e * np.cos(theta_limit)))
+    ratio = np.sqrt(e2_1) / (e + 1.0)           # sqrt((e - 1) / (e + 1))
+
+    def density(F):
+        return (e2_1 * (e * e * np.cosh(F) ** 2 - 1.0)) ** -0.25
+
+    F_limit = 2.0 * np.arctanh(ratio * np.tan(theta_limit / 2.0))
+    F = _equidistribute(density, 0.0, F_limit, np.sqrt(p / (8.0 * tolerance)),
+                        MIN_POINTS // 2, MAX_POINTS // 2)
+    half = 2.0 * np.arctan(np.tanh(F / 2.0) / ratio)
+    half[-1] = theta_limit
+    return np.concatenate((-half[:0:-1], half))
+
+
+def clip_anomaly(p, e, r_clip, limit=np.pi):
+    """
+    Largest true anomaly in [0, limit] at which r = p / (1 + e cos theta)
+    is still inside r_clip.
+
+    0 when periapsis itself lies beyond r_clip; limit when the conic never
+    reaches r_clip before it (an ellipse whose aphelion fits, or a
+    hyperbola clipped short of its asymptote). Every argument may be an
+    array; the result broadcasts over them, a plain float for scalars.
+    """
+    p, e, r_clip, limit = (np.asarray(value, dtype=float)
+                           for value in (p, e, r_clip, limit))
+    excess = p / r_clip - 1.0
+    # A circle (e = 0) has no crossing: all of it fits or none of it does.
+    cos_clip = np.divide(excess, e, out=np.where(excess < 0, -1.0, 1.0), where=e > 0)
+    theta = np.arccos(np.clip(cos_clip, -1.0, 1.0))
+    return np.minimum(theta, limit)[()]
+
+
+def sinh_arms(theta_clip, points, scale):
+    """
+    Anomalies -theta_clip..theta_clip, densest at periapsis.
+
+    Each arm has `points` samples at sinh(scale * t) / sinh(scale) of
+    theta_clip, t uniform on [0, 1]; periapsis appears once per arm, as
+    the arcs have always been drawn. For an array of theta_clip the result
+    has one row per conic.
+    """
+    t = np.linspace(0.0, 1.0, points)
+    arm = np.sinh(scale * t) / np.sinh(scale)
+    return np.multiply.outer(theta_clip, np.concatenate((-arm[::-1], arm)))
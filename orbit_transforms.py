@@ -0,0 +1,120 @@
+"""
+orbit_transforms.py - Composed, memoized rotation matrices for orbit plotting.
+
+A satellite orbit is placed by a chain of axis rotations: the element
+rotations (Omega about z, i about x, omega about z, in whichever order the
+caller's convention uses) and then the parent planet's frame rotations --
+one for Jupiter and Saturn, two for Uranus, four for Phoebe. Each link
+used to be a rotate_points() call over the whole point array, taking four
+sines and cosines and writing three new arrays per link.
+
+Here each axis matrix is built once per (angle, axis), a chain is
+composed into one 3x3 matrix once per chain, and the points go through a
+single matrix product however long the chain is. The three rotate_points
+variants (idealized_orbits.rotate_points,
+palomas_orrery_helpers.rotate_points2 and
+planet_visualization_utilities.rotate_points) all delegate to rotate(),
+so they share one cache and one sign convention:
+
+    z:  x' = x cos - y sin    y' = x sin + y cos
+    x:  y' = y cos - z sin    z' = y sin + z cos
+    y:  z' = z cos - x sin    x' = z sin + x cos
+
+Matrices handed out are read-only: they are the cached objects.
+
+Key functions:
+    axis_matrix() - the 3x3 rotation about one axis (cached)
+    compose() - one matrix for a chain of (angle, axis) steps (cached)
+    apply() - a matrix applied to x, y, z arrays in one product
+    rotate() - one axis rotation of x, y, z
+    rotate_sequence() - a whole chain of rotations of x, y, z
+
+Consumed by: idealized_orbits.py, palomas_orrery_helpers.py,
+    planet_visualization_utilities.py
+
+Role: computation
+Domain: orrery
+
+Module created: October 2026
+"""
+
+import functools
+
+import numpy as np
+
+# Angles differ per date for time-varying elements, so the caches are
+# bounded; a scene uses a few hundred chains at most.
+CACHE_SIZE = 4096
+
+
+def _read_only(matrix):
+    matrix.setflags(write=False)
+    return matrix
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _axis_matrix(angle, axis):
+    c, s = np.cos(angle), np.sin(angle)
+    if axis == 'z':
+        matrix = np.array([[c, -s, 0.0], [s, c, 0.0], [0.0, 0.0, 1.0]])
+    elif axis == 'x':
+        matrix = np.array([[1.0, 0.0, 0.0], [0.0, c, -s], [0.0, s, c]])
+    elif axis == 'y':
+        matrix = np.array([[c, 0.0, s], [0.0, 1.0, 0.0], [-s, 0.0, c]])
+    else:
+        raise ValueError(f"Unknown rotation axis: {axis}. Use 'x', 'y', or 'z'.")
+    return _read_only(matrix)
+
+
+def axis_matrix(angle, axis='z'):
+    """The rotation by `angle` radians about 'x', 'y' or 'z'."""
+    return _axis_matrix(float(angle), axis)
+
+
+def _key(steps):
+    return tuple((float(angle), axis) for angle, axis in steps)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _compose(steps):
+    matrix = np.identity(3)
+    for angle, axis in steps:
+        matrix = _axis_matrix(angle, axis) @ matrix
+    return _read_only(matrix)
+
+
+def compose(steps):
+    """One matrix for (angle, axis) steps applied first to last.
+
+    compose([(a, 'z'), (b, 'x')]) is Rx(b) @ Rz(a): the same points as
+    rotating about z by a and then about x by b.
+    """
+    return _compose(_key(steps))
+
+
+def apply(matrix, x, y, z):
+    """(x', y', z') = matrix @ (x, y, z) for arrays of any one shape.
+
+    Scalars and lists are accepted as rotate_points always accepted them;
+    the results are float arrays of the broadcast shape.
+    """
+    try:
+        points = np.array((x, y, z), dtype=float)
+    except ValueError:
+        # Shapes that only broadcast together, e.g. a scalar z of 0.
+        points = np.array(np.broadcast_arrays(x, y, z), dtype=float)
+    if points.ndim == 2:
+        rotated = matrix @ points
+    else:
+        rotated = (matrix @ points.reshape(3, -1)).reshape(points.shape)
+    return rotated[0], rotated[1], rotated[2]
+
+
+def rotate(x, y, z, angle, axis='z'):
+    """Rotate points about one axis by `angle` radians."""
+    return apply(axis_matrix(angle, axis), x, y, z)
+
+
+def rotate_sequence(x, y, z, steps):
+    """Rotate points through every (angle, axis) step, in one product."""
+    return apply(compose(steps), x, y, z)
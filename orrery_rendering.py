@@ -28,11 +28,14 @@ May 28, 2026: Info-marker contrast fix at the real control point (Opus 4.7).
     shells are NOT on the live dispatch path (dead code) -- the factory
     here controls sphere-shell marker styling. See handoff v14. CUSTOM_SHELLS
     builders (magnetospheres, rings, tori) DO use their own inline markers.
+
+Module updated: October 2026 (create_ring_points scales with render_lod)
 """
 
 import numpy as np
 import plotly.graph_objs as go
 
+import render_lod
 from constants_new import CENTER_BODY_RADII, KM_PER_AU
 from planet_visualization_utilities import create_sphere_points
 
@@ -354,13 +357,16 @@ def create_ring_points(inner_radius, outer_radius, n_points, thickness=0):
     Parameters:
         inner_radius (float): Inner radius of the ring in AU
         outer_radius (float): Outer radius of the ring in AU
-        n_points (int): Number of angular points; radial sampling is n_points/10
+        n_points (int): Number of angular points; radial sampling is n_points/10.
+                        Scaled by the active render_lod level.
         thickness (float): Thickness of the ring in z-direction (AU).
                            0.0 means flat ring (z=0 for all points).
 
     Returns:
         (x, y, z): tuple of flat numpy arrays of point coordinates
     """
+    n_points = render_lod.linear(n_points, minimum=20)
+
     # Generate angular positions
     theta = np.linspace(0, 2 * np.pi, n_points)
 
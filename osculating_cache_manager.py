@@ -15,13 +15,21 @@ Created: November 18, 2025
 
 Role: cache
 Domain: orrery
+
+Module updated: October 2026 (in-process element store: the cache is parsed
+once and re-read only when the file changes; updates are written behind,
+one save per plot session)
 """
 
+import atexit
 import json
 import shutil
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 import tkinter.messagebox as messagebox
+import plot_profiler
 # Correct import:
 # from orbit_data_manager import query_horizons_elements
 # Import fallback manual dictionary
@@ -218,9 +226,9 @@ def save_cache(cache):
         
         raise
 
-def load_cache():
+def _read_cache_file():
     """
-    Load cache with two-generation recovery.
+    Read the cache file with two-generation recovery.
     
     Tries:
         1. Main file
@@ -270,6 +278,105 @@ def load_cache():
     print("[WARN] No valid cache found - starting fresh")
     return create_empty_cache()
 
+# ============================================================================
+# IN-PROCESS STORE
+# ============================================================================
+#
+# Status checks, TP resolution and the pre-fetch loops used to parse the
+# whole file once per object, and every update rewrote it. The store keeps
+# the parsed cache for the process: it is re-read only when the file's
+# mtime or size changes (another instance saved), and updates are held as
+# dirty keys until flush_cache(). Writes go straight through unless a
+# session has called defer_writes().
+
+_store = {'cache': None, 'stamp': None, 'dirty': set(), 'deferred': False}
+_store_lock = threading.RLock()
+
+
+def _file_stamp():
+    try:
+        st = CACHE_FILE.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def load_cache():
+    """
+    Load cache with two-generation recovery (see _read_cache_file).
+
+    Served from the in-process store: the file is parsed on first use and
+    again only after it changes on disk. Updates not yet flushed are kept
+    over a re-read. The returned dict is shared -- read it, and change
+    entries through put_entry().
+
+    Returns:
+        dict: Cache data or empty cache structure
+    """
+    with _store_lock:
+        stamp = _file_stamp()
+        if _store['cache'] is None or stamp != _store['stamp']:
+            cache = _read_cache_file()
+            if _store['cache'] is not None:
+                for key in _store['dirty']:
+                    cache[key] = _store['cache'][key]
+            _store['cache'] = cache
+            _store['stamp'] = _file_stamp()
+        return _store['cache']
+
+
+def put_entry(key, entry):
+    """
+    Store a cache entry; saved now, or at flush_cache() if writes are deferred.
+    """
+    with _store_lock:
+        load_cache()[key] = entry
+        _store['dirty'].add(key)
+        if not _store['deferred']:
+            flush_cache()
+
+
+def defer_writes():
+    """Hold updates in memory until flush_cache() (one save per plot session)."""
+    with _store_lock:
+        _store['deferred'] = True
+
+
+def flush_cache():
+    """
+    Save pending updates, if any, and end deferral.
+
+    On a failed save the updates stay pending for the next flush.
+    """
+    with _store_lock:
+        _store['deferred'] = False
+        if not _store['dirty']:
+            return False
+        save_cache(_store['cache'])
+        _store['dirty'].clear()
+        _store['stamp'] = _file_stamp()
+        return True
+
+
+@contextmanager
+def deferred_writes():
+    """defer_writes() for the block, flush_cache() when it ends."""
+    defer_writes()
+    try:
+        yield
+    finally:
+        flush_cache()
+
+
+def _flush_at_exit():
+    try:
+        flush_cache()
+    except Exception as e:
+        print(f"[FAIL] Osculating cache not saved at exit: {e}")
+
+
+atexit.register(_flush_at_exit)
+
 def create_empty_cache():
     """Create empty cache structure with metadata."""
     return {
@@ -496,6 +603,7 @@ def fetch_solution_tp(obj_name, horizons_id=None, id_type='smallbody'):
         # Any epoch works -- the solution TP is in the header regardless
         epoch_jd = Time('2025-01-01').jd
         
+        plot_profiler.count(plot_profiler.HORIZONS_CALLS)
         obj = Horizons(id=query_id, id_type=id_type, location='@sun', epochs=epoch_jd)
         raw = obj.vectors_async().text
         
@@ -547,11 +655,12 @@ def cache_solution_tp(obj_name, tp_jd, center_body=None):
         key = get_cache_key(obj_name, center_body)
         
         if key in cache:
-            cache[key].setdefault('elements', {})['solution_TP'] = tp_jd
+            entry = dict(cache[key])
+            entry['elements'] = dict(entry.get('elements', {}), solution_TP=tp_jd)
             print(f"[SOLUTION TP] Cached solution_TP for {key}: JD {tp_jd:.10f}", flush=True)
         else:
             # Create minimal entry if object not yet cached
-            cache[key] = {
+            entry = {
                 'elements': {'solution_TP': tp_jd},
                 'metadata': {
                     'fetched': datetime.now().isoformat(),
@@ -561,7 +670,7 @@ def cache_solution_tp(obj_name, tp_jd, center_body=None):
             }
             print(f"[SOLUTION TP] Created new cache entry for {key} with solution_TP", flush=True)
         
-        save_cache(cache)
+        put_entry(key, entry)
     except Exception as e:
         print(f"[SOLUTION TP] Cache write failed for {obj_name}: {e}", flush=True)
 
@@ -600,6 +709,7 @@ def resolve_tp(obj_name, obj_info=None, center_body=None):
             sol_tp = cache[key].get('elements', {}).get('solution_TP')
             if sol_tp is not None:
                 print(f"[RESOLVE TP] {obj_name}: Path 1 (solution TP cached) = JD {sol_tp:.10f}", flush=True)
+                plot_profiler.count(plot_profiler.OSCULATING_CACHE_HITS)
                 return sol_tp, 'solution TP (cached)'
     except Exception as ex:
         print(f"[RESOLVE TP] Path 1 failed for {obj_name}: {ex}", flush=True)
@@ -632,6 +742,7 @@ def resolve_tp(obj_name, obj_info=None, center_body=None):
             osc_tp = cache[key].get('elements', {}).get('TP')
             if osc_tp is not None:
                 print(f"[RESOLVE TP] {obj_name}: Path 3 (osculating TP cached) = JD {osc_tp:.10f}", flush=True)
+                plot_profiler.count(plot_profiler.OSCULATING_CACHE_HITS)
                 return osc_tp, 'osculating TP (cached)'
     except Exception as ex:
         print(f"[RESOLVE TP] Path 3 failed for {obj_name}: {ex}", flush=True)
@@ -802,10 +913,9 @@ def get_elements_with_prompt(obj_name, horizons_id=None, id_type='smallbody', pl
     #        cache[obj_name] = fresh_entry
     #        save_cache(cache)
 
-            # Update cache with center-aware key
-            cache = load_cache()
-            cache[cache_key] = fresh_entry
-            save_cache(cache)
+            # Update cache with center-aware key (saved at once, or at the
+            # end of the pre-fetch session when writes are deferred)
+            put_entry(cache_key, fresh_entry)
 
             return fresh_entry['elements']
         else:
@@ -836,6 +946,7 @@ def get_fallback_elements(obj_name):
         age = calculate_age_days(cache[obj_name])
         age_str = format_age_string(age) if age else "unknown age"
         print(f"[OK] Using cached elements ({age_str})")
+        plot_profiler.count(plot_profiler.OSCULATING_CACHE_HITS)
         return cache[obj_name]['elements']
     
     # Try manual dictionary
@@ -0,0 +1,251 @@
+"""
+osculating_prefetch.py - One-dialog, concurrent osculating element pre-fetch.
+
+Before a plot or animation, the build used to walk the selected bodies one
+at a time through get_elements_with_prompt: a dialog per object, then a
+blocking Horizons request per object, all on the Tk thread. Refreshing 30
+stale objects meant 30 dialogs and 30 sequential round trips.
+
+The pre-fetch now runs in three steps:
+
+    plan_prefetch()  - the (object, center body) cache key of every
+                       selected body and its freshness, from the
+                       in-process osculating store (no file parse per object)
+    ask_refresh()    - one dialog on the Tk thread listing what is missing,
+                       what is due for an update and what is fresh; the
+                       user picks whether to fetch
+    run_prefetch()   - on the build's worker thread: the chosen objects are
+                       fetched concurrently (MAX_WORKERS requests in flight,
+                       request starts spaced MIN_INTERVAL_S apart), progress
+                       reported per object, the cache saved once; every
+                       planned object then gets fresh, cached or
+                       manual-dictionary elements, as before
+
+Still "system provides information, user makes decision": the dialog
+appears even when everything is fresh, offering an update anyway.
+
+Key classes:
+    PrefetchItem - one body's cache key and freshness
+
+Key functions:
+    element_center() - osculating center body for an object in this view
+    plan_prefetch() - freshness of every selected body
+    prefetch_message() - the consolidated dialog text
+    ask_refresh() - show the dialog, return the items to fetch
+    fetch_elements() - concurrent, rate-limited Horizons fetches
+    run_prefetch() - fetch, then resolve elements for the whole plan
+
+Consumed by: palomas_orrery.py (_build_plot, _build_animation)
+
+Role: cache
+Domain: orrery
+
+Module created: October 2026
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+
+import osculating_cache_manager as ocm
+
+MAX_WORKERS = 4
+MIN_INTERVAL_S = 0.25       # spacing between Horizons request starts
+LIST_LIMIT = 8              # names listed per dialog section
+
+# Views whose osculating center applies only to the members of the system
+# (everything else in the view keeps its default center)
+SYSTEM_MEMBERS = {
+    'Pluto-Charon Barycenter': {'999', '901', '902', '903', '904', '905'},
+    'Pluto': {'999', '901', '902', '903', '904', '905'},
+    'Orcus-Vanth Barycenter': {'920090482', '120090482', '2004 DW'},
+    'Orcus': {'920090482', '120090482', '2004 DW'},
+    'Patroclus-Menoetius Barycenter': {'920000617', '120000617', 'A906 UL'},
+    'Earth-Moon Barycenter': {'399', '301'},
+    'Earth': {'399', '301'},
+}
+
+
+@dataclass
+class PrefetchItem:
+    """One body to pre-fetch: what to ask Horizons for and how fresh the cache is."""
+    name: str
+    horizons_id: Optional[str]
+    id_type: str
+    center_body: Optional[str]
+    status: dict = field(default_factory=dict)
+
+    @property
+    def key(self):
+        return ocm.get_cache_key(self.name, self.center_body)
+
+    @property
+    def is_fresh(self):
+        return bool(self.status.get('is_fresh'))
+
+
+def element_center(horizons_id, center_object_name, osculating_center_body):
+    """The view's osculating center for members of its system, else None."""
+    members = SYSTEM_MEMBERS.get(center_object_name)
+    if members and str(horizons_id) in members:
+        return osculating_center_body
+    return None
+
+
+def plan_prefetch(names, selected_objects, center_object_name, osculating_center_body):
+    """
+    PrefetchItems for names, in order, with their cache status.
+
+    An object missing from selected_objects is queried by name with the
+    view's osculating center, as the per-object loop did.
+    """
+    by_name = {obj['name']: obj for obj in selected_objects}
+    plan = []
+    for name in names:
+        obj = by_name.get(name)
+        if obj is None:
+            item = PrefetchItem(name, None, 'smallbody', osculating_center_body)
+        else:
+            horizons_id = obj.get('id', name)
+            item = PrefetchItem(name, horizons_id, obj.get('id_type', 'smallbody'),
+                                element_center(horizons_id, center_object_name,
+                                               osculating_center_body))
+        item.status = ocm.check_cache_status(item.name, item.center_body)
+        plan.append(item)
+    return plan
+
+
+def _names(items):
+    shown = []
+    for item in items[:LIST_LIMIT]:
+        age = item.status.get('age_days')
+        shown.append(item.name if age is None
+                     else f"{item.name} ({ocm.format_age_string(age).lower()})")
+    more = len(items) - LIST_LIMIT
+    return ', '.join(shown) + (f", and {more} more" if more > 0 else '')
+
+
+def prefetch_message(plan):
+    """(title, text, items a Yes would fetch) for the consolidated dialog."""
+    missing = [i for i in plan if not i.status.get('exists')]
+    due = [i for i in plan if i.status.get('exists') and not i.is_fresh]
+    fresh = [i for i in plan if i.is_fresh]
+
+    lines = [f"Osculating elements for {len(plan)} object{'s' if len(plan) != 1 else ''}:"]
+    if missing:
+        lines.append(f"  Not in cache ({len(missing)}): {_names(missing)}")
+    if due:
+        lines.append(f"  Update recommended ({len(due)}): {_names(due)}")
+    if fresh:
+        lines.append(f"  Fresh ({len(fresh)}): {_names(fresh)}")
+    lines.append('')
+
+    stale = missing + due
+    if stale:
+        lines.append(f"Fetch {len(stale)} from JPL Horizons?")
+        lines.append("(No uses cached or manual-dictionary elements)")
+        return "Update Orbital Elements?", '\n'.join(lines), stale
+    lines.append("All are fresh. Update them anyway?")
+    return "Update Orbital Elements?", '\n'.join(lines), list(plan)
+
+
+def ask_refresh(plan, parent_window=None):
+    """Show one dialog for the plan (Tk thread). Returns the items to fetch."""
+    if not plan:
+        return []
+    title, text, candidates = prefetch_message(plan)
+    if ocm.messagebox.askyesno(title, text, parent=parent_window):
+        print(f"[PRE-FETCH] User chose to update {len(candidates)} object(s)", flush=True)
+        return candidates
+    print("[PRE-FETCH] User chose to use existing elements", flush=True)
+    return []
+
+
+class _Spacing:
+    """Thread-safe spacing of request starts (at most one per interval)."""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def fetch_elements(items, plot_date=None, max_workers=MAX_WORKERS,
+                   min_interval=MIN_INTERVAL_S, progress: Optional[Callable] = None,
+                   checkpoint: Optional[Callable] = None) -> Dict[str, Optional[dict]]:
+    """
+    Fetch items from Horizons concurrently; {name: cache entry or None}.
+
+    Fetched entries are stored in the osculating cache, saved once at the
+    end. progress(done, total, item, ok) is called as each one finishes;
+    checkpoint() is called between results (plot_jobs.checkpoint raises to
+    cancel, and requests not yet started are dropped).
+    """
+    spacing = _Spacing(min_interval)
+
+    def fetch(item):
+        spacing.wait()
+        entry = ocm.fetch_osculating_elements(item.name, horizons_id=item.horizons_id,
+                                              id_type=item.id_type, date=plot_date,
+                                              center_body=item.center_body)
+        if entry:
+            ocm.put_entry(item.key, entry)
+        return entry
+
+    results = {}
+    if not items:
+        return results
+    with ocm.deferred_writes():
+        pool = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items))),
+                                  thread_name_prefix='osculating')
+        try:
+            futures = {pool.submit(fetch, item): item for item in items}
+            for done, future in enumerate(as_completed(futures), 1):
+                item = futures[future]
+                try:
+                    results[item.name] = future.result()
+                except Exception as e:
+                    print(f"[PRE-FETCH] ERROR: {item.name}: {e}", flush=True)
+                    results[item.name] = None
+                if progress:
+                    progress(done, len(items), item, results[item.name] is not None)
+                if checkpoint:
+                    checkpoint()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+    return results
+
+
+def run_prefetch(plan, refresh, plot_date=None, progress=None, checkpoint=None):
+    """
+    Fetch the refresh items, then elements for every planned object.
+
+    Returns {name: elements}: freshly fetched where that succeeded,
+    otherwise cached or manual-dictionary elements. Objects with none at
+    all are reported and left out.
+    """
+    fetched = fetch_elements(refresh, plot_date, progress=progress, checkpoint=checkpoint)
+    elements = {}
+    for item in plan:
+        entry = fetched.get(item.name)
+        if entry:
+            elements[item.name] = entry['elements']
+            continue
+        if item.name in fetched:
+            print(f"[WARN] Fetch failed for {item.name} - falling back to cached/manual elements",
+                  flush=True)
+        try:
+            elements[item.name] = ocm.get_fallback_elements(item.name)
+        except ValueError as e:
+            print(f"[PRE-FETCH] ERROR: {item.name}: {e}", flush=True)
+    return elements
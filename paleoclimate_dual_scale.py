@@ -10,10 +10,10 @@ Data Preservation is Climate Action
 
 Role: rendering
 Domain: earth_science
+
+Module updated: October 2026 (data loaders served by climate_datasets)
 """
 
-import json
-import os
 import numpy as np
 from save_utils import save_plot
 try:
@@ -26,11 +26,13 @@ except ImportError:
 # Import data loading functions from main module
 import sys
 sys.path.insert(0, '/mnt/project')
-from paleoclimate_visualization import (
+from climate_datasets import (
     load_lr04_data,
-    load_holocene_data, 
+    load_holocene_data,
     load_modern_temperature_data,
     calculate_preindustrial_offset,
+)
+from paleoclimate_visualization import (
     d18o_to_temperature_approx,
 #    GEOLOGIC_PERIODS
 )
@@ -69,72 +71,11 @@ def load_modern_temperature_data_ma_bp():
     """
     Load modern instrumental temperature data using Ma BP (Before Present = 2025)
     
-    This is a wrapper that converts the Ma B2100 data from the main module
-    to Ma BP for consistency with the paleoclimate data in the dual-scale viz.
+    GISS annual means from the shared climate_datasets layer, which looks
+    for data/temperature_giss_monthly.json beside the working directory
+    and then beside the scripts.
     """
-    try:
-        import json
-        import os
-        
-        # Try multiple possible locations for the temperature file
-    #    possible_paths = [
-    #        'temperature_giss_monthly.json',  # Same directory
-    #        os.path.join(os.path.dirname(__file__), 'temperature_giss_monthly.json'),  # Script directory
-    #        '/mnt/project/temperature_giss_monthly.json'  # Fallback for testing
-    #    ]
-        
-        # Try multiple possible locations for the temperature file
-        possible_paths = [
-            'data/temperature_giss_monthly.json',  # Data subdirectory (primary location)
-            os.path.join(os.path.dirname(__file__), 'data/temperature_giss_monthly.json'),  # Script dir + data/
-            'temperature_giss_monthly.json',  # Legacy root location (backwards compatibility)
-            os.path.join(os.path.dirname(__file__), 'temperature_giss_monthly.json'),
-            '/mnt/project/temperature_giss_monthly.json'  # Fallback for testing
-        ]
-
-        data = None
-        for path in possible_paths:
-            try:
-                with open(path, 'r') as f:
-                    data = json.load(f)
-                break
-            except FileNotFoundError:
-                continue
-        
-        if data is None:
-            print("Warning: Could not find temperature_giss_monthly.json")
-            return None, None
-        
-        records = data['data']
-        
-        # Convert to arrays and get annual averages
-        years = []
-        temps = []
-        
-        for record in records:
-            year = record['year']
-            
-            if year not in years:
-                years.append(year)
-                # Get all months for this year that have valid data
-                year_temps = [r['anomaly_c'] for r in records 
-                             if r['year'] == year and r['anomaly_c'] is not None]
-                if year_temps:
-                    temps.append(np.mean(year_temps))
-                else:
-                    # Skip years with no valid data
-                    years.pop()
-        
-        # Convert years to Ma BP (millions of years before present = 2025)
-        # Present = 2025, so years before present = 2025 - year
-        current_year = 2025
-        ages_ma = [(current_year - y) / 1_000_000 for y in years]
-        
-        return ages_ma, temps
-        
-    except (FileNotFoundError, json.JSONDecodeError) as e:
-        print(f"Warning: Could not load modern temperature data: {e}")
-        return None, None
+    return load_modern_temperature_data(current_year=2025)
 
 
 def load_projection_scenarios():
@@ -292,9 +233,8 @@ def create_paleoclimate_dual_scale_visualization():
     preindustrial_offset = calculate_preindustrial_offset(holocene_data) if holocene_data else 0.0
     
     # Process LR04 paleoclimate data
-    records = lr04_data['data']
-    ages_ka = np.array([r['age_ka_bp'] for r in records])
-    d18o_values = np.array([r['d18o_permil'] for r in records])
+    ages_ka = lr04_data['age_ka_bp']
+    d18o_values = lr04_data['d18o_permil']
     ages_ma = ages_ka / 1000.0
     temp_anomaly = d18o_to_temperature_approx(d18o_values)
     temp_anomaly = temp_anomaly - preindustrial_offset
@@ -9,12 +9,19 @@ Data Preservation is Climate Action
 
 Role: rendering
 Domain: earth_science
+
+Module updated: October 2026 (data loaders served by climate_datasets)
 """
 
-import json
 import os
 import numpy as np
 from save_utils import save_plot
+from climate_datasets import (
+    load_lr04_data,
+    load_holocene_data,
+    calculate_preindustrial_offset,
+    load_modern_temperature_data,
+)
 try:
     import plotly.graph_objects as go
     from plotly.subplots import make_subplots
@@ -80,122 +87,6 @@ def d18o_to_temperature_approx(d18o_values):
     
     return temp_anomaly
 
-def load_lr04_data():
-    """Load LR04 benthic stack from cache"""
-    try:
-        with open(LR04_CACHE, 'r') as f:
-            data = json.load(f)
-        return data
-    except FileNotFoundError:
-        return None
-    except json.JSONDecodeError:
-        return None
-
-
-def load_holocene_data():
-    """Load Kaufman et al. (2020) Holocene temperature reconstruction"""
-    holocene_file = os.path.join(PALEO_DATA_DIR, 'temp12k_allmethods_percentiles.csv')
-    
-    try:
-
-        import csv
-        ages_years = []
-        temps_median = []
-        temps_5th = []
-        temps_95th = []
-        
-        with open(holocene_file, 'r') as f:
-            reader = csv.DictReader(f)
-            # Strip whitespace from fieldnames
-            reader.fieldnames = [name.strip() for name in reader.fieldnames]
-            
-            for row in reader:
-                ages_years.append(float(row['ages']))
-                temps_median.append(float(row['global_median']))
-                temps_5th.append(float(row['global_5']))
-                temps_95th.append(float(row['global_95']))
-        
-        # Convert years BP to Ma BP
-        ages_ma = [age / 1_000_000 for age in ages_years]
-        
-        return {
-            'ages_ma': ages_ma,
-            'temp_median': temps_median,
-            'temp_5th': temps_5th,
-            'temp_95th': temps_95th
-        }
-    except (FileNotFoundError, KeyError) as e:
-        print(f"Warning: Could not load Holocene data: {e}")
-        return None
-
-def calculate_preindustrial_offset(holocene_data):
-    """
-    Calculate offset to normalize to pre-industrial (1850-1900) baseline
-    
-    The Kaufman data is relative to 19th century. We need to find what
-    the temperature was during 1850-1900 period (roughly 75-125 years BP)
-    and use that as our zero point.
-    """
-    if not holocene_data:
-        return 0.0
-    
-    ages_years = [age * 1_000_000 for age in holocene_data['ages_ma']]
-    temps = holocene_data['temp_median']
-    
-    # Find temperatures for 1850-1900 period (75-175 years BP to be safe)
-    preindustrial_temps = []
-    for age, temp in zip(ages_years, temps):
-        if 75 <= age <= 175:
-            preindustrial_temps.append(temp)
-    
-    if preindustrial_temps:
-        # Average of pre-industrial period
-        return np.mean(preindustrial_temps)
-    else:
-        # If we don't have data for that exact period, use closest point
-        # Find index closest to 100 years BP
-        closest_idx = min(range(len(ages_years)), 
-                         key=lambda i: abs(ages_years[i] - 100))
-        return temps[closest_idx]
-
-def load_modern_temperature_data():
-    """Load modern instrumental temperature data to extend to present"""
-    try:
-        with open('temperature_giss_monthly.json', 'r') as f:
-            data = json.load(f)
-        
-        records = data['data']
-        
-        # Convert to arrays and get annual averages
-        years = []
-        temps = []
-        
-        for record in records:
-            year = record['year']
-            
-            if year not in years:
-                years.append(year)
-                # Get all months for this year that have valid data
-                year_temps = [r['anomaly_c'] for r in records 
-                             if r['year'] == year and r['anomaly_c'] is not None]
-                if year_temps:
-                    temps.append(np.mean(year_temps))
-                else:
-                    # Skip years with no valid data
-                    years.pop()
-        
-        # Convert years to Ma BP (millions of years before present)
-        # Present = 2025, so years before present = 2025 - year
-        # Ma = (2025 - year) / 1,000,000
-        current_year = 2025
-        ages_ma = [(current_year - y) / 1_000_000 for y in years]
-        
-        return ages_ma, temps
-        
-    except (FileNotFoundError, json.JSONDecodeError) as e:
-        print(f"Warning: Could not load modern temperature data: {e}")
-        return None, None
-
 def create_paleoclimate_visualization():
     """
     Create Cenozoic paleoclimate visualization
@@ -214,8 +105,6 @@ def create_paleoclimate_visualization():
     if not lr04_data:
         return None
     
-    records = lr04_data['data']
-
      # ADD THIS: Load modern instrumental data
     modern_ages_ma, modern_temps = load_modern_temperature_data()   
     
@@ -226,8 +115,8 @@ def create_paleoclimate_visualization():
     preindustrial_offset = calculate_preindustrial_offset(holocene_data) if holocene_data else 0.0
 
     # Extract and process data
-    ages_ka = np.array([r['age_ka_bp'] for r in records])
-    d18o_values = np.array([r['d18o_permil'] for r in records])
+    ages_ka = lr04_data['age_ka_bp']
+    d18o_values = lr04_data['d18o_permil']
     
     # Convert ages to Ma (millions of years) for better display
     ages_ma = ages_ka / 1000.0
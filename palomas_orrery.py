@@ -79,7 +79,7 @@ from celestial_objects import (                             # importing definiti
     OBJECT_DEFINITIONS, build_objects_list, get_all_var_names,
     SHELL_DEFINITIONS, build_shell_checkboxes  # Phase 2
 )
-from osculating_cache_manager import get_elements_with_prompt
+import osculating_prefetch
 from orbital_param_viz import create_orbital_transformation_viz, create_orbital_viz_window 
 from palomas_orrery_helpers import (calculate_planet9_position_on_orbit, rotate_points2, calculate_axis_range,
                                     fetch_trajectory, fetch_orbit_path, pad_trajectory, add_url_buttons,
@@ -288,7 +288,12 @@ from visualization_utils import (format_hover_text, add_hover_toggle_buttons, ad
 
 from save_utils import save_plot, set_last_save_directory, get_last_save_directory
 
-from shutdown_handler import PlotlyShutdownHandler, create_monitored_thread, show_figure_safely
+from shutdown_handler import PlotlyShutdownHandler, show_figure_safely
+
+import plot_profiler                                        # opt-in stage timing report (data/last_plot_profile.json)
+import plot_jobs                                             # queued, cancellable plot/animation builds
+import render_lod                                           # level-of-detail presets (shell density, orbit decimation)
+import orbit_sampling                                       # adaptive true-anomaly sampling for idealized orbits
 
 # Try to import Earth System Visualization
 try:
@@ -314,7 +319,7 @@ print(f"Working directory set to: {os.getcwd()}", flush=True)
 
 
 # Celestial sphere data loader and renderer live in star_sphere_builder.py
-from star_sphere_builder import add_celestial_sphere_traces
+from star_sphere_builder import add_celestial_sphere_traces, TIERS as STAR_DEPTH_TIERS, VMAG_LIMIT as STAR_DEPTH_DEFAULT
 
 
 def get_fetch_interval_for_type(obj_type, obj_name, trajectory_interval, 
@@ -443,7 +448,8 @@ def handle_update_dialog(num_objects):
     
     remember_var = tk.IntVar(value=0)
     remember_check = tk.Checkbutton(dialog,
-        text="Remember my choice for this session",
+        text="Remember my choice for this session\n"
+             "(Warning: This applies globally to all plots)",
         variable=remember_var)
     remember_check.pack(pady=10)
     
@@ -496,13 +502,13 @@ def get_interval_settings():
         
         # Get values from GUI based on object types
         settings = {
-            'trajectory_points': float(trajectory_points_entry.get()),
-            'orbital_points': float(orbital_points_entry.get()),
-            'satellite_days': int(satellite_days_entry.get()),
-            'satellite_points': float(satellite_points_entry.get()),
+            'trajectory_points': float(plot_jobs.value(trajectory_points_entry)),
+            'orbital_points': float(plot_jobs.value(orbital_points_entry)),
+            'satellite_days': int(plot_jobs.value(satellite_days_entry)),
+            'satellite_points': float(plot_jobs.value(satellite_points_entry)),
             'start_date': get_date_from_gui(),
             'end_date': get_end_date_from_gui(),
-            'days_to_plot': int(days_to_plot_entry.get())
+            'days_to_plot': int(plot_jobs.value(days_to_plot_entry))
         }
         
         # Debug output to verify
@@ -564,7 +570,8 @@ def get_date_from_gui():
     now = datetime.now()
     def safe_int(val, default):
         try:
-            return int(val.get()) if val.get().strip() else default
+            text = plot_jobs.value(val)
+            return int(text) if text.strip() else default
         except (ValueError, tk.TclError):
             return default
     return datetime(
@@ -1196,6 +1203,7 @@ def fetch_position(object_id, date_obj, center_id='Sun', id_type=None, override_
             location = '@' + str(center_id)
 
         # Query the Horizons system with coordinates relative to location
+        plot_profiler.count(plot_profiler.HORIZONS_CALLS)
         obj = Horizons(id=object_id, id_type=id_type, location=location, epochs=epochs)
         vectors = obj.vectors()
 
@@ -1349,6 +1357,19 @@ def _add_close_approach_extras(fig, selected_objects, objects, center_object_nam
         'Moon':    '301',
     }
 
+    # One bulk CAD query covers every selected small body for this window
+    # when its answer is expected to be small; the per-object lookups below
+    # are then answered from the cache (otherwise they query as before)
+    try:
+        from close_approach_data import prefetch_close_approaches
+        small_bodies = [o.get('id', o['name']) for o in objects
+                        if o['name'] in selected_objects and o.get('id_type') == 'smallbody']
+        prefetch_close_approaches(small_bodies, body=center_object_name,
+                                  date_min=start_date.strftime('%Y-%m-%d'),
+                                  date_max=end_date.strftime('%Y-%m-%d'))
+    except Exception as e:
+        print(f"  [CAD] Bulk prefetch skipped: {e}", flush=True)
+
     for obj_name in selected_objects:
         # Find object metadata
         obj_info = next((o for o in objects if o['name'] == obj_name), None)
@@ -2732,6 +2753,7 @@ star_names_var = tk.IntVar(value=0)
 celestial_grid_var = tk.IntVar(value=0)
 celestial_grid_labels_var = tk.IntVar(value=0)
 constellation_names_var = tk.IntVar(value=0)
+star_depth_var = tk.StringVar(value=f"{STAR_DEPTH_DEFAULT:g}")   # faintest vmag shown
 
 sun_var = tk.IntVar(value=0)  
 sun_shells_var = tk.IntVar(value=0)  
@@ -3920,6 +3942,9 @@ def plot_actual_orbits(fig, planets_to_plot, dates_lists, center_id='Sun', show_
                     mode = 'markers'
                     line = None
                     marker = dict(color=color_map(planet), size=2)
+                # LOD: preview thins the line; markers and info use every sample
+                line_x, line_y, line_z = (render_lod.decimate_path(x, y, z)
+                                          if show_lines else (x, y, z))
 
                 # Create the hover text for the actual orbit
                 hover_text = f"{planet} Orbit"
@@ -3927,9 +3952,9 @@ def plot_actual_orbits(fig, planets_to_plot, dates_lists, center_id='Sun', show_
                 special_legend_group = f"{planet}_actual_orbit"
                 fig.add_trace(
                     go.Scatter3d(
-                        x=x,
-                        y=y,
-                        z=z,
+                        x=line_x,
+                        y=line_y,
+                        z=line_z,
                         mode=mode,
                         line=line,
                         marker=marker,
@@ -4066,6 +4091,9 @@ def plot_actual_orbits(fig, planets_to_plot, dates_lists, center_id='Sun', show_
                     mode = 'markers'
                     line = None
                     marker = dict(color=trace_color, size=2)
+                # LOD: preview thins the line; markers and info use every sample
+                line_x, line_y, line_z = (render_lod.decimate_path(x, y, z)
+                                          if show_lines else (x, y, z))
 
                 # Create the hover text and legend name for the actual orbit
                 # For trajectory objects: "Plotted Period" if trajectory_marker_color is set (animate), "Full Mission" otherwise (static)
@@ -4106,9 +4134,9 @@ def plot_actual_orbits(fig, planets_to_plot, dates_lists, center_id='Sun', show_
                 actual_legend_group = f"{planet}_actual_orbit"
                 fig.add_trace(
                     go.Scatter3d(
-                        x=x,
-                        y=y,
-                        z=z,
+                        x=line_x,
+                        y=line_y,
+                        z=line_z,
                         mode=mode,
                         line=line,
                         marker=marker,
@@ -4372,19 +4400,65 @@ def export_social_view():
     )
 
 
+def _plot_job_sources():
+    """Every Tk variable and entry a plot or animation build reads.
+
+    plot_scheduler snapshots these when Plot/Animate is clicked, so a
+    queued build uses the selections it was queued with, and changing the
+    GUI while a build runs does not change that build.
+    """
+    sources = [obj['var'] for obj in objects]
+    sources += list(sun_shell_vars.values())
+    for shell_vars in get_planet_shell_vars_map().values():
+        sources += list(shell_vars.values())
+    sources += [
+        center_object_var, special_fetch_var, scale_var,
+        show_closest_approach_var, show_apsidal_markers_var,
+        star_background_var, star_names_var, celestial_grid_var,
+        celestial_grid_labels_var, constellation_names_var, star_depth_var,
+        track_camera_var, animate_comet_tails_var, profile_plot_var,
+        lod_var, days_to_plot_entry, num_frames_entry, custom_scale_entry,
+        custom_dtick_entry, default_interval_entry,
+        trajectory_interval_entry, satellite_interval_entry,
+        trajectory_points_entry, orbital_points_entry,
+        satellite_days_entry, satellite_points_entry,
+        entry_year, entry_month, entry_day, entry_hour, entry_minute,
+        end_entry_year, end_entry_month, end_entry_day, end_entry_hour,
+        end_entry_minute,
+    ]
+    return sources
+
+
 def plot_objects():
-    # DEBUG: Heartbeat check - confirms button click works
+    """Queue a static plot build; it starts when earlier builds finish."""
+    plot_scheduler.submit('plot', 'Plot', _build_plot, _plot_job_sources())
+
+
+def _run_osculating_prefetch(plan, refresh, plot_date):
+    """Worker-thread half of the pre-fetch: concurrent fetches, progress in the status line."""
+    def progress(done, total, item, ok):
+        text = f"Osculating elements: {done}/{total} fetched ({item.name}{'' if ok else ' failed'})"
+        root.after(0, lambda: output_label.config(text=text))
+
+    elements = osculating_prefetch.run_prefetch(plan, refresh, plot_date, progress=progress,
+                                                checkpoint=plot_jobs.checkpoint)
+    print(f"[PRE-FETCH] Elements ready for {len(elements)} of {len(plan)} objects", flush=True)
+    return elements
+
+
+def _build_plot(job):
+    """Prepare step of a plot job (main thread): pre-fetch, then return the worker."""
     
     # =========================================================================
-    # PRE-FETCH OSCULATING ELEMENTS ON MAIN THREAD
+    # PLAN OSCULATING PRE-FETCH ON MAIN THREAD (fetches run in the worker)
     # =========================================================================
     
     # Create working copy of planetary_params
     active_planetary_params = planetary_params.copy()
     
     # Get selected objects
-    selected_objects_for_prefetch = [obj for obj in objects if obj['var'].get() == 1]
-    center_object_name = center_object_var.get()
+    selected_objects_for_prefetch = [obj for obj in objects if plot_jobs.value(obj['var']) == 1]
+    center_object_name = plot_jobs.value(center_object_var)
     
     # Determine center_body for osculating elements based on view
     # This affects which reference frame the elements use
@@ -4416,6 +4490,16 @@ def plot_objects():
         print(f"[WARNING] Could not get plot date from GUI: {e}, using today", flush=True)
         plot_date = datetime.now()
 
+    # Level of detail for this build's shells and orbit lines. Builds run
+    # one at a time, so the module-level setting holds for the whole job.
+    lod_level = render_lod.set_level(plot_jobs.value(lod_var))
+
+    # Opt-in timing report (checkbox or ORRERY_PROFILE); None when off
+    plot_profiler.start('plot', enabled=plot_jobs.value(profile_plot_var) == 1,
+                        metadata={'center': center_object_name, 'lod': lod_level,
+                                  'selected_objects': len(selected_objects_for_prefetch)})
+    plot_profiler.lap('osculating_prefetch')
+
     # These TNO moons have no usable JPL parent-centered ephemeris
 #    SKIP_HORIZONS_PREFETCH = ['MK2', 'Xiangliu', 'Vanth', 'Weywot']
     SKIP_HORIZONS_PREFETCH = ['MK2', 'Xiangliu', 'Vanth', 'Gonggong']  # Weywot removed - JPL data works at Quaoar
@@ -4431,78 +4515,16 @@ def plot_objects():
     ]
     
     # Debug: Print the state of variables to console
-    is_normal_mode = (special_fetch_var.get() == 0)
+    is_normal_mode = (plot_jobs.value(special_fetch_var) == 0)
 
+    # One consolidated dialog here; the fetches run on the worker thread
+    prefetch_plan, prefetch_refresh = [], []
     if is_normal_mode and pre_fetch_objects:
         print(f"[PRE-FETCH] Checking osculating elements for {len(pre_fetch_objects)} objects...", flush=True)
-                        
-        for obj_name in pre_fetch_objects:
-            try:
-                # Find the object dictionary to get its Horizons ID
-                obj_dict = next((obj for obj in selected_objects_for_prefetch 
-                                if obj['name'] == obj_name), None)
-                
-                if obj_dict:
-                    horizons_id = obj_dict.get('id', obj_name)
-                    id_type = obj_dict.get('id_type', 'smallbody')
-                    
-                    # Determine if this object needs barycentric elements
-                    # Pluto system objects need center_body when viewing from barycenter
-                    obj_center_body = None
-
-                    if center_object_name in ['Pluto-Charon Barycenter', 'Pluto']:
-                        pluto_system_ids = ['999', '901', '902', '903', '904', '905']   # Pluto, Charon, Styx, Nix, Kerberos, Hydra
-                        if str(horizons_id) in pluto_system_ids:
-                            obj_center_body = osculating_center_body
-                    elif center_object_name in ['Orcus-Vanth Barycenter', 'Orcus']:
-                        # Check if this is an Orcus system object (Orcus or Vanth)
-                        orcus_system_ids = ['920090482', '120090482', '2004 DW']  # Orcus primary, Vanth, Orcus small body
-                        if str(horizons_id) in orcus_system_ids:
-                            obj_center_body = osculating_center_body
-                    elif center_object_name == 'Patroclus-Menoetius Barycenter':
-                        # Check if this is a Patroclus system object (Patroclus or Menoetius)
-                        patroclus_system_ids = ['920000617', '120000617', 'A906 UL']  # Patroclus primary, Menoetius, smallbody
-                        if str(horizons_id) in patroclus_system_ids:
-                            obj_center_body = osculating_center_body       
-                    elif center_object_name in ['Earth-Moon Barycenter', 'Earth']:
-                        earth_moon_system_ids = ['399', '301']  # Earth, Moon
-                        if str(horizons_id) in earth_moon_system_ids:
-                            obj_center_body = osculating_center_body                            
-
-                    # Trigger the GUI prompt with proper Horizons ID and center
-
-                    fresh_elements = get_elements_with_prompt(
-                        obj_name, 
-                        horizons_id=horizons_id,
-                        id_type=id_type,
-                        plot_date=plot_date,
-                        parent_window=root,
-                        center_body=obj_center_body
-                    )
-
-                else:
-                    # Fallback to old behavior if object not found
-                    print(f"[WARNING] Object dictionary not found for {obj_name}, using name as ID", flush=True)
-            #        fresh_elements = get_elements_with_prompt(obj_name, plot_date=plot_date, parent_window=root)
-                    fresh_elements = get_elements_with_prompt(obj_name, plot_date=plot_date, parent_window=root, center_body=osculating_center_body)
-                
-                # Update working copy
-                active_planetary_params[obj_name] = fresh_elements
-                
-                # DEBUG: Validation
-                if obj_name == 'Mercury':
-                    ecc = fresh_elements.get('e', 0)
-                    if ecc >= 0.7:
-                        print(f"[WARNING] Mercury is using MANUAL FALLBACK data (e={ecc})", flush=True)
-                        messagebox.showwarning("Fetch Failed", f"Could not fetch fresh data for {obj_name}.\nSystem is using manual fallback (e={ecc}).\nCheck internet connection or Horizons availability.")
-                    else:
-                        print(f"[SUCCESS] Mercury fetched fresh data (e={ecc})", flush=True)
-                
-                print(f"[PRE-FETCH] OK: {obj_name}: Updated", flush=True)
-                    
-            except Exception as e:
-                print(f"[PRE-FETCH] ERROR: {obj_name}: {e}", flush=True)
-                traceback.print_exc()
+        prefetch_plan = osculating_prefetch.plan_prefetch(
+            pre_fetch_objects, selected_objects_for_prefetch,
+            center_object_name, osculating_center_body)
+        prefetch_refresh = osculating_prefetch.ask_refresh(prefetch_plan, parent_window=root)
     # =========================================================================
         
     def worker():
@@ -4512,12 +4534,23 @@ def plot_objects():
             global orbit_paths_over_time
             nonlocal active_planetary_params  # Access the pre-fetched orbital params
 
+            if prefetch_plan:
+                active_planetary_params.update(_run_osculating_prefetch(
+                    prefetch_plan, prefetch_refresh, plot_date))
+                mercury = active_planetary_params.get('Mercury', {})
+                if 'Mercury' in pre_fetch_objects and mercury.get('e', 0) >= 0.7:
+                    print(f"[WARNING] Mercury is using MANUAL FALLBACK data (e={mercury['e']})", flush=True)
+                    plot_scheduler.call_on_main(
+                        messagebox.showwarning, "Fetch Failed",
+                        f"Could not fetch fresh data for Mercury.\nSystem is using manual "
+                        f"fallback (e={mercury['e']}).\nCheck internet connection or Horizons availability.")
+
             exo_objects = [obj for obj in objects 
-                        if obj['var'].get() == 1 and obj.get('object_type') == 'exoplanet']
+                        if plot_jobs.value(obj['var']) == 1 and obj.get('object_type') == 'exoplanet']
 
             exo_host_stars = [obj for obj in objects
                     #   if obj['var'].get() == 1 and obj.get('object_type') == 'exo_host_star'] 
-                        if obj['var'].get() == 1 and obj.get('object_type') in ['exo_host_star', 'exo_binary_star', 'exo_barycenter']]            
+                        if plot_jobs.value(obj['var']) == 1 and obj.get('object_type') in ['exo_host_star', 'exo_binary_star', 'exo_barycenter']]            
 
             # Detect if we're in exoplanet mode (for coordinate system legend)
             is_exoplanet_mode = bool(exo_objects or exo_host_stars)
@@ -4535,10 +4568,7 @@ def plot_objects():
             current_date = STATIC_TODAY
             default_name = f"solar_system_{current_date.strftime('%Y%m%d_%H%M')}"
                        
-            output_label.config(text="Fetching data, please wait...")
-            progress_bar['mode'] = 'indeterminate'
-            progress_bar.start(10)  # Start the progress bar with a slight delay
-            root.update_idletasks()  # Force GUI to update
+            root.after(0, lambda: output_label.config(text="Fetching data, please wait..."))
 
             # REPLACE the interval handling section with:
             settings, error_msg = get_interval_settings()
@@ -4553,7 +4583,7 @@ def plot_objects():
         #        settings['days_to_plot'] = gui_days
 
             # Debug check - don't override the precise calculated value from date range
-            gui_days = int(days_to_plot_entry.get()) if days_to_plot_entry.get() else 0
+            gui_days = int(plot_jobs.value(days_to_plot_entry)) if plot_jobs.value(days_to_plot_entry) else 0
             if int(settings['days_to_plot']) != gui_days:
                 print(f"[INFO] days_to_plot: calculated={settings['days_to_plot']:.6f} days ({settings['days_to_plot']*24*60:.1f} min), GUI shows={gui_days} days", flush=True)
             # Note: Don't override - calculated value preserves sub-day precision for flybys     
@@ -4580,7 +4610,7 @@ def plot_objects():
             hover_data = "Full Object Info"  # Or "Object Names Only"
 
             # Determine center object
-            center_object_name = center_object_var.get()
+            center_object_name = plot_jobs.value(center_object_var)
             center_object_info = next((obj for obj in objects if obj['name'] == center_object_name), None)
 
             # Capture center's system ID
@@ -4600,15 +4630,18 @@ def plot_objects():
                 center_id_type = None
 
 # Get selected objects
-            selected_objects = [obj for obj in objects if obj['var'].get() == 1]
+            selected_objects = [obj for obj in objects if plot_jobs.value(obj['var']) == 1]
             
             if not selected_objects:
                 output_label.config(text="No objects selected for plotting")
                 progress_bar.stop()
                 return
 
+            plot_profiler.lap('orbit_cache_update')
+            plot_jobs.checkpoint()
+
             # Check if we're in special fetch mode or normal mode
-            if special_fetch_var.get() == 0:  # Normal mode
+            if plot_jobs.value(special_fetch_var) == 0:  # Normal mode
 
                 # Check if any selected object needs updating
                 need_update = False
@@ -4695,58 +4728,10 @@ def plot_objects():
                 # Handle updates based on user preference
                 should_update = False
                 
-                if need_update and not update_choice_remembered:
-                    # Show dialog
-                    dialog = tk.Toplevel(root)
-                    dialog.title("Update Orbit Data?")
-                    dialog.geometry("400x200")
-                    
-                    message = tk.Label(dialog, 
-                        text=f"New orbit data is needed for {len(selected_objects)} selected objects.\n\n"
-                             f"Would you like to fetch updated data from JPL Horizons?",
-                        wraplength=350)
-                    message.pack(pady=20)
-                    
-                    remember_var = tk.IntVar(value=0)
-                    remember_check = tk.Checkbutton(dialog,
-                        text="Remember my choice for this session\n"
-                             "(Warning: This applies globally to all plots)",
-                        variable=remember_var)
-                    remember_check.pack(pady=10)
-                    
-                    button_frame = tk.Frame(dialog)
-                    button_frame.pack()
-                    
-                    user_choice = {'update': None}
-                    
-                    def on_yes():
-                        user_choice['update'] = True
-                        if remember_var.get() == 1:
-                            global remember_update_choice, update_choice_remembered
-                            remember_update_choice = True
-                            update_choice_remembered = True
-                        dialog.destroy()
-                    
-                    def on_no():
-                        user_choice['update'] = False
-                        if remember_var.get() == 1:
-                            global remember_update_choice, update_choice_remembered
-                            remember_update_choice = False
-                            update_choice_remembered = True
-                        dialog.destroy()
-                    
-                    tk.Button(button_frame, text="Yes - Update Cache", 
-                             command=on_yes, bg='light green').pack(side='left', padx=5)
-                    tk.Button(button_frame, text="No - Use Existing", 
-                             command=on_no, bg='light coral').pack(side='left', padx=5)
-                    
-                    dialog.wait_window()
-                    
-                    should_update = user_choice.get('update', False)
-                
-                elif need_update and update_choice_remembered:
-                    # Use remembered choice
-                    should_update = remember_update_choice
+                if need_update:
+                    # The dialog runs on the main thread; the worker waits for the answer
+                    should_update = plot_scheduler.call_on_main(
+                        handle_update_dialog, len(selected_objects))
                 
                 # Perform update if needed
                 if should_update:
@@ -4758,7 +4743,7 @@ def plot_objects():
                         object_list=selected_objects,
                         center_object_name=center_object_name,
                 #        days_ahead=int(get_end_date_from_gui()),
-                        days_ahead=int(days_to_plot_entry.get()),
+                        days_ahead=int(plot_jobs.value(days_to_plot_entry)),
                         fetch_requests=fetch_requests if fetch_requests else None,  # FIXED: pass clamped requests
                         planetary_params=active_planetary_params,
                         parent_planets=parent_planets,
@@ -4783,25 +4768,25 @@ def plot_objects():
                         # Determine interval based on object type
                         if obj_type == 'trajectory':
                             # Missions, interstellar objects, comets - use fine intervals
-                            interval = trajectory_interval_entry.get()
+                            interval = plot_jobs.value(trajectory_interval_entry)
                         elif obj_type == 'satellite':
                             # Moons need very fine resolution
-                            interval = satellite_interval_entry.get()
+                            interval = plot_jobs.value(satellite_interval_entry)
                         elif obj_type == 'orbital':
                             # Planets, asteroids, TNOs - can use coarser intervals
                     #        if obj.get('e', 0) > 0.5:  # High eccentricity needs finer intervals
                     #            interval = eccentric_interval_entry.get()
                     #        else:
-                            interval = default_interval_entry.get()
+                            interval = plot_jobs.value(default_interval_entry)
                         elif obj_type == 'lagrange_point':
                             # L-points move smoothly, medium resolution is fine
-                            interval = default_interval_entry.get()
+                            interval = plot_jobs.value(default_interval_entry)
                         elif obj_type == 'fixed':
                             # Fixed objects don't need trajectories
                             continue  # Skip fetching - NOW INSIDE THE LOOP
                         else:
                             # Fallback
-                            interval = default_interval_entry.get()
+                            interval = plot_jobs.value(default_interval_entry)
                             
                         # Calculate date range, clamped to object's valid ephemeris window
                         # FIXED: prevents Horizons errors for tight-window missions (e.g. Artemis II)
@@ -4885,7 +4870,7 @@ def plot_objects():
 
                 # For satellites specifically, even if they have orbital parameters, 
                 # we should always fetch their actual position data
-                if obj['var'].get() == 1 and obj['name'] != center_object_name:
+                if plot_jobs.value(obj['var']) == 1 and obj['name'] != center_object_name:
 
                     # Check if this is a satellite of a planet
                     is_satellite = False
@@ -4940,7 +4925,7 @@ def plot_objects():
                     elif obj_type == 'orbital' and obj['name'] in active_planetary_params:      # uses osculating elements
 
                         # Get the raw days_to_plot value
-                        raw_days = int(days_to_plot_entry.get())
+                        raw_days = int(plot_jobs.value(days_to_plot_entry))
                         settings_days = settings['days_to_plot']
                         
                         print(f"  Raw days_to_plot from entry: {raw_days}", flush=True)
@@ -5030,11 +5015,13 @@ def plot_objects():
                         print(f"{obj['name']} ({obj_type}): {len(dates_list)} dates from {dates_list[0]} to {dates_list[-1]} ({(dates_list[-1] - dates_list[0]).days} days)", flush=True)
 
             # Fetch positions for selected objects on the chosen date
+            plot_profiler.lap('fetch_positions')
+            plot_jobs.checkpoint()
             positions = {}
             for obj in objects:
         #        if obj['var'].get() == 1:
 
-                if not obj['var'].get():
+                if not plot_jobs.value(obj['var']):
                     continue
                 # System-scope: only same-system objects
                 if obj['name'] != center_object_name and obj.get('system_id', 'solar') != center_system_id:
@@ -5230,8 +5217,8 @@ def plot_objects():
             # Print planet positions in the console
             print_planet_positions(positions)
 
-            if scale_var.get() == 'Auto':
-                selected_objects = [obj for obj in objects if obj['var'].get() == 1]
+            if plot_jobs.value(scale_var) == 'Auto':
+                selected_objects = [obj for obj in objects if plot_jobs.value(obj['var']) == 1]
 
                 axis_range = calculate_axis_range_from_orbits(
             #        selected_objects, positions, planetary_params, 
@@ -5242,7 +5229,7 @@ def plot_objects():
 
             else:
                 try:
-                    custom_scale = float(custom_scale_entry.get())
+                    custom_scale = float(plot_jobs.value(custom_scale_entry))
                     axis_range = [-custom_scale, custom_scale]
                 except ValueError:
                     output_label.config(text="Invalid custom scale value.")
@@ -5254,12 +5241,14 @@ def plot_objects():
             # the static plot (S1) and the exoplanet static plot (S3) below.
             # Applies under Auto and Manual scale alike (both yield a range).
             try:
-                _cd = float(custom_dtick_entry.get().strip())
+                _cd = float(plot_jobs.value(custom_dtick_entry).strip())
                 custom_dtick = _cd if _cd > 0 else None
             except (ValueError, AttributeError):
                 custom_dtick = None
 
             # Create Plotly figure
+            plot_profiler.lap('center_shells')
+            plot_jobs.checkpoint()
             fig = go.Figure()
 
             # Add hover toggle buttons
@@ -5279,7 +5268,11 @@ def plot_objects():
             fig, center_shells_added, axis_range = add_center_body_shells(
                 fig, center_object_name, sun_shell_vars,
                 get_planet_shell_vars_map(), _sun_pos_tuple,
-                scale_var.get(), axis_range)
+                plot_jobs.value(scale_var), axis_range)
+
+            # Idealized orbit curves are sampled to a chord error set by the
+            # axis half-range (orbit_sampling)
+            orbit_sampling.set_axis_scale(axis_range)
 
             # (2a) The explicit center-marker block that lived here was REMOVED.
             # It was the second of two center-marker mechanisms (ledger N3: two
@@ -5315,7 +5308,7 @@ def plot_objects():
                     # For non-center planets, use their actual positions
                     elif not is_center and 'position' in planet_data and planet_data['position'] is not None:
                         # Check if any shell for this planet is selected
-                        if any(var.get() == 1 for var in planet_shell_vars[planet_name].values()):
+                        if any(plot_jobs.value(var) == 1 for var in planet_shell_vars[planet_name].values()):
                             print(f"\nAdding shells for non-center planet {planet_name}", flush=True)
                             
                             # Always add the planet shells
@@ -5337,7 +5330,7 @@ def plot_objects():
 
             # Add Sun shells when viewing from non-Sun center (unified dispatch)
             if center_object_name != 'Sun':
-                if any(var.get() == 1 for var in sun_shell_vars.values()):
+                if any(plot_jobs.value(var) == 1 for var in sun_shell_vars.values()):
                     if 'Sun' in positions and positions['Sun'] is not None:
                         sun_pos_dict = positions['Sun']
                         sun_position = (sun_pos_dict['x'], sun_pos_dict['y'], sun_pos_dict['z'])
@@ -5352,14 +5345,16 @@ def plot_objects():
 
             selected_planets = [
                 obj['name'] for obj in objects
-                if obj['var'].get() == 1
+                if plot_jobs.value(obj['var']) == 1
                 and obj['name'] != center_object_name
                 and obj.get('system_id', 'solar') == center_system_id
             ]
 
             # Pass center_object_name to plot_actual_orbits
+            plot_profiler.lap('trajectories', fig)
+            plot_jobs.checkpoint()
 
-            plot_actual_orbits(fig, selected_planets, dates_lists, center_id=center_id, show_lines=True, center_object_name=center_object_name, show_closest_approach=show_closest_approach_var.get())
+            plot_actual_orbits(fig, selected_planets, dates_lists, center_id=center_id, show_lines=True, center_object_name=center_object_name, show_closest_approach=plot_jobs.value(show_closest_approach_var))
 
             # ADD PLOTTED PERIOD OVERLAY FOR TRAJECTORY OBJECTS (yellow highlight)
             # This shows the GUI-selected date range overlaid on the full mission
@@ -5474,7 +5469,7 @@ def plot_objects():
                             print(f"[PLOTTED PERIOD] {obj_name}: {len(x)} points from {plot_start.strftime('%Y-%m-%d')} to {plot_end.strftime('%Y-%m-%d')}", flush=True)
                             
                             # Add yellow closest approach marker for Plotted Period
-                            if show_closest_approach_var.get():
+                            if plot_jobs.value(show_closest_approach_var):
                                 from apsidal_markers import add_closest_approach_marker
                                 
                                 # Build positions_dict from trajectory data
@@ -5502,7 +5497,7 @@ def plot_objects():
             positions = {}
 
             for obj in objects:
-                if not obj['var'].get():
+                if not plot_jobs.value(obj['var']):
                     continue
                 # Only fetch positions for same-system objects
                 if obj['name'] != center_object_name and obj.get('system_id', 'solar') != center_system_id:
@@ -5660,7 +5655,7 @@ def plot_objects():
                 if obj.get('object_type') in ['exoplanet', 'exo_host_star', 'exo_binary_star', 'exo_barycenter']:
                     continue
 
-                if obj['name'] == center_object_name or (obj['var'].get() == 1 and same_system):
+                if obj['name'] == center_object_name or (plot_jobs.value(obj['var']) == 1 and same_system):
 
                     obj_data = positions.get(obj['name'])
                     if not obj_data:
@@ -5692,18 +5687,23 @@ def plot_objects():
             # Sphere radius = current axis_range magnitude.
  
             # Celestial sphere: star background + coordinate grid
-            if (star_background_var.get() or celestial_grid_var.get()
-                    or constellation_names_var.get() ):
+            plot_profiler.lap('celestial_sphere', fig)
+            plot_jobs.checkpoint()
+            if (plot_jobs.value(star_background_var) or plot_jobs.value(celestial_grid_var)
+                    or plot_jobs.value(constellation_names_var) ):
                 add_celestial_sphere_traces(
                     fig, axis_range,
-                    show_stars=star_background_var.get(),
-                    show_names=star_names_var.get(),
-                    show_grid=celestial_grid_var.get(),
-                    show_labels=celestial_grid_labels_var.get(),
-                    show_constellation_names=constellation_names_var.get()
+                    show_stars=plot_jobs.value(star_background_var),
+                    show_names=plot_jobs.value(star_names_var),
+                    show_grid=plot_jobs.value(celestial_grid_var),
+                    show_labels=plot_jobs.value(celestial_grid_labels_var),
+                    show_constellation_names=plot_jobs.value(constellation_names_var),
+                    vmag_limit=float(plot_jobs.value(star_depth_var))
                 )
                 
             # Rearrange traces to ensure the center marker is on top
+            plot_profiler.lap('layout', fig)
+            plot_jobs.checkpoint()
             center_trace_name = center_object_name  # This should match the 'name' parameter of your center marker trace
 
             # Extract center traces
@@ -5725,7 +5725,7 @@ def plot_objects():
                 start_date = get_date_from_gui()
                 end_date = get_end_date_from_gui()
 
-                days_to_plot = int(days_to_plot_entry.get())
+                days_to_plot = int(plot_jobs.value(days_to_plot_entry))
                 
                 # Format the title with date range
                 if days_to_plot == 0:
@@ -5869,9 +5869,11 @@ def plot_objects():
             )
 
             # 5. Collect user-checked objects for orbits
-            selected_objects = [obj['name'] for obj in objects if obj['var'].get() == 1]
+            selected_objects = [obj['name'] for obj in objects if plot_jobs.value(obj['var']) == 1]
             
             # 6. Plot idealized orbits using your new logic
+            plot_profiler.lap('idealized_orbits', fig)
+            plot_jobs.checkpoint()
             plot_idealized_orbits(fig, selected_objects, center_id=center_object_name, 
                                     objects=objects, 
                                     planetary_params=active_planetary_params,  # <--- Use the updated params
@@ -5879,14 +5881,16 @@ def plot_objects():
                                     date=date_obj, days_to_plot=settings['days_to_plot'],
                                     current_positions=current_positions, 
                                     fetch_position=fetch_position,
-                                    show_apsidal_markers=show_apsidal_markers_var.get(),
+                                    show_apsidal_markers=plot_jobs.value(show_apsidal_markers_var),
                                     parent_window=root
                                     )
 
             # ---- Capability B: CAD perigee marker (precision close approach) ----
             # ---- Capability C: Hyperbolic osculating orbit ----------------------
             # Called when center is a major body (not Sun) and apsidal markers enabled
-            if center_object_name != 'Sun' and show_apsidal_markers_var.get():
+            plot_profiler.lap('close_approach_markers', fig)
+            plot_jobs.checkpoint()
+            if center_object_name != 'Sun' and plot_jobs.value(show_apsidal_markers_var):
                 _add_close_approach_extras(
                     fig=fig,
                     selected_objects=selected_objects,
@@ -5895,19 +5899,19 @@ def plot_objects():
                     color_map=color_map,
                     date_obj=date_obj,
                     settings=settings,
-                    show_apsidal_markers=show_apsidal_markers_var.get(),
+                    show_apsidal_markers=plot_jobs.value(show_apsidal_markers_var),
                     parent_window=root,
                 )
 
             # ---- Capability D: Perihelion osculating orbit (Sun-centered) --------
-            if center_object_name == 'Sun' and show_apsidal_markers_var.get():
+            if center_object_name == 'Sun' and plot_jobs.value(show_apsidal_markers_var):
                 _add_perihelion_osculating_orbit(
                     fig=fig,
                     selected_objects=selected_objects,
                     objects=objects,
                     color_map=color_map,
                     date_obj=date_obj,
-                    show_apsidal_markers=show_apsidal_markers_var.get(),
+                    show_apsidal_markers=plot_jobs.value(show_apsidal_markers_var),
                     parent_window=root,
                 )
 
@@ -5915,7 +5919,7 @@ def plot_objects():
             # Only fires for Sun-centered plots where both objects are heliocentric
         #    if center_object_name == 'Sun' and show_closest_approach_var.get():
             # ---- Spacecraft Encounter Markers (tagged encounter data) --------
-            if show_closest_approach_var.get():                
+            if plot_jobs.value(show_closest_approach_var):                
                 _add_spacecraft_encounter_markers(
                     fig=fig,
                     selected_objects=selected_objects,
@@ -5924,11 +5928,13 @@ def plot_objects():
                     center_object_name=center_object_name,
                     center_id=center_id,
                     color_map=color_map,
-                    show_closest_approach=show_closest_approach_var.get(),
+                    show_closest_approach=plot_jobs.value(show_closest_approach_var),
                 )
 
         # ============ EXOPLANET ORBITS ============
             # Plot exoplanet systems if any exoplanet objects are selected           
+            plot_profiler.lap('exoplanets', fig)
+            plot_jobs.checkpoint()
             
             if exo_objects or exo_host_stars:
                 # Override center object for exoplanet systems
@@ -5992,7 +5998,7 @@ def plot_objects():
                         barycenter_obj = next((obj for obj in exo_host_stars 
                                              if obj.get('id_type') == 'barycenter' 
                                              and obj.get('system_id') == system_id 
-                                             and obj['var'].get() == 1), None)
+                                             and plot_jobs.value(obj['var']) == 1), None)
                         
 
                         # Plot host star(s) - works for both binary and single star systems
@@ -6043,6 +6049,8 @@ def plot_objects():
 
 
             # Add URL buttons before showing/saving
+            plot_profiler.lap('buttons', fig)
+            plot_jobs.checkpoint()
             fig = add_url_buttons(fig, objects, selected_objects)
 
             # Add camera view buttons with dropdown for different target objects
@@ -6059,9 +6067,11 @@ def plot_objects():
             # ============ ADD COMET TAILS INTEGRATION ============
             # Conservative comet tail integration
             # _sun_pos_tuple already computed above (D2 shell rendering)
+            plot_profiler.lap('comet_tails', fig)
+            plot_jobs.checkpoint()
 
             for obj in objects:
-                if obj['var'].get() == 1:
+                if plot_jobs.value(obj['var']) == 1:
 
                     # Check if this is a comet by its properties                    
                     is_comet = (
@@ -6101,15 +6111,21 @@ def plot_objects():
             default_name = f"solar_system_{date_obj.strftime('%Y%m%d_%H%M')}"
 
             # Use show_figure_safely to handle both display and save options
+            plot_profiler.lap('save_html', fig)
+            plot_jobs.checkpoint()
             show_figure_safely(fig, default_name)
 
             # Store fig for social media export
             _last_plotted_fig[0] = fig
             _last_plot_name[0] = default_name
 
+            _report, _profile_line = plot_profiler.finish(fig)
+
             # Schedule GUI updates on main thread (required for macOS)
             root.after(0, lambda: output_label.config(text="Plotting complete."))
             root.after(0, lambda: progress_bar.stop())
+            if _profile_line:
+                root.after(0, lambda msg=_profile_line: update_status_display(msg, 'special'))
 
         except Exception as e:
             # Schedule GUI updates on main thread (required for macOS)
@@ -6117,10 +6133,10 @@ def plot_objects():
             print(f"Error during plotting: {e}", flush=True)
             traceback.print_exc()
             root.after(0, lambda: progress_bar.stop())
+            plot_profiler.finish()  # partial report: shows which stage failed
             
-    # Instead of threading.Thread(...).start(), use create_monitored_thread
-    plot_thread = create_monitored_thread(shutdown_handler, worker)
-    plot_thread.start()
+    # plot_scheduler runs this on a monitored worker thread
+    return worker
 
 # Fix for the animate_objects function in palomas_orrery.py
 # This patch fixes the UnboundLocalError: cannot access local variable 'trace_indices' where it is not associated with a value
@@ -6135,15 +6151,23 @@ def plot_objects():
 # Replace the problematic section (around line 4200-4600) with:
 
 def animate_objects(step, label):
+    """Queue an animation build; it starts when earlier builds finish."""
+    plot_scheduler.submit('animate', f'{label} animation',
+                          lambda job: _build_animation(job, step, label),
+                          _plot_job_sources())
+
+
+def _build_animation(job, step, label):
+    """Prepare step of an animation job (main thread): pre-fetch, then return the worker."""
     # =========================================================================
-    # PRE-FETCH OSCULATING ELEMENTS ON MAIN THREAD (Threading Fix)
+    # PLAN OSCULATING PRE-FETCH ON MAIN THREAD (fetches run in the worker)
     # =========================================================================
     # Create working copy of planetary_params with fresh data (same as plot_objects)
     active_planetary_params = planetary_params.copy()
     
     # Get selected objects that need orbital elements
-    selected_objects_for_prefetch = [obj for obj in objects if obj['var'].get() == 1]
-    center_object_name = center_object_var.get()
+    selected_objects_for_prefetch = [obj for obj in objects if plot_jobs.value(obj['var']) == 1]
+    center_object_name = plot_jobs.value(center_object_var)
     
     # Determine center_body for osculating elements based on view
     # This affects which reference frame the elements use
@@ -6182,63 +6206,24 @@ def animate_objects(step, label):
         and not obj.get('is_mission', False)
     ]
     
+    # Level of detail for this build's shells and orbit lines
+    lod_level = render_lod.set_level(plot_jobs.value(lod_var))
+
+    # Opt-in timing report (checkbox or ORRERY_PROFILE); None when off
+    plot_profiler.start('animate', enabled=plot_jobs.value(profile_plot_var) == 1,
+                        metadata={'center': center_object_name, 'step': label,
+                                  'lod': lod_level,
+                                  'selected_objects': len(selected_objects_for_prefetch)})
+    plot_profiler.lap('osculating_prefetch')
+
     # Only pre-fetch in normal mode (not special fetch mode)
-    if special_fetch_var.get() == 0 and pre_fetch_objects:
+    prefetch_plan, prefetch_refresh = [], []
+    if plot_jobs.value(special_fetch_var) == 0 and pre_fetch_objects:
         print(f"\n[ANIMATION PRE-FETCH] Checking osculating elements for {len(pre_fetch_objects)} objects...", flush=True)
-        for obj_name in pre_fetch_objects:
-            try:
-                # Find the object dictionary to get its Horizons ID
-                obj_dict = next((obj for obj in selected_objects_for_prefetch 
-                                if obj['name'] == obj_name), None)
-                
-                if obj_dict:
-                    horizons_id = obj_dict.get('id', obj_name)
-                    id_type = obj_dict.get('id_type', 'smallbody')
-                    
-                    print(f"[ANIMATION PRE-FETCH] Using Horizons ID: {horizons_id} (type: {id_type})", flush=True)
-                    
-                    # Determine if this object needs barycentric elements
-                    # Pluto system objects need center_body when viewing from barycenter
-                    obj_center_body = None
-                    if center_object_name in ['Pluto-Charon Barycenter', 'Pluto']:
-                        # Check if this is a Pluto system object (Pluto, Charon, or outer moons)
-                        pluto_system_ids = ['999', '901', '902', '903', '904', '905']  # Pluto, Charon, Nix, Hydra, Kerberos, Styx
-                        if str(horizons_id) in pluto_system_ids:
-                            obj_center_body = osculating_center_body
-                    elif center_object_name == 'Orcus-Vanth Barycenter':
-                        orcus_system_ids = ['920090482', '120090482', '2004 DW']
-                        if str(horizons_id) in orcus_system_ids:
-                            obj_center_body = osculating_center_body
-                    elif center_object_name == 'Patroclus-Menoetius Barycenter':
-                        patroclus_system_ids = ['920000617', '120000617', 'A906 UL']
-                        if str(horizons_id) in patroclus_system_ids:
-                            obj_center_body = osculating_center_body                    
-                    elif center_object_name in ['Earth-Moon Barycenter', 'Earth']:
-                        # Check if this is an Earth-Moon system object (Earth or Moon)
-                        earth_moon_system_ids = ['399', '301']  # Earth, Moon
-                        if str(horizons_id) in earth_moon_system_ids:
-                            obj_center_body = osculating_center_body
-
-                    # Get elements with proper Horizons ID and center body
-                    fresh_elements = get_elements_with_prompt(
-                        obj_name, 
-                        horizons_id=horizons_id,
-                        id_type=id_type,
-                        plot_date=plot_date,
-                        parent_window=root,
-                        center_body=obj_center_body
-                    )
-
-                else:
-                    # Fallback to old behavior
-                    print(f"[ANIMATION PRE-FETCH] ? Object dictionary not found for {obj_name}, using name as ID", flush=True)
-            #        fresh_elements = get_elements_with_prompt(obj_name, plot_date=plot_date, parent_window=root)
-                    fresh_elements = get_elements_with_prompt(obj_name, plot_date=plot_date, parent_window=root, center_body=osculating_center_body)
-                
-                active_planetary_params[obj_name] = fresh_elements
-                print(f"[ANIMATION PRE-FETCH] OK: {obj_name}: Updated", flush=True)
-            except Exception as e:
-                print(f"[ANIMATION PRE-FETCH] ERROR: {obj_name}: {e}", flush=True)
+        prefetch_plan = osculating_prefetch.plan_prefetch(
+            pre_fetch_objects, selected_objects_for_prefetch,
+            center_object_name, osculating_center_body)
+        prefetch_refresh = osculating_prefetch.ask_refresh(prefetch_plan, parent_window=root)
 
     # =========================================================================
     
@@ -6248,21 +6233,23 @@ def animate_objects(step, label):
             global orbit_paths_over_time
             nonlocal active_planetary_params  # Access the pre-fetched orbital params
 
+            if prefetch_plan:
+                active_planetary_params.update(_run_osculating_prefetch(
+                    prefetch_plan, prefetch_refresh, plot_date))
+
             # Initialize frames list at the beginning
             frames = []
 
             # Display status message at the beginning of animation
-            output_label.config(text=f"Creating {label} animation. Please be patient as data is being fetched...")
-            progress_bar['mode'] = 'indeterminate'
-            progress_bar.start(10)  # Start the progress bar
-            root.update_idletasks()  # Force GUI to update
+            root.after(0, lambda: output_label.config(
+                text=f"Creating {label} animation. Please be patient as data is being fetched..."))
 
             # Detect exoplanet objects (same as in plot_objects)
             exo_objects = [obj for obj in objects 
-                        if obj['var'].get() == 1 and obj.get('object_type') == 'exoplanet']
+                        if plot_jobs.value(obj['var']) == 1 and obj.get('object_type') == 'exoplanet']
 
             exo_host_stars = [obj for obj in objects
-                        if obj['var'].get() == 1 and obj.get('object_type') in ['exo_host_star', 'exo_binary_star', 'exo_barycenter']]
+                        if plot_jobs.value(obj['var']) == 1 and obj.get('object_type') in ['exo_host_star', 'exo_binary_star', 'exo_barycenter']]
 
             # Detect if we're in exoplanet mode
             is_exoplanet_mode = bool(exo_objects or exo_host_stars)
@@ -6271,7 +6258,7 @@ def animate_objects(step, label):
                 print(f"\n[EXOPLANET ANIMATION MODE] Detected {len(exo_objects)} exoplanets and {len(exo_host_stars)} host stars", flush=True)            
 
             # Original setup code remains unchanged
-            center_object_name = center_object_var.get()
+            center_object_name = plot_jobs.value(center_object_var)
             center_object_info = next((obj for obj in objects if obj['name'] == center_object_name), None)
             if center_object_info:
                 if center_object_name == 'Sun':
@@ -6286,7 +6273,7 @@ def animate_objects(step, label):
                 center_id_type = None
 
             # Get frames number and validate
-            N_str = num_frames_entry.get()
+            N_str = plot_jobs.value(num_frames_entry)
             if not N_str.strip():
                 output_label.config(text="Please enter a valid number of frames.")
                 return
@@ -6308,7 +6295,7 @@ def animate_objects(step, label):
         #        settings['days_to_plot'] = gui_days
 
             # Debug check - don't override the precise calculated value from date range
-            gui_days = int(days_to_plot_entry.get()) if days_to_plot_entry.get() else 0
+            gui_days = int(plot_jobs.value(days_to_plot_entry)) if plot_jobs.value(days_to_plot_entry) else 0
             if int(settings['days_to_plot']) != gui_days:
                 print(f"[INFO] Animation days_to_plot: calculated={settings['days_to_plot']:.6f} days ({settings['days_to_plot']*24*60:.1f} min), GUI shows={gui_days} days", flush=True)
             # Note: Don't override - calculated value preserves sub-day precision for flybys       
@@ -6340,7 +6327,9 @@ def animate_objects(step, label):
                 days_ahead = (dates_list[-1] - dates_list[0]).days
 
             # INCREMENTAL UPDATE: Before animating, ensure we have updated data
-            selected_objects = [obj for obj in objects if obj['var'].get() == 1]
+            plot_profiler.lap('orbit_cache_update')
+            plot_jobs.checkpoint()
+            selected_objects = [obj for obj in objects if plot_jobs.value(obj['var']) == 1]
             selected_object_names = [obj['name'] for obj in selected_objects]  # Add this for plot_idealized_orbits
 
             output_label.config(text="Checking for orbit data updates for animation...")
@@ -6449,7 +6438,7 @@ def animate_objects(step, label):
                 # Process each exoplanet system that has planets or barycenter selected
                 processed_systems = set()
                 for obj in exo_objects + exo_host_stars:
-                    if obj['var'].get() == 1:
+                    if plot_jobs.value(obj['var']) == 1:
                         system_id = obj.get('system_id')
                         
                         # Skip if we've already processed this system
@@ -6515,7 +6504,7 @@ def animate_objects(step, label):
                 if obj_type == 'exoplanet':
                     continue
 
-                if obj['var'].get() == 1 and obj['name'] != center_object_name:
+                if plot_jobs.value(obj['var']) == 1 and obj['name'] != center_object_name:
                     
                     # For animations, we need to handle each type appropriately
                     if obj_type == 'trajectory':
@@ -6571,9 +6560,11 @@ def animate_objects(step, label):
                 print(f"  {name}: {len(dates)} dates", flush=True)
 
             # Fetch trajectory data for all selected objects
+            plot_profiler.lap('fetch_trajectories')
+            plot_jobs.checkpoint()
             positions_over_time = {}
             for obj in objects:
-                if obj['var'].get() == 1 and obj['name'] != center_object_name:
+                if plot_jobs.value(obj['var']) == 1 and obj['name'] != center_object_name:
                     # Use the dates from dates_lists
                     obj_dates = dates_lists.get(obj['name'], dates_list)
                     
@@ -6806,6 +6797,8 @@ def animate_objects(step, label):
             
 
             # Initialize figure
+            plot_profiler.lap('center_shells')
+            plot_jobs.checkpoint()
             fig = go.Figure()
 
             # =================================================================
@@ -6848,7 +6841,7 @@ def animate_objects(step, label):
             fig, center_shells_added, _shell_axis_range = add_center_body_shells(
                 fig, center_object_name, sun_shell_vars,
                 get_planet_shell_vars_map(), _sun_pos_tuple,
-                scale_var.get(), None, log_prefix='[ANIMATION] ',
+                plot_jobs.value(scale_var), None, log_prefix='[ANIMATION] ',
                 skip_elements=_center_engine_elements,
                 animate=True)
 
@@ -6864,14 +6857,14 @@ def animate_objects(step, label):
             # animate path cannot yet render. They DO render in static plots
             # and in body-centered animations. Per-frame/non-center rendering
             # is Phase 3 scope; until then, say so instead of silence.
-            if center_object_name != 'Sun' and any(var.get() == 1 for var in sun_shell_vars.values()):
+            if center_object_name != 'Sun' and any(plot_jobs.value(var) == 1 for var in sun_shell_vars.values()):
                 print(f"[ANIMATION] NOTE: Sun shells are checked but not yet rendered in "
                       f"{center_object_name}-centered animations (Phase 3 scope). "
                       f"They render in static plots and Sun-centered animations.", flush=True)
             _pm_map = get_planet_shell_vars_map()
             _skipped_shell_bodies = [
                 p for p, vs in _pm_map.items()
-                if p != center_object_name and any(v.get() == 1 for v in vs.values())
+                if p != center_object_name and any(plot_jobs.value(v) == 1 for v in vs.values())
             ]
             if _skipped_shell_bodies:
                 print(f"[ANIMATION] NOTE: shells checked for non-center bodies "
@@ -6904,7 +6897,7 @@ def animate_objects(step, label):
             trajectory_context_dates = {}
             
             for obj in objects:
-                if obj['var'].get() == 1 and obj['name'] != center_object_name:
+                if plot_jobs.value(obj['var']) == 1 and obj['name'] != center_object_name:
                     obj_type = obj.get('object_type', 'orbital')
                     
         #            if obj_type == 'orbital' and obj['name'] in planetary_params:
@@ -7033,7 +7026,7 @@ def animate_objects(step, label):
                             print(f"[TRAJECTORY CONTEXT] Plotted {obj_name} full mission: {len(x)} points", flush=True)
                             
                             # Add closest approach marker for Full Mission (base color)
-                            if show_closest_approach_var.get():
+                            if plot_jobs.value(show_closest_approach_var):
                                 from apsidal_markers import add_closest_approach_marker
                                 
                                 # Build positions_dict from context trajectory data
@@ -7059,11 +7052,13 @@ def animate_objects(step, label):
                                 )
 
             # Plot actual orbits using the orbit_dates_lists (DETAIL layer for trajectories)
+            plot_profiler.lap('trajectories', fig)
+            plot_jobs.checkpoint()
 
-            selected_planets = [obj['name'] for obj in objects if obj['var'].get() == 1 and obj['name'] != center_object_name]
+            selected_planets = [obj['name'] for obj in objects if plot_jobs.value(obj['var']) == 1 and obj['name'] != center_object_name]
             # FIXED: Added center_object_name - was defaulting to 'Sun' causing wrong hover text
             # Pass yellow marker color for trajectory Plotted Period traces
-            plot_actual_orbits(fig, selected_planets, orbit_dates_lists, center_id=center_id, show_lines=True, center_object_name=center_object_name, show_closest_approach=show_closest_approach_var.get(), trajectory_marker_color='yellow')
+            plot_actual_orbits(fig, selected_planets, orbit_dates_lists, center_id=center_id, show_lines=True, center_object_name=center_object_name, show_closest_approach=plot_jobs.value(show_closest_approach_var), trajectory_marker_color='yellow')
     
             for i, trace in enumerate(fig.data):
                 trace_type = type(trace).__name__
@@ -7071,7 +7066,14 @@ def animate_objects(step, label):
                 print(f"  Trace {i}: {trace.name} ({trace_type}, mode: {trace_mode})", flush=True)
 
             # ADD THIS SECTION - Plot idealized orbits
+            plot_profiler.lap('idealized_orbits', fig)
+            plot_jobs.checkpoint()
             selected_object_names = [obj['name'] for obj in selected_objects]  # Convert to names list
+            # Chord-error scale for the idealized orbit curves; the final axis
+            # range (exoplanet systems, center shells) is settled further down
+            orbit_sampling.set_axis_scale(get_animation_axis_range(
+                scale_var, custom_scale_entry, objects, active_planetary_params,
+                parent_planets, center_object_name))
             plot_idealized_orbits(
                 fig, 
                 selected_object_names,  # Use the names list
@@ -7084,13 +7086,13 @@ def animate_objects(step, label):
                 days_to_plot=settings['days_to_plot'],
                 current_positions=initial_positions,
                 fetch_position=fetch_position,
-                show_apsidal_markers=show_apsidal_markers_var.get(),
+                show_apsidal_markers=plot_jobs.value(show_apsidal_markers_var),
                 parent_window=root  
             )
 
             # ---- Capability B: CAD perigee marker (precision close approach) ----
             # ---- Capability C: Hyperbolic osculating orbit ----------------------
-            if center_object_name != 'Sun' and show_apsidal_markers_var.get():
+            if center_object_name != 'Sun' and plot_jobs.value(show_apsidal_markers_var):
                 _add_close_approach_extras(
                     fig=fig,
                     selected_objects=selected_object_names,
@@ -7099,26 +7101,26 @@ def animate_objects(step, label):
                     color_map=color_map,
                     date_obj=dates_list[0] if dates_list else datetime.now(),
                     settings=settings,
-                    show_apsidal_markers=show_apsidal_markers_var.get(),
+                    show_apsidal_markers=plot_jobs.value(show_apsidal_markers_var),
                     parent_window=root,
                 )
 
             # ---- Capability D: Perihelion osculating orbit (Sun-centered) --------
-            if center_object_name == 'Sun' and show_apsidal_markers_var.get():
+            if center_object_name == 'Sun' and plot_jobs.value(show_apsidal_markers_var):
                 _add_perihelion_osculating_orbit(
                     fig=fig,
                     selected_objects=selected_object_names,
                     objects=objects,
                     color_map=color_map,
                     date_obj=dates_list[0] if dates_list else datetime.now(),
-                    show_apsidal_markers=show_apsidal_markers_var.get(),
+                    show_apsidal_markers=plot_jobs.value(show_apsidal_markers_var),
                     parent_window=root,
                 )
 
             # ---- Spacecraft Encounter Markers (Mode 2: pairwise detection) --------
         #    if center_object_name == 'Sun' and show_closest_approach_var.get():
             # ---- Spacecraft Encounter Markers (tagged encounter data) --------
-            if show_closest_approach_var.get():                
+            if plot_jobs.value(show_closest_approach_var):                
                 _add_spacecraft_encounter_markers(
                     fig=fig,
                     selected_objects=selected_object_names,
@@ -7127,7 +7129,7 @@ def animate_objects(step, label):
                     center_object_name=center_object_name,
                     center_id=center_id,
                     color_map=color_map,
-                    show_closest_approach=show_closest_approach_var.get(),
+                    show_closest_approach=plot_jobs.value(show_closest_approach_var),
                     positions_cache=positions_over_time,
                 )
 
@@ -7135,6 +7137,8 @@ def animate_objects(step, label):
                 print(f"  Trace {i}: {trace.name}", flush=True)      
 
             # Initialize trace_indices BEFORE trying to use it
+            plot_profiler.lap('moving_object_traces', fig)
+            plot_jobs.checkpoint()
             trace_indices = {}
             
             # Find and track the Pluto-Charon Barycenter trace if it exists
@@ -7190,7 +7194,7 @@ def animate_objects(step, label):
                     barycenter_obj = next((obj for obj in exo_host_stars 
                                         if obj.get('id_type') == 'barycenter' 
                                         and obj.get('system_id') == system_id 
-                                        and obj['var'].get() == 1), None)
+                                        and plot_jobs.value(obj['var']) == 1), None)
                     
                     if system_stars or barycenter_obj or not system['host_star'].get('is_binary'):
                         fig = plot_binary_host_stars(fig, system['host_star'], dates_list[0], 
@@ -7261,7 +7265,7 @@ def animate_objects(step, label):
                             # Find which system this star belongs to and get its properties
                             star_data = None
                             for obj in exo_objects + exo_host_stars:
-                                if obj['var'].get() == 1:
+                                if plot_jobs.value(obj['var']) == 1:
                                     sys_id = obj.get('system_id')
                                     if sys_id:
                                         sys = get_system(sys_id)
@@ -7316,7 +7320,7 @@ def animate_objects(step, label):
                 if obj.get('object_type') == 'exoplanet':
                     continue
 
-                if obj['var'].get() == 1 and obj['name'] != center_object_name:
+                if plot_jobs.value(obj['var']) == 1 and obj['name'] != center_object_name:
                     obj_name = obj['name']
                     obj_positions = positions_over_time.get(obj_name)
                     
@@ -7374,6 +7378,8 @@ def animate_objects(step, label):
             
             # ============ ADD COMET TAILS INTEGRATION ============
             # Conservative comet tail integration for first frame
+            plot_profiler.lap('comet_tails', fig)
+            plot_jobs.checkpoint()
             # Note: For animations, we only add tails to the initial figure state
             # as recalculating them every frame would be too expensive
         #    if len(dates_list) > 0:
@@ -7396,7 +7402,7 @@ def animate_objects(step, label):
 
                 for obj in objects:
 
-                    if obj['var'].get() == 1:
+                    if plot_jobs.value(obj['var']) == 1:
                         # Check if this is a comet by its properties
 
                         is_comet = (
@@ -7417,7 +7423,7 @@ def animate_objects(step, label):
                             # frame-1 here (excluded from per-frame mode).
                             try:
                                 _tails_engine_owned = (
-                                    animate_comet_tails_var.get() == 1
+                                    plot_jobs.value(animate_comet_tails_var) == 1
                                     and obj_name != 'MAPS')
                             except Exception:
                                 _tails_engine_owned = False
@@ -7454,6 +7460,8 @@ def animate_objects(step, label):
             # ============ END COMET TAILS INTEGRATION ============
 
             # NOW create frames - after trace_indices has been defined
+            plot_profiler.lap('frames', fig)
+            plot_jobs.checkpoint()
             # =================================================================
             # OPTIMIZATION: frames carry ONLY the traces the frame loop updates
             # (single-point object/barycenter markers registered in
@@ -7573,7 +7581,7 @@ def animate_objects(step, label):
             _track_body = None
             _track_radius = None
             try:
-                _tc = track_camera_var.get()
+                _tc = plot_jobs.value(track_camera_var)
             except Exception:
                 _tc = 'None (free camera)'
             if _tc and not _tc.startswith('None'):
@@ -7778,7 +7786,7 @@ def animate_objects(step, label):
 
                 # Then update regular solar system objects
                 for obj in objects:
-                        if obj['var'].get() == 1 and obj['name'] != center_object_name:
+                        if plot_jobs.value(obj['var']) == 1 and obj['name'] != center_object_name:
                             obj_name = obj['name']
                                         
                             # Skip exoplanets - already handled above
@@ -7904,6 +7912,8 @@ def animate_objects(step, label):
 
 
             # Get axis range using orbital parameters (same as static plots)
+            plot_profiler.lap('layout', fig)
+            plot_jobs.checkpoint()
             if is_exoplanet_mode and exo_objects:
                 # Use exoplanet-specific axis range calculation
                 from exoplanet_orbits import calculate_exoplanet_axis_range
@@ -7955,22 +7965,23 @@ def animate_objects(step, label):
             # the free-camera animation (S2), under Auto and Manual scale alike;
             # camera-tracked frames build their own grid (track_camera_var).
             try:
-                _cd = float(custom_dtick_entry.get().strip())
+                _cd = float(plot_jobs.value(custom_dtick_entry).strip())
                 custom_dtick = _cd if _cd > 0 else None
             except (ValueError, AttributeError):
                 custom_dtick = None
 
                         
             # Celestial sphere: star background + coordinate grid (static backdrop)
-            if (star_background_var.get() or celestial_grid_var.get()
-                    or constellation_names_var.get() ):
+            if (plot_jobs.value(star_background_var) or plot_jobs.value(celestial_grid_var)
+                    or plot_jobs.value(constellation_names_var) ):
                 add_celestial_sphere_traces(
                     fig, axis_range,
-                    show_stars=star_background_var.get(),
-                    show_names=star_names_var.get(),
-                    show_grid=celestial_grid_var.get(),
-                    show_labels=celestial_grid_labels_var.get(),
-                    show_constellation_names=constellation_names_var.get()
+                    show_stars=plot_jobs.value(star_background_var),
+                    show_names=plot_jobs.value(star_names_var),
+                    show_grid=plot_jobs.value(celestial_grid_var),
+                    show_labels=plot_jobs.value(celestial_grid_labels_var),
+                    show_constellation_names=plot_jobs.value(constellation_names_var),
+                    vmag_limit=float(plot_jobs.value(star_depth_var))
                 )
 
             # Update layout with dynamic scaling
@@ -8138,6 +8149,8 @@ def animate_objects(step, label):
                     fig.data[trace_idx].visible = frames[0].data[frame_idx].visible
 
             # Add hover toggle buttons
+            plot_profiler.lap('buttons', fig)
+            plot_jobs.checkpoint()
             fig = add_hover_toggle_buttons(fig)
 
             # Add camera view buttons with dropdown for different target objects
@@ -8168,12 +8181,18 @@ def animate_objects(step, label):
             current_date = STATIC_TODAY
             default_name = f"{center_object_name}_system_animation_{current_date.strftime('%Y%m%d_%H%M')}"
 
+            plot_profiler.lap('save_html', fig)
+            plot_jobs.checkpoint()
             show_animation_safely(fig, default_name)
 
             # Store fig for social media export
             _last_plotted_fig[0] = fig
             _last_plot_name[0] = default_name
 
+            _report, _profile_line = plot_profiler.finish(fig)
+            if _profile_line:
+                root.after(0, lambda msg=_profile_line: update_status_display(msg, 'special'))
+
             # Update output_label with instructions (schedule on main thread for macOS)
 
             root.after(0, lambda: output_label.config(
@@ -8186,10 +8205,10 @@ def animate_objects(step, label):
             print(f"Error during animation: {e}", flush=True)
             traceback.print_exc()
             root.after(0, lambda: progress_bar.stop())        
+            plot_profiler.finish()  # partial report: shows which stage failed
 
-    # Create and start monitored thread
-    animation_thread = create_monitored_thread(shutdown_handler, animation_worker)
-    animation_thread.start()
+    # plot_scheduler runs this on a monitored worker thread
+    return animation_worker
 
 def on_closing():
     """Handle cleanup when the main window is closed."""
@@ -8341,6 +8360,8 @@ def reset_all_selections():
     scale_var.set('Auto')
     center_object_var.set('Sun')
     track_camera_var.set('None (free camera)')
+    lod_var.set(render_lod.DEFAULT_LEVEL)
+    star_depth_var.set(f"{STAR_DEPTH_DEFAULT:g}")
 
     # --- Family 6: scalar entry widgets -> startup defaults (delete + insert) ---
     def _set_entry(entry, value):
@@ -8756,7 +8777,8 @@ def get_end_date_from_gui():
     now = datetime.now()
     def safe_int(val, default):
         try:
-            return int(val.get()) if val.get().strip() else default
+            text = plot_jobs.value(val)
+            return int(text) if text.strip() else default
         except (ValueError, tk.TclError):
             return default
     return datetime(
@@ -8836,8 +8858,9 @@ star_bg_checkbutton = tk.Checkbutton(celestial_sphere_frame,
     text="Star Background", variable=star_background_var)
 star_bg_checkbutton.pack(anchor='w')
 CreateToolTip(star_bg_checkbutton,
-    "Show ~288 stars brighter than magnitude 3.5 as uniform dots\n"
-    "on a sphere scaled to the current axis range.\n"
+    "Show ~288 stars brighter than magnitude 3.5 (or down to the\n"
+    "chosen Depth) as uniform dots on a sphere scaled to the\n"
+    "current axis range.\n"
     "Stars are at their real RA/Dec sky positions (ecliptic frame).")
  
 # Star names sub-checkbox (indented, only meaningful when stars are on)
@@ -8848,6 +8871,24 @@ CreateToolTip(star_names_checkbutton,
     "Show star designations (e.g. '* alf Ori') on hover.\n"
     "Requires Star Background to be enabled.")
 
+# Star depth: faintest magnitude drawn. Deeper tiers are read from the
+# binary star tiles built by star_sphere_builder.py.
+star_depth_row = tk.Frame(celestial_sphere_frame)
+star_depth_row.pack(anchor='w', padx=(20, 0))
+tk.Label(star_depth_row, text="Depth:").pack(side='left')
+for _star_tier in STAR_DEPTH_TIERS:
+    _star_depth_radio = tk.Radiobutton(star_depth_row, text=f"{_star_tier:g}",
+                                       variable=star_depth_var, value=f"{_star_tier:g}")
+    _star_depth_radio.pack(side='left')
+    CreateToolTip(_star_depth_radio,
+        "STAR DEPTH (faintest magnitude shown)\n\n"
+        "* 3.5: ~290 bright stars (the default)\n"
+        "* 5: ~1,600 stars -- the sky from a suburban yard\n"
+        "* 6.5: ~8,000 stars -- the naked-eye sky from a dark site\n"
+        "* 8: ~40,000 stars -- binocular sky; larger HTML\n\n"
+        "Deeper than 3.5 needs the star tiles: run star_sphere_builder.py.\n"
+        "Requires Star Background to be enabled.")
+
 # Constellation names sub-checkbox (indented)
 constellation_names_checkbutton = tk.Checkbutton(celestial_sphere_frame,
     text="  Constellation Names", variable=constellation_names_var)
@@ -10346,6 +10387,26 @@ CreateToolTip(custom_dtick_entry,
     "* 0.00005 AU ~ 7,480 km\n"
     "* 0.00002 AU ~ 2,992 km")
 
+# Level of detail for shell point density and orbit lines (render_lod).
+# Standard reproduces the historical densities exactly.
+lod_var = tk.StringVar(value=render_lod.current())
+lod_row = tk.Frame(scale_frame)
+lod_row.pack(anchor='w')
+tk.Label(lod_row, text="Detail:").pack(side='left')
+for _lod_level in render_lod.LEVELS:
+    _lod_radio = tk.Radiobutton(lod_row, text=render_lod.PRESETS[_lod_level]['label'],
+                                variable=lod_var, value=_lod_level)
+    _lod_radio.pack(side='left')
+    CreateToolTip(_lod_radio,
+        "LEVEL OF DETAIL\n\n"
+        "* Preview: half-density shells, rings and hover points; orbit lines\n"
+        "  simplified where they run straight, bends kept. Fastest to build\n"
+        "  and smallest HTML -- also the lean choice for social exports.\n"
+        "* Standard: the usual densities, every orbit sample.\n"
+        "* Publication: 1.5x shell density for close-up stills.\n\n"
+        "Applies to the next Plot or Animate. Markers, closest-approach\n"
+        "and apsidal calculations always use every sample.")
+
 # Create a frame for the center object selection
 center_frame = tk.LabelFrame(controls_frame, text="Select Center Object for Your Plot")
 center_frame.pack(pady=(5, 5), fill='x')
@@ -10743,6 +10804,86 @@ status_display = tk.Label(
 )
 status_display.pack(anchor='w', padx=5, pady=5)
 
+# Opt-in build profiler: stage timings, Horizons call counts and trace bytes
+# written to data/last_plot_profile.json, summary shown in the status display.
+# The ORRERY_PROFILE environment variable turns it on without the checkbox.
+profile_plot_var = tk.IntVar(value=0)
+profile_plot_checkbox = tk.Checkbutton(
+    status_frame,
+    text="Profile plot build (timing report)",
+    variable=profile_plot_var,
+    bg='SystemButtonFace'
+)
+profile_plot_checkbox.pack(anchor='w', padx=5)
+CreateToolTip(profile_plot_checkbox,
+    "PLOT BUILD PROFILER\n\n"
+    "Times each stage of Plot and Animate (pre-fetch, positions,\n"
+    "trajectories, shells, idealized orbits, buttons, HTML write)\n"
+    "and counts Horizons calls and osculating cache hits.\n\n"
+    "- Report: data/last_plot_profile.json\n"
+    "- Summary: shown in the status display above\n"
+    "- Adds a little overhead (trace sizes are measured)")
+
+# Plot/Animate builds run one at a time on a worker thread (plot_jobs).
+# Clicking again while a build runs queues the new build with the GUI
+# selections as they were at the click.
+def _on_plot_job_update(job, event):
+    """plot_scheduler status callback (always on the main thread)."""
+    waiting = len(plot_scheduler.pending())
+    if event == 'queued':
+        update_status_display(f"Queued: {job.label} ({waiting} waiting)", 'info')
+    elif event == 'started':
+        progress_bar['mode'] = 'indeterminate'
+        progress_bar.start(10)
+        suffix = f" ({waiting} queued)" if waiting else ""
+        update_status_display(f"Started: {job.label}{suffix}", 'info')
+    else:
+        if job.started is None:
+            # Dropped from the queue before it ran
+            update_status_display(f"Removed from queue: {job.label}", 'warning')
+            return
+        progress_bar.stop()
+        if event == 'cancelled':
+            plot_profiler.finish()  # partial report: shows where it stopped
+            output_label.config(text=f"{job.label} cancelled.")
+            update_status_display(f"Cancelled: {job.label}", 'warning')
+        elif event == 'failed':
+            plot_profiler.finish()
+            output_label.config(text=f"Error during {job.label}: {job.error}")
+            update_status_display(f"Failed: {job.label}", 'error')
+
+plot_scheduler = plot_jobs.PlotJobScheduler(root, shutdown_handler,
+                                            on_update=_on_plot_job_update)
+
+def cancel_plot_job():
+    """Stop the running build at its next stage boundary."""
+    job = plot_scheduler.cancel_current()
+    if job is None:
+        update_status_display("No plot is running", 'info')
+    else:
+        update_status_display(f"Cancelling {job.label} after the current stage...", 'warning')
+
+def clear_plot_queue():
+    """Drop queued builds and cancel the running one."""
+    running, dropped = plot_scheduler.cancel_all()
+    if running is None and not dropped:
+        update_status_display("No plots running or queued", 'info')
+
+plot_job_frame = tk.Frame(status_frame, bg='SystemButtonFace')
+plot_job_frame.pack(anchor='w', padx=5, pady=(2, 0))
+cancel_plot_button = tk.Button(plot_job_frame, text="Cancel Plot", command=cancel_plot_job)
+cancel_plot_button.pack(side='left')
+clear_queue_button = tk.Button(plot_job_frame, text="Cancel All", command=clear_plot_queue)
+clear_queue_button.pack(side='left', padx=(5, 0))
+CreateToolTip(cancel_plot_button,
+    "Stop the plot or animation being built.\n\n"
+    "The build stops at the next stage boundary; a Horizons\n"
+    "request already in flight finishes first.")
+CreateToolTip(clear_queue_button,
+    "Cancel the running build and drop any queued ones.\n\n"
+    "Clicking Plot or Animate while a build runs queues the\n"
+    "new build with the selections you had at the click.")
+
 # =============================================================================
 # DEPRECATED: Special Fetch Mode and Interval Settings
 # The two-layer trajectory system provides automatic detail resolution,
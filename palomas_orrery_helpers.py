@@ -15,6 +15,8 @@ Role: utility
 Domain: orrery
 
 Module updated: April 2026 with Anthropic's Claude Opus 4.6
+
+Module updated: October 2026 (rotate_points2 delegates to orbit_transforms)
 """
 #Paloma's Orrery - Solar System Visualization Tool
 
@@ -27,6 +29,7 @@ import plotly.graph_objs as go
 import webbrowser
 import os
 import warnings
+import orbit_transforms
 # from astropy.utils.exceptions import ErfaWarning
 # ErfaWarning - for suppressing astronomy library warnings about "dubious" dates.
 # Import path has changed across versions (astropy -> erfa -> erfa.core).
@@ -44,6 +47,7 @@ import sys
 import math
 import json
 import orbit_data_manager
+import plot_profiler
 import shutil
 
 from idealized_orbits import plot_idealized_orbits, planetary_params, parent_planets, planet_tilts, rotate_points 
@@ -274,39 +278,11 @@ def rotate_points2(x, y, z, angle, axis='z'):
         
     Returns:
         tuple: (xr, yr, zr) rotated coordinates
+
+    The matrix for (angle, axis) is cached in orbit_transforms, shared
+    with idealized_orbits.rotate_points.
     """
-    import numpy as np
-    
-    # Convert inputs to numpy arrays if they aren't already
-    x = np.array(x, copy=True)
-    y = np.array(y, copy=True)
-    z = np.array(z, copy=True)
-
-    # Initialize rotated coordinates
-    xr = x.copy()
-    yr = y.copy()
-    zr = z.copy()
-
-    # Perform rotation based on specified axis
-    if axis == 'z':
-        # Rotate about z-axis
-        xr = x * np.cos(angle) - y * np.sin(angle)
-        yr = x * np.sin(angle) + y * np.cos(angle)
-        # zr remains the same
-    elif axis == 'x':
-        # Rotate about x-axis
-        yr = y * np.cos(angle) - z * np.sin(angle)
-        zr = y * np.sin(angle) + z * np.cos(angle)
-        # xr remains the same
-    elif axis == 'y':
-        # Rotate about y-axis
-        zr = z * np.cos(angle) - x * np.sin(angle)
-        xr = z * np.sin(angle) + x * np.cos(angle)
-        # yr remains the same
-    else:
-        raise ValueError(f"Unknown rotation axis: {axis}. Use 'x', 'y', or 'z'.")
-
-    return xr, yr, zr
+    return orbit_transforms.rotate(x, y, z, angle, axis)
 
 def calculate_axis_range(objects_to_plot):
     """Calculate appropriate axis range based on outermost planet"""
@@ -380,6 +356,7 @@ def fetch_trajectory(object_id, dates_list, center_id='Sun', id_type=None,
         epochs = times.jd.tolist()
         
         # Query Horizons
+        plot_profiler.count(plot_profiler.HORIZONS_CALLS)
         obj = Horizons(id=object_id, id_type=id_type, location='@' + center_id, epochs=epochs)
         vectors = obj.vectors()
 
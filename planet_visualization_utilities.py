@@ -35,6 +35,12 @@ radius aliases -- Mercury, Venus, Moon, Mars, Saturn, Uranus, Neptune,
 Pluto, Eris -- now imported directly from constants_new.py instead of
 re-derived from CENTER_BODY_RADII; same values, same names)
 
+Module updated: October 2026 (shared sphere, magnetosphere and bow-shock
+grids scale with the render_lod level; standard level is unchanged)
+
+Module updated: October 2026 (rotate_points uses the cached matrices in
+orbit_transforms)
+
 Role: rendering
 Domain: orrery
 """
@@ -42,6 +48,8 @@ Domain: orrery
 import math
 import numpy as np
 import plotly.graph_objs as go
+import orbit_transforms
+import render_lod
 from constants_new import (
     KM_PER_AU, SUN_RADIUS_KM, LIGHT_MINUTES_PER_AU, KNOWN_ORBITAL_PERIODS,
     CENTER_BODY_RADII,
@@ -139,41 +147,10 @@ def rotate_points(x, y, z, angle, axis='x'):
     Returns:
         tuple: (x_rotated, y_rotated, z_rotated)
     """
-    # Create rotation matrices
-    if axis == 'x':
-        # Rotation around x-axis
-        rot_matrix = np.array([
-            [1, 0, 0],
-            [0, np.cos(angle), -np.sin(angle)],
-            [0, np.sin(angle), np.cos(angle)]
-        ])
-    elif axis == 'y':
-        # Rotation around y-axis
-        rot_matrix = np.array([
-            [np.cos(angle), 0, np.sin(angle)],
-            [0, 1, 0],
-            [-np.sin(angle), 0, np.cos(angle)]
-        ])
-    elif axis == 'z':
-        # Rotation around z-axis
-        rot_matrix = np.array([
-            [np.cos(angle), -np.sin(angle), 0],
-            [np.sin(angle), np.cos(angle), 0],
-            [0, 0, 1]
-        ])
-    
-    # Stack coordinates into a single array
-    points = np.vstack((x, y, z))
-    
-    # Apply rotation
-    rotated_points = np.dot(rot_matrix, points)
-    
-    # Unpack results
-    x_rotated = rotated_points[0, :]
-    y_rotated = rotated_points[1, :]
-    z_rotated = rotated_points[2, :]
-    
-    return x_rotated, y_rotated, z_rotated
+    # One cached matrix per (angle, axis), shared with the orbit plotting
+    # rotations; the points are stacked as np.vstack always stacked them.
+    matrix = orbit_transforms.axis_matrix(angle, axis)
+    return orbit_transforms.apply(matrix, *np.vstack((x, y, z)))
 
 def create_hover_markers_for_planet(center_position, radius, color, name, description, num_points=40):
     """
@@ -241,9 +218,14 @@ def create_magnetosphere_shape(params, n_phi=20, n_theta=20,
         n_theta (int): Azimuthal resolution (default 20).
         n_tail_segments (int): Magnetotail axial segments (default 10).
 
+        All three are scaled by the active render_lod level.
+
     Returns:
         tuple: (x, y, z) coordinates as lists
     """
+    n_phi = render_lod.linear(n_phi)
+    n_theta = render_lod.linear(n_theta)
+    n_tail_segments = render_lod.linear(n_tail_segments, minimum=2)
     x_coords = []
     y_coords = []
     z_coords = []
@@ -325,7 +307,8 @@ def create_bow_shock_shape(standoff, width, n_phi=30, n_theta=30,
         width (float): legacy paraboloid flank scale in AU. Used ONLY on the
                        paraboloid path (eccentricity=None). Ignored on the
                        conic path, where flank flare is set by eccentricity.
-        n_phi, n_theta (int): grid resolution (legacy default 30x30).
+        n_phi, n_theta (int): grid resolution (legacy default 30x30),
+                       scaled by the active render_lod level.
         eccentricity (float or None): None -> legacy paraboloid (regression
                        test only); a float (typ. ~1.05) -> conic-section model
                        (the delivered shape).
@@ -335,6 +318,8 @@ def create_bow_shock_shape(standoff, width, n_phi=30, n_theta=30,
     """
     import numpy as np
 
+    n_phi = render_lod.linear(n_phi)
+    n_theta = render_lod.linear(n_theta)
     bx, by, bz = [], [], []
 
     if eccentricity is None:
@@ -383,11 +368,13 @@ def create_sphere_points(radius, n_points=50):
     
     Parameters:
         radius (float): Radius of the sphere in AU
-        n_points (int): Number of points to generate along each dimension
+        n_points (int): Number of points to generate along each dimension,
+            scaled by the active render_lod level
         
     Returns:
         tuple: (x, y, z) coordinates as flattened arrays
     """
+    n_points = render_lod.linear(n_points)
     phi = np.linspace(0, 2*np.pi, n_points)
     theta = np.linspace(-np.pi/2, np.pi/2, n_points)
     phi, theta = np.meshgrid(phi, theta)
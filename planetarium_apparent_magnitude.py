@@ -28,7 +28,8 @@ from data_processing import (
 )
 from star_properties import (
     load_existing_properties, generate_unique_ids, query_simbad_for_star_properties,
-    assign_properties_to_data
+    assign_properties_to_data,
+    missing_property_ids
 )
 from stellar_parameters import calculate_stellar_parameters
 from visualization_core import analyze_magnitude_distribution, analyze_and_report_stars
@@ -139,7 +140,8 @@ def process_stars(hip_data, gaia_data, mag_limit):
         load_existing_properties, 
         generate_unique_ids, 
         query_simbad_for_star_properties,
-        assign_properties_to_data
+        assign_properties_to_data,
+        missing_property_ids
     )
     
     properties_file = 'star_data/star_properties_magnitude.pkl'
@@ -147,7 +149,7 @@ def process_stars(hip_data, gaia_data, mag_limit):
     unique_ids = generate_unique_ids(combined_data)
     
     # Find which stars need SIMBAD queries
-    missing_ids = [uid for uid in unique_ids if uid not in existing_properties]
+    missing_ids = missing_property_ids(unique_ids, existing_properties)
     
     if missing_ids:
         print(f"Querying SIMBAD for {len(missing_ids)} stars...")
@@ -38,7 +38,8 @@ from data_processing import (
 )
 from star_properties import (
     load_existing_properties, generate_unique_ids, query_simbad_for_star_properties,
-    assign_properties_to_data
+    assign_properties_to_data,
+    missing_property_ids
 )
 from stellar_parameters import calculate_stellar_parameters
 
@@ -161,7 +162,8 @@ def process_stars(hip_data, gaia_data, max_light_years):
         load_existing_properties, 
         generate_unique_ids, 
         query_simbad_for_star_properties,
-        assign_properties_to_data
+        assign_properties_to_data,
+        missing_property_ids
     )
     
     properties_file = 'star_data/star_properties_distance.pkl'
@@ -169,7 +171,7 @@ def process_stars(hip_data, gaia_data, max_light_years):
     unique_ids = generate_unique_ids(combined_data)
     
     # Find which stars need SIMBAD queries
-    missing_ids = [uid for uid in unique_ids if uid not in existing_properties]
+    missing_ids = missing_property_ids(unique_ids, existing_properties)
     
     # DEBUG: Add this to see what's happening
     print(f"DEBUG: Total stars: {len(unique_ids)}")
@@ -0,0 +1,315 @@
+"""
+plot_jobs.py - Queued, cancellable plot and animation builds for the GUI.
+
+Plot and Animate in palomas_orrery.py used to start a fresh worker thread
+per click. Two clicks meant two builds racing on the same globals, there
+was no way to stop a long animation short of closing the window, and the
+worker read the GUI's Tk variables while it ran, so changing a checkbox
+mid-build changed the build.
+
+PlotJobScheduler runs one build at a time:
+
+    - submit() snapshots the GUI inputs the build reads (on the main
+      thread, at click time) and queues the job
+    - when a job reaches the front, its prepare step runs on the main
+      thread (osculating pre-fetch, which may open dialogs) and returns
+      the work to run on a monitored worker thread
+      (shutdown_handler.create_monitored_thread)
+    - status changes are marshalled back to the main thread with
+      root.after, and the next queued job starts from there
+    - cancel_current() / cancel_all() set a flag the pipeline checks at its
+      stage boundaries through checkpoint(); a stage already inside a
+      Horizons request finishes that request first
+    - call_on_main() lets the worker ask the main thread to run a dialog
+      or message box and wait for the answer
+
+The build code reads GUI inputs through value(), which returns the
+snapshot taken at submit time while a job is running on the calling
+thread, and the live widget value otherwise.
+
+Key classes:
+    PlotJobScheduler - FIFO queue, worker thread, cancel, main-thread calls
+    PlotJob - one queued build and its snapshot
+    GuiSnapshot - frozen .get() values for a set of Tk variables/widgets
+
+Key functions:
+    checkpoint() - raise JobCancelled if the running job was cancelled
+    value() - snapshot-aware .get() for the build code
+
+Consumed by: palomas_orrery.py
+
+Role: utility
+Domain: orrery
+
+Module created: October 2026
+"""
+
+import itertools
+import threading
+import traceback
+from collections import deque
+from datetime import datetime
+
+from shutdown_handler import create_monitored_thread
+
+
+class JobCancelled(BaseException):
+    """Raised by checkpoint() inside a build whose job was cancelled.
+
+    A BaseException, like asyncio.CancelledError, so the pipelines'
+    per-stage ``except Exception`` handlers do not swallow it.
+    """
+
+
+class GuiSnapshot:
+    """The .get() value of each source (Tk variable or Entry) at one moment."""
+
+    def __init__(self, sources=()):
+        self._values = {}
+        self._sources = []      # keep the objects alive so id() stays unique
+        for source in sources:
+            if id(source) in self._values:
+                continue
+            self._values[id(source)] = source.get()
+            self._sources.append(source)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __contains__(self, source):
+        return id(source) in self._values
+
+    def value(self, source):
+        """Snapshot value for source; live .get() if it was not captured."""
+        try:
+            return self._values[id(source)]
+        except KeyError:
+            return source.get()
+
+
+class PlotJob:
+    """One queued plot or animation build."""
+
+    def __init__(self, job_id, kind, label, prepare, snapshot):
+        self.job_id = job_id
+        self.kind = kind
+        self.label = label
+        self.prepare = prepare
+        self.snapshot = snapshot
+        self.state = 'queued'
+        self.error = None
+        self.submitted = datetime.now()
+        self.started = None
+        self._cancel = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def __repr__(self):
+        return f"<PlotJob #{self.job_id} {self.label} {self.state}>"
+
+
+# The job whose code is running on this thread: set on the main thread for
+# the duration of prepare(), and on the worker thread for the build.
+_local = threading.local()
+
+
+def current_job():
+    """The job running on the calling thread, or None."""
+    return getattr(_local, 'job', None)
+
+
+def checkpoint():
+    """Raise JobCancelled if the job running on this thread was cancelled."""
+    job = getattr(_local, 'job', None)
+    if job is not None and job.cancelled:
+        raise JobCancelled(job.label)
+
+
+def value(source):
+    """source.get(), read from the running job's snapshot when there is one."""
+    job = getattr(_local, 'job', None)
+    if job is not None and job.snapshot is not None:
+        return job.snapshot.value(source)
+    return source.get()
+
+
+class PlotJobScheduler:
+    """Run plot/animation builds one at a time, off the Tk main thread.
+
+    Args:
+        root: Tk root (anything with after(ms, func, *args))
+        handler: PlotlyShutdownHandler the worker threads register with
+        on_update: optional callback(job, event) run on the main thread for
+            'queued', 'started', 'done', 'failed' and 'cancelled'
+    """
+
+    def __init__(self, root, handler, on_update=None):
+        self.root = root
+        self.handler = handler
+        self.on_update = on_update
+        self._queue = deque()
+        self._current = None
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # main-thread API
+    # ------------------------------------------------------------------
+    def submit(self, kind, label, prepare, sources=()):
+        """Snapshot sources and queue a build. Returns the PlotJob.
+
+        prepare(job) runs on the main thread when the job starts and
+        returns the callable to run on the worker thread (or None if
+        there is nothing left to do).
+        """
+        job = PlotJob(next(self._ids), kind, label, prepare, GuiSnapshot(sources))
+        with self._lock:
+            self._queue.append(job)
+            busy = self._current is not None
+        if busy:
+            self._notify(job, 'queued')
+        else:
+            self._start_next()
+        return job
+
+    @property
+    def current(self):
+        return self._current
+
+    def pending(self):
+        """Jobs waiting behind the current one, oldest first."""
+        with self._lock:
+            return list(self._queue)
+
+    def is_busy(self):
+        return self._current is not None
+
+    def cancel_current(self):
+        """Ask the running build to stop at its next checkpoint."""
+        job = self._current
+        if job is not None:
+            job.cancel()
+        return job
+
+    def cancel_all(self):
+        """Drop every queued job and cancel the running one."""
+        with self._lock:
+            dropped = list(self._queue)
+            self._queue.clear()
+        for job in dropped:
+            job.cancel()
+            job.state = 'cancelled'
+            self._notify(job, 'cancelled')
+        return self.cancel_current(), dropped
+
+    # ------------------------------------------------------------------
+    # worker-thread API
+    # ------------------------------------------------------------------
+    def call_on_main(self, func, *args, **kwargs):
+        """Run func on the Tk main thread and return its result.
+
+        Called from the worker for dialogs and message boxes. Called on
+        the main thread it simply runs func. Gives up with JobCancelled if
+        the application shuts down while waiting.
+        """
+        if threading.current_thread() is threading.main_thread():
+            return func(*args, **kwargs)
+
+        done = threading.Event()
+        outcome = {}
+
+        def runner():
+            try:
+                outcome['result'] = func(*args, **kwargs)
+            except BaseException as e:
+                outcome['error'] = e
+            finally:
+                done.set()
+
+        self.root.after(0, runner)
+        while not done.wait(0.2):
+            if getattr(self.handler, 'is_shutting_down', False):
+                raise JobCancelled('shutdown')
+        if 'error' in outcome:
+            raise outcome['error']
+        return outcome.get('result')
+
+    # ------------------------------------------------------------------
+    # internals
+    # ------------------------------------------------------------------
+    def _notify(self, job, event):
+        if self.on_update is None:
+            return
+        try:
+            self.on_update(job, event)
+        except Exception as e:
+            print(f"[PLOT JOBS] Status callback error: {e}", flush=True)
+
+    def _post(self, func, *args):
+        """Schedule func on the main thread; ignored once Tk is gone."""
+        try:
+            self.root.after(0, func, *args)
+        except Exception as e:
+            print(f"[PLOT JOBS] Could not reach main thread: {e}", flush=True)
+
+    def _start_next(self):
+        """Start the oldest queued job. Main thread only."""
+        with self._lock:
+            if self._current is not None or not self._queue:
+                return
+            job = self._queue.popleft()
+            self._current = job
+
+        job.state = 'running'
+        job.started = datetime.now()
+        self._notify(job, 'started')
+
+        _local.job = job
+        try:
+            checkpoint()
+            work = job.prepare(job)
+        except JobCancelled:
+            self._finished(job, 'cancelled')
+            return
+        except Exception as e:
+            traceback.print_exc()
+            self._finished(job, 'failed', e)
+            return
+        finally:
+            _local.job = None
+
+        if work is None:
+            self._finished(job, 'done')
+            return
+
+        thread = create_monitored_thread(self.handler, self._run_worker, job, work)
+        thread.start()
+
+    def _run_worker(self, job, work):
+        state, error = 'done', None
+        _local.job = job
+        try:
+            work()
+        except JobCancelled:
+            state = 'cancelled'
+        except Exception as e:
+            state, error = 'failed', e
+            traceback.print_exc()
+        finally:
+            _local.job = None
+        self._post(self._finished, job, state, error)
+
+    def _finished(self, job, state, error=None):
+        """Record the outcome and start the next job. Main thread only."""
+        job.state = state
+        job.error = error
+        with self._lock:
+            if self._current is job:
+                self._current = None
+        self._notify(job, state)
+        self._start_next()
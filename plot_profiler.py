@@ -0,0 +1,266 @@
+"""
+plot_profiler.py - Opt-in stage timing for the plot and animation pipelines.
+
+plot_objects() and animate_objects() in palomas_orrery.py are long linear
+pipelines (osculating pre-fetch, position fetch, trajectories, shells,
+idealized orbits, buttons, HTML write). Until now the only record of where
+a slow plot spent its time was the console. This module gives them a small
+instrumentation surface:
+
+    - stage timers, opened with lap() at each pipeline boundary
+    - named counters (Horizons calls, osculating cache hits, ...) that
+      fetch helpers bump through the module-level count() without having
+      to be handed a profiler object
+    - traces added and serialized bytes per stage, measured against the
+      figure passed to lap()
+
+Profiling is OFF unless the GUI checkbox is ticked or the ORRERY_PROFILE
+environment variable is set (1/true/yes/on). When off, start() returns None
+and every module-level helper is a no-op, so instrumented call sites cost
+a global lookup and nothing else.
+
+The report is written beside data/last_plot_report.json as
+data/last_plot_profile.json; summary() gives a one-line digest for the
+status display.
+
+Key functions:
+    start() - begin a profile for one plot/animation build
+    lap() - close the current stage and open the next
+    count() - bump a counter on the active profile (no-op when inactive)
+    finish() - close the last stage, write the JSON report, clear active
+
+Consumed by: palomas_orrery.py, palomas_orrery_helpers.py,
+             orbit_data_manager.py, osculating_cache_manager.py
+
+Role: utility
+Domain: orrery
+
+Module updated: October 2026
+"""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+ENV_FLAG = 'ORRERY_PROFILE'
+
+PROFILE_REPORT_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'data', 'last_plot_profile.json')
+
+# Counter names used across the instrumented modules. Kept here so the
+# report and the status summary agree on spelling.
+HORIZONS_CALLS = 'horizons_calls'
+OSCULATING_CACHE_HITS = 'osculating_cache_hits'
+OSCULATING_FETCHES = 'osculating_fetches'
+
+# The profile for the build currently running. One build runs at a time
+# (the GUI worker), so a single slot is enough; the lock only guards the
+# counters, which can be bumped from the Tk thread during pre-fetch.
+_active = None
+_lock = threading.Lock()
+
+
+def env_enabled():
+    """True when ORRERY_PROFILE requests profiling for every build."""
+    return os.environ.get(ENV_FLAG, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def _trace_bytes(trace):
+    """Serialized size of one trace, as plotly would write it into HTML."""
+    try:
+        from plotly.utils import PlotlyJSONEncoder
+        return len(json.dumps(trace.to_plotly_json(), cls=PlotlyJSONEncoder))
+    except Exception:
+        return 0
+
+
+class PlotProfiler:
+    """Stage timer and counter set for one plot or animation build."""
+
+    def __init__(self, label, metadata=None):
+        self.label = label
+        self.metadata = dict(metadata or {})
+        self.started = datetime.now()
+        self._t0 = time.perf_counter()
+        self.stages = []
+        self.totals = {}
+        self._current = None
+        self._fig_id = None
+        self._trace_mark = 0
+
+    # ------------------------------------------------------------------
+    # stages
+    # ------------------------------------------------------------------
+    def lap(self, stage, fig=None):
+        """Close the open stage (if any) and open `stage`.
+
+        Passing the figure lets the closing stage record how many traces
+        it added and how many bytes they serialize to. A new Figure object
+        (plot_objects builds its real figure part way through) resets the
+        trace baseline rather than reporting a negative count.
+        """
+        now = time.perf_counter()
+        self._close_current(now, fig)
+        self._current = {
+            'name': stage,
+            'start': now - self._t0,
+            'seconds': 0.0,
+            'traces_added': 0,
+            'bytes_added': 0,
+            'counters': {},
+        }
+        if fig is not None:
+            self._mark_figure(fig)
+
+    def _mark_figure(self, fig):
+        if id(fig) != self._fig_id:
+            self._fig_id = id(fig)
+            self._trace_mark = len(fig.data)
+
+    def _close_current(self, now, fig):
+        stage = self._current
+        if stage is None:
+            return
+        stage['seconds'] = round(now - self._t0 - stage['start'], 4)
+        stage['start'] = round(stage['start'], 4)
+        if fig is not None:
+            if id(fig) != self._fig_id:
+                # Figure was created inside this stage: everything on it is new.
+                self._fig_id = id(fig)
+                self._trace_mark = 0
+            n_traces = len(fig.data)
+            if n_traces > self._trace_mark:
+                new = fig.data[self._trace_mark:]
+                stage['traces_added'] = len(new)
+                stage['bytes_added'] = sum(_trace_bytes(t) for t in new)
+            self._trace_mark = n_traces
+        self.stages.append(stage)
+        self._current = None
+
+    # ------------------------------------------------------------------
+    # counters
+    # ------------------------------------------------------------------
+    def count(self, counter, n=1):
+        """Add n to `counter` on the open stage and on the run totals."""
+        with _lock:
+            self.totals[counter] = self.totals.get(counter, 0) + n
+            if self._current is not None:
+                counters = self._current['counters']
+                counters[counter] = counters.get(counter, 0) + n
+
+    # ------------------------------------------------------------------
+    # report
+    # ------------------------------------------------------------------
+    def report(self, fig=None):
+        """Close the open stage and return the report dict."""
+        self._close_current(time.perf_counter(), fig)
+        total_seconds = round(time.perf_counter() - self._t0, 4)
+
+        figure = {}
+        if fig is not None:
+            figure['traces'] = len(fig.data)
+            figure['trace_bytes'] = sum(s['bytes_added'] for s in self.stages)
+            frames = getattr(fig, 'frames', None) or ()
+            figure['frames'] = len(frames)
+            if frames:
+                try:
+                    from plotly.utils import PlotlyJSONEncoder
+                    figure['frame_bytes'] = sum(
+                        len(json.dumps(fr.to_plotly_json(), cls=PlotlyJSONEncoder))
+                        for fr in frames)
+                except Exception:
+                    figure['frame_bytes'] = None
+
+        return {
+            'metadata': {
+                'label': self.label,
+                'generation_time': self.started.isoformat(),
+                'generated_by': 'plot_profiler',
+                'total_seconds': total_seconds,
+                **self.metadata,
+            },
+            'stages': self.stages,
+            'totals': dict(self.totals),
+            'figure': figure,
+        }
+
+    def summary(self, report=None, top=3):
+        """One-line digest: total time, slowest stages, Horizons calls."""
+        report = report or self.report()
+        total = report['metadata']['total_seconds']
+        slowest = sorted(report['stages'], key=lambda s: s['seconds'], reverse=True)[:top]
+        parts = [f"{s['name']} {s['seconds']:.1f}s" for s in slowest]
+        calls = report['totals'].get(HORIZONS_CALLS, 0)
+        hits = report['totals'].get(OSCULATING_CACHE_HITS, 0)
+        return (f"Profile {total:.1f}s: " + ", ".join(parts) +
+                f" | Horizons {calls}, cache hits {hits}")
+
+
+def save_report(report, path=PROFILE_REPORT_FILE):
+    """Write the report JSON; returns the path, or None on failure."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2, default=str)
+        print(f"[PROFILE] Report saved to {path}", flush=True)
+        return path
+    except Exception as e:
+        print(f"[PROFILE] Error saving report: {e}", flush=True)
+        return None
+
+
+# ----------------------------------------------------------------------
+# Module-level surface used by the pipelines and fetch helpers
+# ----------------------------------------------------------------------
+
+def start(label, enabled=False, metadata=None):
+    """Begin profiling a build. Returns the profiler, or None when off.
+
+    enabled is the GUI checkbox state; ORRERY_PROFILE turns profiling on
+    regardless of it.
+    """
+    global _active
+    if not (enabled or env_enabled()):
+        _active = None
+        return None
+    _active = PlotProfiler(label, metadata)
+    return _active
+
+
+def active():
+    """The profiler for the running build, or None."""
+    return _active
+
+
+def lap(stage, fig=None):
+    """Open the next stage on the active profile (no-op when inactive)."""
+    prof = _active
+    if prof is not None:
+        prof.lap(stage, fig)
+
+
+def count(counter, n=1):
+    """Bump a counter on the active profile (no-op when inactive)."""
+    prof = _active
+    if prof is not None:
+        prof.count(counter, n)
+
+
+def finish(fig=None, path=PROFILE_REPORT_FILE):
+    """Close the active profile, write its report, and clear it.
+
+    Returns (report, summary_line), or (None, None) when nothing was
+    being profiled.
+    """
+    global _active
+    prof = _active
+    if prof is None:
+        return None, None
+    _active = None
+    report = prof.report(fig)
+    save_report(report, path)
+    line = prof.summary(report)
+    print(f"[PROFILE] {line}", flush=True)
+    return report, line
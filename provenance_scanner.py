@@ -300,17 +300,26 @@ MODULE_DOMAIN_MAP entries added for orrery_rendering and shell_configs,
 and two entries removed for smoke_* files no longer in the repo.
 Report-only grouping -- no scanning or scoring behaviour changed).
 
+Module updated: October 2026 (every per-file read goes through ast_index:
+one parse per module per scan, and unit extraction, the import map, the
+shadow-constant walk and the coverage-gap count are reused from
+data/ast_index.pkl for files whose content has not changed. Findings are
+unchanged).
+
 Role: devtool
 Domain: dev_tools
 """
 
 import ast
+import copy
 import os
 import re
 import sys
 from collections import defaultdict
 from datetime import datetime
 
+import ast_index
+
 # Reuse the atlas dependency graph builder
 from module_atlas import build_dependency_graph, classify_role
 
@@ -524,6 +533,12 @@ MODULE_DOMAIN_MAP = {
     'orbital_elements': 'orrery',
     'osculating_cache_manager': 'orrery',
     'object_type_analyzer': 'orrery',
+    'plot_profiler': 'orrery',
+    'plot_jobs': 'orrery',
+    'render_lod': 'orrery',
+    'osculating_prefetch': 'orrery',
+    'orbit_sampling': 'orrery',
+    'orbit_transforms': 'orrery',
 
     # --- earth_science ---
     'earth_visualization_shells': 'earth_science',
@@ -541,6 +556,10 @@ MODULE_DOMAIN_MAP = {
     'fetch_paleoclimate_data': 'earth_science',
     'fetch_climate_data': 'earth_science',
     'climate_cache_manager': 'earth_science',
+    'climate_datasets': 'earth_science',
+    'climate_refresh': 'earth_science',
+    'era5_daily': 'earth_science',
+    'earth_system_grid': 'earth_science',
 
     # --- gallery (gallery-adjacent files that live in THIS repo only) ---
     'social_media_export': 'gallery',
@@ -566,6 +585,9 @@ MODULE_DOMAIN_MAP = {
     'visualization_2d': 'stars',
     'visualization_3d': 'stars',
     'visualization_core': 'stars',
+    'vot_sidecar': 'stars',
+    'star_properties_store': 'stars',
+    'vizier_bands': 'stars',
 
     # --- utilities: genuinely cross-domain shared helpers (new bucket) ---
     'plot_data_report_widget': 'utilities',
@@ -595,6 +617,32 @@ MODULE_DOMAIN_MAP = {
     'diagnose_bcodmo': 'dev_tools',
     'examine_hot_csv': 'dev_tools',
     'export_orbit_cache': 'dev_tools',
+    'test_plot_profiler': 'dev_tools',
+    'measure_html_writer': 'dev_tools',
+    'test_plot_jobs': 'dev_tools',
+    'test_camera_waypoints': 'dev_tools',
+    'test_render_lod': 'dev_tools',
+    'test_vot_sidecar': 'dev_tools',
+    'measure_vot_sidecar': 'dev_tools',
+    'test_star_properties_store': 'dev_tools',
+    'test_vizier_bands': 'dev_tools',
+    'test_star_sphere_tiles': 'dev_tools',
+    'test_climate_datasets': 'dev_tools',
+    'test_climate_refresh': 'dev_tools',
+    'test_era5_daily': 'dev_tools',
+    'test_earth_system_grid': 'dev_tools',
+    'benchmark_suite': 'dev_tools',
+    'test_benchmark_suite': 'dev_tools',
+    'test_osculating_store': 'dev_tools',
+    'test_osculating_prefetch': 'dev_tools',
+    'test_orbit_sampling': 'dev_tools',
+    'test_close_approach_bulk': 'dev_tools',
+    'test_export_binary_positions': 'dev_tools',
+    'test_maintenance_schedule': 'dev_tools',
+    'ast_index': 'dev_tools',
+    'test_worksheet_incremental': 'dev_tools',
+    'test_ast_index': 'dev_tools',
+    'test_orbit_transforms': 'dev_tools',
 }
 
 
@@ -1082,22 +1130,14 @@ def build_name_import_map(project_dir, local_modules):
         consumer = fname[:-3]
         filepath = os.path.join(project_dir, fname)
         try:
-            with open(filepath, 'rb') as f:
-                tree = ast.parse(f.read())
+            from_imports = ast_index.module_facts(filepath)['from_imports']
         except Exception:
             continue
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ImportFrom) and node.module:
-                mod_root = node.module.split('.')[0]
-                if mod_root not in local_modules:
-                    continue
-                for alias in node.names:
-                    name = alias.name
-                    if name == '*':
-                        imported_names[mod_root]['*'].add(consumer)
-                    else:
-                        imported_names[mod_root][name].add(consumer)
+        for module, name in from_imports:
+            mod_root = module.split('.')[0]
+            if mod_root in local_modules:
+                imported_names[mod_root][name].add(consumer)
 
     return imported_names
 
@@ -1699,17 +1739,11 @@ def extract_units_from_file(filepath, module_name, role):
     units = []
 
     try:
-        with open(filepath, 'rb') as f:
-            source_bytes = f.read()
-        tree = ast.parse(source_bytes)
-    except Exception:
-        return units
-
-    try:
-        with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-            lines = f.readlines()
+        src = ast_index.source(filepath)
+        tree = src.tree
     except Exception:
         return units
+    lines = src.lines
 
     fname = os.path.basename(filepath)
 
@@ -1805,6 +1839,34 @@ def extract_units_from_file(filepath, module_name, role):
     return units
 
 
+def indexed_units(filepath, module_name, role):
+    """extract_units_from_file() through the AST index.
+
+    Extraction reads nothing but the file and its role, so its result is
+    stored per content hash: the units as plain slot dicts, plus whatever
+    the file added to the four extraction collectors, which are replayed
+    here on every call exactly as a fresh extraction would append them.
+    Scoring mutates units, so the caller always gets new objects.
+    """
+    collectors = (SCOPE_DECLARED_BLOCKS, SHADOWED_STRINGS, DEEP_CITATIONS,
+                  ORPHAN_ANNOTATIONS)
+
+    def extract(src):
+        marks = [len(c) for c in collectors]
+        units = extract_units_from_file(filepath, module_name, role)
+        found = []
+        for c, mark in zip(collectors, marks):
+            found.append(c[mark:])
+            del c[mark:]
+        return ([{k: getattr(u, k) for k in ProvenanceUnit.__slots__}
+                 for u in units], found)
+
+    stored, found = ast_index.fact(filepath, 'units/' + role, extract)
+    for c, entries in zip(collectors, found):
+        c.extend(entries)
+    return [ProvenanceUnit(**copy.deepcopy(fields)) for fields in stored]
+
+
 def _make_dict_unit(assign_node, name, lines, module_name, fname, role,
                     spans=(), anchors=None):
     """Build a ProvenanceUnit for a top-level dict assignment."""
@@ -2091,17 +2153,19 @@ def build_cited_constant_names(project_dir):
     if not os.path.exists(path):
         return {}
     try:
-        with open(path, 'rb') as f:
-            content = f.read()
-        lines_c = content.decode('utf-8', errors='replace').splitlines(
-            keepends=True)
-        tree = ast.parse(content)
+        return dict(ast_index.fact(path, 'cited_constant_names',
+                                   _cited_constant_names))
     except Exception:
         return {}
 
+
+def _cited_constant_names(src):
+    lines_c = src.source.decode('utf-8', errors='replace').splitlines(
+        keepends=True)
+    nodes = src.nodes
     source_re = re.compile(r'#\s*[Ss]ource\s*:', re.IGNORECASE)
     named = {}
-    for node in ast.walk(tree):
+    for node in nodes:
         if not isinstance(node, ast.Assign) or len(node.targets) != 1:
             continue
         target = node.targets[0]
@@ -2135,47 +2199,61 @@ def scan_shadow_constants(project_dir, cited_names, pinned_values):
             continue
         path = os.path.join(project_dir, fname)
         try:
-            with open(path, 'rb') as f:
-                tree = ast.parse(f.read())
+            assignments = ast_index.fact(path, 'shadow_candidates',
+                                         _shadow_candidates)
         except Exception:
             continue
 
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.Assign) or len(node.targets) != 1:
-                continue
-            target = node.targets[0]
-            if not isinstance(target, ast.Name):
-                continue
-            name = target.id
-
-            num = _numeric_from_node(node.value)
+        for lineno, name, num, literals in assignments:
             if num is not None:
                 upstream = cited_names.get(name)
                 if upstream is not None and abs(num - upstream) < 1e-9:
                     SHADOW_CONSTANTS.append(
-                        (fname, node.lineno, name, 'direct', num))
+                        (fname, lineno, name, 'direct', num))
                 continue
 
-            if isinstance(node.value, ast.BinOp) and name.isupper():
-                literals = []
-                ok = True
-                for sub in ast.walk(node.value):
-                    val = None
-                    if isinstance(sub, ast.Constant) and isinstance(
-                            sub.value, (int, float)) and not isinstance(
-                            sub.value, bool):
-                        val = float(sub.value)
-                    if val is None:
-                        continue
-                    literals.append(val)
-                    if round(val, 3) not in pinned_values:
-                        ok = False
-                        break
-                if (ok and len(literals) >= 2
-                        and any(abs(v) >= SHADOW_DERIVED_MIN_MAGNITUDE
-                                for v in literals)):
-                    SHADOW_CONSTANTS.append(
-                        (fname, node.lineno, name, 'derived', None))
+            if (len(literals) >= 2
+                    and all(round(v, 3) in pinned_values for v in literals)
+                    and any(abs(v) >= SHADOW_DERIVED_MIN_MAGNITUDE
+                            for v in literals)):
+                SHADOW_CONSTANTS.append(
+                    (fname, lineno, name, 'derived', None))
+
+
+def _shadow_candidates(src):
+    """Every single-name assignment scan_shadow_constants() could flag.
+
+    (lineno, name, value, literals): value is the assigned number, or
+    None with the numeric literals of an UPPER_CASE arithmetic expression.
+    Nothing here depends on constants_new.py, so it is stored per file;
+    the match against cited names and pinned values is redone each scan.
+    """
+    found = []
+    try:
+        nodes = src.nodes
+    except Exception:
+        return found
+    for node in nodes:
+        if not isinstance(node, ast.Assign) or len(node.targets) != 1:
+            continue
+        target = node.targets[0]
+        if not isinstance(target, ast.Name):
+            continue
+        name = target.id
+
+        num = _numeric_from_node(node.value)
+        if num is not None:
+            found.append((node.lineno, name, num, ()))
+            continue
+
+        if isinstance(node.value, ast.BinOp) and name.isupper():
+            literals = tuple(
+                float(sub.value) for sub in ast.walk(node.value)
+                if isinstance(sub, ast.Constant)
+                and isinstance(sub.value, (int, float))
+                and not isinstance(sub.value, bool))
+            found.append((node.lineno, name, None, literals))
+    return found
 
 
 def build_pinned_values(project_dir):
@@ -2192,17 +2270,19 @@ def build_pinned_values(project_dir):
     if not os.path.exists(constants_path):
         return set()
     try:
-        with open(constants_path, 'rb') as f:
-            content = f.read()
-        lines_c = content.decode('utf-8', errors='replace').splitlines(keepends=True)
-        tree = ast.parse(content)
+        return set(ast_index.fact(constants_path, 'pinned_values',
+                                  _pinned_values))
     except Exception:
         return set()
 
+
+def _pinned_values(src):
+    lines_c = src.source.decode('utf-8', errors='replace').splitlines(keepends=True)
+    nodes = src.nodes
     pinned = set()
     SOURCE_RE = re.compile(r'#\s*[Ss]ource\s*:', re.IGNORECASE)
 
-    for node in ast.walk(tree):
+    for node in nodes:
         if not isinstance(node, ast.Assign):
             continue
         if len(node.targets) != 1:
@@ -2703,13 +2783,18 @@ def _scan_coverage_gap(filepath):
     build ProvenanceUnits -- this is a coverage signal, not an audit.
     """
     try:
-        with open(filepath, 'rb') as f:
-            tree = ast.parse(f.read())
+        return ast_index.fact(filepath, 'coverage_gap', _coverage_gap_count)
     except Exception:
         return 0
 
+
+def _coverage_gap_count(src):
     count = 0
-    for node in ast.walk(tree):
+    try:
+        nodes = src.nodes
+    except Exception:
+        return count
+    for node in nodes:
         if not isinstance(node, ast.Constant):
             continue
         if not isinstance(node.value, str):
@@ -2742,6 +2827,11 @@ def scan_project(project_dir, output_path='PROVENANCE_AUDIT.md'):
 
     suppressed_fingerprints, accepted_residuals = load_exceptions(project_dir)
 
+    # Every per-file read below goes through one index, so a module is
+    # parsed at most once here and not at all when it is unchanged since
+    # the last scan. Cross-file results are rebuilt from its facts.
+    index = ast_index.open_index(project_dir)
+
     deps, consumers, local_modules = build_dependency_graph(project_dir)
     imported_names = build_name_import_map(project_dir, local_modules)
 
@@ -2774,7 +2864,7 @@ def scan_project(project_dir, output_path='PROVENANCE_AUDIT.md'):
         # skips a name-to-path resolution that could pick the wrong tree.
         role = classify_role(module_name, filepath)
 
-        units = extract_units_from_file(filepath, module_name, role)
+        units = indexed_units(filepath, module_name, role)
         for u in units:
             score_unit(u, imported_names)
             hit, fp = is_suppressed(u, suppressed_fingerprints)
@@ -2830,6 +2920,7 @@ def scan_project(project_dir, output_path='PROVENANCE_AUDIT.md'):
                     cross_check_issues=list(CROSS_CHECK_ISSUES),
                     orphan_annotations=list(ORPHAN_ANNOTATIONS),
                     started=run_started)
+    index.save()
 
     return all_units, consistent_dups, inconsistencies
 
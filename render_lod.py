@@ -0,0 +1,185 @@
+"""
+render_lod.py - Level-of-detail presets for shell density and orbit paths.
+
+The shell builders in the *_visualization_shells.py modules and the shared
+geometry helpers hard-code their point densities (sphere grids, mesh
+resolution, magnetosphere and bow-shock grids, ring meshes, Fibonacci hover
+points), and plotted orbit paths carry every cached sample whatever the
+zoom. This module holds one process-wide level that those builders consult:
+
+    - preview: half the linear density, and orbit lines simplified with a
+      curvature-aware decimator (straight runs thinned, bends kept)
+    - standard: the historical densities, orbit paths untouched -- shells
+      and cached orbit paths are byte-identical to builds made before LOD
+      existed
+    - publication: 1.5x the linear density, orbit paths untouched
+
+Each level also sets the chord error allowed on idealized orbit curves
+(orbit_sampling), as a fraction of the axis half-range.
+
+The GUI sets the level at the start of each plot/animation build from the
+LOD selector (snapshotted with the other build inputs in plot_jobs); the
+ORRERY_LOD environment variable sets the startup level for scripts. A
+social-media export uses whatever level the figure was built at, so a
+Preview build gives the lean export from the same code path.
+
+Key functions:
+    set_level() / current() - choose or read the active preset
+    linear() - scale a 1-D resolution (grid side, mesh lines, ring points)
+    count() - scale a point count that covers a surface
+    decimate_path() - curvature-aware simplification of an orbit line
+
+Consumed by: planet_visualization_utilities.py, orrery_rendering.py,
+             *_visualization_shells.py, palomas_orrery.py, orbit_sampling.py
+
+Role: utility
+Domain: orrery
+
+Module created: October 2026
+Module updated: October 2026 (orbit_chord_fraction for adaptive orbit sampling)
+"""
+
+import os
+
+import numpy as np
+
+ENV_VAR = 'ORRERY_LOD'
+
+LEVELS = ('preview', 'standard', 'publication')
+
+# resolution: multiplier on linear densities (counts scale by its square).
+# orbit_tolerance_deg: accumulated turning angle that forces a kept vertex;
+#   None leaves orbit paths untouched.
+# orbit_max_gap: longest run of samples dropped in a row, so that slow
+#   sections (long straight runs near aphelion) still keep their timing.
+# orbit_chord_fraction: chord error allowed on idealized orbit curves, as a
+#   fraction of the axis half-range (orbit_sampling).
+PRESETS = {
+    'preview': {
+        'label': 'Preview',
+        'resolution': 0.5,
+        'orbit_tolerance_deg': 2.0,
+        'orbit_max_gap': 24,
+        'orbit_chord_fraction': 1 / 500,
+    },
+    'standard': {
+        'label': 'Standard',
+        'resolution': 1.0,
+        'orbit_tolerance_deg': None,
+        'orbit_max_gap': None,
+        'orbit_chord_fraction': 1 / 2000,
+    },
+    'publication': {
+        'label': 'Publication',
+        'resolution': 1.5,
+        'orbit_tolerance_deg': None,
+        'orbit_max_gap': None,
+        'orbit_chord_fraction': 1 / 5000,
+    },
+}
+
+DEFAULT_LEVEL = 'standard'
+
+
+def _startup_level():
+    level = os.environ.get(ENV_VAR, '').strip().lower()
+    return level if level in PRESETS else DEFAULT_LEVEL
+
+
+_level = _startup_level()
+
+
+def set_level(name):
+    """Make name ('preview' | 'standard' | 'publication') the active level."""
+    global _level
+    key = str(name).strip().lower()
+    if key not in PRESETS:
+        raise ValueError(f"Unknown LOD level {name!r}; expected one of {LEVELS}")
+    _level = key
+    return key
+
+
+def current():
+    """Name of the active level."""
+    return _level
+
+
+def preset(name=None):
+    """Preset dict for name (default: the active level)."""
+    return PRESETS[name or _level]
+
+
+def linear(n, minimum=4):
+    """Scale a 1-D resolution by the active level.
+
+    Standard returns n unchanged. Other levels never go below minimum
+    (or n itself, if n is already smaller).
+    """
+    scale = PRESETS[_level]['resolution']
+    if scale == 1.0:
+        return n
+    return max(min(n, minimum), int(round(n * scale)))
+
+
+def count(n, minimum=8):
+    """Scale a point count spread over a surface (linear scale squared)."""
+    scale = PRESETS[_level]['resolution']
+    if scale == 1.0:
+        return n
+    return max(min(n, minimum), int(round(n * scale * scale)))
+
+
+def decimate_indices(x, y, z, tolerance_deg, max_gap=None):
+    """Indices of the vertices kept by curvature-aware simplification.
+
+    Walks the accumulated turning angle along the path and keeps the first
+    vertex each time it crosses another multiple of tolerance_deg, so
+    vertices cluster where the path bends (perihelion, flybys) and thin out
+    along straight runs. The endpoints are always kept, and so is every
+    max_gap-th vertex when max_gap is given.
+    """
+    pts = np.column_stack((np.asarray(x, dtype=float),
+                           np.asarray(y, dtype=float),
+                           np.asarray(z, dtype=float)))
+    n = len(pts)
+    if n <= 2:
+        return np.arange(n)
+
+    seg = np.diff(pts, axis=0)
+    length = np.linalg.norm(seg, axis=1)
+    unit = np.divide(seg, length[:, None], out=np.zeros_like(seg),
+                     where=length[:, None] > 0)
+    cos_turn = np.clip(np.einsum('ij,ij->i', unit[:-1], unit[1:]), -1.0, 1.0)
+    turn = np.degrees(np.arccos(cos_turn))           # angle at vertices 1..n-2
+    turn[(length[:-1] == 0) | (length[1:] == 0)] = 0.0
+
+    bucket = np.floor(np.concatenate(([0.0], np.cumsum(turn))) / tolerance_deg)
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    keep[1:-1] = bucket[1:] != bucket[:-1]
+    if max_gap:
+        keep[::max_gap] = True
+    return np.flatnonzero(keep)
+
+
+def decimate_path(x, y, z, level=None):
+    """Simplify an orbit line for the active level.
+
+    Returns (x, y, z) of the kept vertices, as lists when the inputs were
+    lists and arrays otherwise. Levels without an orbit tolerance return
+    the inputs unchanged.
+    """
+    p = PRESETS[level or _level]
+    tolerance = p['orbit_tolerance_deg']
+    if tolerance is None or len(x) <= 2:
+        return x, y, z
+    idx = decimate_indices(x, y, z, tolerance, p['orbit_max_gap'])
+    if len(idx) == len(x):
+        return x, y, z
+
+    def take(values):
+        if isinstance(values, list):
+            return [values[i] for i in idx]
+        return np.asarray(values)[idx]
+
+    return take(x), take(y), take(z)
@@ -463,11 +463,7 @@ def _inject_encyclopedia(fig, html_str):
     Returns:
         str: HTML string with encyclopedia overlay injected (or unchanged)
     """
-    encyclopedia = _extract_encyclopedia(fig)
-    if not encyclopedia:
-        return html_str
-    
-    overlay_block = _build_encyclopedia_overlay(encyclopedia)
+    overlay_block = _encyclopedia_block(fig)
     if not overlay_block:
         return html_str
     
@@ -475,6 +471,14 @@ def _inject_encyclopedia(fig, html_str):
     return html_str.replace('</body>', overlay_block + '\n</body>')
 
 
+def _encyclopedia_block(fig):
+    """Return the encyclopedia overlay HTML for fig, or '' if nothing matches."""
+    encyclopedia = _extract_encyclopedia(fig)
+    if not encyclopedia:
+        return ''
+    return _build_encyclopedia_overlay(encyclopedia) or ''
+
+
 def _inject_camera_tracking(fig, html_str):
     """Inject a camera-tracking relayout script into a Plotly HTML string.
 
@@ -489,9 +493,17 @@ def _inject_camera_tracking(fig, html_str):
 
     (Phase 4 render-gate, June 2026 with Anthropic's Claude Fable 5.)
     """
+    block = _camera_tracking_block(fig)
+    if not block:
+        return html_str
+    return html_str.replace('</body>', block + '\n</body>')
+
+
+def _camera_tracking_block(fig):
+    """Return the camera-tracking <script> block for fig, or '' if untracked."""
     data = getattr(fig, '_track_relayout_data', None)
     if not data or not data.get('byName') or data.get('first') is None:
-        return html_str
+        return ''
 
     payload = json.dumps({
         'hw': data['hw'],
@@ -541,17 +553,174 @@ def _inject_camera_tracking(fig, html_str):
 <!-- ===== END CAMERA TRACKING ===== -->
 """.replace('__TRACK_JSON__', payload)
 
+    return block
+
+
+def _inject_camera_waypoints(fig, html_str):
+    """Inject the look-at / fly-to camera script into a Plotly HTML string.
+
+    visualization_utils' camera dropdowns keep one shared waypoint table
+    on fig._camera_waypoints and give each button only ('look' | 'fly',
+    index). No-op when the figure has no such table.
+    """
+    block = _camera_waypoints_block(fig)
+    if not block:
+        return html_str
     return html_str.replace('</body>', block + '\n</body>')
 
 
+def _camera_waypoints_block(fig):
+    """Return the camera-waypoint <script> block for fig, or '' if none.
+
+    The script listens for plotly_buttonclicked, builds the same relayout
+    the buttons used to carry (camera, axis ranges, grid dtick, axis
+    titles) from the shared table, and eases the camera or window there
+    over a few relayout steps before applying the exact final view.
+    """
+    data = getattr(fig, '_camera_waypoints', None)
+    if not data:
+        return ''
+
+    payload = json.dumps({
+        'center': data['center'],
+        'xyz': data['xyz'],
+        'flyR': data['flyR'],
+        'dtick': data['dtick'],
+        'lookRanges': data.get('lookRanges'),
+        'full': data.get('full'),
+        'steps': data.get('steps', 0),
+    }, separators=(',', ':'))
+
+    block = """
+<!-- ===== CAMERA WAYPOINTS ===== -->
+<script>
+(function() {
+  var W = __WAYPOINT_JSON__;
+  var UP = {x: 0, y: 0, z: 1};
+  var AU_KM = 149597870.7;
+  var token = 0;
+  function _pt(k) { return [W.xyz[3 * k], W.xyz[3 * k + 1], W.xyz[3 * k + 2]]; }
+  function _xyz(p) { return {x: p[0], y: p[1], z: p[2]}; }
+  function _lookAt(k) {
+    var c = W.center, eye, ctr;
+    if (k < 0) {
+      eye = {x: 0.001, y: 0, z: 0}; ctr = {x: 1, y: 0, z: 0};
+    } else {
+      var p = _pt(k), dx = p[0] - c[0], dy = p[1] - c[1], dz = p[2] - c[2];
+      var d = Math.sqrt(dx * dx + dy * dy + dz * dz);
+      eye = {x: c[0] + dx / d * 0.001, y: c[1] + dy / d * 0.001, z: c[2] + dz / d * 0.001};
+      ctr = _xyz(p);
+    }
+    var u = {'scene.camera': {eye: eye, center: ctr, up: UP}};
+    if (W.lookRanges) {
+      u['scene.xaxis.range'] = W.lookRanges[0];
+      u['scene.yaxis.range'] = W.lookRanges[1];
+      u['scene.zaxis.range'] = W.lookRanges[2];
+    }
+    return u;
+  }
+  function _suffix(d) {
+    var km = d * AU_KM;
+    if (d < 0.01) return ' (grid: ' + Math.round(km).toLocaleString('en-US') + ' km)';
+    if (d < 0.1) return ' (grid: ' + (km / 1e6).toFixed(1) + 'M km)';
+    return '';
+  }
+  function _flyTo(k) {
+    var ranges, d, sfx;
+    if (k < 0) {
+      if (!W.full) return null;
+      ranges = W.full.ranges; d = W.full.dtick; sfx = '';
+    } else {
+      var p = _pt(k), r = W.flyR[k];
+      if (r === null) return null;
+      ranges = [[p[0] - r, p[0] + r], [p[1] - r, p[1] + r], [p[2] - r, p[2] + r]];
+      d = W.dtick[k]; sfx = _suffix(d);
+    }
+    var u = {'scene.camera': {eye: {x: 1.5, y: 1.5, z: 1.2}, center: {x: 0, y: 0, z: 0}, up: UP}};
+    ['x', 'y', 'z'].forEach(function(a, i) {
+      u['scene.' + a + 'axis.range'] = ranges[i];
+      u['scene.' + a + 'axis.dtick'] = d;
+      u['scene.' + a + 'axis.title'] = a.toUpperCase() + ' (AU)' + sfx;
+    });
+    u['scene.aspectmode'] = 'cube';
+    u['scene.aspectratio'] = {x: 1, y: 1, z: 1};
+    return u;
+  }
+  function _mix(a, b, t) { return a + (b - a) * t; }
+  function _mixObj(a, b, t) { return {x: _mix(a.x, b.x, t), y: _mix(a.y, b.y, t), z: _mix(a.z, b.z, t)}; }
+  function _step(plotDiv, mode, u, t) {
+    var sc = plotDiv._fullLayout && plotDiv._fullLayout.scene;
+    if (!sc) return null;
+    if (mode === 'look') {
+      var cam = sc.camera, to = u['scene.camera'];
+      if (!cam || !cam.eye || !cam.center) return null;
+      return {'scene.camera': {eye: _mixObj(cam.eye, to.eye, t), center: _mixObj(cam.center, to.center, t), up: UP}};
+    }
+    var s = {};
+    ['x', 'y', 'z'].forEach(function(a) {
+      var from = sc[a + 'axis'] && sc[a + 'axis'].range, to = u['scene.' + a + 'axis.range'];
+      if (from && to) s['scene.' + a + 'axis.range'] = [_mix(+from[0], to[0], t), _mix(+from[1], to[1], t)];
+    });
+    return s;
+  }
+  function _go(plotDiv, mode, u) {
+    var my = ++token, n = W.steps || 0, i = 1;
+    function next() {
+      if (my !== token) return;
+      if (i >= n) { Plotly.relayout(plotDiv, u); return; }
+      var t = i / n; t = t * t * (3 - 2 * t);  // smoothstep ease
+      var s = _step(plotDiv, mode, u, t);
+      i += 1;
+      if (!s) { i = n; next(); return; }
+      Plotly.relayout(plotDiv, s).then(next, next);
+    }
+    next();
+  }
+  function _wire() {
+    var plotDiv = document.querySelector('.plotly-graph-div');
+    if (plotDiv && typeof plotDiv.on === 'function' && typeof Plotly !== 'undefined') {
+      plotDiv.on('plotly_buttonclicked', function(e) {
+        var a = e && e.button && e.button.args;
+        if (!a || (a[0] !== 'look' && a[0] !== 'fly')) return;
+        var u = a[0] === 'look' ? _lookAt(a[1]) : _flyTo(a[1]);
+        if (u) _go(plotDiv, a[0], u);
+      });
+    } else {
+      setTimeout(_wire, 100);
+    }
+  }
+  _wire();
+})();
+</script>
+<!-- ===== END CAMERA WAYPOINTS ===== -->
+""".replace('__WAYPOINT_JSON__', payload)
+
+    return block
+
+
+# Stand-ins for the streamed parts of the document. plotly builds the page
+# skeleton (script tags, div, Plotly.newPlot call) around a one-trace,
+# one-frame placeholder figure; the writer then streams the real traces and
+# frames into the placeholders' positions, one object at a time.
+_DATA_SENTINEL = '__ORRERY_STREAMED_DATA__'
+_FRAMES_SENTINEL = '__ORRERY_STREAMED_FRAMES__'
+
+
 def _write_html(fig, file_path, offline=False, auto_play=False):
     """Write HTML file with appropriate settings and encyclopedia overlay.
     
-    Generates the HTML string via fig.to_html(), injects the Object
-    Encyclopedia overlay (if INFO entries match trace names), and writes
-    the result to file. The encyclopedia is always-on -- no toggle needed.
-    If no matching INFO entries exist, the output is identical to plain
-    fig.write_html().
+    Streams the document straight to the file handle: the figure JSON is
+    serialized one trace and one frame at a time, and the Object
+    Encyclopedia overlay and camera-tracking script are written ahead of
+    </body> rather than spliced into a finished string. A 100 MB animation
+    export therefore never exists as a whole Python string (the old path
+    held the to_html() string, two post-processed copies and the encoded
+    bytes at once). The output is byte-for-byte what the buffered writer
+    produces, apart from plotly's random div id. The encyclopedia is
+    always-on -- no toggle needed.
+    
+    Falls back to _write_html_buffered() if plotly's page skeleton ever
+    stops matching the placeholder layout this writer expects.
     
     Parameters:
         fig: Plotly figure object
@@ -559,6 +728,113 @@ def _write_html(fig, file_path, offline=False, auto_play=False):
         offline: If True, embed Plotly.js (~5MB + plot data). If False, use CDN (~10KB)
         auto_play: If True, start animations automatically
     """
+    pieces = _html_skeleton(fig, offline=offline, auto_play=auto_play)
+    if pieces is None:
+        print("Note: plotly HTML skeleton not recognized; using buffered writer")
+        _write_html_buffered(fig, file_path, offline=offline, auto_play=auto_play)
+        return
+
+    head, between, before_body_end, body_end = pieces
+    with open(file_path, 'w', encoding='utf-8', newline='') as f:
+        f.write(head)
+        _stream_json_list(f, (trace.to_plotly_json() for trace in fig.data))
+        if between is not None:
+            f.write(between)
+            _stream_json_list(f, (frame.to_plotly_json() for frame in fig.frames))
+        f.write(before_body_end)
+
+        # Same order and separators as the string-injection path:
+        # encyclopedia, camera waypoints, camera tracking, each followed
+        # by '\n'.
+        for block in (_encyclopedia_block(fig), _camera_waypoints_block(fig),
+                      _camera_tracking_block(fig)):
+            if block:
+                f.write(block + '\n')
+        f.write(body_end)
+
+
+def _stream_json_list(f, items):
+    """Write a JSON array to f one element at a time.
+    
+    Each element gets the same treatment fig.to_dict() gives the whole
+    figure (plotly 6 base64-packs numpy arrays), so the streamed JSON
+    matches what fig.to_html() would have embedded.
+    """
+    from plotly.io.json import to_json_plotly
+
+    f.write('[')
+    for i, item in enumerate(items):
+        if i:
+            f.write(',')
+        _convert_to_base64(item)
+        f.write(to_json_plotly(item))
+    f.write(']')
+
+
+def _convert_to_base64(obj):
+    """plotly>=6 packs numpy arrays as base64 in to_dict(); older plotly does not."""
+    try:
+        from _plotly_utils.utils import convert_to_base64
+    except ImportError:
+        return
+    convert_to_base64(obj)
+
+
+def _html_skeleton(fig, offline=False, auto_play=False):
+    """Build the page around placeholders and split it where data goes.
+    
+    Returns (head, between, before_body_end, body_end): head ends where the
+    trace array belongs, between (None for a figure without frames) runs
+    from the trace array to the frames array, and the last two pieces
+    straddle the final </body> so overlays can be written in front of it.
+    Returns None if a placeholder does not appear exactly once.
+    """
+    import plotly.io as pio
+    from plotly.io.json import to_json_plotly
+
+    has_frames = bool(fig.frames)
+    layout = fig.layout.to_plotly_json()
+    _convert_to_base64(layout)
+    placeholder = {
+        'data': [{'type': 'scatter', 'name': _DATA_SENTINEL}],
+        'layout': layout,
+    }
+    if has_frames:
+        placeholder['frames'] = [{'name': _FRAMES_SENTINEL}]
+
+    skeleton = pio.to_html(
+        placeholder,
+        include_plotlyjs=True if offline else 'cdn',
+        auto_play=auto_play,
+        full_html=True,
+        config={'displayModeBar': True},
+        validate=False,
+    )
+
+    data_json = to_json_plotly(placeholder['data'])
+    if skeleton.count(data_json) != 1:
+        return None
+    head, rest = skeleton.split(data_json)
+
+    between = None
+    if has_frames:
+        frames_json = to_json_plotly(placeholder['frames'])
+        if rest.count(frames_json) != 1:
+            return None
+        between, rest = rest.split(frames_json)
+
+    cut = rest.rfind('</body>')
+    if cut < 0:
+        return None
+    return head, between, rest[:cut], rest[cut:]
+
+
+def _write_html_buffered(fig, file_path, offline=False, auto_play=False):
+    """Write HTML via fig.to_html() and string injection (pre-streaming path).
+    
+    Kept as the fallback for _write_html() and as the baseline that
+    measure_html_writer.py compares the streaming writer against.
+    """
     include_plotlyjs = True if offline else 'cdn'
     
     # Generate HTML string instead of writing directly
@@ -572,6 +848,9 @@ def _write_html(fig, file_path, offline=False, auto_play=False):
     # Inject encyclopedia overlay if INFO entries match trace names
     html_str = _inject_encyclopedia(fig, html_str)
 
+    # Inject the look-at / fly-to script if the camera dropdowns are present
+    html_str = _inject_camera_waypoints(fig, html_str)
+
     # Inject camera-tracking relayout script if tracking data is present
     html_str = _inject_camera_tracking(fig, html_str)
     
@@ -24,7 +24,8 @@ Each snapshot uses a shared parameterized fetch function. The date drives:
 
 DATA SOURCES:
   - Primary: ERA5 reanalysis via CDS API (available ~5 days behind real time)
-  - Cache: Local CSV files (auto-generated on first successful ERA5 fetch)
+  - Cache: Compact per-day .npz products in data/era5_daily/ (era5_daily.py),
+           built once from the raw NetCDF; legacy CSV caches still read
   - Fallback: Realistic synthetic grid seeded with confirmed station records
   - Station records: NWS SCAC, NOAA, WWA rapid attribution (March 20, 2026)
 
@@ -45,6 +46,9 @@ USAGE:
 
 Role: scenario
 Domain: earth_science
+
+Module updated: October 2026 (ERA5 read lazily into per-day products via
+era5_daily; CSV cache kept as a read-only fallback)
 """
 
 import os
@@ -514,22 +518,60 @@ def _load_era5_csv_cache(scenario, cache_path, status_callback=None):
     return False
 
 
-def _save_era5_csv_cache(lats, lons, anomalies_f, cache_path):
-    """Save ERA5 anomaly data as CSV for future runs."""
-    os.makedirs(os.path.dirname(cache_path) or '.', exist_ok=True)
-    with open(cache_path, 'w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow(['lat', 'lon', 'anomaly_f'])
-        for lat, lon, val in zip(lats, lons, anomalies_f):
-            writer.writerow([f'{lat:.4f}', f'{lon:.4f}', f'{val:.2f}'])
-    print(f"  ERA5 anomaly cache saved: {cache_path} ({len(lats)} points)")
+def _era5_raw_paths(data_dir, date_str):
+    """(event NetCDF, March climatology NetCDF) downloaded for a date."""
+    day_of_month = int(date_str.split('-')[2])
+    return (os.path.join(data_dir, f"era5_raw_{date_str}.nc"),
+            os.path.join(data_dir, f"era5_clim_march_day{day_of_month:02d}.nc"))
+
+
+def _load_era5_daily_product(scenario, data_dir, status_callback=None):
+    """
+    Fill the scenario from the compact per-day ERA5 product (era5_daily).
+
+    The product is built once from the raw NetCDF files -- only the
+    snapshot's box is read, the climatology a year at a time -- and
+    reused on every later run. Returns True if successful; False (so the
+    later tiers run) when no product can be built, including from a raw
+    file that is corrupt, lacks t2m or does not cover the box.
+    """
+    import era5_daily
+
+    date_str = scenario['date']
+    config = SNAPSHOT_CONFIGS.get(date_str)
+    if not config:
+        return False
+    event_nc, clim_nc = _era5_raw_paths(data_dir, date_str)
+    try:
+        fields = era5_daily.daily_product(date_str, event_nc, clim_nc,
+                                          config['grid_lat_range'], config['grid_lon_range'],
+                                          data_dir)
+    except (OSError, ValueError, KeyError) as e:
+        # Truncated download, box outside the file's grid, or no t2m:
+        # leave it to the CSV cache, a fresh CDS fetch or the synthetic field
+        print(f"  Warning: ERA5 product for {date_str} not built from the raw "
+              f"NetCDF ({type(e).__name__}: {e})")
+        return False
+    if fields is None:
+        return False
+
+    lats, lons, values = era5_daily.point_cloud(fields)
+    scenario['lats'] = lats
+    scenario['lons'] = lons
+    scenario['values'] = values
+    if status_callback:
+        status_callback(
+            f"ERA5 loaded: {len(lats)} points, "
+            f"anomaly range {min(values):.1f}-{max(values):.1f}F"
+        )
+    return True
 
 
 def _fetch_era5_from_cds(scenario, data_dir, status_callback=None):
     """
     Fetch ERA5 daily max 2m temperature from Copernicus CDS API,
     compute anomaly against 1991-2020 March climatology, and cache
-    the result as a CSV.
+    the result as a per-day era5_daily product.
 
     Requirements:
       - pip install cdsapi netCDF4
@@ -537,7 +579,8 @@ def _fetch_era5_from_cds(scenario, data_dir, status_callback=None):
         (register free at https://cds.climate.copernicus.eu/)
 
     The climatology is cached separately and reused across dates.
-    Each event date is fetched once and cached as CSV.
+    Each event date is fetched once; its anomaly (and wet-bulb, from the
+    dewpoint) is reduced to a compact .npz under data/era5_daily/.
 
     Returns True if successful, False to fall back to synthetic.
     """
@@ -576,7 +619,7 @@ def _fetch_era5_from_cds(scenario, data_dir, status_callback=None):
         return False
 
     # --- Step 1: Fetch the event day (daily max 2m temp) ---
-    event_nc = os.path.join(data_dir, f"era5_raw_{date_str}.nc")
+    event_nc, clim_nc = _era5_raw_paths(data_dir, date_str)
     if not os.path.exists(event_nc):
         if status_callback:
             status_callback(f"Downloading ERA5 daily max for {date_str}...")
@@ -586,7 +629,7 @@ def _fetch_era5_from_cds(scenario, data_dir, status_callback=None):
                 'reanalysis-era5-single-levels',
                 {
                     'product_type': ['reanalysis'],
-                    'variable': ['2m_temperature'],
+                    'variable': ['2m_temperature', '2m_dewpoint_temperature'],
                     'year': [year],
                     'month': [month],
                     'day': [day],
@@ -605,7 +648,6 @@ def _fetch_era5_from_cds(scenario, data_dir, status_callback=None):
 
     # --- Step 2: Fetch or load March climatology (1991-2020) ---
     # One climatology file per day-of-month, reusable across years
-    clim_nc = os.path.join(data_dir, f"era5_clim_march_day{day_of_month:02d}.nc")
     clim_years = [str(y) for y in range(1991, 2021)]
 
     if not os.path.exists(clim_nc):
@@ -618,7 +660,7 @@ def _fetch_era5_from_cds(scenario, data_dir, status_callback=None):
                 'reanalysis-era5-single-levels',
                 {
                     'product_type': ['reanalysis'],
-                    'variable': ['2m_temperature'],
+                    'variable': ['2m_temperature', '2m_dewpoint_temperature'],
                     'year': clim_years,
                     'month': ['03'],
                     'day': [f'{day_of_month:02d}'],
@@ -639,62 +681,9 @@ def _fetch_era5_from_cds(scenario, data_dir, status_callback=None):
         status_callback(f"Computing anomaly for {date_str}...")
 
     try:
-        # Read event day: compute daily max from hourly data
-        ds_event = netCDF4.Dataset(event_nc, 'r')
-        t2m_event = ds_event.variables['t2m'][:]  # shape: (hours, lat, lon)
-        lats_nc = ds_event.variables['latitude'][:]
-        lons_nc = ds_event.variables['longitude'][:]
-        ds_event.close()
-
-        # Daily max across all hours (axis=0)
-        tmax_event_k = np.max(t2m_event, axis=0)  # shape: (lat, lon), Kelvin
-
-        # Read climatology: compute daily max for each year, then average
-        ds_clim = netCDF4.Dataset(clim_nc, 'r')
-        t2m_clim = ds_clim.variables['t2m'][:]  # shape: (years*24, lat, lon)
-        ds_clim.close()
-
-        n_years = len(clim_years)
-        n_hours = 24
-        # Reshape to (years, hours, lat, lon) and take max per year
-        t2m_clim_reshaped = t2m_clim.reshape(n_years, n_hours,
-                                              t2m_clim.shape[1],
-                                              t2m_clim.shape[2])
-        tmax_clim_per_year = np.max(t2m_clim_reshaped, axis=1)  # (years, lat, lon)
-        tmax_clim_mean_k = np.mean(tmax_clim_per_year, axis=0)  # (lat, lon)
-
-        # Anomaly in Fahrenheit: (Kelvin difference) * 9/5
-        anomaly_k = tmax_event_k - tmax_clim_mean_k
-        anomaly_f = anomaly_k * 9.0 / 5.0
-
-        # Clip negative anomalies to 0 (we only care about heat)
-        anomaly_f = np.clip(anomaly_f, 0, None)
-
-        # Flatten to point cloud (engine contract)
-        flat_lats = []
-        flat_lons = []
-        flat_vals = []
-        for i in range(len(lats_nc)):
-            for j in range(len(lons_nc)):
-                flat_lats.append(float(lats_nc[i]))
-                flat_lons.append(float(lons_nc[j]))
-                flat_vals.append(float(anomaly_f[i, j]))
-
-        # Populate scenario
-        scenario['lats'] = flat_lats
-        scenario['lons'] = flat_lons
-        scenario['values'] = flat_vals
-
-        # Cache as CSV for future runs (instant load next time)
-        cache_path = os.path.join(data_dir, f"era5_western_{date_str}.csv")
-        _save_era5_csv_cache(flat_lats, flat_lons, flat_vals, cache_path)
-
-        if status_callback:
-            status_callback(
-                f"ERA5 loaded: {len(flat_lats)} points, "
-                f"anomaly range {min(flat_vals):.1f}-{max(flat_vals):.1f}F"
-            )
-
+        if not _load_era5_daily_product(scenario, data_dir, status_callback):
+            print(f"  ERA5 anomaly computation produced no data for {date_str}")
+            return False
         return True
 
     except Exception as e:
@@ -708,14 +697,15 @@ def _try_era5_fetch(scenario, data_dir, status_callback=None):
     """
     Attempt ERA5 reanalysis fetch for the scenario date.
 
-    Three-tier strategy:
-      1. Local CSV cache (instant -- from previous successful fetch)
-      2. CDS API fetch (requires cdsapi + netCDF4 + ~/.cdsapirc)
-      3. Return False -> caller falls back to synthetic grid
+    Four-tier strategy:
+      1. Per-day ERA5 product (instant -- built once from the raw NetCDF)
+      2. Legacy CSV cache (from runs before the per-day products)
+      3. CDS API fetch (requires cdsapi + netCDF4 + ~/.cdsapirc)
+      4. Return False -> caller falls back to synthetic grid
 
     ERA5T (near-real-time) data is available ~5 days behind real time.
-    First fetch for a date downloads from CDS and caches as CSV.
-    Subsequent runs load from CSV cache instantly.
+    First fetch for a date downloads from CDS and builds the product.
+    Subsequent runs load the product instantly.
 
     CDS account (free): https://cds.climate.copernicus.eu/
     API setup: https://cds.climate.copernicus.eu/how-to-api
@@ -723,15 +713,19 @@ def _try_era5_fetch(scenario, data_dir, status_callback=None):
     date_str = scenario['date']
     cache_path = os.path.join(data_dir, f"era5_western_{date_str}.csv")
 
-    # Tier 1: Local CSV cache (instant)
+    # Tier 1: Per-day product (from cached NetCDF if it has to be built)
+    if _load_era5_daily_product(scenario, data_dir, status_callback):
+        return True
+
+    # Tier 2: Legacy CSV cache
     if _load_era5_csv_cache(scenario, cache_path, status_callback):
         return True
 
-    # Tier 2: CDS API fetch (downloads, computes anomaly, caches CSV)
+    # Tier 3: CDS API fetch (downloads, computes anomaly, builds product)
     if _fetch_era5_from_cds(scenario, data_dir, status_callback):
         return True
 
-    # Tier 3: Caller falls back to synthetic
+    # Tier 4: Caller falls back to synthetic
     return False
 
 
@@ -5,6 +5,9 @@ This module replaces simbad_test.py and provides robust SIMBAD querying capabili
 
 Role: computation
 Domain: stars
+
+Module updated: October 2026 (properties saved through star_properties_store;
+    column-wise catalog rebuild)
 """
 
 import os
@@ -19,6 +22,7 @@ import pandas as pd
 import shutil
 import re
 from vot_cache_manager import VOTCacheManager, integrate_vot_protection_with_simbad_manager, verify_vot_cache_integrity
+from star_properties_store import open_store, save_properties, store_dir_for
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -221,6 +225,15 @@ class SimbadQueryManager:
                     logger.info(f"Protected PKL: {backup_name}")
                 except Exception as e:
                     logger.error(f"Failed to protect {pkl_file}: {e}")
+            store_dir = store_dir_for(pkl_file)
+            if os.path.isdir(store_dir):
+                backup_name = store_dir + '.protected_' + time.strftime('%Y%m%d_%H%M%S')
+                try:
+                    shutil.copytree(store_dir, backup_name)
+                    protected_files.append(backup_name)
+                    logger.info(f"Protected properties store: {backup_name}")
+                except Exception as e:
+                    logger.error(f"Failed to protect {store_dir}: {e}")
         
         # Protect VOT files using VOT manager
         vot_count = 0
@@ -240,73 +253,15 @@ class SimbadQueryManager:
         
         Args:
             combined_df: DataFrame with calculated properties (Temperature, Luminosity, etc.)
-            properties_file: Path to the properties pickle file
+            properties_file: Path to the properties pickle file (store kept beside it)
             
         Returns:
             Updated properties dictionary
         """
         logger.info(f"Updating {properties_file} with calculated properties...")
         
-        # Load existing properties using the standard method
-        if os.path.exists(properties_file):
-            with open(properties_file, 'rb') as f:
-                data = pickle.load(f)
-            
-            # Convert to dictionary format if needed
-            if isinstance(data, dict) and 'unique_ids' in data:
-                # Old list format - convert to dictionary with safe list access
-                existing_properties = {}
-                
-                # Get all lists with safe defaults
-                unique_ids = data.get('unique_ids', [])
-                star_names = data.get('star_names', [])
-                spectral_types = data.get('spectral_types', [])
-                v_magnitudes = data.get('V_magnitudes', [])
-                b_magnitudes = data.get('B_magnitudes', [])
-                object_types = data.get('object_types', [])
-                is_messier_list = data.get('is_messier', [])
-                distance_ly_list = data.get('distance_ly', [])
-                distance_pc_list = data.get('distance_pc', [])
-                temperature_list = data.get('Temperature', [])
-                luminosity_list = data.get('Luminosity', [])
-                abs_mag_list = data.get('Abs_Mag', [])
-                ra_icrs_list = data.get('RA_ICRS', [])
-                de_icrs_list = data.get('DE_ICRS', [])
-                ra_str_list = data.get('ra_str', [])
-                dec_str_list = data.get('dec_str', [])
-                stellar_class_list = data.get('Stellar_Class', [])
-                object_type_desc_list = data.get('Object_Type_Desc', [])
-                source_catalog_list = data.get('Source_Catalog', [])
-                
-                # Process only valid entries
-                for i, uid in enumerate(unique_ids):
-                    if uid:
-                        existing_properties[uid] = {
-                            'star_name': star_names[i] if i < len(star_names) else None,
-                            'spectral_type': spectral_types[i] if i < len(spectral_types) else None,
-                            'V_magnitude': v_magnitudes[i] if i < len(v_magnitudes) else None,
-                            'B_magnitude': b_magnitudes[i] if i < len(b_magnitudes) else None,
-                            'object_type': object_types[i] if i < len(object_types) else None,
-                            'is_messier': is_messier_list[i] if i < len(is_messier_list) else False,
-                            'distance_ly': distance_ly_list[i] if i < len(distance_ly_list) else None,
-                            'distance_pc': distance_pc_list[i] if i < len(distance_pc_list) else None,
-                            'Temperature': temperature_list[i] if i < len(temperature_list) else None,
-                            'Luminosity': luminosity_list[i] if i < len(luminosity_list) else None,
-                            'Abs_Mag': abs_mag_list[i] if i < len(abs_mag_list) else None,
-                            'RA_ICRS': ra_icrs_list[i] if i < len(ra_icrs_list) else None,
-                            'DE_ICRS': de_icrs_list[i] if i < len(de_icrs_list) else None,
-                            'ra_str': ra_str_list[i] if i < len(ra_str_list) else None,
-                            'dec_str': dec_str_list[i] if i < len(dec_str_list) else None,
-                            'Stellar_Class': stellar_class_list[i] if i < len(stellar_class_list) else None,
-                            'Object_Type_Desc': object_type_desc_list[i] if i < len(object_type_desc_list) else None,
-                            'Source_Catalog': source_catalog_list[i] if i < len(source_catalog_list) else None,
-                        }
-            elif isinstance(data, dict):
-                existing_properties = data
-            else:
-                existing_properties = {}
-        else:
-            existing_properties = {}
+        # Load existing properties from the columnar store (imports the PKL once)
+        existing_properties = open_store(properties_file)
         
         # Track statistics
         original_count = len(existing_properties)
@@ -369,13 +324,14 @@ class SimbadQueryManager:
             for field, value in calculated_fields.items():
                 if value is not None and (pd.notna(value) if hasattr(pd, 'notna') else True):
                     props[field] = value
+            existing_properties[uid] = props
         
         # Log statistics
         self.stats.cached = updated_count  # Reuse cached field for updates
         logger.info(f"Updated {updated_count} existing stars, added {new_count} new stars")
         logger.info(f"Total stars: {len(existing_properties)} (was {original_count})")
         
-        # Save using the existing _save_properties method with safety checks
+        # Appends only the rows touched above
         self._save_properties_with_safety(existing_properties, properties_file)
         
         return existing_properties
@@ -384,131 +340,16 @@ class SimbadQueryManager:
     def _save_properties_with_safety(self, properties: Dict, filepath: str):
         """
         Enhanced save with safety checks similar to orbit_data_manager.
-        """
-        # Check if file exists and get its size
-        original_size = 0
-        original_count = 0
-        if os.path.exists(filepath):
-            original_size = os.path.getsize(filepath)
-            try:
-                with open(filepath, 'rb') as f:
-                    old_data = pickle.load(f)
-                if isinstance(old_data, dict) and 'unique_ids' in old_data:
-                    original_count = len(old_data.get('unique_ids', []))
-                elif isinstance(old_data, dict):
-                    original_count = len(old_data)
-            except:
-                pass
-        
-        new_count = len(properties)
-        
-        # Safety check: Don't allow massive data loss
-        if original_count > 100 and new_count < original_count * 0.1:
-            # Create emergency backup
-            emergency_backup = filepath + '.emergency_' + time.strftime('%Y%m%d_%H%M%S')
-            shutil.copy2(filepath, emergency_backup)
-            logger.error(f"SAFETY: Blocked save that would reduce {original_count} to {new_count} stars")
-            logger.info(f"Emergency backup created: {emergency_backup}")
-            raise ValueError(f"Refusing to save: would lose {original_count - new_count} stars")
-        
-        # Safety check: Suspicious size reduction
-        if original_size > 1024 * 1024 and new_count < 20:
-            emergency_backup = filepath + '.size_warning_' + time.strftime('%Y%m%d_%H%M%S')
-            shutil.copy2(filepath, emergency_backup)
-            logger.error(f"SAFETY: Large file ({original_size/1024/1024:.1f}MB) -> {new_count} entries")
-            raise ValueError("Refusing to save: suspicious size reduction")
-        
-        # Use atomic save operation
-        temp_file = filepath + '.tmp'
-        backup_file = filepath + '.backup'
         
+        Writes through star_properties_store: a store opened for filepath
+        appends its changed rows; a dict is written as an atomic snapshot
+        (previous snapshot kept as backup.npz), refused with an emergency
+        copy if it would lose more than 90% of the stars.
+        """
         try:
-            # Convert to list format for compatibility (existing format)
-            all_unique_ids = list(properties.keys())
-            property_lists = {
-                'unique_ids': all_unique_ids,
-                'star_names': [],
-                'spectral_types': [],
-                'V_magnitudes': [],
-                'B_magnitudes': [],
-                'object_types': [],
-                'is_messier': [],
-                'distance_ly': [],
-                'distance_pc': [],
-                'notes': [],
-                # Add calculated fields to the save format
-                'Temperature': [],
-                'Luminosity': [],
-                'Abs_Mag': [],
-                'RA_ICRS': [],
-                'DE_ICRS': [],
-                'ra_str': [],
-                'dec_str': [],
-                'Stellar_Class': [],
-                'Object_Type_Desc': [],
-                'Source_Catalog': [],
-            }
-            
-            for uid in all_unique_ids:
-                props = properties[uid]
-                property_lists['star_names'].append(props.get('star_name'))
-                property_lists['spectral_types'].append(props.get('spectral_type'))
-                property_lists['V_magnitudes'].append(props.get('V_magnitude'))
-                property_lists['B_magnitudes'].append(props.get('B_magnitude'))
-                property_lists['object_types'].append(props.get('object_type'))
-                property_lists['is_messier'].append(props.get('is_messier', False))
-                property_lists['distance_ly'].append(props.get('distance_ly'))
-                property_lists['distance_pc'].append(props.get('distance_pc'))
-                property_lists['notes'].append(props.get('notes', ''))
-                # Add calculated fields
-                property_lists['Temperature'].append(props.get('Temperature'))
-                property_lists['Luminosity'].append(props.get('Luminosity'))
-                property_lists['Abs_Mag'].append(props.get('Abs_Mag'))
-                property_lists['RA_ICRS'].append(props.get('RA_ICRS'))
-                property_lists['DE_ICRS'].append(props.get('DE_ICRS'))
-                property_lists['ra_str'].append(props.get('ra_str'))
-                property_lists['dec_str'].append(props.get('dec_str'))
-                property_lists['Stellar_Class'].append(props.get('Stellar_Class'))
-                property_lists['Object_Type_Desc'].append(props.get('Object_Type_Desc'))
-                property_lists['Source_Catalog'].append(props.get('Source_Catalog'))
-            
-            # Write to temp file
-            with open(temp_file, 'wb') as f:
-                pickle.dump(property_lists, f)
-            
-            # Verify temp file
-            with open(temp_file, 'rb') as f:
-                verify_data = pickle.load(f)
-                if len(verify_data.get('unique_ids', [])) != len(all_unique_ids):
-                    raise ValueError("Verification failed")
-            
-            # Backup original if it exists
-            if os.path.exists(filepath):
-                if os.path.exists(backup_file):
-                    os.remove(backup_file)
-                shutil.move(filepath, backup_file)
-            
-            # Move temp to final
-            shutil.move(temp_file, filepath)
-            
-            # Clean up backup if successful
-            if os.path.exists(backup_file):
-                os.remove(backup_file)
-            
-            logger.info(f"Saved {len(properties)} properties to {filepath}")
-            
+            save_properties(properties, filepath)
         except Exception as e:
             logger.error(f"Error saving properties: {e}")
-            # Restore from backup if available
-            if os.path.exists(backup_file):
-                shutil.copy2(backup_file, filepath)
-                logger.info("Restored from backup after save failure")
-            # Clean up temp file
-            if os.path.exists(temp_file):
-                try:
-                    os.remove(temp_file)
-                except:
-                    pass
             raise
 
     def rebuild_pkl_from_vot_caches(self, mode='distance', force_rebuild=False):
@@ -520,7 +361,7 @@ class SimbadQueryManager:
             force_rebuild: If True, rebuild even if PKL exists
             
         Returns:
-            Dictionary of star properties
+            Star properties (StarPropertyStore, dict-compatible)
         """
         if mode == 'distance':
             properties_file = 'star_data/star_properties_distance.pkl'
@@ -536,55 +377,28 @@ class SimbadQueryManager:
             }
         
         # Check if rebuild is needed
-        if not force_rebuild and os.path.exists(properties_file):
+        if not force_rebuild and (os.path.exists(properties_file) or
+                                  os.path.isdir(store_dir_for(properties_file))):
             logger.info(f"{properties_file} already exists. Use force_rebuild=True to rebuild.")
             return self.load_existing_properties(properties_file)
         
         logger.info(f"Rebuilding {properties_file} from VOT caches...")
         
-        # Step 1: Extract unique IDs from VOT files
-        all_unique_ids = set()
-        catalog_data = {}
+        # Step 1: Catalog-derived columns (IDs, distances, magnitudes) for all VOT rows
+        catalog = self.vot_manager.load_catalog_properties(vot_files)
         
-        for catalog, vot_file in vot_files.items():
-            if not os.path.exists(vot_file):
-                logger.warning(f"VOT file not found: {vot_file}")
-                continue
-            
-            table = self.vot_manager.safe_load_vot(vot_file)
-            if table is None:
-                continue
-            
-            logger.info(f"Processing {len(table)} entries from {catalog}")
-            catalog_data[catalog] = table
-            
-            # Extract identifiers
-            if 'hipparcos' in catalog.lower():
-                for row in table:
-                    if 'HIP' in row.colnames:
-                        all_unique_ids.add(f"HIP {row['HIP']}")
-            elif 'gaia' in catalog.lower():
-                for row in table:
-                    if 'Source' in row.colnames:
-                        all_unique_ids.add(f"Gaia DR3 {row['Source']}")
-        
-        if not all_unique_ids:
+        if len(catalog) == 0:
             logger.error("No star IDs found in VOT files")
             return {}
         
-        logger.info(f"Found {len(all_unique_ids)} unique star IDs from VOT files")
+        logger.info(f"Found {len(catalog)} unique star IDs from VOT files")
         
-        # Step 2: Check existing PKL for any cached SIMBAD data
-        existing_properties = {}
-        if os.path.exists(properties_file):
-            try:
-                existing_properties = self.load_existing_properties(properties_file)
-                logger.info(f"Loaded {len(existing_properties)} existing properties")
-            except Exception as e:
-                logger.warning(f"Could not load existing properties: {e}")
+        # Step 2: Existing properties store (SIMBAD data already cached)
+        existing_properties = open_store(properties_file)
+        logger.info(f"Loaded {len(existing_properties)} existing properties")
         
-        # Step 3: Query SIMBAD for missing properties
-        missing_ids = list(all_unique_ids - set(existing_properties.keys()))
+        # Step 3: Query SIMBAD only for IDs the store has never seen
+        missing_ids = existing_properties.missing(catalog.ids)
         
         if missing_ids:
             logger.info(f"Querying SIMBAD for {len(missing_ids)} missing star properties...")
@@ -617,62 +431,26 @@ class SimbadQueryManager:
         
         # Step 4: Merge with catalog data for complete properties
         final_properties = self._merge_catalog_and_simbad_data(
-            existing_properties, catalog_data, mode
+            existing_properties, catalog, mode
         )
         
-        # Step 5: Save final properties
+        # Step 5: Save final properties (appends the changed rows)
         self._save_properties_with_safety(final_properties, properties_file)
         
         logger.info(f"Rebuild complete: {len(final_properties)} star properties saved")
         return final_properties
     
-    def _merge_catalog_and_simbad_data(self, simbad_props: Dict, catalog_data: Dict, mode: str) -> Dict:
+    def _merge_catalog_and_simbad_data(self, simbad_props, catalog, mode: str):
         """
         Merge SIMBAD properties with catalog data.
-        """
-        merged = simbad_props.copy()
-        
-        # Add catalog-specific data
-        for catalog, table in catalog_data.items():
-            if table is None:
-                continue
-            
-            if 'hipparcos' in catalog.lower():
-                for row in table:
-                    hip_id = f"HIP {row['HIP']}"
-                    if hip_id not in merged:
-                        merged[hip_id] = {'unique_id': hip_id}
-                    
-                    # Add/update catalog data
-                    merged[hip_id]['Source_Catalog'] = 'Hipparcos'
-                    
-                    if 'Plx' in row.colnames and row['Plx'] > 0:
-                        merged[hip_id]['distance_pc'] = 1000.0 / row['Plx']
-                        merged[hip_id]['distance_ly'] = (1000.0 / row['Plx']) * 3.26156
-                    
-                    if 'Vmag' in row.colnames:
-                        merged[hip_id]['V_magnitude'] = float(row['Vmag'])
-                    
-                    if 'B-V' in row.colnames and 'Vmag' in row.colnames:
-                        merged[hip_id]['B_magnitude'] = float(row['Vmag'] + row['B-V'])
-            
-            elif 'gaia' in catalog.lower():
-                for row in table:
-                    gaia_id = f"Gaia DR3 {row['Source']}"
-                    if gaia_id not in merged:
-                        merged[gaia_id] = {'unique_id': gaia_id}
-                    
-                    merged[gaia_id]['Source_Catalog'] = 'Gaia'
-                    
-                    if 'Plx' in row.colnames and row['Plx'] > 0:
-                        merged[gaia_id]['distance_pc'] = 1000.0 / row['Plx']
-                        merged[gaia_id]['distance_ly'] = (1000.0 / row['Plx']) * 3.26156
-                    
-                    if 'Gmag' in row.colnames:
-                        # Approximate V magnitude from Gaia G magnitude
-                        merged[gaia_id]['V_magnitude'] = float(row['Gmag']) - 0.2
         
-        return merged
+        catalog is the column set from VOTCacheManager.load_catalog_properties;
+        its distances, magnitudes and Source_Catalog overwrite the stored
+        values where the catalog has them.
+        """
+        changed = simbad_props.merge(catalog)
+        logger.info(f"Catalog data updated {changed} stars ({mode})")
+        return simbad_props
     
     def verify_cache_integrity(self) -> Dict:
         """
@@ -1053,34 +831,7 @@ class SimbadQueryManager:
     def _save_properties(self, properties: Dict, filepath: str):
         """Save properties to file."""
         try:
-            # Convert to list format for compatibility
-            all_unique_ids = list(properties.keys())
-            property_lists = {
-                'unique_ids': all_unique_ids,
-                'star_names': [],
-                'spectral_types': [],
-                'V_magnitudes': [],
-                'B_magnitudes': [],
-                'object_types': [],
-                'is_messier': [],
-                'distance_ly': [],
-                'notes': []
-            }
-            
-            for uid in all_unique_ids:
-                props = properties[uid]
-                property_lists['star_names'].append(props.get('star_name'))
-                property_lists['spectral_types'].append(props.get('spectral_type'))
-                property_lists['V_magnitudes'].append(props.get('V_magnitude'))
-                property_lists['B_magnitudes'].append(props.get('B_magnitude'))
-                property_lists['object_types'].append(props.get('object_type'))
-                property_lists['is_messier'].append(props.get('is_messier', False))
-                property_lists['distance_ly'].append(props.get('distance_ly'))
-                property_lists['notes'].append(props.get('notes', ''))
-            
-            with open(filepath, 'wb') as f:
-                pickle.dump(property_lists, f)
-        
+            save_properties(properties, filepath)
         except Exception as e:
             logger.error(f"Error saving properties to {filepath}: {e}")
 
@@ -1113,38 +864,9 @@ class SimbadQueryManager:
         return props
 
     def load_existing_properties(self, filepath: str) -> Dict:
-        """Load existing properties from pickle file."""
-        if not os.path.exists(filepath):
-            return {}
-        
+        """Load existing properties as a {unique_id: props} dict."""
         try:
-            with open(filepath, 'rb') as f:
-                data = pickle.load(f)
-            
-            # Handle both dict and list formats
-            if isinstance(data, dict) and 'unique_ids' in data:
-                # Convert list format to dict
-                properties = {}
-                unique_ids = data.get('unique_ids', [])
-                star_names = data.get('star_names', [])
-                spectral_types = data.get('spectral_types', [])
-                v_mags = data.get('V_magnitudes', [])
-                b_mags = data.get('B_magnitudes', [])
-                obj_types = data.get('object_types', [])
-                
-                for i, uid in enumerate(unique_ids):
-                    properties[uid] = {
-                        'star_name': star_names[i] if i < len(star_names) else None,
-                        'spectral_type': spectral_types[i] if i < len(spectral_types) else None,
-                        'V_magnitude': v_mags[i] if i < len(v_mags) else None,
-                        'B_magnitude': b_mags[i] if i < len(b_mags) else None,
-                        'object_type': obj_types[i] if i < len(obj_types) else None,
-                    }
-                return properties
-            elif isinstance(data, dict):
-                return data
-            else:
-                return {}
+            return open_store(filepath).to_dict()
         except Exception as e:
             logger.error(f"Error loading properties from {filepath}: {e}")
             return {}
@@ -7,20 +7,22 @@ queries. Handles both old and new SIMBAD API column name formats.
 
 Key functions:
     query_simbad_for_star_properties() - Batch query with cache
-    load_existing_properties() - Load from local pickle cache
+    load_existing_properties() - Load the local properties store
+    missing_property_ids() - IDs not yet cached (one vectorized join)
+    assign_properties_to_data() - Join cached properties onto the star table
 
 Role: data
 Domain: stars
 
 Module updated: April 2026 with Anthropic's Claude Opus 4.6
+Module updated: October 2026 (properties cached in star_properties_store)
 """
-import os
-import pickle
 import time
 import re
 from astroquery.simbad import Simbad
 import numpy as np
 from simbad_manager import SimbadQueryManager, SimbadConfig
+from star_properties_store import StarPropertyStore, open_store, save_properties
 
 
 def get_column_value_safe(result_table, old_name, new_name):
@@ -69,59 +71,34 @@ def parse_magnitude(value):
 
 
 def load_existing_properties(properties_file):
-    """Load existing star and Messier object properties from a file."""
-    if os.path.exists(properties_file):
-        print("Loading properties from local file...")
-        try:
-            with open(properties_file, 'rb') as f:
-                data = pickle.load(f)
-            
-            # Verify required keys are present
-            required_keys = {
-                'unique_ids', 'star_names', 'spectral_types', 
-                'V_magnitudes', 'B_magnitudes', 'object_types'
-            }
-            
-            if not required_keys.issubset(data.keys()):
-                print("Error: Missing required keys in properties file.")
-                return {}
-                
-            # Create dictionary of properties
-            existing_properties = {}
-            for i in range(len(data['unique_ids'])):
-                uid = data['unique_ids'][i]
-                
-                # Build properties dictionary with core fields
-                props = {
-                    'star_name': data['star_names'][i],
-                    'spectral_type': data['spectral_types'][i],
-                    'V_magnitude': data['V_magnitudes'][i],
-                    'B_magnitude': data['B_magnitudes'][i],
-                    'object_type': data['object_types'][i],
-                }
-                
-                # Add Messier-specific fields if present
-                if 'is_messier' in data:
-                    props['is_messier'] = data['is_messier'][i]
-                    if data['is_messier'][i]:
-                        props['distance_ly'] = data.get('distance_ly', [None] * len(data['unique_ids']))[i]
-                        props['notes'] = data.get('notes', [''] * len(data['unique_ids']))[i]
-                
-                existing_properties[uid] = props
-            
-            # Report statistics
-            messier_count = sum(1 for props in existing_properties.values() if props.get('is_messier', False))
-            print(f"Loaded {len(existing_properties)} objects ({messier_count} Messier objects)")
-            
-            return existing_properties
-            
-        except Exception as e:
-            print(f"Error loading properties from file: {e}")
-            return {}
-    else:
-        print("No existing properties file found. Starting fresh.")
+    """Load existing star and Messier object properties.
+
+    Returns a StarPropertyStore (dict-compatible; the legacy PKL is
+    imported into star_properties_*.store/ on first use), or {} when
+    nothing is cached yet or the store cannot be read.
+    """
+    try:
+        store = open_store(properties_file)
+    except Exception as e:
+        print(f"Error loading properties from file: {e}")
         return {}
 
+    if len(store) == 0:
+        print("No existing properties file found. Starting fresh.")
+        return store
+
+    print("Loading properties from local file...")
+    messier_count = int(np.count_nonzero(store.columns['is_messier']))
+    print(f"Loaded {len(store)} objects ({messier_count} Messier objects)")
+    return store
+
+
+def missing_property_ids(unique_ids, existing_properties):
+    """unique_ids with no cached properties, in input order."""
+    if isinstance(existing_properties, StarPropertyStore):
+        return existing_properties.missing(unique_ids)
+    return [uid for uid in unique_ids if uid not in existing_properties]
+
 def generate_unique_ids(combined_data):
     """Generate unique identifiers for all stars consistently."""
     print("Generating unique identifiers...")
@@ -160,33 +137,12 @@ def generate_unique_ids(combined_data):
     return unique_ids
 
 def save_properties_to_file(properties, properties_file):
-    """Save star properties to file with Messier object support."""
-    all_unique_ids = list(properties.keys())
-    property_lists = {
-        'unique_ids': all_unique_ids,
-        'star_names': [],
-        'spectral_types': [],
-        'V_magnitudes': [],
-        'B_magnitudes': [],
-        'object_types': [],
-        'is_messier': [],
-        'distance_ly': [],
-        'notes': []
-    }
-    
-    for uid in all_unique_ids:
-        props = properties[uid]
-        property_lists['star_names'].append(props['star_name'])
-        property_lists['spectral_types'].append(props['spectral_type'])
-        property_lists['V_magnitudes'].append(props['V_magnitude'])
-        property_lists['B_magnitudes'].append(props['B_magnitude'])
-        property_lists['object_types'].append(props['object_type'])
-        property_lists['is_messier'].append(props.get('is_messier', False))
-        property_lists['distance_ly'].append(props.get('distance_ly', None))
-        property_lists['notes'].append(props.get('notes', ''))
-    
-    with open(properties_file, 'wb') as f:
-        pickle.dump(property_lists, f)
+    """Save star properties with Messier object support.
+
+    A store from load_existing_properties() appends only the rows added
+    since its last save; a plain dict is written as a full snapshot.
+    """
+    save_properties(properties, properties_file)
 
 def create_custom_simbad():
     custom_simbad = Simbad()
@@ -357,10 +313,59 @@ def query_simbad_for_star_properties(missing_ids, existing_properties, propertie
         return existing_properties
 
 
+def _as_column(values):
+    """Object array -> the dtype a plain list would have become in a Table.
+
+    Columns holding a None stay object; otherwise numpy infers str or float,
+    as astropy does for a list (so both assign paths give the same dtypes).
+    """
+    if np.equal(values, None).any():
+        return values
+    return np.array(values.tolist())
+
+
+def _assign_from_store(store, unique_ids):
+    """Property columns for unique_ids as one join against the store."""
+    idx = store.lookup(unique_ids)
+    found = idx >= 0
+
+    names = store.gather('star_name', idx)
+    names[np.equal(names, None) | np.equal(names, '')] = "Unknown"
+
+    # Distance and notes only carry over for Messier objects (legacy behaviour)
+    is_messier = store.gather('is_messier', idx) & found
+    distance = store.gather('distance_ly', idx)
+    distance_obj = np.full(len(idx), None, dtype=object)
+    keep = is_messier & ~np.isnan(distance)
+    distance_obj[keep] = distance[keep]
+    notes = store.gather('notes', idx)
+    notes_obj = np.full(len(idx), '', dtype=object)
+    notes_obj[is_messier] = notes[is_messier]
+
+    return {
+        'Star_Name': _as_column(names),
+        'Spectral_Type': _as_column(store.gather('spectral_type', idx)),
+        'V_mag': store.gather('V_magnitude', idx),
+        'B_mag': store.gather('B_magnitude', idx),
+        'Object_Type': _as_column(store.gather('object_type', idx)),
+        'Is_Messier': is_messier,
+        'Distance_ly': _as_column(distance_obj),
+        'Notes': _as_column(notes_obj),
+    }
+
+
 def assign_properties_to_data(combined_data, existing_properties, unique_ids):
     """Assign retrieved properties to the combined data with Messier object support."""
     print("\nAssigning properties to combined data...")
-    
+
+    if isinstance(existing_properties, StarPropertyStore):
+        props_to_assign = _assign_from_store(existing_properties, unique_ids)
+        for col_name, values in props_to_assign.items():
+            combined_data[col_name] = values
+        messier_count = int(np.count_nonzero(props_to_assign['Is_Messier']))
+        print(f"Assigned properties to {len(unique_ids)} objects ({messier_count} Messier objects)")
+        return combined_data
+
     # Initialize property lists
     props_to_assign = {
         'Star_Name': [],
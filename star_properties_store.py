@@ -0,0 +1,656 @@
+"""
+star_properties_store.py - Columnar, indexed store for SIMBAD star properties.
+
+SIMBAD-derived properties used to live only in star_data/star_properties_*.pkl:
+a pickle of parallel lists that every HR diagram and planetarium build
+turned into one Python dict per star, probed 100k times, and rewrote in
+full after every 50-star SIMBAD batch. This module keeps the same data as
+columns:
+
+    - ids: sorted numpy str array of unique_id ("HIP 123", "Gaia DR3 ...")
+    - float columns (magnitudes, distances, calculated parameters), NaN
+      where the legacy dict had None
+    - a bool column (is_messier)
+    - string columns, dictionary-encoded on disk (codes into a string
+      table, -1 for None) and held as object arrays in memory
+
+Lookups are joins: lookup() turns a list of unique_ids into row indices
+with one searchsorted, and missing() / gather() / the vectorized
+assign_properties_to_data path in star_properties.py build whole columns
+from those indices. merge() upserts a whole column set (the catalogue
+rebuild in vot_cache_manager / simbad_manager) the same way.
+
+On disk, star_properties_X.pkl is kept as star_properties_X.store/:
+
+    MANIFEST.json        generation, segment list, row count, and the
+                         size/mtime of the legacy PKL last imported
+    base-<gen>.npz       full snapshot
+    seg-<gen>-<n>.npz    appended rows (new or updated stars); later wins
+    backup.npz           the previous generation's snapshot
+
+Every data file is written to a temporary name, fsynced and renamed before
+the manifest that lists it is atomically replaced, and readers only open
+files the manifest lists. A crash mid-write therefore leaves the previous
+manifest, and the data it names, intact; stray files from the interrupted
+write are removed at the next compaction. flush() appends only rows
+changed since the last write; after MAX_SEGMENTS appends the segments are
+compacted into a new base.
+
+Full rewrites keep the PKL-era safety checks: a save that would drop more
+than 90% of a store of over 100 stars is refused after an emergency copy
+of the store directory.
+
+The first open of a store with no manifest imports the legacy PKL (list
+or dict format). If the PKL changes later (restored by hand, written by an
+older tool), its rows are imported again as a segment.
+
+Key classes:
+    StarPropertyStore - the columns plus a dict-compatible interface
+
+Key functions:
+    open_store() - store for a star_properties_*.pkl path (imports the PKL)
+    save_properties() - write a dict or store back with safety checks
+    store_dir_for() - star_properties_X.pkl -> star_properties_X.store
+
+Consumed by: star_properties.py, simbad_manager.py, star_sphere_builder.py
+
+Role: cache
+Domain: stars
+
+Module created: October 2026
+"""
+
+import glob
+import json
+import logging
+import os
+import pickle
+import shutil
+import time
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+STORE_VERSION = 1
+MAX_SEGMENTS = 8
+
+# Property name -> kind. Order is the on-disk column order.
+FIELDS = {
+    'star_name': 'str',
+    'spectral_type': 'str',
+    'V_magnitude': 'float',
+    'B_magnitude': 'float',
+    'object_type': 'str',
+    'is_messier': 'bool',
+    'distance_ly': 'float',
+    'distance_pc': 'float',
+    'notes': 'str',
+    'Temperature': 'float',
+    'Luminosity': 'float',
+    'Abs_Mag': 'float',
+    'RA_ICRS': 'float',
+    'DE_ICRS': 'float',
+    'ra_str': 'str',
+    'dec_str': 'str',
+    'Stellar_Class': 'str',
+    'Object_Type_Desc': 'str',
+    'Source_Catalog': 'str',
+}
+
+# Keys of the legacy list-format PKL for each field
+LEGACY_KEYS = {
+    'star_name': 'star_names',
+    'spectral_type': 'spectral_types',
+    'V_magnitude': 'V_magnitudes',
+    'B_magnitude': 'B_magnitudes',
+    'object_type': 'object_types',
+}
+
+
+def store_dir_for(properties_file: str) -> str:
+    """star_data/star_properties_X.pkl -> star_data/star_properties_X.store"""
+    return os.path.splitext(properties_file)[0] + '.store'
+
+
+# ----------------------------------------------------------------------
+# value conversion
+# ----------------------------------------------------------------------
+
+def _to_float(value) -> float:
+    if value is None or np.ma.is_masked(value):
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _to_str(value):
+    if value is None or np.ma.is_masked(value):
+        return None
+    if isinstance(value, bytes):
+        return value.decode('utf-8')
+    return str(value)
+
+
+def _empty_column(kind: str, n: int):
+    if kind == 'float':
+        return np.full(n, np.nan)
+    if kind == 'bool':
+        return np.zeros(n, dtype=bool)
+    return np.full(n, None, dtype=object)
+
+
+def _column_from_values(kind: str, values) -> np.ndarray:
+    if kind == 'float':
+        return np.array([_to_float(v) for v in values], dtype=float)
+    if kind == 'bool':
+        return np.array([bool(v) if v is not None else False for v in values], dtype=bool)
+    out = np.empty(len(values), dtype=object)
+    out[:] = [_to_str(v) for v in values]
+    return out
+
+
+class StarPropertyStore:
+    """Star properties as sorted columns, with a dict-compatible interface.
+
+    Reads (len, in, [uid], get, keys, items) behave like the legacy
+    {unique_id: {field: value}} dict. Assigning store[uid] = props stages
+    the row; it is visible to reads at once and written by the next
+    flush(). Mutating a dict returned by store[uid] does not change the
+    store -- assign it back.
+    """
+
+    def __init__(self, ids=None, columns=None, path: Optional[str] = None):
+        ids = np.asarray([] if ids is None else ids, dtype=str)
+        columns = columns or {}
+        self.path = path
+        self.ids = ids
+        self.columns = {}
+        for name, kind in FIELDS.items():
+            col = columns.get(name)
+            self.columns[name] = _empty_column(kind, len(ids)) if col is None else col
+        self._pending: Dict[str, dict] = {}
+        self._unflushed = set()
+
+    # ------------------------------------------------------------------
+    # construction
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_dict(cls, properties: Dict[str, dict], path: Optional[str] = None):
+        """Build from a {unique_id: props} dict (later keys win on duplicates)."""
+        uids = [uid for uid in properties.keys() if uid]
+        records = [properties[uid] for uid in uids]
+        columns = {name: _column_from_values(kind, [r.get(name) for r in records])
+                   for name, kind in FIELDS.items()}
+        store = cls(np.asarray(uids, dtype=str), columns, path)
+        return store._sorted_unique()
+
+    @classmethod
+    def from_legacy(cls, data, path: Optional[str] = None):
+        """Build from an unpickled legacy PKL (list format or dict format)."""
+        if isinstance(data, dict) and 'unique_ids' in data:
+            uids = list(data.get('unique_ids', []))
+            n = len(uids)
+            keep = [i for i, uid in enumerate(uids) if uid]
+            columns = {}
+            for name, kind in FIELDS.items():
+                values = data.get(LEGACY_KEYS.get(name, name))
+                if values is None:
+                    columns[name] = _empty_column(kind, len(keep))
+                    continue
+                values = list(values) + [None] * (n - len(values))
+                columns[name] = _column_from_values(kind, [values[i] for i in keep])
+            store = cls(np.asarray([uids[i] for i in keep], dtype=str), columns, path)
+            return store._sorted_unique()
+        if isinstance(data, dict):
+            return cls.from_dict(data, path)
+        return cls(path=path)
+
+    def _sorted_unique(self):
+        """Sort by id; for repeated ids keep the last occurrence."""
+        n = len(self.ids)
+        if n == 0:
+            return self
+        order = np.lexsort((np.arange(n), self.ids))
+        ids = self.ids[order]
+        last = np.ones(n, dtype=bool)
+        last[:-1] = ids[1:] != ids[:-1]
+        sel = order[last]
+        self.ids = self.ids[sel]
+        for name in self.columns:
+            self.columns[name] = self.columns[name][sel]
+        return self
+
+    # ------------------------------------------------------------------
+    # joins
+    # ------------------------------------------------------------------
+    def _apply_pending(self):
+        """Merge staged rows into the sorted columns."""
+        if not self._pending:
+            return
+        staged = StarPropertyStore.from_dict(self._pending)
+        self._unflushed.update(self._pending)
+        self._pending = {}
+        self.ids = np.concatenate((self.ids, staged.ids))
+        for name in self.columns:
+            self.columns[name] = np.concatenate((self.columns[name], staged.columns[name]))
+        self._sorted_unique()
+
+    def lookup(self, unique_ids: Iterable) -> np.ndarray:
+        """Row index of each unique_id, -1 where absent (None ids included)."""
+        self._apply_pending()
+        uids = list(unique_ids)
+        if not uids:
+            return np.zeros(0, dtype=np.intp)
+        query = np.asarray(['' if u is None else str(u) for u in uids], dtype=str)
+        if len(self.ids) == 0:
+            return np.full(len(query), -1, dtype=np.intp)
+        pos = np.searchsorted(self.ids, query)
+        pos_c = np.minimum(pos, len(self.ids) - 1)
+        hit = (self.ids[pos_c] == query) & (query != '')
+        return np.where(hit, pos_c, -1).astype(np.intp)
+
+    def missing(self, unique_ids: Iterable) -> list:
+        """unique_ids with no row (None included), in input order."""
+        uids = list(unique_ids)
+        idx = self.lookup(uids)
+        return [uids[i] for i in np.flatnonzero(idx < 0)]
+
+    def gather(self, name: str, idx: np.ndarray, fill=None) -> np.ndarray:
+        """Column name at row indices idx; fill (default NaN/False/None) where idx < 0."""
+        self._apply_pending()
+        kind = FIELDS[name]
+        col = self.columns[name]
+        out = _empty_column(kind, len(idx))
+        if fill is not None:
+            out[:] = fill
+        found = idx >= 0
+        out[found] = col[idx[found]]
+        return out
+
+    def merge(self, other: 'StarPropertyStore') -> int:
+        """Upsert other's rows column-wise; returns the number of rows changed.
+
+        New ids are added as they are. For ids already present, each
+        value other actually has (not NaN, not None, True for is_messier)
+        replaces the stored one; gaps in other leave the stored value.
+        Changed rows are written by the next flush().
+        """
+        self._apply_pending()
+        other._apply_pending()
+        if len(other.ids) == 0:
+            return 0
+        idx = self.lookup(other.ids)
+        old = idx >= 0
+        changed = ~old
+        for name, kind in FIELDS.items():
+            src = other.columns[name]
+            if kind == 'float':
+                present = ~np.isnan(src)
+            elif kind == 'bool':
+                present = src.copy()
+            else:
+                present = ~np.equal(src, None)
+            present &= old
+            if not present.any():
+                continue
+            rows = np.flatnonzero(present)
+            dst = self.columns[name]
+            differs = np.asarray(dst[idx[rows]] != src[rows], dtype=bool)
+            dst[idx[rows]] = src[rows]
+            changed[rows[differs]] = True
+
+        self._unflushed.update(other.ids[changed].tolist())
+        new = ~old
+        if new.any():
+            self.ids = np.concatenate((self.ids, other.ids[new]))
+            for name in self.columns:
+                self.columns[name] = np.concatenate((self.columns[name], other.columns[name][new]))
+            self._sorted_unique()
+        return int(np.count_nonzero(changed))
+
+    # ------------------------------------------------------------------
+    # dict-compatible interface
+    # ------------------------------------------------------------------
+    def __len__(self):
+        self._apply_pending()
+        return len(self.ids)
+
+    def _find(self, uid) -> int:
+        """Row of uid in the sorted columns (staged rows not merged), or -1."""
+        if uid is None or len(self.ids) == 0:
+            return -1
+        pos = int(np.searchsorted(self.ids, uid))
+        return pos if pos < len(self.ids) and self.ids[pos] == uid else -1
+
+    def __contains__(self, uid):
+        return uid in self._pending or self._find(uid) >= 0
+
+    def _row(self, i: int) -> dict:
+        props = {}
+        for name, kind in FIELDS.items():
+            value = self.columns[name][i]
+            if kind == 'float':
+                value = None if np.isnan(value) else float(value)
+            elif kind == 'bool':
+                value = bool(value)
+            props[name] = value
+        return props
+
+    def __getitem__(self, uid) -> dict:
+        if uid in self._pending:
+            return dict(self._pending[uid])
+        idx = self._find(uid)
+        if idx < 0:
+            raise KeyError(uid)
+        return self._row(idx)
+
+    def get(self, uid, default=None):
+        try:
+            return self[uid]
+        except KeyError:
+            return default
+
+    def __setitem__(self, uid, props: dict):
+        self._pending[uid] = dict(props)
+
+    def update(self, properties: Dict[str, dict]):
+        for uid, props in properties.items():
+            self[uid] = props
+
+    def keys(self):
+        self._apply_pending()
+        return self.ids.tolist()
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def values(self):
+        return [props for _uid, props in self.items()]
+
+    def items(self):
+        self._apply_pending()
+        return [(uid, self._row(i)) for i, uid in enumerate(self.ids.tolist())]
+
+    def to_dict(self) -> Dict[str, dict]:
+        """Legacy {unique_id: props} dict."""
+        return dict(self.items())
+
+    # ------------------------------------------------------------------
+    # persistence
+    # ------------------------------------------------------------------
+    def flush(self):
+        """Append rows changed since the last write as one segment."""
+        if self.path is None:
+            raise ValueError("store has no path; use save_properties()")
+        self._apply_pending()
+        if not self._unflushed:
+            return 0
+        idx = self.lookup(sorted(self._unflushed))
+        changed = StarPropertyStore(self.ids[idx],
+                                    {name: col[idx] for name, col in self.columns.items()})
+        _append_segment(self.path, changed, rows=len(self.ids))
+        count = len(self._unflushed)
+        self._unflushed = set()
+        return count
+
+
+# ----------------------------------------------------------------------
+# on-disk format
+# ----------------------------------------------------------------------
+
+def _encode(store: StarPropertyStore) -> dict:
+    arrays = {'ids': store.ids}
+    for name, kind in FIELDS.items():
+        col = store.columns[name]
+        if kind != 'str':
+            arrays[name] = col
+            continue
+        present = np.array([v is not None for v in col], dtype=bool)
+        table, codes = np.unique(col[present].astype(str), return_inverse=True)
+        full = np.full(len(col), -1, dtype=np.int32)
+        full[present] = codes
+        arrays[name] = full
+        arrays[name + '__strings'] = table
+    return arrays
+
+
+def _decode(npz) -> StarPropertyStore:
+    ids = npz['ids']
+    columns = {}
+    for name, kind in FIELDS.items():
+        if name not in npz.files:
+            continue
+        values = npz[name]
+        if kind == 'str':
+            table = npz[name + '__strings'].astype(object)
+            col = np.full(len(values), None, dtype=object)
+            present = values >= 0
+            col[present] = table[values[present]]
+            values = col
+        columns[name] = values
+    return StarPropertyStore(ids, columns)
+
+
+def _write_npz(path: str, store: StarPropertyStore):
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        np.savez(f, **_encode(store))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _read_manifest(directory: str) -> Optional[dict]:
+    path = os.path.join(directory, 'MANIFEST.json')
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r') as f:
+        manifest = json.load(f)
+    if manifest.get('version') != STORE_VERSION:
+        raise ValueError(f"unsupported store version {manifest.get('version')}")
+    return manifest
+
+
+def _write_manifest(directory: str, manifest: dict):
+    path = os.path.join(directory, 'MANIFEST.json')
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(manifest, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _legacy_stamp(properties_file: str) -> Optional[dict]:
+    if not os.path.exists(properties_file):
+        return None
+    st = os.stat(properties_file)
+    return {'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+
+
+def _load_dir(directory: str, manifest: dict) -> StarPropertyStore:
+    parts = []
+    for name in [manifest['base']] + manifest['segments']:
+        with np.load(os.path.join(directory, name), allow_pickle=False) as npz:
+            parts.append(_decode(npz))
+    store = StarPropertyStore(np.concatenate([p.ids for p in parts]),
+                              {name: np.concatenate([p.columns[name] for p in parts])
+                               for name in FIELDS})
+    store._sorted_unique()
+    if len(store.ids) != manifest['rows']:
+        logger.warning(f"Store {directory}: manifest lists {manifest['rows']} rows, "
+                       f"files hold {len(store.ids)}")
+    return store
+
+
+def _write_snapshot(properties_file: str, store: StarPropertyStore,
+                    manifest: Optional[dict]):
+    """Write store as a new base generation and retire the old files."""
+    directory = store_dir_for(properties_file)
+    os.makedirs(directory, exist_ok=True)
+    generation = (manifest['generation'] + 1) if manifest else 1
+    base = f'base-{generation}.npz'
+    _write_npz(os.path.join(directory, base), store)
+
+    # Keep the outgoing snapshot as backup.npz before the switch
+    if manifest:
+        old_base = os.path.join(directory, manifest['base'])
+        if os.path.exists(old_base):
+            shutil.copy2(old_base, os.path.join(directory, 'backup.npz.tmp'))
+            os.replace(os.path.join(directory, 'backup.npz.tmp'),
+                       os.path.join(directory, 'backup.npz'))
+
+    new_manifest = {
+        'version': STORE_VERSION,
+        'generation': generation,
+        'base': base,
+        'segments': [],
+        'rows': int(len(store.ids)),
+        'updated': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'legacy_pkl': (manifest or {}).get('legacy_pkl'),
+    }
+    _write_manifest(directory, new_manifest)
+    _remove_unlisted(directory, new_manifest)
+    return new_manifest
+
+
+def _remove_unlisted(directory: str, manifest: dict):
+    keep = {'MANIFEST.json', 'backup.npz', manifest['base'], *manifest['segments']}
+    for path in glob.glob(os.path.join(directory, '*')):
+        name = os.path.basename(path)
+        if name not in keep and (name.endswith('.npz') or name.endswith('.tmp')):
+            try:
+                os.remove(path)
+            except OSError as e:
+                logger.warning(f"Could not remove stale store file {path}: {e}")
+
+
+def _append_segment(properties_file: str, changed: StarPropertyStore,
+                    rows: Optional[int] = None):
+    directory = store_dir_for(properties_file)
+    manifest = _read_manifest(directory)
+    if manifest is None:
+        _write_snapshot(properties_file, changed, None)
+        return
+    if len(manifest['segments']) + 1 > MAX_SEGMENTS:
+        full = _load_dir(directory, manifest)
+        merged = StarPropertyStore(np.concatenate((full.ids, changed.ids)),
+                                   {name: np.concatenate((full.columns[name], changed.columns[name]))
+                                    for name in FIELDS})
+        _write_snapshot(properties_file, merged._sorted_unique(), manifest)
+        return
+    seg = f"seg-{manifest['generation']}-{len(manifest['segments']) + 1}.npz"
+    _write_npz(os.path.join(directory, seg), changed)
+    manifest['segments'].append(seg)
+    if rows is None:
+        # Row count after the append: existing rows plus ids not seen before
+        base = _load_dir(directory, {**manifest, 'segments': manifest['segments'][:-1]})
+        rows = len(base.ids) + np.count_nonzero(base.lookup(changed.ids) < 0)
+    manifest['rows'] = int(rows)
+    manifest['updated'] = time.strftime('%Y-%m-%d %H:%M:%S')
+    _write_manifest(directory, manifest)
+
+
+def _read_legacy(properties_file: str):
+    with open(properties_file, 'rb') as f:
+        return pickle.load(f)
+
+
+def open_store(properties_file: str) -> StarPropertyStore:
+    """Store for properties_file, importing the legacy PKL when needed.
+
+    Returns an empty store (nothing written yet) when neither the store
+    nor the PKL exists.
+    """
+    directory = store_dir_for(properties_file)
+    manifest = _read_manifest(directory)
+    stamp = _legacy_stamp(properties_file)
+
+    if manifest is None:
+        if stamp is None:
+            return StarPropertyStore(path=properties_file)
+        store = StarPropertyStore.from_legacy(_read_legacy(properties_file), properties_file)
+        manifest = _write_snapshot(properties_file, store, None)
+        manifest['legacy_pkl'] = stamp
+        _write_manifest(directory, manifest)
+        logger.info(f"Imported {len(store.ids)} star properties from {properties_file}")
+        return store
+
+    store = _load_dir(directory, manifest)
+    store.path = properties_file
+    if stamp is not None and stamp != manifest.get('legacy_pkl'):
+        legacy = StarPropertyStore.from_legacy(_read_legacy(properties_file))
+        logger.info(f"{properties_file} changed since last import; "
+                    f"re-importing {len(legacy.ids)} rows")
+        _append_segment(properties_file, legacy)
+        manifest = _read_manifest(directory)
+        manifest['legacy_pkl'] = stamp
+        _write_manifest(directory, manifest)
+        store = _load_dir(directory, manifest)
+        store.path = properties_file
+    return store
+
+
+def stored_count(properties_file: str) -> int:
+    """Rows in the store (or legacy PKL) without loading the columns."""
+    manifest = _read_manifest(store_dir_for(properties_file))
+    if manifest is not None:
+        return int(manifest['rows'])
+    if os.path.exists(properties_file):
+        data = _read_legacy(properties_file)
+        if isinstance(data, dict) and 'unique_ids' in data:
+            return len(data.get('unique_ids', []))
+        if isinstance(data, dict):
+            return len(data)
+    return 0
+
+
+def _dir_size(directory: str) -> int:
+    if not os.path.isdir(directory):
+        return 0
+    return sum(os.path.getsize(p) for p in glob.glob(os.path.join(directory, '*.npz')))
+
+
+def save_properties(properties, properties_file: str):
+    """Persist properties (a dict or a StarPropertyStore) for properties_file.
+
+    A store opened for this file appends only its changed rows. Anything
+    else is written as a full snapshot, refused (after an emergency copy
+    of the store) if it would drop more than 90% of more than 100 stars,
+    or shrink a store of over 1 MB to fewer than 20.
+    """
+    if isinstance(properties, StarPropertyStore) and properties.path == properties_file:
+        properties.flush()
+        return
+
+    directory = store_dir_for(properties_file)
+    manifest = _read_manifest(directory)
+    original_count = stored_count(properties_file)
+    new_count = len(properties)
+
+    if original_count > 100 and new_count < original_count * 0.1:
+        emergency = directory + '.emergency_' + time.strftime('%Y%m%d_%H%M%S')
+        if os.path.isdir(directory):
+            shutil.copytree(directory, emergency)
+        logger.error(f"SAFETY: Blocked save that would reduce {original_count} to {new_count} stars")
+        logger.info(f"Emergency backup created: {emergency}")
+        raise ValueError(f"Refusing to save: would lose {original_count - new_count} stars")
+
+    original_size = _dir_size(directory)
+    if original_size > 1024 * 1024 and new_count < 20:
+        warning = directory + '.size_warning_' + time.strftime('%Y%m%d_%H%M%S')
+        shutil.copytree(directory, warning)
+        logger.error(f"SAFETY: Large store ({original_size/1024/1024:.1f}MB) -> {new_count} entries")
+        raise ValueError("Refusing to save: suspicious size reduction")
+
+    if isinstance(properties, StarPropertyStore):
+        properties._apply_pending()
+        store = StarPropertyStore(properties.ids, dict(properties.columns))
+    else:
+        store = StarPropertyStore.from_dict(properties)
+    _write_snapshot(properties_file, store, manifest)
+    logger.info(f"Saved {len(store.ids)} properties to {directory}")
@@ -3,19 +3,34 @@ star_sphere_builder.py - Build and render celestial sphere for Paloma's Orrery.
 
 Two roles in one file:
   1. BUILDER (offline): Reads Hipparcos VOT + SIMBAD caches, produces
-     star_data/star_sphere_vmag35.json. Run standalone: python star_sphere_builder.py
+     star_data/star_sphere_vmag35.json and the deeper magnitude tiers.
+     Run standalone: python star_sphere_builder.py
   2. RENDERER (runtime): Imported by palomas_orrery.py to add star background
      and celestial grid traces to Plotly 3D figures. Single function called by
      both plot_objects and animate_objects -- zero parallel-pipeline divergence.
 
 Output:
-    star_data/star_sphere_vmag35.json
+    star_data/star_sphere_vmag35.json   grid, constellations, stars to vmag 3.5
+    star_data/star_sphere_tiles/        stars to vmag 8 as binary tiles:
+        manifest.json                   tiers, region offsets per tier
+        tier_NN.npy                     float32 xyz + vmag, sorted by sky region
+        tier_NN_names.json              designations, read only for Star Names
+
+Each tier holds the stars between the previous limit and its own (3.5, 5,
+6.5, 8), so a naked-eye sky (6.5) reads three small files and a vmag 3.5
+plot still reads nothing but the JSON. Within a tier the rows are grouped
+by ecliptic sky region (12 longitude x 6 equal-area latitude cells) and
+the manifest records each region's slice, so a caller drawing part of
+the sky reads only those rows.
 
 No network access required -- reads only local cache files.
 
 # Module created: April 2026 with Anthropic's Claude Opus 4.6
 # Renderer added: April 13, 2026 with Anthropic's Claude Opus 4.6
 # Part of Paloma's Orrery celestial sphere feature
+# Module updated: October 2026 (Hipparcos VOT read through vot_sidecar;
+#   SIMBAD names read from star_properties_store; magnitude-tiered binary
+#   tiles with sky-region partitioning)
 
 Role: rendering
 Domain: stars
@@ -24,7 +39,6 @@ Domain: stars
 import os
 import sys
 import json
-import pickle
 import numpy as np
 
 # ---- Configuration ----
@@ -33,6 +47,17 @@ VMAG_LIMIT = 3.5
 OUTPUT_DIR = 'star_data'
 OUTPUT_FILE = os.path.join(OUTPUT_DIR, 'star_sphere_vmag35.json')
 
+# Magnitude tiers of the binary star tiles (faint limit of each tier)
+TIERS = (3.5, 5.0, 6.5, 8.0)
+TILE_DIR = os.path.join(OUTPUT_DIR, 'star_sphere_tiles')
+TILE_MANIFEST = 'manifest.json'
+TILE_DTYPE = np.dtype([('xyz', '<f4', (3,)), ('vmag', '<f4')])
+
+# Sky regions: ecliptic longitude bins x latitude bins equal in sin(beta),
+# so every region covers the same solid angle
+REGION_LON_BINS = 12
+REGION_LAT_BINS = 6
+
 # Hipparcos VOT cache -- same files used by planetarium_apparent_magnitude.py
 HIP_VOT_CANDIDATES = [
     'hipparcos_data_magnitude.vot',
@@ -181,44 +206,36 @@ def load_simbad_names():
     Load star designations from the SIMBAD properties cache.
     Returns dict mapping 'HIP NNNNN' -> star_name (e.g. '* alf Ori').
     """
-    if not os.path.exists(PROPERTIES_PKL):
+    from star_properties_store import open_store, store_dir_for
+
+    if not os.path.exists(PROPERTIES_PKL) and not os.path.isdir(store_dir_for(PROPERTIES_PKL)):
         print(f"  SIMBAD cache not found: {PROPERTIES_PKL}")
         print("  Stars will use HIP ID as designation.")
         return {}
 
     print(f"Loading SIMBAD properties from: {PROPERTIES_PKL}")
-    with open(PROPERTIES_PKL, 'rb') as f:
-        data = pickle.load(f)
-
-    names = {}
-    if isinstance(data, dict) and 'unique_ids' in data:
-        uids = data['unique_ids']
-        star_names = data.get('star_names', [])
-        for i, uid in enumerate(uids):
-            if i < len(star_names) and star_names[i]:
-                names[uid] = str(star_names[i])
-    elif isinstance(data, dict):
-        for uid, props in data.items():
-            if isinstance(props, dict) and 'star_name' in props:
-                names[uid] = str(props['star_name'])
+    store = open_store(PROPERTIES_PKL)
+    star_names = store.columns['star_name']
+    has_name = np.array([bool(n) for n in star_names], dtype=bool)
+    names = dict(zip(store.ids[has_name].tolist(), star_names[has_name].tolist()))
 
     print(f"  Loaded {len(names)} star designations.")
     return names
 
 
-def build_star_data(vot_path, simbad_names):
+def build_star_data(vot_path, simbad_names, vmag_limit=VMAG_LIMIT):
     """
-    Build the star array from Hipparcos VOT data.
+    Build the star array from Hipparcos VOT data, stars with vmag <= vmag_limit.
     
     Returns (stars, hip_to_index) where:
       stars: list of [x, y, z, vmag, designation] arrays
       hip_to_index: dict mapping HIP number (int) to index in stars list
     Unit vectors are in ecliptic coordinates.
     """
-    from astropy.table import Table
+    import vot_sidecar
 
     print(f"\nLoading Hipparcos data from: {vot_path}")
-    data = Table.read(vot_path, format='votable')
+    data = vot_sidecar.read_vot(vot_path, mode='magnitude')
     print(f"  Total entries in VOT: {len(data)}")
 
     # Find RA/Dec columns
@@ -245,8 +262,8 @@ def build_star_data(vot_path, simbad_names):
     hip_ids = data['HIP'] if 'HIP' in data.colnames else None
 
     # Filter
-    valid = np.isfinite(vmag) & np.isfinite(ra_deg) & np.isfinite(dec_deg) & (vmag <= VMAG_LIMIT)
-    print(f"  Stars with vmag <= {VMAG_LIMIT}: {np.sum(valid)}")
+    valid = np.isfinite(vmag) & np.isfinite(ra_deg) & np.isfinite(dec_deg) & (vmag <= vmag_limit)
+    print(f"  Stars with vmag <= {vmag_limit}: {np.sum(valid)}")
 
     # Build stars with HIP tracking for constellation centroid lookup
     stars_with_hip = []  # (star_entry, hip_number_or_None)
@@ -606,6 +623,98 @@ def build_centroid_data(stars, hip_to_index):
     return centroids
 
 
+def sky_region(xyz):
+    """Sky region index (0 .. REGION_LON_BINS * REGION_LAT_BINS - 1) of unit vectors."""
+    xyz = np.asarray(xyz, dtype=float).reshape(-1, 3)
+    lon = np.mod(np.arctan2(xyz[:, 1], xyz[:, 0]), 2 * np.pi)
+    lon_bin = np.minimum((lon / (2 * np.pi) * REGION_LON_BINS).astype(int),
+                         REGION_LON_BINS - 1)
+    lat_bin = np.clip(((xyz[:, 2] + 1.0) / 2.0 * REGION_LAT_BINS).astype(int),
+                      0, REGION_LAT_BINS - 1)
+    return lat_bin * REGION_LON_BINS + lon_bin
+
+
+def regions_in_window(lon_range, lat_range):
+    """
+    Sky regions overlapping an ecliptic window, in degrees.
+
+    lon_range may wrap through 0 (e.g. (330, 30)); lat_range is (min, max).
+    """
+    lon_lo, lon_hi = (v % 360.0 for v in lon_range)
+    width = 360.0 / REGION_LON_BINS
+    lon_bins = []
+    for b in range(REGION_LON_BINS):
+        a, z = b * width, (b + 1) * width
+        if lon_lo <= lon_hi:
+            hit = a < lon_hi and z > lon_lo
+        else:
+            hit = a < lon_hi or z > lon_lo
+        if hit:
+            lon_bins.append(b)
+    sin_lo, sin_hi = (np.sin(np.radians(v)) for v in lat_range)
+    lat_bins = [b for b in range(REGION_LAT_BINS)
+                if -1 + 2 * b / REGION_LAT_BINS < sin_hi
+                and -1 + 2 * (b + 1) / REGION_LAT_BINS > sin_lo]
+    return sorted(la * REGION_LON_BINS + lo for la in lat_bins for lo in lon_bins)
+
+
+def _tier_name(limit):
+    return f"tier_{int(round(limit * 10)):02d}"
+
+
+def build_tiles(stars, tile_dir=TILE_DIR, tiers=TIERS):
+    """
+    Write the magnitude-tiered binary tiles from a build_star_data list.
+
+    stars must reach tiers[-1]. Each tier file holds the stars with
+    previous limit < vmag <= its limit, grouped by sky region and brightest
+    first within a region; the manifest is written last, so an interrupted
+    build leaves the previous tiles in use.
+    """
+    os.makedirs(tile_dir, exist_ok=True)
+    xyz = np.array([s[:3] for s in stars], dtype=float).reshape(-1, 3)
+    vmag = np.array([s[3] for s in stars], dtype=float)
+    names = [s[4] if len(s) > 4 else '' for s in stars]
+    region = sky_region(xyz)
+    n_regions = REGION_LON_BINS * REGION_LAT_BINS
+
+    manifest = {
+        'version': 1,
+        'coordinate_frame': 'ecliptic_J2000',
+        'region_lon_bins': REGION_LON_BINS,
+        'region_lat_bins': REGION_LAT_BINS,
+        'tiers': [],
+    }
+    lower = -np.inf
+    for limit in tiers:
+        in_tier = np.flatnonzero((vmag > lower) & (vmag <= limit))
+        order = in_tier[np.lexsort((vmag[in_tier], region[in_tier]))]
+        rows = np.empty(len(order), dtype=TILE_DTYPE)
+        rows['xyz'] = xyz[order]
+        rows['vmag'] = vmag[order]
+        offsets = np.searchsorted(region[order], np.arange(n_regions + 1)).tolist()
+
+        base = _tier_name(limit)
+        np.save(os.path.join(tile_dir, base + '.npy'), rows)
+        with open(os.path.join(tile_dir, base + '_names.json'), 'w', encoding='utf-8') as f:
+            json.dump([names[i] for i in order], f, separators=(',', ':'))
+        manifest['tiers'].append({
+            'vmag_min': None if np.isinf(lower) else lower,
+            'vmag_max': limit,
+            'file': base + '.npy',
+            'names_file': base + '_names.json',
+            'star_count': len(order),
+            'region_offsets': offsets,
+        })
+        lower = limit
+
+    path = os.path.join(tile_dir, TILE_MANIFEST)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(path + '.tmp', path)
+    return manifest
+
+
 def build_json(vot_path):
     """Main build routine."""
     print("=" * 60)
@@ -621,6 +730,10 @@ def build_json(vot_path):
         print("ERROR: No stars produced. Aborting.")
         return False
 
+    # Deeper magnitude tiers as binary tiles (the JSON stays at VMAG_LIMIT)
+    deep_stars, _ = build_star_data(vot_path, simbad_names, vmag_limit=TIERS[-1])
+    manifest = build_tiles(deep_stars)
+
     # Build grid data
     grid = build_grid_data()
 
@@ -658,6 +771,10 @@ def build_json(vot_path):
     print(f"  File size: {file_size:,} bytes ({file_size/1024:.1f} KB)")
     print(f"  Brightest: {stars[0][4]} (vmag {stars[0][3]})")
     print(f"  Faintest: {stars[-1][4]} (vmag {stars[-1][3]})")
+    print(f"Tiles: {TILE_DIR}")
+    for tier in manifest['tiers']:
+        size = os.path.getsize(os.path.join(TILE_DIR, tier['file']))
+        print(f"  vmag <= {tier['vmag_max']}: {tier['star_count']} stars, {size:,} bytes")
     print(f"{'=' * 60}")
 
     return True
@@ -697,9 +814,102 @@ def load_star_sphere_data():
         return None
 
 
+_tile_cache = {'manifest': None, 'stamp': None, 'rows': {}, 'names': {}}
+
+
+def _tile_manifest(tile_dir):
+    """Tile manifest, re-read (and the tile cache dropped) when it changes."""
+    path = os.path.join(tile_dir, TILE_MANIFEST)
+    try:
+        stamp = (os.path.abspath(path), os.stat(path).st_mtime_ns)
+    except OSError:
+        return None
+    if _tile_cache['stamp'] != stamp:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[STAR SPHERE] Error loading {path}: {e}", flush=True)
+            return None
+        _tile_cache.update(manifest=manifest, stamp=stamp, rows={}, names={})
+    return _tile_cache['manifest']
+
+
+def load_star_tiles(vmag_limit, regions=None, names=False, tile_dir=TILE_DIR):
+    """
+    Stars with vmag <= vmag_limit from the binary tiles.
+
+    Only the tiers below vmag_limit are opened (memory-mapped), and of
+    those only the rows of the requested sky regions (None = whole sky).
+    Designations are read only when names is True.
+
+    Returns dict with 'xyz' (n x 3 unit vectors, ecliptic), 'vmag' and
+    'names' (list, or None), or None if no tiles have been built. A limit
+    deeper than the deepest tier is served from the tiers there are.
+    """
+    manifest = _tile_manifest(tile_dir)
+    if manifest is None:
+        return None
+
+    xyz, vmag, designations = [], [], []
+    for tier in manifest['tiers']:
+        if tier['vmag_min'] is not None and tier['vmag_min'] >= vmag_limit:
+            break
+        rows = _tile_cache['rows'].get(tier['file'])
+        if rows is None:
+            rows = np.load(os.path.join(tile_dir, tier['file']), mmap_mode='r')
+            _tile_cache['rows'][tier['file']] = rows
+        offsets = tier['region_offsets']
+        if regions is None:
+            slices = [slice(0, offsets[-1])]
+        else:
+            slices = [slice(offsets[r], offsets[r + 1]) for r in sorted(set(regions))]
+        for sl in slices:
+            xyz.append(np.asarray(rows['xyz'][sl], dtype=float))
+            vmag.append(np.asarray(rows['vmag'][sl], dtype=float))
+        if names:
+            tier_names = _tile_cache['names'].get(tier['names_file'])
+            if tier_names is None:
+                with open(os.path.join(tile_dir, tier['names_file']), 'r', encoding='utf-8') as f:
+                    tier_names = json.load(f)
+                _tile_cache['names'][tier['names_file']] = tier_names
+            for sl in slices:
+                designations.extend(tier_names[sl])
+
+    xyz = np.concatenate(xyz) if xyz else np.empty((0, 3))
+    vmag = np.concatenate(vmag) if vmag else np.empty(0)
+    keep = vmag <= vmag_limit
+    if names:
+        designations = [n for n, k in zip(designations, keep) if k]
+    return {'xyz': xyz[keep], 'vmag': vmag[keep], 'names': designations if names else None}
+
+
+def _sphere_stars(sphere_data, vmag_limit, names):
+    """
+    Stars for the background: from the JSON up to its own limit, from the
+    tiles beyond it (falling back to the JSON stars if none are built).
+    """
+    json_limit = sphere_data.get('meta', {}).get('vmag_limit', VMAG_LIMIT)
+    if vmag_limit > json_limit:
+        tiles = load_star_tiles(vmag_limit, names=names, tile_dir=TILE_DIR)
+        if tiles is not None:
+            return tiles
+        print(f"[STAR SPHERE] No star tiles in {TILE_DIR}; showing vmag <= {json_limit}.",
+              flush=True)
+        print(f"[STAR SPHERE] Run star_sphere_builder.py to build them.", flush=True)
+
+    stars = sphere_data.get('stars', [])
+    return {
+        'xyz': np.array([s[:3] for s in stars], dtype=float).reshape(-1, 3),
+        'vmag': np.array([s[3] for s in stars], dtype=float),
+        'names': [s[4] if len(s) > 4 else '' for s in stars] if names else None,
+    }
+
+
 def add_celestial_sphere_traces(fig, axis_range, show_stars, show_names,
                                  show_grid, show_labels,
-                                 show_constellation_names=False):
+                                 show_constellation_names=False,
+                                 vmag_limit=VMAG_LIMIT):
     """
     Add celestial sphere traces to a Plotly 3D figure.
 
@@ -714,6 +924,8 @@ def add_celestial_sphere_traces(fig, axis_range, show_stars, show_names,
         show_grid: bool -- Celestial Grid checkbox
         show_labels: bool -- Labels sub-checkbox (dense hover labels)
         show_constellation_names: bool -- Constellation Names sub-checkbox
+        vmag_limit: faintest star shown (Star Depth); beyond VMAG_LIMIT the
+            stars come from the magnitude tiles, names only if show_names
     """
     import plotly.graph_objects as go
 
@@ -725,16 +937,16 @@ def add_celestial_sphere_traces(fig, axis_range, show_stars, show_names,
 
     # ---- Star Background ----
     if show_stars:
-        stars = sphere_data.get('stars', [])
-        if stars:
-            sx = [s[0] * R for s in stars]
-            sy = [s[1] * R for s in stars]
-            sz = [s[2] * R for s in stars]
+        stars = _sphere_stars(sphere_data, vmag_limit, show_names)
+        if len(stars['xyz']):
+            sx = (stars['xyz'][:, 0] * R).tolist()
+            sy = (stars['xyz'][:, 1] * R).tolist()
+            sz = (stars['xyz'][:, 2] * R).tolist()
 
             # Hover: show designation if star names enabled, skip otherwise
             if show_names:
-                hover_texts = [s[4] if len(s) > 4 and s[4] else f'vmag {s[3]}'
-                               for s in stars]
+                hover_texts = [n if n else f'vmag {round(float(v), 2)}'
+                               for n, v in zip(stars['names'], stars['vmag'])]
                 hover_mode = '%{text}<extra></extra>'
                 hover_info = None  # use hovertemplate
             else:
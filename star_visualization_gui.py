@@ -11,6 +11,7 @@ Role: gui
 Domain: stars
 
 Module updated: April 2026 with Anthropic's Claude Opus 4.6
+Module updated: October 2026 (distance/magnitude properties read from star_properties_store)
 """
 # star_visualization_gui.py - Final version with enhanced pickle file support
 # This GUI reads the enhanced pickle files that contain both raw and calculated data
@@ -30,6 +31,7 @@ import re
 import webbrowser
 from typing import Dict, List, Optional
 from star_notes import unique_notes
+from star_properties_store import open_store, stored_count, store_dir_for
 import time
 import json
 import platform
@@ -106,11 +108,24 @@ class LazyStarPropertiesLoader:
         }
         self.file_stats = {}
         self._scan_files()
+
+    def _has_store(self, key):
+        return key in ('distance', 'magnitude') and \
+            os.path.isdir(store_dir_for(self.property_files[key]))
     
     def _scan_files(self):
         """Quick scan to get file stats without loading data."""
         for key, filename in self.property_files.items():
-            if os.path.exists(filename):
+            if self._has_store(key):
+                store_dir = store_dir_for(filename)
+                size_mb = sum(os.path.getsize(os.path.join(store_dir, f))
+                              for f in os.listdir(store_dir)) / (1024 * 1024)
+                self.file_stats[key] = {
+                    'exists': True,
+                    'size_mb': size_mb,
+                    'filename': filename
+                }
+            elif os.path.exists(filename):
                 size_mb = os.path.getsize(filename) / (1024 * 1024)
                 self.file_stats[key] = {
                     'exists': True,
@@ -134,6 +149,16 @@ class LazyStarPropertiesLoader:
             return {}
         
         filename = self.property_files[property_type]
+        if self._has_store(property_type):
+            print(f"Loading {property_type} properties (first access)...")
+            try:
+                properties = open_store(filename)
+                self.loaded_properties[property_type] = properties
+                print(f"  Loaded {len(properties)} stars from {store_dir_for(filename)}")
+                return properties
+            except Exception as e:
+                print(f"Error loading {filename}: {e}")
+                return {}
         if not os.path.exists(filename):
             print(f"File not found: {filename}")
             return {}
@@ -167,6 +192,8 @@ class LazyStarPropertiesLoader:
         """Get count without loading data."""
         if property_type in self.loaded_properties:
             return len(self.loaded_properties[property_type])
+        if property_type in self.property_files and self._has_store(property_type):
+            return stored_count(self.property_files[property_type])
         
         # For quick GUI display, return estimate based on file size
         if property_type in self.file_stats and self.file_stats[property_type]['exists']:
@@ -231,7 +258,13 @@ class StarVisualizationSearchWidget(ttk.Frame):
         for data_type, category in [('distance', 'Stars by Distance'), 
                                     ('magnitude', 'Stars by Magnitude')]:
             filename = f'star_data/star_properties_{data_type}.pkl'
-            if os.path.exists(filename):
+            if os.path.isdir(store_dir_for(filename)):
+                try:
+                    names = open_store(filename).columns['star_name']
+                    self.star_data[category] = sorted(n for n in names if n is not None)
+                except Exception:
+                    self.star_data[category] = []
+            elif os.path.exists(filename):
                 try:
                     with open(filename, 'rb') as f:
                         data = pickle.load(f)
@@ -553,6 +586,16 @@ class StarVisualizationSearchWidget(ttk.Frame):
         }
         
         filename = file_map.get(category)
+        if filename and os.path.isdir(store_dir_for(filename)):
+            try:
+                store = open_store(filename)
+                rows = np.flatnonzero(store.columns['star_name'] == star_name)
+                if len(rows):
+                    uid = str(store.ids[rows[0]])
+                    return {'Star_Name': star_name, 'unique_id': uid, **store[uid]}
+            except Exception as e:
+                print(f"Error loading {star_name} from {filename}: {e}")
+            return {}
         if not filename or not os.path.exists(filename):
             return {}
         
@@ -0,0 +1,276 @@
+"""
+test_ast_index.py - Tests for the shared AST index.
+
+Builds a small project in a temporary folder and scans it with
+provenance_scanner, module_atlas and dep_trace. Checks that one scan
+parses each module once however many of the three tools read it, that a
+re-scan in a new process parses nothing and an edit re-parses only the
+edited file, that the findings and the collector diagnostics are the same
+from the index as from a fresh extraction, that a stored fact is dropped
+when its version or its file's content moves, and that files removed
+from the project leave the index on the next save.
+
+Needs no network access.
+
+Run from the project directory:
+    python test_ast_index.py
+
+Exits 0 if all tests pass, non-zero on any failure.
+
+Role: devtool
+Domain: dev_tools
+
+Module created: October 2026
+"""
+
+import ast
+import contextlib
+import io
+import os
+import pickle
+import sys
+import tempfile
+import traceback
+
+import ast_index
+import dep_trace
+import module_atlas
+import provenance_scanner as ps
+
+FILES = {
+    'constants_new.py': (
+        '"""Fixture constants.\n\nRole: data\nDomain: orrery\n"""\n\n'
+        '# Source: IUGG mean radius\n'
+        'EARTH_RADIUS_KM = 6371.0\n\n'
+        '# Source: IAU 2015 nominal\n'
+        'SUN_RADIUS_KM = 695700.0\n'),
+    'fixture_data.py': (
+        '"""Fixture catalog for the index tests.\n\nRole: data\nDomain: orrery\n"""\n\n'
+        'from constants_new import EARTH_RADIUS_KM\n\n'
+        'MOON_RADIUS_KM = 1737.4\n\n'
+        'PLANET_INFO = {\n'
+        "    'mass_kg': 5.97e24,\n"
+        "    'period_days': 365.25,\n"
+        '}\n\n'
+        "MOON_NOTE = 'The Moon orbits 384,400 km from Earth every 27.3 days.'\n\n"
+        '# Cross-checked: reviewer, 2026-10-01, worksheet-7\n\n'
+        'def local_radius():\n'
+        '    EARTH_RADIUS_KM = 6371.0\n'
+        '    SUN_RATIO = 695700.0 / 6371.0\n'
+        '    return EARTH_RADIUS_KM, SUN_RATIO\n'),
+    'fixture_tool.py': (
+        '"""Fixture tool that reads the catalog.\n\nRole: devtool\nDomain: dev_tools\n"""\n\n'
+        'import fixture_data\n'
+        'from fixture_data import MOON_RADIUS_KM, PLANET_INFO\n\n\n'
+        'def report():\n'
+        '    """Print the radius."""\n'
+        '    return MOON_RADIUS_KM\n'),
+    'fixture_broken.py': 'def broken(:\n',
+}
+
+
+@contextlib.contextmanager
+def _project():
+    """Temporary project; the index registry is restored afterwards."""
+    saved = dict(ast_index._INDEXES), dict(ast_index._CODE_VERSIONS)
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, text in FILES.items():
+            with open(os.path.join(tmp, name), 'w', encoding='utf-8') as handle:
+                handle.write(text)
+        try:
+            yield tmp
+        finally:
+            ast_index._INDEXES.clear()
+            ast_index._INDEXES.update(saved[0])
+            ast_index._CODE_VERSIONS.clear()
+            ast_index._CODE_VERSIONS.update(saved[1])
+
+
+def _new_process():
+    """Forget every in-memory index, as a fresh interpreter would."""
+    ast_index._INDEXES.clear()
+
+
+@contextlib.contextmanager
+def _counting_parses():
+    """Record each parse of a fixture file (the tools' own code is not counted)."""
+    parsed = []
+    real = ast.parse
+    fixtures = [text.encode('utf-8') for text in FILES.values()]
+
+    def counting(source, *args, **kwargs):
+        if any(source.startswith(text) for text in fixtures):
+            parsed.append(source)
+        return real(source, *args, **kwargs)
+
+    ast.parse = counting
+    try:
+        yield parsed
+    finally:
+        ast.parse = real
+
+
+def _scan(tmp):
+    with contextlib.redirect_stdout(io.StringIO()):
+        units = ps.scan_project(tmp, os.path.join(tmp, 'AUDIT.md'))[0]
+    collected = [list(c) for c in (ps.SCOPE_DECLARED_BLOCKS, ps.SHADOWED_STRINGS,
+                                   ps.DEEP_CITATIONS, ps.ORPHAN_ANNOTATIONS,
+                                   ps.SHADOW_CONSTANTS)]
+    return [(u.file, u.kind, u.name, u.line_start, u.score) for u in units], collected
+
+
+# ============================================================
+# Parsing
+# ============================================================
+
+def test_one_parse_per_module_across_tools():
+    """Scanner, atlas and dep_trace in one process parse each file once."""
+    with _project() as tmp:
+        _new_process()
+        with _counting_parses() as parsed:
+            _scan(tmp)
+            with contextlib.redirect_stdout(io.StringIO()):
+                modules = module_atlas.scan_modules(tmp)
+            deps, _, _ = dep_trace.build_graph(tmp)
+        assert len(parsed) == len(FILES)
+        assert deps['fixture_tool'] == {'fixture_data'}
+        tool = [m for m in modules if m['name'] == 'fixture_tool'][0]
+        assert tool['deps'] == ['fixture_data'] and tool['role'] == 'devtool'
+        assert tool['functions'] == [('report()', 'Print the radius.', 11)]
+
+
+def test_rescan_parses_only_edited_file():
+    """A new process parses nothing; after one edit it parses that file."""
+    with _project() as tmp:
+        _new_process()
+        first = _scan(tmp)
+        _new_process()
+        with _counting_parses() as parsed:
+            again = _scan(tmp)
+        assert again == first
+        assert parsed == []
+        with open(os.path.join(tmp, 'fixture_tool.py'), 'a') as handle:
+            handle.write('\nEXTRA_LIMIT_KM = 42.0\n')
+        _new_process()
+        with _counting_parses() as parsed:
+            edited = _scan(tmp)
+        assert len(parsed) == 1 and b'EXTRA_LIMIT_KM' in parsed[0]
+        assert len(edited[0]) == len(first[0]) + 1
+
+
+# ============================================================
+# Same findings
+# ============================================================
+
+def test_indexed_scan_matches_fresh_extraction():
+    """Units and collector entries from the index equal a direct extraction."""
+    with _project() as tmp:
+        _new_process()
+        cold = _scan(tmp)
+        _new_process()
+        warm = _scan(tmp)
+        assert warm == cold
+        path = os.path.join(tmp, 'fixture_data.py')
+        del ps.ORPHAN_ANNOTATIONS[:]
+        direct = ps.extract_units_from_file(path, 'fixture_data', 'data')
+        from_index = ps.indexed_units(path, 'fixture_data', 'data')
+        fields = [[getattr(u, k) for k in ps.ProvenanceUnit.__slots__] for u in direct]
+        assert fields == [[getattr(u, k) for k in ps.ProvenanceUnit.__slots__]
+                          for u in from_index]
+        assert [entry[2] for entry in cold[1][4]] == ['EARTH_RADIUS_KM', 'SUN_RATIO']
+        assert len(cold[1][3]) == 1
+
+
+def test_scoring_does_not_touch_stored_units():
+    """Units handed out are copies; mutating them leaves the index alone."""
+    with _project() as tmp:
+        _new_process()
+        ast_index.open_index(tmp)
+        path = os.path.join(tmp, 'fixture_data.py')
+        units = ps.indexed_units(path, 'fixture_data', 'data')
+        units[0].consumers.add('someone')
+        units[0].score = 99
+        again = ps.indexed_units(path, 'fixture_data', 'data')
+        assert again[0].consumers == set() and again[0].score is None
+
+
+# ============================================================
+# Invalidation and persistence
+# ============================================================
+
+def test_version_and_content_invalidate():
+    """A new version or new content recomputes; otherwise the fact is reused."""
+    with _project() as tmp:
+        _new_process()
+        index = ast_index.open_index(tmp)
+        path = os.path.join(tmp, 'fixture_tool.py')
+        calls = []
+
+        def count_lines(src):
+            calls.append(1)
+            return len(src.lines)
+
+        assert index.fact(path, 'n', count_lines, 'v1') == 13
+        index.fact(path, 'n', count_lines, 'v1')
+        assert len(calls) == 1
+        index.fact(path, 'n', count_lines, 'v2')
+        assert len(calls) == 2
+        with open(path, 'a') as handle:
+            handle.write('# more\n')
+        assert index.fact(path, 'n', count_lines, 'v2') == 14 and len(calls) == 3
+
+
+def test_save_drops_removed_files_and_other_pythons():
+    """Removed files leave the saved index; another interpreter's index is ignored."""
+    with _project() as tmp:
+        _new_process()
+        _scan(tmp)
+        stored_path = os.path.join(tmp, ast_index.INDEX_PATH)
+        with open(stored_path, 'rb') as handle:
+            assert 'fixture_tool.py' in pickle.load(handle)['files']
+        os.remove(os.path.join(tmp, 'fixture_tool.py'))
+        assert ast_index.open_index(tmp).save()
+        with open(stored_path, 'rb') as handle:
+            stored = pickle.load(handle)
+        assert 'fixture_tool.py' not in stored['files']
+        stored['python'] = 'another interpreter'
+        with open(stored_path, 'wb') as handle:
+            pickle.dump(stored, handle)
+        _new_process()
+        assert ast_index.open_index(tmp)._files == {}
+
+
+# ============================================================
+# Test runner
+# ============================================================
+
+def _collect_tests():
+    """Find every module-level function whose name starts with 'test_'."""
+    import inspect
+    tests = []
+    current_module = sys.modules[__name__]
+    for name, obj in inspect.getmembers(current_module):
+        if name.startswith('test_') and inspect.isfunction(obj):
+            tests.append((name, obj))
+    tests.sort(key=lambda pair: inspect.getsourcelines(pair[1])[1])
+    return tests
+
+
+def main():
+    """Run all tests. Print summary. Exit non-zero on any failure."""
+    tests = _collect_tests()
+    failures = []
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"  PASS  {name}")
+        except Exception as e:
+            failures.append((name, f"{type(e).__name__}: {e}"))
+            print(f"  FAIL  {name}")
+            traceback.print_exc()
+    print(f"\n{len(tests) - len(failures)} of {len(tests)} ast index tests passed.")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
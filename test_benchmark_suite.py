@@ -0,0 +1,177 @@
+"""
+test_benchmark_suite.py - Tests for the offline benchmark suite.
+
+Checks that every hot-path group is registered, that selection rejects
+unknown names, that the fixtures are deterministic and a recorded file
+under the expected name is left alone, that a run refuses network access
+and records failures rather than aborting, that results survive the JSON
+round trip, and that the comparison flags only regressions above both the
+ratio threshold and the noise floor.
+
+Run from the project directory:
+    python test_benchmark_suite.py
+
+Exits 0 if all tests pass, non-zero on any failure.
+
+Role: devtool
+Domain: dev_tools
+
+Module created: October 2026
+"""
+
+import os
+import socket
+import sys
+import tempfile
+import time
+import traceback
+
+import benchmark_suite as bs
+
+
+def _results(**medians):
+    return {'version': bs.RESULTS_VERSION, 'commit': 'abc1234', 'date': '2026-10-18T12:00:00',
+            'benchmarks': {name.replace('__', '/'): {'group': 'g', 'best_s': m, 'median_s': m,
+                                                     'runs': [m]}
+                           for name, m in medians.items()}}
+
+
+# ============================================================
+# Registry and fixtures
+# ============================================================
+
+def test_all_hot_paths_registered():
+    """Cache, trajectory, orbits, shells, animation, html and stars are covered."""
+    groups = {b.group for b in bs.BENCHMARKS.values()}
+    assert groups == {'cache', 'trajectory', 'orbits', 'shells', 'animation', 'html', 'stars'}
+    assert [b.name for b in bs.select(['cache'])] == ['cache/orbit_load', 'cache/orbit_save']
+    assert [b.name for b in bs.select(['stars/tiles_load'])] == ['stars/tiles_load']
+    try:
+        bs.select(['cache', 'nope'])
+    except ValueError as e:
+        assert 'nope' in str(e)
+    else:
+        raise AssertionError("unknown benchmark accepted")
+
+
+def test_fixtures_deterministic_and_recorded_kept():
+    """Two fixture directories hold identical files; a recorded cache is not replaced."""
+    with tempfile.TemporaryDirectory() as a, tempfile.TemporaryDirectory() as b:
+        paths = [bs.Fixtures(d, orbits=3, days=20, stars=50).orbit_paths() for d in (a, b)]
+        contents = []
+        for path in paths:
+            with open(path, 'rb') as f:
+                contents.append(f.read())
+        assert contents[0] == contents[1]
+
+        with open(os.path.join(b, bs.PROPERTIES_FILE), 'wb') as f:
+            f.write(b'recorded')
+        fixtures = bs.Fixtures(b, stars=50)
+        with open(fixtures.star_properties(), 'rb') as f:
+            assert f.read() == b'recorded'
+
+
+# ============================================================
+# Running
+# ============================================================
+
+def test_run_offline_records_times_and_errors():
+    """A run times what it can, blocks connects and records a failing stage."""
+    @bs.benchmark('probe')
+    def bench_connect(fixtures):
+        """Tries to reach the network."""
+        return lambda: socket.create_connection(('127.0.0.1', 9), timeout=1)
+
+    connect = socket.socket.connect
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            results = bs.run(['trajectory/plotting_arrays', 'probe'], repeat=2, fixtures_dir=tmp)
+    finally:
+        del bs.BENCHMARKS['probe/connect']
+    entry = results['benchmarks']['trajectory/plotting_arrays']
+    assert len(entry['runs']) == 2 and entry['best_s'] <= entry['median_s']
+    assert 'network disabled' in results['benchmarks']['probe/connect']['error']
+    assert socket.socket.connect is connect
+
+
+def test_results_round_trip():
+    """save_results / load_results keep the numbers; 'latest' finds the newest file."""
+    with tempfile.TemporaryDirectory() as tmp:
+        saved_dir = bs.RESULTS_DIR
+        bs.RESULTS_DIR = tmp
+        try:
+            path = bs.save_results(_results(cache__orbit_load=0.05))
+            assert os.path.dirname(path) == tmp and path.endswith('_abc1234.json')
+            loaded = bs.load_results('latest')
+        finally:
+            bs.RESULTS_DIR = saved_dir
+        assert loaded['benchmarks']['cache/orbit_load']['median_s'] == 0.05
+
+
+# ============================================================
+# Comparison
+# ============================================================
+
+def test_compare_threshold_and_noise_floor():
+    """Only slower-by-ratio-and-by-time counts; new and missing benchmarks are listed."""
+    baseline = _results(a__slow=0.100, a__noise=0.0010, a__fast=0.100, a__same=0.100, a__gone=1.0)
+    current = _results(a__slow=0.140, a__noise=0.0020, a__fast=0.050, a__same=0.110, a__new=0.3)
+    status = {row['name']: row['status'] for row in bs.compare(current, baseline, 1.25)}
+    assert status == {'a/slow': 'regression', 'a/noise': 'ok', 'a/fast': 'improved',
+                      'a/same': 'ok', 'a/new': 'new', 'a/gone': 'missing'}
+    assert bs.compare(current, baseline, 1.5)[0]['status'] == 'ok'
+
+
+def test_main_exit_code_on_regression():
+    """--compare exits 1 when a benchmark regressed against the baseline."""
+    @bs.benchmark('probe')
+    def bench_sleep(fixtures):
+        """Takes 10 ms."""
+        return lambda: time.sleep(0.01)
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            fast_base = bs.save_results(_results(probe__sleep=1e-4), os.path.join(tmp, 'fast.json'))
+            slow_base = bs.save_results(_results(probe__sleep=10.0), os.path.join(tmp, 'slow.json'))
+            args = ['--only', 'probe', '--repeat', '1', '--fixtures', tmp]
+            assert bs.main(args + ['--compare', fast_base]) == 1
+            assert bs.main(args + ['--compare', slow_base]) == 0
+            assert bs.main(args + ['--compare', os.path.join(tmp, 'missing.json')]) == 2
+    finally:
+        del bs.BENCHMARKS['probe/sleep']
+
+
+# ============================================================
+# Test runner
+# ============================================================
+
+def _collect_tests():
+    """Find every module-level function whose name starts with 'test_'."""
+    import inspect
+    tests = []
+    current_module = sys.modules[__name__]
+    for name, obj in inspect.getmembers(current_module):
+        if name.startswith('test_') and inspect.isfunction(obj):
+            tests.append((name, obj))
+    tests.sort(key=lambda pair: inspect.getsourcelines(pair[1])[1])
+    return tests
+
+
+def main():
+    """Run all tests. Print summary. Exit non-zero on any failure."""
+    tests = _collect_tests()
+    failures = []
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"  PASS  {name}")
+        except Exception as e:
+            failures.append((name, f"{type(e).__name__}: {e}"))
+            print(f"  FAIL  {name}")
+            traceback.print_exc()
+    print(f"\n{len(tests) - len(failures)} of {len(tests)} benchmark suite tests passed.")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,166 @@
+"""
+test_camera_waypoints.py - Tests for the shared look-at / fly-to camera table.
+
+The look-at and fly-to dropdowns in visualization_utils keep one waypoint
+table on the figure and give each button only ('look' | 'fly', index);
+save_utils injects the script that turns an index back into a relayout.
+These tests check that both menus share one table, that every button
+index resolves to its target, that the layout stays small for a crowded
+scene, and that the script is written only when the table exists.
+
+Run from the project directory:
+    python test_camera_waypoints.py
+
+Exits 0 if all tests pass, non-zero on any failure.
+
+Role: devtool
+Domain: dev_tools
+
+Module created: October 2026
+"""
+
+import json
+import math
+import os
+import sys
+import tempfile
+import traceback
+
+import plotly.graph_objects as go
+
+import save_utils
+
+# idealized_orbits (imported by visualization_utils) re-wraps sys.stdout in a
+# UTF-8 TextIOWrapper at import time. Under pytest's capture that wrapper
+# would close the capture buffer when collected, so put the original stream
+# back and detach the wrapper from it.
+_stdout = sys.stdout
+import visualization_utils as vu
+if sys.stdout is not _stdout:
+    sys.stdout.detach()
+    sys.stdout = _stdout
+
+
+def _scene(n_objects):
+    """Figure with fixed axis ranges and n_objects spread along a spiral."""
+    fig = go.Figure()
+    fig.update_layout(scene=dict(xaxis=dict(range=[-40, 40]),
+                                 yaxis=dict(range=[-40, 40]),
+                                 zaxis=dict(range=[-40, 40])))
+    positions = {'Sun': {'x': 0.0, 'y': 0.0, 'z': 0.0}}
+    for i in range(n_objects):
+        r = 0.4 + 0.6 * i
+        positions[f'Body {i}'] = {'x': r * math.cos(i), 'y': r * math.sin(i), 'z': 0.02 * r}
+    return fig, positions
+
+
+def _with_buttons(n_objects):
+    fig, positions = _scene(n_objects)
+    fig = vu.add_look_at_object_buttons(fig, positions, 'Sun')
+    fig = vu.add_fly_to_object_buttons(fig, positions, 'Sun')
+    return fig, positions
+
+
+# ============================================================
+# Shared table
+# ============================================================
+
+def test_menus_share_one_table():
+    """Each target gets one waypoint, referenced by both dropdowns."""
+    fig, positions = _with_buttons(12)
+    store = fig._camera_waypoints
+    assert len(store['names']) == 12
+    assert len(store['xyz']) == 3 * 12
+    look, fly = fig.layout.updatemenus
+    look_idx = {b.args[1] for b in look.buttons if b.args[1] >= 0}
+    fly_idx = {b.args[1] for b in fly.buttons if b.args[1] >= 0}
+    assert look_idx == fly_idx == set(range(12))
+
+
+def test_button_index_resolves_to_target():
+    """A button's waypoint holds its target's position and fly window."""
+    fig, positions = _with_buttons(8)
+    store = fig._camera_waypoints
+    for menu in fig.layout.updatemenus:
+        for button in menu.buttons:
+            assert button.method == 'skip'
+            mode, k = button.args
+            assert mode in ('look', 'fly')
+            if k < 0:
+                continue
+            name = store['names'][k]
+            assert name in button.label
+            p = positions[name]
+            assert store['xyz'][3 * k:3 * k + 3] == [p['x'], p['y'], p['z']]
+            assert store['flyR'][k] > 0
+            assert store['dtick'][k] == vu._calculate_grid_dtick(store['flyR'][k] * 2)
+    assert store['full']['ranges'] == [[-40, 40]] * 3
+    assert store['lookRanges'] == [[-40, 40]] * 3
+
+
+def test_layout_stays_small_with_many_targets():
+    """60 targets: the two dropdowns plus the table stay well under 20 KB."""
+    fig, _positions = _with_buttons(60)
+    menus = json.dumps(fig.layout.to_plotly_json()['updatemenus'])
+    block = save_utils._camera_waypoints_block(fig)
+    assert len(menus) < 15000, len(menus)
+    assert len(menus) + len(block) < 20000
+
+
+# ============================================================
+# Script injection
+# ============================================================
+
+def test_script_written_with_table_only():
+    """The HTML carries the waypoint script only when the table exists."""
+    fig, _positions = _with_buttons(3)
+    plain = go.Figure(go.Scatter3d(x=[0], y=[0], z=[0]))
+    with tempfile.TemporaryDirectory() as tmp:
+        with_path = os.path.join(tmp, 'with.html')
+        plain_path = os.path.join(tmp, 'plain.html')
+        save_utils._write_html(fig, with_path)
+        save_utils._write_html(plain, plain_path)
+        with open(with_path, encoding='utf-8') as f:
+            with_html = f.read()
+        with open(plain_path, encoding='utf-8') as f:
+            plain_html = f.read()
+    assert with_html.count('CAMERA WAYPOINTS =====') == 2
+    assert 'plotly_buttonclicked' in with_html
+    assert 'CAMERA WAYPOINTS' not in plain_html
+    assert save_utils._inject_camera_waypoints(plain, '<body></body>') == '<body></body>'
+
+
+# ============================================================
+# Test runner
+# ============================================================
+
+def _collect_tests():
+    """Find every module-level function whose name starts with 'test_'."""
+    import inspect
+    tests = []
+    current_module = sys.modules[__name__]
+    for name, obj in inspect.getmembers(current_module):
+        if name.startswith('test_') and inspect.isfunction(obj):
+            tests.append((name, obj))
+    tests.sort(key=lambda pair: inspect.getsourcelines(pair[1])[1])
+    return tests
+
+
+def main():
+    """Run all tests. Print summary. Exit non-zero on any failure."""
+    tests = _collect_tests()
+    failures = []
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"  PASS  {name}")
+        except Exception as e:
+            failures.append((name, f"{type(e).__name__}: {e}"))
+            print(f"  FAIL  {name}")
+            traceback.print_exc()
+    print(f"\n{len(tests) - len(failures)} of {len(tests)} camera waypoint tests passed.")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
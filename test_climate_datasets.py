@@ -0,0 +1,214 @@
+"""
+test_climate_datasets.py - Tests for the shared climate dataset layer.
+
+Writes small GISS, Holocene and Scotese sources to a temporary directory
+and checks that climate_datasets parses each one once, serves the same
+values the per-figure loaders computed, reuses its binary cache across
+sessions, re-parses a changed source but not a merely touched one, and
+falls back to the source when the cache is unreadable.
+
+Run from the project directory:
+    python test_climate_datasets.py
+
+Exits 0 if all tests pass, non-zero on any failure.
+
+Role: devtool
+Domain: dev_tools
+
+Module created: October 2026
+"""
+
+import json
+import os
+import sys
+import tempfile
+import traceback
+
+import numpy as np
+
+import climate_datasets as cd
+
+
+def _giss(tmp, shift=0.0):
+    records = []
+    for year in (1880, 1881, 1882):
+        for month in range(1, 13):
+            value = round(0.01 * month - 0.2 + shift, 2)
+            if year == 1881 or (year == 1882 and month > 6):
+                value = None                  # 1881 has no valid month at all
+            records.append({'year': year, 'month': month, 'anomaly_c': value})
+    path = os.path.join(tmp, 'giss.json')
+    with open(path, 'w') as f:
+        json.dump({'metadata': {}, 'data': records}, f)
+    return path, records
+
+
+def _holocene(tmp, ages=(0, 100, 200, 300)):
+    path = os.path.join(tmp, 'holocene.csv')
+    with open(path, 'w') as f:
+        f.write('ages, global_5, global_median, global_95\n')
+        for i, age in enumerate(ages):
+            f.write(f"{age},{i - 1.0},{0.1 * i},{i + 1.0}\n")
+    return path
+
+
+class _Sandbox:
+    """Point DATASETS and CACHE_DIR at a temp dir; count parser calls."""
+    def __init__(self, tmp, **sources):
+        self.tmp = tmp
+        self.sources = sources
+        self.calls = {}
+
+    def __enter__(self):
+        self.saved = (dict(cd.DATASETS), cd.CACHE_DIR)
+        cd.CACHE_DIR = os.path.join(self.tmp, 'parsed_cache')
+        for name, path in self.sources.items():
+            parser = cd.DATASETS[name][1]
+
+            def counted(p, _parser=parser, _name=name):
+                self.calls[_name] = self.calls.get(_name, 0) + 1
+                return _parser(p)
+            cd.DATASETS[name] = (path, counted)
+        cd._memo.clear()
+        return self
+
+    def __exit__(self, *exc):
+        cd.DATASETS.clear()
+        cd.DATASETS.update(self.saved[0])
+        cd.CACHE_DIR = self.saved[1]
+        cd._memo.clear()
+
+
+# ============================================================
+# Values
+# ============================================================
+
+def test_giss_annual_matches_per_year_loop():
+    """Annual means equal the old loop's, years with no valid month dropped."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path, records = _giss(tmp)
+        with _Sandbox(tmp, giss=path):
+            ages, temps = cd.load_modern_temperature_data()
+
+    years, want = [], []
+    for record in records:
+        year = record['year']
+        if year not in years:
+            years.append(year)
+            year_temps = [r['anomaly_c'] for r in records
+                          if r['year'] == year and r['anomaly_c'] is not None]
+            if year_temps:
+                want.append(np.mean(year_temps))
+            else:
+                years.pop()
+    assert temps == want
+    assert ages == [(2025 - y) / 1_000_000 for y in years]
+
+
+def test_preindustrial_offset():
+    """Mean over 75-175 years BP; nearest point to 100 BP when none fall there."""
+    with tempfile.TemporaryDirectory() as tmp:
+        with _Sandbox(tmp, holocene=_holocene(tmp)):
+            data = cd.load_holocene_data()
+            assert np.isclose(cd.calculate_preindustrial_offset(data), 0.1)
+            assert not data['temp_median'].flags.writeable
+        with _Sandbox(tmp, holocene=_holocene(tmp, ages=(0, 60, 250))):
+            assert cd.calculate_preindustrial_offset(cd.load_holocene_data()) == 0.1
+    assert cd.calculate_preindustrial_offset(None) == 0.0
+
+
+# ============================================================
+# Caching
+# ============================================================
+
+def test_parsed_once_and_cached_across_sessions():
+    """Repeat loads hit memory; a new session reads the .npz, not the source."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path, _ = _giss(tmp)
+        with _Sandbox(tmp, giss=path) as box:
+            first = cd.load_dataset('giss')
+            assert cd.load_dataset('giss') is first
+            assert os.path.exists(cd.cache_paths('giss')['arrays'])
+            cd._memo.clear()
+            again = cd.load_dataset('giss')
+            assert box.calls == {'giss': 1}
+            assert np.array_equal(again['annual_mean'], first['annual_mean'])
+
+
+def test_changed_source_reparsed_touched_source_not():
+    """New bytes re-parse; same bytes with a new mtime keep the cache."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path, _ = _giss(tmp)
+        with _Sandbox(tmp, giss=path) as box:
+            cd.load_dataset('giss')
+            st = os.stat(path)
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+            cd._memo.clear()
+            cd.load_dataset('giss')
+            assert box.calls == {'giss': 1}
+            with open(cd.cache_paths('giss')['manifest']) as f:
+                assert json.load(f)['source_mtime_ns'] == os.stat(path).st_mtime_ns
+
+            _giss(tmp, shift=0.5)
+            data = cd.load_dataset('giss')
+            assert box.calls == {'giss': 2}
+            assert np.isclose(data['anomaly_c'][0], -0.19 + 0.5)
+
+
+def test_corrupt_cache_falls_back_to_source():
+    """An unreadable .npz is ignored and the source parsed again."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path, _ = _giss(tmp)
+        with _Sandbox(tmp, giss=path) as box:
+            want = cd.load_dataset('giss')['annual_mean'].copy()
+            with open(cd.cache_paths('giss')['arrays'], 'wb') as f:
+                f.write(b'not numpy')
+            cd._memo.clear()
+            assert np.array_equal(cd.load_dataset('giss')['annual_mean'], want)
+            assert box.calls == {'giss': 2}
+
+
+def test_missing_source():
+    """A missing source is None from load_dataset and a warning from the loaders."""
+    with tempfile.TemporaryDirectory() as tmp:
+        missing = os.path.join(tmp, 'nope.csv')
+        with _Sandbox(tmp, scotese=missing, giss=missing):
+            assert cd.load_dataset('scotese') is None
+            assert cd.load_scotese_phanerozoic_data() is None
+            assert cd.load_modern_temperature_data() == (None, None)
+
+
+# ============================================================
+# Test runner
+# ============================================================
+
+def _collect_tests():
+    """Find every module-level function whose name starts with 'test_'."""
+    import inspect
+    tests = []
+    current_module = sys.modules[__name__]
+    for name, obj in inspect.getmembers(current_module):
+        if name.startswith('test_') and inspect.isfunction(obj):
+            tests.append((name, obj))
+    tests.sort(key=lambda pair: inspect.getsourcelines(pair[1])[1])
+    return tests
+
+
+def main():
+    """Run all tests. Print summary. Exit non-zero on any failure."""
+    tests = _collect_tests()
+    failures = []
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"  PASS  {name}")
+        except Exception as e:
+            failures.append((name, f"{type(e).__name__}: {e}"))
+            print(f"  FAIL  {name}")
+            traceback.print_exc()
+    print(f"\n{len(tests) - len(failures)} of {len(tests)} climate dataset tests passed.")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,267 @@
+"""
+test_climate_refresh.py - Tests for the concurrent climate cache refresh.
+
+Serves small NOAA CO2 and GISS temperature files from a local HTTP
+fixture server (with ETag / Last-Modified and 304 handling) and checks
+that climate_refresh stores the validators, answers an unchanged source
+with a single conditional request and no write, appends only new months,
+applies revised values without dropping months the download lacks, falls
+back through a source's URLs, fetches sources concurrently, and leaves a
+cache intact when its source fails.
+
+Needs no network access.
+
+Run from the project directory:
+    python test_climate_refresh.py
+
+Exits 0 if all tests pass, non-zero on any failure.
+
+Role: devtool
+Domain: dev_tools
+
+Module created: October 2026
+"""
+
+import dataclasses
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import climate_refresh as cr
+
+
+def _co2_text(months):
+    lines = ["# NOAA GML Mauna Loa CO2 (fixture)"]
+    for year, month, ppm in months:
+        lines.append(f"{year} {month} {year + (month - 0.5) / 12:.4f} {ppm:.2f} "
+                     f"{ppm - 0.3:.2f} 25 0.40 0.15")
+    return '\n'.join(lines) + '\n'
+
+
+def _giss_text(rows):
+    lines = ["GLOBAL Land-Ocean Temperature Index (fixture)",
+             "Year   Jan  Feb  Mar  Apr  May  Jun  Jul  Aug  Sep  Oct  Nov  Dec"]
+    for year, values in rows:
+        lines.append(' '.join([str(year)] + values))
+    return '\n'.join(lines) + '\n'
+
+
+class _Fixture:
+    """A local HTTP server: path -> body, with an ETag per body and request counts."""
+    def __init__(self):
+        self.files = {}
+        self.hits = {}
+        self.delay = 0.0
+        fixture = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                fixture.hits[self.path] = fixture.hits.get(self.path, 0) + 1
+                time.sleep(fixture.delay)
+                if self.path not in fixture.files:
+                    self.send_error(404)
+                    return
+                body, etag = fixture.files[self.path]
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('ETag', etag)
+                self.send_header('Last-Modified', 'Sat, 17 Oct 2026 12:00:00 GMT')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.base = f"http://127.0.0.1:{self.server.server_port}"
+
+    def serve(self, path, text):
+        self.files[path] = (text.encode(), f'"{hash(text) & 0xffffffff:x}"')
+        return self.base + path
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _co2_source(tmp, *urls):
+    source = next(s for s in cr.default_sources() if s.name == 'co2')
+    return dataclasses.replace(source, urls=list(urls),
+                               output_file=os.path.join(tmp, 'co2.json'))
+
+
+def _giss_source(tmp, *urls):
+    source = next(s for s in cr.default_sources() if s.name == 'temperature')
+    return dataclasses.replace(source, urls=list(urls),
+                               output_file=os.path.join(tmp, 'giss.json'))
+
+
+def _cache(source):
+    with open(source.output_file) as f:
+        return json.load(f)
+
+
+CO2 = [(2026, 1, 426.10), (2026, 2, 427.00), (2026, 3, 427.85)]
+
+
+# ============================================================
+# Conditional requests
+# ============================================================
+
+def test_first_fetch_stores_validators():
+    """A cold cache is written with the server's ETag and Last-Modified."""
+    with tempfile.TemporaryDirectory() as tmp, _Fixture() as server:
+        source = _co2_source(tmp, server.serve('/co2.txt', _co2_text(CO2)))
+        result = cr.refresh_source(source)
+        assert result.status == 'updated' and result.added == 3 and result.records == 3
+        cached = _cache(source)
+        assert [r['co2_ppm'] for r in cached['data']] == [426.10, 427.00, 427.85]
+        http = cached['metadata']['http']
+        assert http['etag'] == server.files['/co2.txt'][1]
+        assert http['last_modified'] == 'Sat, 17 Oct 2026 12:00:00 GMT'
+        assert cached['metadata']['record_count'] == 3
+
+
+def test_unchanged_source_one_request_no_write():
+    """A 304 answer leaves the cache file untouched."""
+    with tempfile.TemporaryDirectory() as tmp, _Fixture() as server:
+        source = _co2_source(tmp, server.serve('/co2.txt', _co2_text(CO2)))
+        cr.refresh_source(source)
+        before = os.stat(source.output_file).st_mtime_ns
+        server.hits.clear()
+
+        result = cr.refresh_source(source)
+        assert result.status == 'unchanged' and result.records == 3
+        assert result.latest['co2_ppm'] == 427.85
+        assert server.hits == {'/co2.txt': 1}
+        assert os.stat(source.output_file).st_mtime_ns == before
+        assert not os.path.exists(source.output_file + '.backup')
+
+
+# ============================================================
+# Merging
+# ============================================================
+
+def test_new_months_appended_missing_months_kept():
+    """Only new months are added; months absent from the download stay."""
+    with tempfile.TemporaryDirectory() as tmp, _Fixture() as server:
+        url = server.serve('/co2.txt', _co2_text(CO2))
+        source = _co2_source(tmp, url)
+        cr.refresh_source(source)
+
+        server.serve('/co2.txt', _co2_text(CO2[1:] + [(2026, 4, 429.20)]))
+        result = cr.refresh_source(source)
+        assert (result.status, result.added, result.revised) == ('updated', 1, 0)
+        months = [(r['year'], r['month']) for r in _cache(source)['data']]
+        assert months == [(2026, 1), (2026, 2), (2026, 3), (2026, 4)]
+        assert os.path.exists(source.output_file + '.backup')
+
+
+def test_revised_values_applied():
+    """GISS re-homogenisation: a changed month is updated in place."""
+    with tempfile.TemporaryDirectory() as tmp, _Fixture() as server:
+        year = ['120', '130', '118'] + ['***'] * 9
+        url = server.serve('/giss.txt', _giss_text([(2026, year)]))
+        source = _giss_source(tmp, url)
+        assert cr.refresh_source(source).added == 3
+
+        server.serve('/giss.txt', _giss_text([(2026, ['121', '130', '118', '115'] + ['***'] * 8)]))
+        result = cr.refresh_source(source)
+        assert (result.added, result.revised, result.records) == (1, 1, 4)
+        anomalies = [r['anomaly_c'] for r in _cache(source)['data']]
+        assert anomalies == [1.21, 1.30, 1.18, 1.15]
+
+
+def test_merge_records_unit():
+    """merge_records orders by (year, month) and reports counts."""
+    cached = [{'year': 2000, 'month': 2, 'v': 1}, {'year': 2000, 'month': 3, 'v': 1}]
+    fresh = [{'year': 2000, 'month': 1, 'v': 0}, {'year': 2000, 'month': 3, 'v': 2}]
+    merged, added, revised = cr.merge_records(cached, fresh)
+    assert (added, revised) == (1, 1)
+    assert [(r['month'], r['v']) for r in merged] == [(1, 0), (2, 1), (3, 2)]
+
+
+# ============================================================
+# Failures and concurrency
+# ============================================================
+
+def test_fallback_url_and_failed_source_keeps_cache():
+    """A 404 falls through to the next URL; all URLs failing changes nothing."""
+    with tempfile.TemporaryDirectory() as tmp, _Fixture() as server:
+        good = server.serve('/co2.txt', _co2_text(CO2))
+        source = _co2_source(tmp, server.base + '/missing.txt', good)
+        assert cr.refresh_source(source).records == 3
+        with open(source.output_file, 'rb') as f:
+            before = f.read()
+
+        broken = dataclasses.replace(source, urls=[server.base + '/missing.txt'])
+        result = cr.refresh_source(broken)
+        assert result.status == 'failed' and not result.success and '404' in result.error
+        with open(source.output_file, 'rb') as f:
+            assert f.read() == before
+
+
+def test_sources_fetched_concurrently():
+    """Two slow sources finish in about the time of one; results keep source order."""
+    with tempfile.TemporaryDirectory() as tmp, _Fixture() as server:
+        server.delay = 0.4
+        sources = [_giss_source(tmp, server.serve('/giss.txt', _giss_text([(2026, ['120'] * 12)]))),
+                   _co2_source(tmp, server.serve('/co2.txt', _co2_text(CO2)))]
+        messages = []
+        start = time.perf_counter()
+        results = cr.refresh(sources, status_callback=messages.append)
+        elapsed = time.perf_counter() - start
+        assert [r.name for r in results] == ['temperature', 'co2']
+        assert all(r.status == 'updated' for r in results)
+        assert elapsed < 0.75, f"{elapsed:.2f} s"
+        assert len(messages) == 2 and all(m.startswith('[OK]') for m in messages)
+
+
+# ============================================================
+# Test runner
+# ============================================================
+
+def _collect_tests():
+    """Find every module-level function whose name starts with 'test_'."""
+    import inspect
+    tests = []
+    current_module = sys.modules[__name__]
+    for name, obj in inspect.getmembers(current_module):
+        if name.startswith('test_') and inspect.isfunction(obj):
+            tests.append((name, obj))
+    tests.sort(key=lambda pair: inspect.getsourcelines(pair[1])[1])
+    return tests
+
+
+def main():
+    """Run all tests. Print summary. Exit non-zero on any failure."""
+    tests = _collect_tests()
+    failures = []
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"  PASS  {name}")
+        except Exception as e:
+            failures.append((name, f"{type(e).__name__}: {e}"))
+            print(f"  FAIL  {name}")
+            traceback.print_exc()
+    print(f"\n{len(tests) - len(failures)} of {len(tests)} climate refresh tests passed.")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,298 @@
+"""
+test_close_approach_bulk.py - Tests for bulk CAD prefetch and the append-only cache.
+
+Points close_approach_data at a temporary cache directory and replaces the
+CAD API with a local stand-in that records every request. Checks that the
+legacy JSON cache is migrated once, that one bulk query answers many
+designations (including ones known by number, name or provisional
+designation, and ones with no approach), that windows and distances are
+only trusted when they cover the request, that a query expected to be
+large (a long window or a wide distance) falls back to per-object
+queries, that each fetch appends a line instead of rewriting the file,
+that records appended by another process are picked up, that compaction
+keeps only live records, and that prefetches over shifting date ranges
+merge into one window instead of piling up.
+
+Needs no network access.
+
+Run from the project directory:
+    python test_close_approach_bulk.py
+
+Exits 0 if all tests pass, non-zero on any failure.
+
+Role: devtool
+Domain: dev_tools
+
+Module created: October 2026
+"""
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import traceback
+import urllib.parse
+from pathlib import Path
+
+import close_approach_data as cad
+
+FIELDS = ['des', 'orbit_id', 'jd', 'cd', 'dist', 'dist_min', 'dist_max',
+          'v_rel', 'v_inf', 't_sigma_f', 'h', 'fullname']
+
+# (des, jd, date, dist_au, fullname) -- approaches to Earth in 2029
+ROWS = [
+    ('99942', 2462240.407, '2029-Apr-13 21:46', 0.000254, '    99942 Apophis (2004 MN4)'),
+    ('2024 YR4', 2462464.5, '2029-Nov-24 00:00', 0.0412, '           (2024 YR4)'),
+    ('2024 YR4', 2462299.5, '2029-Jun-12 00:00', 0.3100, '           (2024 YR4)'),
+    ('433', 2462199.5, '2029-Mar-04 00:00', 0.4500, '      433 Eros (A898 PA)'),
+]
+
+
+class _CAD:
+    """urlopen stand-in: answers from ROWS and records each query."""
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, url, timeout=None):
+        query = dict(urllib.parse.parse_qsl(urllib.parse.urlparse(url).query))
+        self.queries.append(query)
+        rows = [r for r in ROWS if r[3] <= float(query['dist-max'])]
+        if 'des' in query:
+            rows = [r for r in rows if query['des'] in (r[0], r[4].strip().strip('()'))
+                    or f"({query['des']})" in r[4]]
+        data = [[des, '1', str(jd), cd, str(dist), str(dist * 0.99), str(dist * 1.01),
+                 '7.4', '5.8', '< 00:01', '19.1', full]
+                for des, jd, cd, dist, full in rows]
+        body = json.dumps({'count': str(len(data)), 'fields': FIELDS, 'data': data})
+        return contextlib.closing(io.BytesIO(body.encode('utf-8')))
+
+
+# The stand-in's own rate: two of its approaches lie inside 0.05 AU in 2029.
+STAND_IN_RATES = {'Earth': 2}
+
+
+@contextlib.contextmanager
+def _setup(legacy=None, rates=STAND_IN_RATES):
+    """Temporary cache directory, fresh store, stand-in API; yields (api, log path).
+
+    rates replaces APPROACHES_PER_YEAR (None keeps the real estimates).
+    """
+    saved_path, saved_open = cad._get_cache_path, cad.urllib.request.urlopen
+    saved_rates = cad.APPROACHES_PER_YEAR
+    if rates is not None:
+        cad.APPROACHES_PER_YEAR = rates
+    api = _CAD()
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_path = Path(tmp) / cad.CAD_CACHE_FILENAME
+        if legacy is not None:
+            with open(legacy_path, 'w', encoding='utf-8') as f:
+                json.dump(legacy, f)
+        cad._get_cache_path = lambda: legacy_path
+        cad.urllib.request.urlopen = api
+        cad._reset_store()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                yield api, legacy_path.with_name(cad.CAD_LOG_FILENAME)
+        finally:
+            cad._get_cache_path, cad.urllib.request.urlopen = saved_path, saved_open
+            cad.APPROACHES_PER_YEAR = saved_rates
+            cad._reset_store()
+
+
+def _lines(path):
+    with open(path, 'rb') as f:
+        return f.read().splitlines()
+
+
+# ============================================================
+# Cache file
+# ============================================================
+
+def test_legacy_cache_migrated_once():
+    """Legacy entries are served from the log; the JSON file is left alone."""
+    legacy = {'close_approach:2004 MN4:Earth': {'designation': '2004 MN4', 'body': 'Earth',
+                                                'approaches': [{'jd': 1.0, 'dist_au': 0.1}]}}
+    with _setup(legacy) as (api, log):
+        assert cad.get_close_approaches('2004 MN4', 'Earth') == [{'jd': 1.0, 'dist_au': 0.1}]
+        assert len(_lines(log)) == 1 and not api.queries
+        cad._reset_store()
+        cad.get_close_approaches('2004 MN4', 'Earth')
+        assert len(_lines(log)) == 1
+        with open(log.with_name(cad.CAD_CACHE_FILENAME)) as f:
+            assert json.load(f) == legacy
+
+
+def test_fetch_appends_one_line():
+    """A per-object fetch appends a record; earlier bytes and no backups change."""
+    with _setup() as (api, log):
+        cad.get_close_approaches('2024 YR4', 'Earth', '2029-01-01', '2030-01-01')
+        with open(log, 'rb') as f:
+            before = f.read()
+        approaches = cad.get_close_approaches('433', 'Earth', '2029-01-01', '2030-01-01')
+        with open(log, 'rb') as f:
+            after = f.read()
+        assert after.startswith(before) and after.count(b'\n') == 2
+        assert [a['fullname'] for a in approaches] == ['433 Eros (A898 PA)']
+        assert sorted(p.name for p in log.parent.iterdir()) == [cad.CAD_LOG_FILENAME]
+
+
+def test_records_from_another_process_picked_up():
+    """A record appended to the log elsewhere is seen without a reload."""
+    with _setup() as (api, log):
+        cad.get_close_approaches('433', 'Earth', '2029-01-01', '2030-01-01')
+        record = {'kind': 'object', 'key': cad._cache_key('1999 RQ36', 'Earth'),
+                  'entry': {'approaches': [{'jd': 2.0, 'dist_au': 0.2}]}}
+        with open(log, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + '\n')
+        assert cad.get_close_approaches('1999 RQ36', 'Earth') == [{'jd': 2.0, 'dist_au': 0.2}]
+        assert len(api.queries) == 1
+
+
+def test_compaction_keeps_live_records():
+    """Superseded records trigger a rewrite holding only the latest of each."""
+    saved = cad.COMPACT_AFTER
+    cad.COMPACT_AFTER = 3
+    try:
+        with _setup() as (api, log):
+            for _ in range(3):
+                cad.get_close_approaches('433', 'Earth', '2029-01-01', '2030-01-01',
+                                         force_refresh=True)
+            cad.get_close_approaches('2024 YR4', 'Earth', '2029-01-01', '2030-01-01')
+            assert len(_lines(log)) == 4
+            cad.get_close_approaches('433', 'Earth', '2029-01-01', '2030-01-01',
+                                     force_refresh=True)
+            assert len(_lines(log)) == 2 and log.with_suffix('.jsonl.bak').exists()
+            cad._reset_store()
+            assert len(cad._load_cache()) == 2
+    finally:
+        cad.COMPACT_AFTER = saved
+
+
+# ============================================================
+# Bulk prefetch
+# ============================================================
+
+def test_one_query_covers_many_designations():
+    """Apophis by provisional designation, Eros by number, Bennu with none: one request."""
+    with _setup() as (api, log):
+        found = cad.prefetch_close_approaches(['2004 MN4', '2024 YR4', '433', '1999 RQ36'],
+                                              'Earth', '2029-01-01', '2030-01-01')
+        assert len(api.queries) == 1 and 'des' not in api.queries[0]
+        assert api.queries[0]['neo'] == 'false'
+        assert [a['date'] for a in found['2004 MN4']] == ['2029-Apr-13 21:46']
+        assert [a['date'] for a in found['2024 YR4']] == ['2029-Jun-12 00:00', '2029-Nov-24 00:00']
+        assert len(found['433']) == 1 and found['1999 RQ36'] == []
+
+        closest = cad.get_closest_approach('2004 MN4', 'Earth', '2029-04-01', '2029-04-30')
+        assert closest['dist_au'] == 0.000254
+        assert cad.get_close_approaches('1999 RQ36', 'Earth', '2029-06-01', '2029-07-01') == []
+        assert cad.get_close_approaches('Eros', 'Earth', '2029-01-01', '2030-01-01')[0]['jd'] == 2462199.5
+        # One window record, then one per-object entry per designation
+        assert len(api.queries) == 1 and len(_lines(log)) == 5
+        assert cad._cache_key('1999 RQ36', 'Earth') in cad._load_cache()
+
+
+def test_window_and_distance_must_cover():
+    """Dates outside the window, or a wider distance, go to a per-object query."""
+    with _setup() as (api, log):
+        cad.prefetch_close_approaches(['2004 MN4', '2024 YR4'], 'Earth',
+                                      '2029-01-01', '2030-01-01', dist_max='0.05')
+        assert cad.get_close_approaches('2024 YR4', 'Earth', '2029-06-01', '2029-12-31',
+                                        dist_max='0.05')[0]['dist_au'] == 0.0412
+        cad.get_close_approaches('2024 YR4', 'Earth', '2029-06-01', '2029-12-31')
+        cad.get_close_approaches('2004 MN4', 'Earth', '2028-06-01', '2029-12-31',
+                                 dist_max='0.05')
+        assert [('des' in q) for q in api.queries] == [False, True, True]
+
+
+def test_few_missing_skip_bulk():
+    """With one designation left to fetch, no bulk query is made."""
+    with _setup() as (api, log):
+        cad.get_close_approaches('2004 MN4', 'Earth', '2029-01-01', '2030-01-01')
+        found = cad.prefetch_close_approaches(['2004 MN4', '433'], 'Earth',
+                                              '2029-01-01', '2030-01-01')
+        assert list(found) == ['2004 MN4'] and len(api.queries) == 1
+
+
+def test_large_answer_uses_per_object_queries():
+    """0.5 AU around Earth for two years is too big to bulk; a month at 0.05 AU is not."""
+    with _setup(rates=None) as (api, log):
+        found = cad.prefetch_close_approaches(['2004 MN4', '2024 YR4', '433'], 'Earth',
+                                              '2029-01-01', '2031-01-01')
+        assert found == {} and not api.queries and not log.exists()
+        cad.prefetch_close_approaches(['2004 MN4', '2024 YR4', '433'], 'Earth',
+                                      '2029-04-01', '2029-05-01', dist_max='0.05')
+        assert len(api.queries) == 1 and 'des' not in api.queries[0]
+
+
+def test_shifting_windows_stay_bounded():
+    """Overlapping prefetches merge into one window; records grow only per designation."""
+    with _setup() as (api, log):
+        names = []
+        for month in range(1, 11):
+            start, end = f'2029-{month:02d}-01', f'2029-{month + 2:02d}-01'
+            pair = [f'2030 A{month}', f'2030 B{month}']
+            names += pair
+            found = cad.prefetch_close_approaches(pair, 'Earth', start, end)
+            assert set(found) == set(pair)
+        assert len(api.queries) == 10 and len(cad._store['windows']) == 1
+        window = list(cad._store['windows'].values())[0]
+        assert (window['date_min'], window['date_max']) == ('2029-01-01', '2029-12-01')
+        assert len(_lines(log)) == 1 + len(names)
+        cad._reset_store()
+        cad.prefetch_close_approaches(['2031 C1', '2031 C2'], 'Earth', '2029-03-01', '2029-09-01')
+        assert len(api.queries) == 10 and len(cad._load_cache()) == len(names)
+
+
+def test_compaction_evicts_oldest_windows():
+    """Beyond MAX_WINDOWS disjoint windows, the least recently fetched go."""
+    saved = cad.MAX_WINDOWS
+    cad.MAX_WINDOWS = 2
+    try:
+        with _setup() as (api, log):
+            for year in (2029, 2031, 2033):
+                cad._append_record({'kind': 'window', 'body': 'Earth',
+                                    'date_min': f'{year}-01-01', 'date_max': f'{year}-06-01',
+                                    'dist_max': '0.5', 'approaches': [],
+                                    'fetched': f'2026-10-{year - 2010}'})
+            assert sorted(w[1] for w in cad._store['windows']) == ['2031-01-01', '2033-01-01']
+            assert len(_lines(log)) == 2
+    finally:
+        cad.MAX_WINDOWS = saved
+
+
+# ============================================================
+# Test runner
+# ============================================================
+
+def _collect_tests():
+    """Find every module-level function whose name starts with 'test_'."""
+    import inspect
+    tests = []
+    current_module = sys.modules[__name__]
+    for name, obj in inspect.getmembers(current_module):
+        if name.startswith('test_') and inspect.isfunction(obj):
+            tests.append((name, obj))
+    tests.sort(key=lambda pair: inspect.getsourcelines(pair[1])[1])
+    return tests
+
+
+def main():
+    """Run all tests. Print summary. Exit non-zero on any failure."""
+    tests = _collect_tests()
+    failures = []
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"  PASS  {name}")
+        except Exception as e:
+            failures.append((name, f"{type(e).__name__}: {e}"))
+            print(f"  FAIL  {name}")
+            traceback.print_exc()
+    print(f"\n{len(tests) - len(failures)} of {len(tests)} close approach bulk tests passed.")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""
+test_earth_system_grid.py - Tests for the shared Earth System gridding stage.
+
+Checks that grid_field reproduces scipy.griddata's linear interpolation
+(NaN outside the hull included), reuses one triangulation for a point set
+that repeats across dates while the values change, honours the
+configured resolution, evicts old point sets, and that the heatmap
+overlay draws from the field it is handed.
+
+Run from the project directory:
+    python test_earth_system_grid.py
+
+Exits 0 if all tests pass, non-zero on any failure.
+
+Role: devtool
+Domain: dev_tools
+
+Module created: October 2026
+"""
+
+import os
+import sys
+import tempfile
+import traceback
+
+import numpy as np
+from scipy.interpolate import griddata
+
+import earth_system_grid as esg
+
+
+def _cloud(seed=0, n=400, regular=False):
+    rng = np.random.default_rng(seed)
+    if regular:
+        lon, lat = np.meshgrid(np.linspace(-125, -104, 43), np.linspace(30, 42, 25))
+        lons, lats = lon.ravel(), lat.ravel()
+    else:
+        lons = rng.uniform(-125, -104, n)
+        lats = rng.uniform(30, 42, n)
+    values = 20 * np.exp(-((lats - 34) ** 2 + (lons - 114) ** 2) / 50) + rng.uniform(0, 2, len(lats))
+    return list(lats), list(lons), list(values)
+
+
+# ============================================================
+# Interpolation
+# ============================================================
+
+def test_matches_griddata():
+    """Same grid nodes, same values, same NaN mask as griddata(method='linear')."""
+    esg._interpolators.clear()
+    for regular in (False, True):
+        lats, lons, values = _cloud(regular=regular)
+        field = esg.grid_field(lats, lons, values)
+        grid_x, grid_y = np.mgrid[min(lons):max(lons):100j, min(lats):max(lats):100j]
+        want = griddata((lons, lats), values, (grid_x, grid_y), method='linear')
+        assert np.array_equal(field.grid_x, grid_x) and np.array_equal(field.grid_y, grid_y)
+        assert np.array_equal(np.isnan(field.grid_z), np.isnan(want))
+        assert np.nanmax(np.abs(field.grid_z - want)) < 1e-9
+    assert not np.isnan(field.grid_z).any()      # a regular grid's hull is its box
+
+
+def test_repeated_point_set_reuses_triangulation():
+    """A new day on the same grid reuses the interpolator; values still differ."""
+    esg._interpolators.clear()
+    lats, lons, values = _cloud(regular=True)
+    first = esg.grid_field(lats, lons, values)
+    interpolator = next(iter(esg._interpolators.values()))
+    second = esg.grid_field(lats, lons, [v * 2 for v in values])
+    assert len(esg._interpolators) == 1
+    assert next(iter(esg._interpolators.values())) is interpolator
+    assert np.allclose(second.grid_z, first.grid_z * 2, equal_nan=True)
+
+
+def test_resolution_and_eviction():
+    """Resolution sets the grid shape; only CACHE_SIZE point sets are kept."""
+    esg._interpolators.clear()
+    lats, lons, values = _cloud()
+    assert esg.grid_field(lats, lons, values, resolution=40).grid_z.shape == (40, 40)
+    for seed in range(1, esg.CACHE_SIZE + 3):
+        esg.grid_field(*_cloud(seed=seed, n=50))
+    assert len(esg._interpolators) == esg.CACHE_SIZE
+
+
+def test_field_summary():
+    """bounds, center and peak describe the point cloud."""
+    lats, lons, values = _cloud()
+    field = esg.grid_field(lats, lons, values)
+    assert field.bounds == (min(lats), max(lats), min(lons), max(lons))
+    assert np.isclose(field.center[0], np.mean(lats))
+    assert field.peak == max(values)
+
+
+# ============================================================
+# Engine
+# ============================================================
+
+def test_heatmap_overlay_uses_given_field():
+    """build_heatmap_kml contours the passed field and boxes it by its bounds."""
+    import earth_system_generator as engine
+
+    lats, lons, values = _cloud()
+    field = esg.grid_field(lats, lons, values, resolution=30)
+    thresholds = {'contour_levels_start': 0, 'contour_levels_stop': 24}
+    with tempfile.TemporaryDirectory() as tmp:
+        saved = engine.DATA_DIR
+        engine.DATA_DIR = tmp
+        try:
+            kml = engine.build_heatmap_kml('grid_test', '2026-03-20', lats, lons, values,
+                                           thresholds, field=field)
+        finally:
+            engine.DATA_DIR = saved
+        assert os.path.exists(os.path.join(tmp, '2026-03-20_heatmap_grid_test.png'))
+        with open(kml) as f:
+            text = f.read()
+        assert f"<north>{max(lats)}</north>" in text
+        assert f"<west>{min(lons)}</west>" in text
+
+
+# ============================================================
+# Test runner
+# ============================================================
+
+def _collect_tests():
+    """Find every module-level function whose name starts with 'test_'."""
+    import inspect
+    tests = []
+    current_module = sys.modules[__name__]
+    for name, obj in inspect.getmembers(current_module):
+        if name.startswith('test_') and inspect.isfunction(obj):
+            tests.append((name, obj))
+    tests.sort(key=lambda pair: inspect.getsourcelines(pair[1])[1])
+    return tests
+
+
+def main():
+    """Run all tests. Print summary. Exit non-zero on any failure."""
+    tests = _collect_tests()
+    failures = []
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"  PASS  {name}")
+        except Exception as e:
+            failures.append((name, f"{type(e).__name__}: {e}"))
+            print(f"  FAIL  {name}")
+            traceback.print_exc()
+    print(f"\n{len(tests) - len(failures)} of {len(tests)} earth system grid tests passed.")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,279 @@
+"""
+test_era5_daily.py - Tests for the lazy ERA5 reader and per-day products.
+
+Builds small hourly t2m/d2m cubes in memory and checks that era5_daily
+reads only the scenario box and one year's day at a time, reproduces the
+whole-file daily-max anomaly the heatwave scenario used to compute, gives
+textbook wet-bulb values, and that per-day products are reused, rebuilt
+when their NetCDF sources change (even with another source deleted),
+and fill a snapshot ahead of the legacy CSV cache -- and that a corrupt
+raw file, one without t2m or one that misses the box leaves the snapshot
+to the CSV cache instead of failing.
+
+Run from the project directory:
+    python test_era5_daily.py
+
+Exits 0 if all tests pass, non-zero on any failure.
+
+Role: devtool
+Domain: dev_tools
+
+Module created: October 2026
+"""
+
+import os
+import sys
+import tempfile
+import traceback
+
+import numpy as np
+
+import era5_daily as ed
+import scenarios_western_heatwave_march_2026 as west
+
+
+class _Recording:
+    """A sliceable variable that records the shape of every read."""
+    def __init__(self, array):
+        self.array = array
+        self.shape = array.shape
+        self.reads = []
+
+    def __getitem__(self, key):
+        block = self.array[key]
+        self.reads.append(block.shape)
+        return block
+
+
+def _cube(years=3, nlat=20, nlon=30, seed=0):
+    rng = np.random.default_rng(seed)
+    hours = np.arange(24 * years) % 24
+    diurnal = 8.0 * np.sin((hours - 9) / 24 * 2 * np.pi)[:, None, None]
+    t2m = 290.0 + diurnal + rng.normal(0, 2, (24 * years, nlat, nlon))
+    d2m = t2m - rng.uniform(2, 15, t2m.shape)
+    lats = np.linspace(50.0, 40.5, nlat)            # ERA5 latitudes descend
+    lons = np.linspace(-125.0, -110.5, nlon)
+    return t2m, d2m, lats, lons
+
+
+# ============================================================
+# Lazy reads
+# ============================================================
+
+def test_bbox_window():
+    """Box slices cover exactly the cells inside, for either latitude order."""
+    _, _, lats, lons = _cube()
+    window = ed.bbox_window(lats, lons, (42.0, 46.0), (-120.0, -115.0))
+    assert np.all((lats[window[0]] >= 42) & (lats[window[0]] <= 46))
+    assert np.all((lons[window[1]] >= -120) & (lons[window[1]] <= -115))
+    assert (lats >= 42).sum() - (lats > 46).sum() == len(lats[window[0]])
+    ascending = ed.bbox_window(lats[::-1], lons, (42.0, 46.0), (-120.0, -115.0))
+    assert ascending[0].stop - ascending[0].start == window[0].stop - window[0].start
+    try:
+        ed.bbox_window(lats, lons, (0, 10), (0, 10))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("box outside the grid accepted")
+
+
+def test_matches_whole_file_anomaly():
+    """Chunked reduction equals the old reshape/max/mean over the whole cube."""
+    t2m, _, lats, lons = _cube(years=5)
+    event = t2m[:24] + 6.0
+    window = ed.bbox_window(lats, lons, (42.0, 46.0), (-120.0, -115.0))
+
+    clim, n_years = ed.climatology_fields({'t2m': t2m}, window)
+    day = ed.daily_max_fields({'t2m': event}, window)
+    got = np.clip((day['tmax_k'] - clim['clim_tmax_k']) * 9.0 / 5.0, 0, None)
+
+    tmax_event = np.max(event, axis=0)
+    tmax_clim = np.mean(np.max(t2m.reshape(5, 24, *t2m.shape[1:]), axis=1), axis=0)
+    want = np.clip((tmax_event - tmax_clim) * 9.0 / 5.0, 0, None)[window]
+    assert n_years == 5
+    assert np.allclose(got, want)
+
+
+def test_reads_one_year_of_the_box_at_a_time():
+    """No read is larger than one day of the box; hours subset reads just those."""
+    t2m, d2m, lats, lons = _cube(years=4)
+    window = ed.bbox_window(lats, lons, (42.0, 46.0), (-120.0, -115.0))
+    box = (window[0].stop - window[0].start, window[1].stop - window[1].start)
+    variables = {'t2m': _Recording(t2m), 'd2m': _Recording(d2m)}
+    ed.climatology_fields(variables, window)
+    assert variables['t2m'].reads == [(24,) + box] * 4
+    assert variables['d2m'].reads == [(24,) + box] * 4
+
+    variables = {'t2m': _Recording(t2m)}
+    ed.daily_max_fields(variables, window, 24, hours=[18, 20, 22])
+    assert variables['t2m'].reads == [(3,) + box]
+
+
+def test_wet_bulb_values():
+    """Stull: 20 C at 50% RH -> ~13.7 C; saturated air -> about the air temperature."""
+    t = 293.15
+    td_50 = 273.15 + 243.04 * (np.log(0.5) + 17.625 * 20 / 263.04) / (
+        17.625 - (np.log(0.5) + 17.625 * 20 / 263.04))
+    assert abs(ed.wet_bulb_c(t, td_50) - 13.7) < 0.2
+    assert abs(ed.wet_bulb_c(t, t) - 20.0) < 0.5
+
+
+# ============================================================
+# Products
+# ============================================================
+
+def _fields():
+    lat = np.array([45.0, 44.5], dtype=np.float32)
+    lon = np.array([-120.0, -119.5, -119.0], dtype=np.float32)
+    anomaly = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+    return {'lat': lat, 'lon': lon, 'anomaly_f': anomaly, 'tmax_k': anomaly + 290}
+
+
+def test_product_reused_and_rebuilt_on_source_change():
+    """A product is current for its sources; a changed NetCDF invalidates it."""
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, 'era5_raw_2026-03-20.nc')
+        with open(src, 'wb') as f:
+            f.write(b'x' * 100)
+        path = ed.product_path(tmp, 'era5_western_2026-03-20', (30, 42), (-125, -104))
+        ed._memo.clear()
+        ed._save(path, _fields(), [src], None)
+        assert not ed._load(path, [src], None)['anomaly_f'].flags.writeable
+
+        ed._memo.clear()
+        loaded = ed._load(path, [src], None)
+        assert loaded['anomaly_f'].dtype == np.float32 and loaded['anomaly_f'][1, 2] == 6.0
+        assert ed._load(path, [src], [18, 21]) is None          # other hours
+
+        with open(src, 'ab') as f:
+            f.write(b'more')
+        assert ed._load(path, [src], None) is None              # memo checks too
+        ed._memo.clear()
+        assert ed._load(path, [src], None) is None
+
+        os.remove(src)                                          # raw download cleaned up
+        assert ed._load(path, [src], None) is not None
+
+
+def test_changed_source_not_waived_by_missing_one():
+    """An ERA5T refresh of the event file is caught with the climatology gone."""
+    with tempfile.TemporaryDirectory() as tmp:
+        event, clim = west._era5_raw_paths(tmp, '2026-03-20')
+        for src in (event, clim):
+            with open(src, 'wb') as f:
+                f.write(b'x' * 100)
+        path = ed.product_path(tmp, 'era5_western_2026-03-20', (30, 42), (-125, -104))
+        ed._memo.clear()
+        ed._save(path, _fields(), [event, clim], None)
+        with open(event, 'wb') as f:
+            f.write(b'y' * 120)                                 # refreshed download
+        os.remove(clim)
+        assert ed._load(path, [event, clim], None) is None
+        ed._memo.clear()
+        assert ed._load(path, [event, clim], None) is None
+        os.remove(event)
+        assert ed._load(path, [event, clim], None) is not None
+
+
+def test_snapshot_filled_from_product_before_csv():
+    """The scenario uses the per-day product; the CSV is only a fallback."""
+    with tempfile.TemporaryDirectory() as tmp:
+        date = '2026-03-20'
+        config = west.SNAPSHOT_CONFIGS[date]
+        with open(os.path.join(tmp, f"era5_western_{date}.csv"), 'w') as f:
+            f.write("lat,lon,anomaly_f\n1.0,2.0,99.0\n")
+        scenario = {'date': date}
+        ed._memo.clear()
+        assert west._try_era5_fetch(scenario, tmp)
+        assert scenario['values'] == [99.0]                     # no product yet: CSV
+
+        path = ed.product_path(tmp, f"era5_western_{date}",
+                               config['grid_lat_range'], config['grid_lon_range'])
+        ed._save(path, _fields(), [], None)
+        ed._memo.clear()
+        scenario = {'date': date}
+        assert west._try_era5_fetch(scenario, tmp)
+        assert scenario['lats'] == [45.0, 45.0, 45.0, 44.5, 44.5, 44.5]
+        assert scenario['lons'][:3] == [-120.0, -119.5, -119.0]
+        assert scenario['values'] == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+
+
+
+class _Dataset:
+    """netCDF4.Dataset stand-in over in-memory variables."""
+    def __init__(self, variables):
+        self.variables = variables
+
+    def close(self):
+        pass
+
+
+def _corrupt_open(path):
+    """What netCDF4.Dataset raises for a truncated download."""
+    raise OSError(f"[Errno -51] NetCDF: Unknown file format: '{path}'")
+
+
+def test_bad_raw_file_falls_back_to_csv():
+    """Corrupt, t2m-less or off-box raw NetCDF: the CSV tier still answers."""
+    t2m, _, lats, lons = _cube(years=1)
+    off_box = {'t2m': t2m, 'latitude': lats + 50.0, 'longitude': lons}
+    no_t2m = {'d2m': t2m, 'latitude': np.linspace(45, 30, 20),
+              'longitude': np.linspace(-126, -103, 30)}
+    try:
+        import netCDF4  # noqa: F401 -- the real reader rejects the bytes itself
+        corrupt = ed._open
+    except ImportError:
+        corrupt = _corrupt_open
+    openers = (corrupt, lambda path: _Dataset(off_box), lambda path: _Dataset(no_t2m))
+    saved = ed._open
+    try:
+        for opener in openers:
+            with tempfile.TemporaryDirectory() as tmp:
+                date = '2026-03-20'
+                for path in west._era5_raw_paths(tmp, date):
+                    with open(path, 'wb') as f:
+                        f.write(b'CDF\x01' + b'\x00' * 12)    # truncated header
+                with open(os.path.join(tmp, f"era5_western_{date}.csv"), 'w') as f:
+                    f.write("lat,lon,anomaly_f\n1.0,2.0,99.0\n")
+                ed._memo.clear()
+                ed._open = opener
+                scenario = {'date': date}
+                assert west._try_era5_fetch(scenario, tmp)
+                assert scenario['values'] == [99.0]
+    finally:
+        ed._open = saved
+
+# ============================================================
+# Test runner
+# ============================================================
+
+def _collect_tests():
+    """Find every module-level function whose name starts with 'test_'."""
+    import inspect
+    tests = []
+    current_module = sys.modules[__name__]
+    for name, obj in inspect.getmembers(current_module):
+        if name.startswith('test_') and inspect.isfunction(obj):
+            tests.append((name, obj))
+    tests.sort(key=lambda pair: inspect.getsourcelines(pair[1])[1])
+    return tests
+
+
+def main():
+    """Run all tests. Print summary. Exit non-zero on any failure."""
+    tests = _collect_tests()
+    failures = []
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"  PASS  {name}")
+        except Exception as e:
+            failures.append((name, f"{type(e).__name__}: {e}"))
+            print(f"  FAIL  {name}")
+            traceback.print_exc()
+    print(f"\n{len(tests) - len(failures)} of {len(tests)} ERA5 daily product tests passed.")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
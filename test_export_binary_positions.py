@@ -0,0 +1,281 @@
+"""
+test_export_binary_positions.py - Tests for the binary position export.
+
+Runs export_orbit_cache against synthetic orbit and osculating caches in a
+temporary directory. Checks that JSON position files carry exactly the
+values of the per-point conversion they replaced, that binary files decode
+to within their error budget at every cached time, that decimation and
+fixed point shrink the payload, that the header and delta-encoded int32
+columns follow the documented layout, that zero, negative and too-fine
+error budgets are refused (a too-fine one skips the object rather than
+aborting the export), and that a binary --full-catalog run writes the
+manifest, the catalog files and a coverage index that passes the
+invariants.
+
+Needs no network access and no real caches.
+
+Run from the project directory:
+    python test_export_binary_positions.py
+
+Exits 0 if all tests pass, non-zero on any failure.
+
+Role: devtool
+Domain: dev_tools
+
+Module created: October 2026
+"""
+
+import contextlib
+import io
+import json
+import struct
+import sys
+import tempfile
+import traceback
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+
+import export_orbit_cache as ex
+
+# osculating center per stored_center slug
+OSC_CENTERS = {'sun': '@sun', 'earth': '@399', 'jupiter': '@599', 'saturn': '@699',
+               'pluto_barycenter': '@9'}
+
+
+def _pair(a, e, period, n, step=1.0, start=date(2025, 1, 1)):
+    """An orbit_paths.json entry: n Kepler positions (AU), step days apart."""
+    dp = {}
+    for k in range(n):
+        M = 2 * np.pi * k * step / period
+        E = M
+        for _ in range(40):
+            E = M + e * np.sin(E)
+        x, y = a * (np.cos(E) - e), a * np.sqrt(1 - e * e) * np.sin(E)
+        when = _key(start, k * step)
+        dp[when] = {'x': float(x), 'y': float(y), 'z': float(0.05 * y),
+                    'vx': 0.0, 'vy': 0.0, 'vz': 0.0}
+    return {'data_points': dp, 'metadata': {'center_body': 'Sun', 'horizons_id': 'fixture',
+                                            'last_updated': '2026-10-01'}}
+
+
+def _key(start, days):
+    whole = int(days)
+    key = str(start + timedelta(days=whole))
+    seconds = int(round((days - whole) * 86400))
+    if seconds:
+        key += " %02d:%02d" % (seconds // 3600, seconds % 3600 // 60)
+    return key
+
+
+def _track(pair):
+    dp = pair['data_points']
+    dates = sorted(dp)
+    return ex._track_arrays(dp, dates)
+
+
+def _max_error(t, xyz, decoded):
+    return np.sqrt(sum((np.interp(t, decoded['t'], decoded['xyz'][:, k]) - xyz[:, k]) ** 2
+                       for k in range(3))).max()
+
+
+def _osculating():
+    """An osculating cache entry for every test object that has one."""
+    osculating = {}
+    for obj in ex.TEST_OBJECTS:
+        if obj.osc_key:
+            osculating[obj.osc_key] = {
+                'elements': {'a': 1.0, 'e': 0.1, 'i': 1.0, 'Omega': 2.0, 'omega': 3.0,
+                             'MA': 4.0, 'epoch': '2026-01-01 00:00 osc.'},
+                'metadata': {'center_body': OSC_CENTERS[obj.stored_center],
+                             'horizons_id': obj.horizons_id, 'fetched': '2026-10-01'}}
+    return osculating
+
+
+@contextlib.contextmanager
+def _caches(orbit_paths, osculating):
+    saved = ex.ORBIT_PATHS, ex.OSC_CACHE
+    with tempfile.TemporaryDirectory() as tmp:
+        ex.ORBIT_PATHS, ex.OSC_CACHE = Path(tmp) / 'orbit_paths.json', Path(tmp) / 'osc.json'
+        for path, data in ((ex.ORBIT_PATHS, orbit_paths), (ex.OSC_CACHE, osculating)):
+            with open(path, 'w') as fh:
+                json.dump(data, fh)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                yield Path(tmp) / 'out'
+        finally:
+            ex.ORBIT_PATHS, ex.OSC_CACHE = saved
+
+
+# ============================================================
+# Encoding
+# ============================================================
+
+def test_json_values_unchanged():
+    """Vectorized km/JD values equal the per-point conversion, time-bearing keys included."""
+    pair = _pair(0.00257, 0.055, 27.3, 200, step=0.25)
+    dp = pair['data_points']
+    dates = sorted(dp)
+    assert any(':' in d for d in dates)
+    t, xyz = ex._track_arrays(dp, dates)
+    assert t.tolist() == [ex._dt_to_jd(ex._parse_calendar(d)) for d in dates]
+    assert xyz[:, 1].tolist() == [dp[d]['y'] * ex.KM_PER_AU for d in dates]
+
+
+def test_round_trip_within_budget():
+    """Decoded traces interpolate to within max_error_km at every cached time."""
+    for pair, budget in ((_pair(1.0, 0.0167, 365.25, 1500), None),
+                         (_pair(17.8, 0.967, 27500, 3000, step=10), None),
+                         (_pair(0.00257, 0.055, 27.3, 800, step=0.125), 5.0)):
+        t, xyz = _track(pair)
+        data, fields = ex.encode_positions(t, xyz, budget)
+        decoded = ex.decode_positions(data)
+        if budget is not None:
+            assert fields['max_error_km'] == budget
+        assert fields['measured_error_km'] <= fields['max_error_km']
+        assert _max_error(t, xyz, decoded) <= fields['max_error_km']
+        assert decoded['t'][0] == t[0] and decoded['t'][-1] == t[-1]
+
+
+def test_decimation_and_fixed_point_shrink_payload():
+    """A densely sampled trace keeps a fraction of its points and bytes."""
+    t, xyz = _track(_pair(5.2, 0.048, 4332.6, 4000))
+    data, fields = ex.encode_positions(t, xyz)
+    as_json = json.dumps({'t': t.tolist(), 'x': xyz[:, 0].tolist(),
+                          'y': xyz[:, 1].tolist(), 'z': xyz[:, 2].tolist()})
+    assert fields['n_points'] < fields['source_points'] / 4
+    assert len(data) < len(as_json) / 20
+
+
+def test_layout_is_delta_int32():
+    """40-byte header, then t/x/y/z int32 columns whose running sums are the values."""
+    t, xyz = _track(_pair(1.0, 0.0167, 365.25, 100))
+    data, fields = ex.encode_positions(t, xyz, 1000.0)
+    magic, version, _, n, source, t0, quantum, budget = struct.unpack_from('<4sHHIIddd', data)
+    assert (magic, version, n, source) == (b'OPOS', 1, fields['n_points'], 100)
+    assert len(data) == 40 + 16 * n
+    columns = np.frombuffer(data[40:], dtype='<i4').reshape(4, n)
+    assert columns[0, 0] == 0 and np.all(columns[0, 1:] > 0)
+    x = np.cumsum(columns[1]) * quantum
+    assert abs(x[0] - xyz[0, 0]) <= quantum and abs(x[-1] - xyz[-1, 0]) <= quantum
+    assert t0 + columns[0].sum() / 86400.0 == t[-1]
+
+
+def test_budget_too_fine_raises():
+    """A budget that overflows int32 fixed point is refused."""
+    t, xyz = _track(_pair(30.0, 0.01, 60000, 50, step=50))
+    try:
+        ex.encode_positions(t, xyz, 1e-6)
+    except ValueError:
+        return
+    raise AssertionError("int32 overflow not detected")
+
+
+def test_nonpositive_budget_refused():
+    """0 and negative budgets raise, in encode_positions and on the command line."""
+    t, xyz = _track(_pair(1.0, 0.0167, 365.25, 100))
+    for budget in (0.0, -5.0, float('nan')):
+        try:
+            ex.encode_positions(t, xyz, budget)
+        except ValueError:
+            continue
+        raise AssertionError("budget %r accepted" % budget)
+    for text in ('0', '-5', 'inf'):
+        try:
+            with contextlib.redirect_stderr(io.StringIO()):
+                ex.main(['--format', 'binary', '--max-error-km', text])
+        except SystemExit as exc:
+            assert exc.code == 2
+            continue
+        raise AssertionError("--max-error-km %s accepted" % text)
+
+
+def test_too_fine_budget_skips_object():
+    """A budget too fine for a heliocentric track warns and serves no positions."""
+    cache = {'Earth_Sun': _pair(1.0, 0.0167, 365.25, 200)}
+    earth = [o for o in ex.TEST_OBJECTS if o.slug == 'earth'][0]
+    warnings, manifest = [], {}
+    with tempfile.TemporaryDirectory() as tmp:
+        block = ex.write_position_file(cache, earth, Path(tmp), warnings.append,
+                                       'binary', 0.001, manifest)
+        assert block is None and manifest == {}
+        assert not list((Path(tmp) / 'positions').iterdir())
+    assert len(warnings) == 1 and 'int32' in warnings[0]
+
+
+# ============================================================
+# Export run
+# ============================================================
+
+def test_binary_full_catalog_export():
+    """Manifest, catalog files and coverage index from one binary --full-catalog run."""
+    orbit_paths = {
+        'Earth_Sun': _pair(1.0, 0.0167, 365.25, 800),
+        'Jupiter_Sun': _pair(5.2, 0.048, 4332.6, 800, step=5),
+        'Saturn_Sun': _pair(9.5, 0.054, 10759, 800, step=10),
+        'Moon_Earth': _pair(0.00257, 0.055, 27.3, 400, step=0.25),
+        'Titan_Saturn': _pair(0.00817, 0.029, 15.9, 400, step=0.25),
+        'Pluto_Pluto-Charon Barycenter': _pair(1.4e-5, 0.0, 6.39, 200, step=0.25),
+        'Charon_Pluto-Charon Barycenter': _pair(1.2e-4, 0.0, 6.39, 200, step=0.25),
+        'Voyager 1_Sun': _pair(170.0, 0.0, 1e7, 300, step=30),
+        'Ceres_Sun': _pair(2.77, 0.079, 1680, 600, step=2),
+        'Io_Jupiter': _pair(0.00282, 0.004, 1.77, 100),
+    }
+    with _caches(orbit_paths, _osculating()) as out:
+        assert ex.main(['--output-dir', str(out), '--format', 'binary', '--full-catalog']) == 0
+        with open(out / 'positions' / 'manifest.json') as fh:
+            manifest = json.load(fh)
+        with open(out / 'coverage_index.json') as fh:
+            index = json.load(fh)
+        assert manifest['format'] == 'opos1' and manifest['layout']['header_bytes'] == 40
+        assert set(manifest['files']) == {'earth', 'jupiter', 'saturn', 'moon', 'titan', 'pluto',
+                                          'charon', 'voyager_1', 'catalog/ceres_sun',
+                                          'catalog/io_jupiter'}
+        for entry in manifest['files'].values():
+            with open(out / entry['file'], 'rb') as fh:
+                decoded = ex.decode_positions(fh.read())
+            assert len(decoded['t']) == entry['n_points']
+            assert entry['measured_error_km'] <= entry['max_error_km']
+        moon = index['objects']['moon']['positions']
+        assert moon['file'] == 'positions/moon.bin' and moon['format'] == 'opos1'
+        assert moon['step_hours'] == 6 and moon['source_points'] == 400
+        assert index['objects']['io']['positions'] is None
+        assert index['positions_manifest'] == 'positions/manifest.json'
+        assert not (out / 'positions' / 'earth.json').exists()
+
+
+# ============================================================
+# Test runner
+# ============================================================
+
+def _collect_tests():
+    """Find every module-level function whose name starts with 'test_'."""
+    import inspect
+    tests = []
+    current_module = sys.modules[__name__]
+    for name, obj in inspect.getmembers(current_module):
+        if name.startswith('test_') and inspect.isfunction(obj):
+            tests.append((name, obj))
+    tests.sort(key=lambda pair: inspect.getsourcelines(pair[1])[1])
+    return tests
+
+
+def main():
+    """Run all tests. Print summary. Exit non-zero on any failure."""
+    tests = _collect_tests()
+    failures = []
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"  PASS  {name}")
+        except Exception as e:
+            failures.append((name, f"{type(e).__name__}: {e}"))
+            print(f"  FAIL  {name}")
+            traceback.print_exc()
+    print(f"\n{len(tests) - len(failures)} of {len(tests)} export binary positions tests passed.")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,221 @@
+"""
+test_maintenance_schedule.py - Tests for maintenance_run's scheduler.
+
+Builds a small project in a temporary folder and runs the schedule with
+run_tool replaced by a local stand-in. Checks that a tool's inputs follow
+its imports and its own script's file literals but not a library's, that
+folder patterns stay in their folder, that a tool waits exactly for the
+tools above it whose files it touches, that rows come out in table order
+however the runs finish, and that a passing tool whose inputs have not
+moved is not re-run while a failure, an edited import or --all re-runs.
+
+Needs no network access and runs none of the real tools.
+
+Run from the project directory:
+    python test_maintenance_schedule.py
+
+Exits 0 if all tests pass, non-zero on any failure.
+
+Role: devtool
+Domain: dev_tools
+
+Module created: October 2026
+"""
+
+import contextlib
+import os
+import sys
+import tempfile
+import threading
+import time
+import traceback
+
+import maintenance_run as mr
+
+FILES = {
+    'gen.py': "OUT = 'doc.md'\n",
+    'lib.py': "import helper\nAUDIT = 'audit.md'\n",
+    'helper.py': "X = 1\n",
+    'test_reads_doc.py': "import lib\nPATH = 'doc.md'\n",
+    'test_plain.py': "import helper\n",
+    'test_other.py': "VALUE = 2\n",
+    'doc.md': "old\n",
+    'audit.md': "audit\n",
+    'sub/nested.py': "\n",
+}
+
+
+def _tool(label, script, inputs=(), outputs=(), documents=(), checker=True):
+    return mr.Tool(label, [script], checker, None, False, list(documents),
+                   None if inputs is None else list(inputs),
+                   list(documents) + list(outputs))
+
+
+TOOLS = [
+    _tool('Generator', 'gen.py', documents=['doc.md'], checker=False),
+    _tool('Reads doc', 'test_reads_doc.py'),
+    _tool('Plain', 'test_plain.py'),
+    _tool('Other', 'test_other.py'),
+    _tool('Always', 'test_other.py', inputs=None, outputs=['audit.md']),
+]
+
+
+class _Tools:
+    """run_tool stand-in: records runs, fails on request, sleeps per script."""
+    def __init__(self, fail=(), delay=None):
+        self.fail = set(fail)
+        self.delay = delay or {}
+        self.ran = []
+        self._lock = threading.Lock()
+
+    def __call__(self, project_dir, argv_tail):
+        time.sleep(self.delay.get(argv_tail[0], 0.0))
+        with self._lock:
+            self.ran.append(argv_tail[0])
+        rc = 1 if argv_tail[0] in self.fail else 0
+        return rc, '%s done\n' % argv_tail[0], 0.01
+
+
+@contextlib.contextmanager
+def _project():
+    saved_cwd, saved_run = os.getcwd(), mr.run_tool
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, text in FILES.items():
+            os.makedirs(os.path.dirname(os.path.join(tmp, name)), exist_ok=True)
+            with open(os.path.join(tmp, name), 'w') as handle:
+                handle.write(text)
+        os.chdir(tmp)
+        try:
+            yield tmp
+        finally:
+            os.chdir(saved_cwd)
+            mr.run_tool = saved_run
+
+
+def _pass(tmp, state, tools=None, jobs=1, force=False):
+    tools = tools or _Tools()
+    mr.run_tool = tools
+    emitted = []
+    rows, skipped = mr.run_suite(tmp, TOOLS, mr.tree_snapshot(tmp), state, jobs,
+                                 force, lambda i, row: emitted.append(i))
+    return tools, rows, skipped, emitted
+
+
+# ============================================================
+# Inputs and order
+# ============================================================
+
+def test_patterns_stay_in_their_folder():
+    """'*.py' is the top level only; a literal path counts even when absent."""
+    tree = {'a.py': None, 'sub/b.py': None, 'sub/c.txt': None}
+    assert mr.expand(['*.py'], tree) == {'a.py'}
+    assert mr.expand(['sub/*'], tree) == {'sub/b.py', 'sub/c.txt'}
+    assert mr.expand(['missing.json'], tree) == {'missing.json'}
+
+
+def test_inputs_follow_imports_and_script_literals():
+    """Imports are followed down; only the script's own literals name files."""
+    with _project() as tmp:
+        tree = mr.tree_snapshot(tmp)
+        names = mr.basenames(tree)
+        reads = mr.input_paths(TOOLS[1], tree, names, {})
+        assert reads == {'test_reads_doc.py', 'lib.py', 'helper.py', 'doc.md'}
+        assert mr.input_paths(TOOLS[4], tree, names, {}) is None
+
+
+def test_waits_only_for_tools_it_touches():
+    """A reader of the generator's document waits; independent tools do not."""
+    with _project() as tmp:
+        tree = mr.tree_snapshot(tmp)
+        deps = mr.dependencies(TOOLS, tree, mr.basenames(tree), {})
+    assert deps == {0: set(), 1: {0}, 2: set(), 3: set(), 4: {0}}
+
+
+def test_rows_in_table_order():
+    """The slow first tool still prints first when four run at once."""
+    with _project() as tmp:
+        tools, rows, _, emitted = _pass(tmp, mr.load_state(tmp), _Tools(
+            delay={'gen.py': 0.3}), jobs=4)
+    assert emitted == list(range(len(TOOLS)))
+    assert tools.ran[0] != 'gen.py'
+    assert [row[0] for row in rows] == [t.label for t in TOOLS]
+
+
+# ============================================================
+# Skipping
+# ============================================================
+
+def test_unchanged_tools_not_rerun():
+    """Second pass: passing tools are quoted; ALWAYS and failures run again."""
+    with _project() as tmp:
+        state = mr.load_state(tmp)
+        _pass(tmp, state, _Tools(fail={'test_plain.py'}))
+        tools, rows, skipped, _ = _pass(tmp, state, _Tools(fail={'test_plain.py'}))
+    assert sorted(skipped) == ['Generator', 'Other', 'Reads doc']
+    assert sorted(tools.ran) == ['test_other.py', 'test_plain.py']
+    assert rows[1][3].endswith('[not re-run]') and 'done' in rows[1][3]
+    assert rows[0][3] == 'unchanged (nothing it reads has moved) [not re-run]'
+
+
+def test_edited_import_or_document_reruns():
+    """Editing an imported module, or a generated document, re-runs its readers."""
+    with _project() as tmp:
+        state = mr.load_state(tmp)
+        _pass(tmp, state)
+        with open('helper.py', 'a') as handle:
+            handle.write('Y = 2\n')
+        tools, _, skipped, _ = _pass(tmp, state)
+        assert sorted(skipped) == ['Generator', 'Other']
+        with open('doc.md', 'w') as handle:
+            handle.write('hand edit\n')
+        tools, _, skipped, _ = _pass(tmp, state)
+        assert sorted(skipped) == ['Other', 'Plain']
+
+
+def test_all_flag_and_state_round_trip():
+    """--all ignores the record; the record survives a save and reload."""
+    with _project() as tmp:
+        state = mr.load_state(tmp)
+        _pass(tmp, state)
+        mr.save_state(tmp, state)
+        reloaded = mr.load_state(tmp)
+        _, _, skipped, _ = _pass(tmp, reloaded)
+        assert len(skipped) == 4
+        tools, _, skipped, _ = _pass(tmp, reloaded, force=True)
+        assert skipped == [] and len(tools.ran) == len(TOOLS)
+
+
+# ============================================================
+# Test runner
+# ============================================================
+
+def _collect_tests():
+    """Find every module-level function whose name starts with 'test_'."""
+    import inspect
+    tests = []
+    current_module = sys.modules[__name__]
+    for name, obj in inspect.getmembers(current_module):
+        if name.startswith('test_') and inspect.isfunction(obj):
+            tests.append((name, obj))
+    tests.sort(key=lambda pair: inspect.getsourcelines(pair[1])[1])
+    return tests
+
+
+def main():
+    """Run all tests. Print summary. Exit non-zero on any failure."""
+    tests = _collect_tests()
+    failures = []
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"  PASS  {name}")
+        except Exception as e:
+            failures.append((name, f"{type(e).__name__}: {e}"))
+            print(f"  FAIL  {name}")
+            traceback.print_exc()
+    print(f"\n{len(tests) - len(failures)} of {len(tests)} maintenance schedule tests passed.")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
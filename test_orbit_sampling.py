@@ -0,0 +1,234 @@
+"""
+test_orbit_sampling.py - Tests for adaptive true-anomaly orbit sampling.
+
+Checks that every chord of a sampled ellipse, arc or hyperbola stays
+within the tolerance set by the axis scale and LOD level, that apsides
+and the closing point are exact samples, that near-circular orbits on
+large views get few points while a high-e comet meets the tolerance the
+old fixed 360-point grid missed, that the hyperbolic trajectory
+builder in idealized_orbits uses the sampler out to max_distance, and
+that the closed-form clip anomaly and the sinh-spaced arms give what the
+80-step bisection and the per-arm construction gave, one conic at a time
+or batched.
+
+Run from the project directory:
+    python test_orbit_sampling.py
+
+Exits 0 if all tests pass, non-zero on any failure.
+
+Role: devtool
+Domain: dev_tools
+
+Module created: October 2026
+"""
+
+import contextlib
+import sys
+import traceback
+
+import numpy as np
+
+import idealized_orbits
+import orbit_sampling
+import render_lod
+
+
+@contextlib.contextmanager
+def _view(scale=None, level='standard'):
+    """Axis scale and LOD level for the duration of a test."""
+    saved_scale, saved_level = orbit_sampling.axis_scale(), render_lod.current()
+    orbit_sampling.set_axis_scale(scale)
+    render_lod.set_level(level)
+    try:
+        yield
+    finally:
+        orbit_sampling.set_axis_scale(saved_scale)
+        render_lod.set_level(saved_level)
+
+
+def _chord_error(a, e, theta):
+    """Largest distance between the conic and the polyline through theta."""
+    p = abs(a) * abs(1 - e * e)
+    worst = 0.0
+    for t0, t1 in zip(theta[:-1], theta[1:]):
+        u = np.linspace(t0, t1, 41)
+        r = p / (1 + e * np.cos(u))
+        x, y = r * np.cos(u), r * np.sin(u)
+        dx, dy = x[-1] - x[0], y[-1] - y[0]
+        dist = np.abs(dx * (y - y[0]) - dy * (x - x[0])) / np.hypot(dx, dy)
+        worst = max(worst, dist.max())
+    return worst
+
+
+# ============================================================
+# Ellipses and arcs
+# ============================================================
+
+def test_chord_error_within_tolerance():
+    """Circles to e = 0.9999, with and without an axis scale, stay within tolerance."""
+    for scale in (None, 2.0, 50.0):
+        with _view(scale):
+            for a, e in [(1.0, 0.0), (1.0, 0.0167), (3.0, 0.5), (17.8, 0.967), (300.0, 0.9999)]:
+                theta = orbit_sampling.ellipse_anomalies(a, e)
+                tolerance = orbit_sampling.chord_tolerance(a * (1 + e))
+                assert _chord_error(a, e, theta) <= 1.05 * tolerance, (scale, a, e)
+                assert np.all(np.diff(theta) > 0)
+
+
+def test_apsides_and_closure_exact():
+    """0, pi and 2*pi are samples and the halves mirror each other."""
+    theta = orbit_sampling.ellipse_anomalies(100.0, 0.99)
+    mid = len(theta) // 2
+    assert theta[0] == 0.0 and theta[mid] == np.pi and theta[-1] == 2 * np.pi
+    assert np.allclose(theta[:mid + 1], 2 * np.pi - theta[:mid - 1:-1])
+
+
+def test_big_scene_thins_near_circular_orbits():
+    """Earth's orbit on a 50 AU view gets the minimum, well under the old 360."""
+    with _view(50.0):
+        assert len(orbit_sampling.ellipse_anomalies(1.0, 0.0167)) == orbit_sampling.MIN_POINTS + 1
+    with _view(None):
+        assert len(orbit_sampling.ellipse_anomalies(1.0, 0.0167)) < 180
+
+
+def test_comet_beats_fixed_grid():
+    """A high-e comet meets tolerance with fewer points than the old 360 grid, which misses it."""
+    fixed = np.linspace(0, 2 * np.pi, 360)
+    with _view(50.0):
+        for a, e in [(100.0, 0.99), (80.0, 0.99993)]:
+            theta = orbit_sampling.ellipse_anomalies(a, e)
+            tolerance = orbit_sampling.chord_tolerance(None)
+            assert len(theta) < len(fixed)
+            assert _chord_error(a, e, fixed) > 10 * tolerance
+            assert _chord_error(a, e, theta) <= 1.05 * tolerance
+
+
+def test_lod_level_sets_density():
+    """Preview < standard < publication for the same view."""
+    counts = []
+    for level in ('preview', 'standard', 'publication'):
+        with _view(5.0, level):
+            counts.append(len(orbit_sampling.ellipse_anomalies(3.0, 0.5)))
+    assert counts[0] < counts[1] < counts[2]
+
+
+def test_multi_revolution_arc():
+    """Arcs keep their endpoints, stay monotonic and scale with revolutions."""
+    with _view(None):
+        one = orbit_sampling.arc_anomalies(1.0, 0.5, 0, 2 * np.pi)
+        arc = orbit_sampling.arc_anomalies(1.0, 0.5, 0, 5 * np.pi)
+        short = orbit_sampling.arc_anomalies(1.0, 0.5, 0, 0.3)
+        assert arc[0] == 0 and arc[-1] == 5 * np.pi and np.all(np.diff(arc) > 0)
+        assert 2 * len(one) < len(arc) < 3 * len(one)
+        assert 4 < len(short) < len(one)
+        assert _chord_error(1.0, 0.5, arc) <= 1.05 * orbit_sampling.chord_tolerance(1.5)
+
+
+# ============================================================
+# Hyperbolae
+# ============================================================
+
+def test_hyperbola_symmetric_within_tolerance():
+    """Perihelion is a sample, branches mirror, chords stay within tolerance."""
+    with _view(5.0):
+        for a, e in [(-1.27, 1.2), (-5.0, 1.02), (-0.5, 4.0)]:
+            limit = np.arccos(-1 / e) - 0.1
+            theta = orbit_sampling.hyperbola_anomalies(a, e, limit)
+            mid = len(theta) // 2
+            assert theta[mid] == 0.0 and theta[-1] == limit
+            assert np.allclose(theta, -theta[::-1])
+            assert _chord_error(a, e, theta) <= 1.05 * orbit_sampling.chord_tolerance(None)
+
+
+def test_hyperbolic_trajectory_stops_at_max_distance():
+    """generate_hyperbolic_orbit_points ends at max_distance with adaptive samples."""
+    with _view(None):
+        x, y, z, q = idealized_orbits.generate_hyperbolic_orbit_points(
+            -1.27, 1.2, 122.7, 241.8, 24.6, idealized_orbits.rotate_points, max_distance=5.0)
+    r = np.sqrt(np.asarray(x) ** 2 + np.asarray(y) ** 2 + np.asarray(z) ** 2)
+    assert abs(r.min() - q) < 1e-9 and abs(r.max() - 5.0) < 1e-6
+    assert len(r) < 500
+
+
+
+# ============================================================
+# Clipped osculating arcs
+# ============================================================
+
+def _bisect_clip(p, e, r_clip, high, limit):
+    """The clip search the osculating-arc plotters used to run."""
+    low = 0.0
+    for _ in range(80):
+        mid = (low + high) / 2.0
+        if p / (1.0 + e * np.cos(mid)) < r_clip:
+            low = mid
+        else:
+            high = mid
+    return min(low, limit)
+
+
+def test_clip_anomaly_matches_bisection():
+    """Hyperbolae, near-parabolic and circular orbits, inside and outside the clip."""
+    cases = [(4.25e-5, 4.25, 3.0e-3), (0.2, 1.0004, 7.5), (0.1, 0.9995, 3.0),
+             (2.4, 0.6, 1.0), (0.96, 0.2, 30.0), (1.0, 0.0, 2.0), (1.0, 0.0, 0.5),
+             (3.0, 2.0, 1.0)]
+    for p, e, r_clip in cases:
+        if e > 1:
+            asymptote = np.arccos(-1.0 / e)
+            limit, high = asymptote - np.radians(0.1), asymptote - 1e-8
+        else:
+            limit = high = np.pi
+        expected = _bisect_clip(p, e, r_clip, high, limit)
+        found = orbit_sampling.clip_anomaly(p, e, r_clip, limit)
+        assert abs(found - expected) < 1e-12, (p, e, r_clip)
+    assert orbit_sampling.clip_anomaly(3.0, 2.0, 1.0) == 0.0
+    p, e, r_clip = (np.array(column) for column in zip(*cases))
+    batched = orbit_sampling.clip_anomaly(p, e, r_clip)
+    assert batched.shape == (len(cases),)
+    assert np.allclose(batched, [orbit_sampling.clip_anomaly(*case) for case in cases])
+
+
+def test_sinh_arms_match_per_arm_construction():
+    """Both arms equal the concatenated mirrored arm, for one or many conics."""
+    t = np.linspace(0, 1, 300)
+    arm = np.sinh(3.0 * t) / np.sinh(3.0) * 1.7
+    expected = np.concatenate([-arm[::-1], arm])
+    assert np.array_equal(orbit_sampling.sinh_arms(1.7, 300, 3.0), expected)
+    rows = orbit_sampling.sinh_arms(np.array([1.7, 0.4]), 300, 3.0)
+    assert rows.shape == (2, 600) and np.array_equal(rows[0], expected)
+    assert np.allclose(rows[1], -rows[1][::-1])
+
+# ============================================================
+# Test runner
+# ============================================================
+
+def _collect_tests():
+    """Find every module-level function whose name starts with 'test_'."""
+    import inspect
+    tests = []
+    current_module = sys.modules[__name__]
+    for name, obj in inspect.getmembers(current_module):
+        if name.startswith('test_') and inspect.isfunction(obj):
+            tests.append((name, obj))
+    tests.sort(key=lambda pair: inspect.getsourcelines(pair[1])[1])
+    return tests
+
+
+def main():
+    """Run all tests. Print summary. Exit non-zero on any failure."""
+    tests = _collect_tests()
+    failures = []
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"  PASS  {name}")
+        except Exception as e:
+            failures.append((name, f"{type(e).__name__}: {e}"))
+            print(f"  FAIL  {name}")
+            traceback.print_exc()
+    print(f"\n{len(tests) - len(failures)} of {len(tests)} orbit sampling tests passed.")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""
+test_orbit_transforms.py - Tests for the composed rotation matrices.
+
+Checks that one cached axis rotation gives the elementwise formulas the
+three rotate_points variants used to spell out, that a composed chain
+gives the same points as rotating link by link, that cached matrices are
+read-only while create_planet_transformation_matrix() still hands out a
+writable copy, that scalars, lists and shapes that only broadcast are
+accepted, and that an unknown axis is still a ValueError.
+
+Needs no network access.
+
+Run from the project directory:
+    python test_orbit_transforms.py
+
+Exits 0 if all tests pass, non-zero on any failure.
+
+Role: devtool
+Domain: dev_tools
+
+Module created: October 2026
+"""
+
+import sys
+import traceback
+
+import numpy as np
+
+import orbit_transforms
+
+RNG = np.random.default_rng(7)
+X, Y, Z = RNG.normal(size=(3, 50))
+
+
+def _elementwise(x, y, z, angle, axis):
+    """The rotation as rotate_points2 wrote it before it delegated."""
+    c, s = np.cos(angle), np.sin(angle)
+    if axis == 'z':
+        return x * c - y * s, x * s + y * c, z
+    if axis == 'x':
+        return x, y * c - z * s, y * s + z * c
+    return z * s + x * c, y, z * c - x * s
+
+
+# ============================================================
+# Same points
+# ============================================================
+
+def test_axis_rotation_matches_formulas():
+    """Each axis gives the elementwise formulas, through all three wrappers."""
+    import idealized_orbits
+    import palomas_orrery_helpers
+    import planet_visualization_utilities
+    wrappers = (orbit_transforms.rotate, idealized_orbits.rotate_points,
+                palomas_orrery_helpers.rotate_points2,
+                planet_visualization_utilities.rotate_points)
+    for axis in 'xyz':
+        expected = _elementwise(X, Y, Z, 0.83, axis)
+        for rotate in wrappers:
+            assert np.allclose(rotate(X, Y, Z, 0.83, axis), expected, atol=1e-15)
+
+
+def test_composed_chain_matches_sequential():
+    """A six-link chain in one product equals six rotations in turn."""
+    steps = ((1.1, 'z'), (0.4, 'x'), (-2.3, 'z'), (0.9, 'y'), (0.2, 'x'), (3.0, 'z'))
+    x, y, z = X, Y, Z
+    for angle, axis in steps:
+        x, y, z = _elementwise(x, y, z, angle, axis)
+    assert np.allclose(orbit_transforms.rotate_sequence(X, Y, Z, steps),
+                       (x, y, z), atol=1e-14)
+    assert np.allclose(orbit_transforms.rotate_sequence(X, Y, Z, ()), (X, Y, Z))
+
+
+def test_planet_pole_unchanged():
+    """orient_to_planet_pole is the pole matrix applied to the points."""
+    import idealized_orbits
+    for planet in ('Jupiter', 'Saturn', 'Uranus', 'Neptune', 'Earth'):
+        matrix = idealized_orbits.create_planet_transformation_matrix(planet)
+        rotated = idealized_orbits.orient_to_planet_pole(X, Y, Z, planet)
+        assert np.allclose(rotated, np.dot(matrix, np.vstack((X, Y, Z))))
+
+
+# ============================================================
+# Caching
+# ============================================================
+
+def test_cached_matrices_are_read_only():
+    """Handed-out matrices are the cached ones and cannot be written."""
+    import idealized_orbits
+    first = orbit_transforms.compose([(0.5, 'z'), (0.1, 'x')])
+    assert orbit_transforms.compose(((0.5, 'z'), (0.1, 'x'))) is first
+    assert orbit_transforms.axis_matrix(np.float64(0.5)) is orbit_transforms.axis_matrix(0.5)
+    try:
+        first[0, 0] = 2.0
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('cached matrix was writable')
+    copy = idealized_orbits.create_planet_transformation_matrix('Saturn')
+    copy[0, 0] = 2.0
+    again = idealized_orbits.create_planet_transformation_matrix('Saturn')
+    assert again[0, 0] != 2.0
+
+
+# ============================================================
+# Inputs
+# ============================================================
+
+def test_scalars_lists_and_broadcasting():
+    """Scalars, lists and a scalar z all rotate as they used to."""
+    x, y, z = orbit_transforms.rotate(1.0, 0.0, 0.0, np.pi / 2, 'z')
+    assert np.allclose((x, y, z), (0.0, 1.0, 0.0)) and np.ndim(x) == 0
+    x, y, z = orbit_transforms.rotate([1.0, 2.0], [0.0, 0.0], [0.0, 1.0], np.pi, 'x')
+    assert np.allclose(y, [0.0, -0.0]) and np.allclose(z, [0.0, -1.0])
+    x, y, z = orbit_transforms.rotate(X, Y, 0.0, 0.3, 'x')
+    assert z.shape == X.shape and np.allclose(z, Y * np.sin(0.3))
+    grid = np.ones((4, 5))
+    x, y, z = orbit_transforms.rotate(grid, 2 * grid, 3 * grid, 0.7, 'y')
+    assert x.shape == (4, 5) and np.allclose(y, 2.0)
+
+
+def test_unknown_axis_raises():
+    """An axis other than x, y or z is a ValueError, as before."""
+    try:
+        orbit_transforms.rotate(X, Y, Z, 0.1, 'w')
+    except ValueError as exc:
+        assert 'Unknown rotation axis' in str(exc)
+    else:
+        raise AssertionError('no error for axis w')
+
+
+# ============================================================
+# Test runner
+# ============================================================
+
+def _collect_tests():
+    """Find every module-level function whose name starts with 'test_'."""
+    import inspect
+    tests = []
+    current_module = sys.modules[__name__]
+    for name, obj in inspect.getmembers(current_module):
+        if name.startswith('test_') and inspect.isfunction(obj):
+            tests.append((name, obj))
+    tests.sort(key=lambda pair: inspect.getsourcelines(pair[1])[1])
+    return tests
+
+
+def main():
+    """Run all tests. Print summary. Exit non-zero on any failure."""
+    tests = _collect_tests()
+    failures = []
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"  PASS  {name}")
+        except Exception as e:
+            failures.append((name, f"{type(e).__name__}: {e}"))
+            print(f"  FAIL  {name}")
+            traceback.print_exc()
+    print(f"\n{len(tests) - len(failures)} of {len(tests)} orbit transform tests passed.")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,242 @@
+"""
+test_osculating_prefetch.py - Tests for the consolidated osculating pre-fetch.
+
+Runs osculating_prefetch against a temporary osculating cache with the
+Horizons request replaced by a slow local stand-in. Checks that the plan
+gives each body its view-dependent cache key and freshness, that one
+dialog covers every stale body (or offers all when everything is fresh),
+that stale bodies are fetched concurrently with spaced request starts and
+saved once, that failed fetches fall back to cached or manual elements,
+and that a cancelled build stops before the remaining requests start.
+
+Needs no network access.
+
+Run from the project directory:
+    python test_osculating_prefetch.py
+
+Exits 0 if all tests pass, non-zero on any failure.
+
+Role: devtool
+Domain: dev_tools
+
+Module created: October 2026
+"""
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import osculating_cache_manager as ocm
+import osculating_prefetch as op
+
+
+def _entry(a, days_old=0):
+    fetched = datetime.now() - timedelta(days=days_old)
+    return {'elements': {'a': a, 'e': 0.1, 'i': 1.0},
+            'metadata': {'fetched': fetched.isoformat(), 'source': 'fixture'}}
+
+
+class _Horizons:
+    """fetch_osculating_elements stand-in: slow, records start times, can fail."""
+    def __init__(self, delay=0.2, fail=()):
+        self.delay = delay
+        self.fail = set(fail)
+        self.starts = []
+        self._lock = threading.Lock()
+
+    def __call__(self, obj_name, horizons_id=None, id_type='smallbody', date=None,
+                 center_body=None):
+        with self._lock:
+            self.starts.append((time.monotonic(), obj_name, center_body))
+        time.sleep(self.delay)
+        if obj_name in self.fail:
+            return None
+        return _entry(100.0 + len(obj_name))
+
+
+@contextlib.contextmanager
+def _setup(entries, horizons=None):
+    """Temporary cache file and store, stand-in fetcher, count of saves."""
+    names = ('CACHE_FILE', 'BACKUP_FILE', 'BACKUP_OLD', 'TEMP_FILE')
+    saved = {n: getattr(ocm, n) for n in names}
+    saved_fetch, saved_save = ocm.fetch_osculating_elements, ocm.save_cache
+    saves = []
+
+    def counting_save(cache):
+        saves.append(len(cache))
+        return saved_save(cache)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n, filename in zip(names, ('c.json', 'c_backup.json', 'c_backup_old.json', 'c.tmp')):
+            setattr(ocm, n, Path(tmp) / filename)
+        with open(ocm.CACHE_FILE, 'w') as f:
+            json.dump(dict(ocm.create_empty_cache(), **entries), f)
+        ocm._store.update(cache=None, stamp=None, dirty=set(), deferred=False)
+        ocm.fetch_osculating_elements = horizons or _Horizons()
+        ocm.save_cache = counting_save
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                yield saves
+        finally:
+            ocm.fetch_osculating_elements, ocm.save_cache = saved_fetch, saved_save
+            ocm._store.update(cache=None, stamp=None, dirty=set(), deferred=False)
+            for n, value in saved.items():
+                setattr(ocm, n, value)
+
+
+def _on_disk():
+    with open(ocm.CACHE_FILE) as f:
+        return json.load(f)
+
+
+def _objects(names):
+    return [{'name': n, 'id': str(1000 + k), 'id_type': 'smallbody'} for k, n in enumerate(names)]
+
+
+# ============================================================
+# Planning and the dialog
+# ============================================================
+
+def test_plan_keys_and_freshness():
+    """System members get the view's center; statuses come from the cache."""
+    entries = {'Charon@9': _entry(0.1), 'Ceres': _entry(2.77, days_old=60)}
+    with _setup(entries):
+        objects = [{'name': 'Charon', 'id': '901', 'id_type': 'majorbody'},
+                   {'name': 'Ceres', 'id': 'Ceres'}]
+        plan = op.plan_prefetch(['Charon', 'Ceres', 'Eris'], objects,
+                                'Pluto-Charon Barycenter', '@9')
+    assert [i.key for i in plan] == ['Charon@9', 'Ceres', 'Eris@9']
+    assert [i.horizons_id for i in plan] == ['901', 'Ceres', None]
+    assert [i.is_fresh for i in plan] == [True, False, False]
+    assert not plan[2].status['exists']
+
+
+def test_one_dialog_for_all_stale():
+    """Thirty stale bodies: one dialog naming the counts; Yes fetches all thirty."""
+    names = [f"Asteroid {k}" for k in range(30)]
+    entries = {n: _entry(2.0, days_old=90) for n in names[:20]}
+    entries['Vesta'] = _entry(2.36)
+    asked = []
+    saved_ask = ocm.messagebox.askyesno
+    ocm.messagebox.askyesno = lambda title, text, parent=None: asked.append(text) or True
+    try:
+        with _setup(entries):
+            plan = op.plan_prefetch(names + ['Vesta'], _objects(names + ['Vesta']), 'Sun', None)
+            refresh = op.ask_refresh(plan)
+    finally:
+        ocm.messagebox.askyesno = saved_ask
+    assert len(asked) == 1
+    assert 'Not in cache (10)' in asked[0] and 'Update recommended (20)' in asked[0]
+    assert 'Fresh (1): Vesta' in asked[0] and 'and 12 more' in asked[0]
+    assert len(refresh) == 30 and 'Vesta' not in [i.name for i in refresh]
+
+
+def test_all_fresh_offers_update_anyway():
+    """Everything fresh still prompts; Yes then refreshes every body."""
+    with _setup({'Mars': _entry(1.52)}):
+        plan = op.plan_prefetch(['Mars'], _objects(['Mars']), 'Sun', None)
+    _, text, candidates = op.prefetch_message(plan)
+    assert 'Update them anyway?' in text and candidates == plan
+
+
+# ============================================================
+# Fetching
+# ============================================================
+
+def test_concurrent_spaced_single_save():
+    """Eight 0.2 s requests finish well under 1.6 s, start spaced, and save once."""
+    names = [f"Comet {k}" for k in range(8)]
+    horizons = _Horizons(delay=0.2)
+    with _setup({}, horizons) as saves:
+        plan = op.plan_prefetch(names, _objects(names), 'Sun', None)
+        seen = []
+        t0 = time.perf_counter()
+        fetched = op.fetch_elements(plan, max_workers=4, min_interval=0.02,
+                                    progress=lambda done, total, item, ok: seen.append((done, ok)))
+        elapsed = time.perf_counter() - t0
+        on_disk = _on_disk()
+    assert elapsed < 0.9, f"{elapsed:.2f} s"
+    starts = sorted(t for t, _, _ in horizons.starts)
+    assert min(b - a for a, b in zip(starts, starts[1:])) >= 0.015
+    assert seen == [(k, True) for k in range(1, 9)]
+    assert len(saves) == 1 and all(n in on_disk for n in names)
+    assert all(fetched[n]['elements']['a'] == 100.0 + len(n) for n in names)
+
+
+def test_failed_fetch_falls_back():
+    """A failed fetch uses cached, then manual-dictionary elements."""
+    horizons = _Horizons(delay=0.0, fail={'Ceres', 'Mars'})
+    with _setup({'Ceres': _entry(2.77, days_old=60)}, horizons) as saves:
+        plan = op.plan_prefetch(['Ceres', 'Mars', 'Eris'], _objects(['Ceres', 'Mars', 'Eris']),
+                                'Sun', None)
+        elements = op.run_prefetch(plan, plan)
+    assert elements['Ceres']['a'] == 2.77
+    assert elements['Mars'] == ocm.FALLBACK_ELEMENTS['Mars']
+    assert elements['Eris']['a'] == 104.0
+    assert len(saves) == 1
+
+
+def test_cancel_stops_remaining_requests():
+    """A checkpoint that raises drops the requests that have not started."""
+    names = [f"Body {k}" for k in range(12)]
+    horizons = _Horizons(delay=0.1)
+
+    class Cancelled(BaseException):
+        pass
+
+    def checkpoint():
+        raise Cancelled()
+
+    with _setup({}, horizons):
+        plan = op.plan_prefetch(names, _objects(names), 'Sun', None)
+        try:
+            op.fetch_elements(plan, max_workers=2, min_interval=0.0, checkpoint=checkpoint)
+        except Cancelled:
+            pass
+        else:
+            raise AssertionError("cancel ignored")
+        assert 'Body 0' in _on_disk()    # finished work is kept
+    assert len(horizons.starts) < len(names)
+
+
+# ============================================================
+# Test runner
+# ============================================================
+
+def _collect_tests():
+    """Find every module-level function whose name starts with 'test_'."""
+    import inspect
+    tests = []
+    current_module = sys.modules[__name__]
+    for name, obj in inspect.getmembers(current_module):
+        if name.startswith('test_') and inspect.isfunction(obj):
+            tests.append((name, obj))
+    tests.sort(key=lambda pair: inspect.getsourcelines(pair[1])[1])
+    return tests
+
+
+def main():
+    """Run all tests. Print summary. Exit non-zero on any failure."""
+    tests = _collect_tests()
+    failures = []
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"  PASS  {name}")
+        except Exception as e:
+            failures.append((name, f"{type(e).__name__}: {e}"))
+            print(f"  FAIL  {name}")
+            traceback.print_exc()
+    print(f"\n{len(tests) - len(failures)} of {len(tests)} osculating prefetch tests passed.")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
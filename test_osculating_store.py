@@ -0,0 +1,206 @@
+"""
+test_osculating_store.py - Tests for the in-process osculating elements store.
+
+Points osculating_cache_manager at a temporary cache file and checks that
+status checks and TP lookups parse the file once, that a file saved by
+another process is picked up without losing pending updates, that
+deferred updates are written in a single save (with the usual backup
+rotation), and that a failed save keeps them pending.
+
+Run from the project directory:
+    python test_osculating_store.py
+
+Exits 0 if all tests pass, non-zero on any failure.
+
+Role: devtool
+Domain: dev_tools
+
+Module created: October 2026
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import traceback
+from datetime import datetime
+from pathlib import Path
+
+import osculating_cache_manager as ocm
+
+
+def _entry(a, tp=None):
+    elements = {'a': a, 'e': 0.1, 'i': 1.0}
+    if tp is not None:
+        elements['TP'] = tp
+    return {'elements': elements,
+            'metadata': {'fetched': datetime.now().isoformat(), 'source': 'fixture'}}
+
+
+@contextlib.contextmanager
+def _cache_dir(entries=None):
+    """Temporary cache files, a fresh store, and a count of file parses and saves."""
+    names = ('CACHE_FILE', 'BACKUP_FILE', 'BACKUP_OLD', 'TEMP_FILE')
+    saved = {n: getattr(ocm, n) for n in names}
+    saved_read, saved_save = ocm._read_cache_file, ocm.save_cache
+    calls = {'read': 0, 'save': 0}
+
+    def counting_read():
+        calls['read'] += 1
+        return saved_read()
+
+    def counting_save(cache):
+        calls['save'] += 1
+        return saved_save(cache)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n, filename in zip(names, ('c.json', 'c_backup.json', 'c_backup_old.json', 'c.tmp')):
+            setattr(ocm, n, Path(tmp) / filename)
+        if entries is not None:
+            with open(ocm.CACHE_FILE, 'w') as f:
+                json.dump(dict(ocm.create_empty_cache(), **entries), f)
+        ocm._store.update(cache=None, stamp=None, dirty=set(), deferred=False)
+        ocm._read_cache_file, ocm.save_cache = counting_read, counting_save
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                yield calls
+        finally:
+            ocm._read_cache_file, ocm.save_cache = saved_read, saved_save
+            ocm._store.update(cache=None, stamp=None, dirty=set(), deferred=False)
+            for n, value in saved.items():
+                setattr(ocm, n, value)
+
+
+def _on_disk():
+    with open(ocm.CACHE_FILE) as f:
+        return json.load(f)
+
+
+def _rewrite_externally(cache):
+    """Another instance saves the cache (different size, newer mtime)."""
+    with open(ocm.CACHE_FILE, 'w') as f:
+        json.dump(cache, f, indent=4)
+    st = os.stat(ocm.CACHE_FILE)
+    os.utime(ocm.CACHE_FILE, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+
+
+# ============================================================
+# Reads
+# ============================================================
+
+def test_status_checks_parse_once():
+    """Many status checks and TP lookups cost one file parse."""
+    bodies = {f"Body {k}": _entry(1.0 + k, tp=2460000.5 + k) for k in range(20)}
+    with _cache_dir(bodies) as calls:
+        for _ in range(3):
+            for name in bodies:
+                assert ocm.check_cache_status(name)['exists']
+        assert not ocm.check_cache_status('Nowhere')['exists']
+        assert ocm.get_fallback_elements('Body 3')['a'] == 4.0
+        assert calls == {'read': 1, 'save': 0}
+
+
+def test_external_save_reloaded_pending_kept():
+    """A file saved elsewhere is re-read; updates not yet flushed survive it."""
+    with _cache_dir({'Mars': _entry(1.52)}) as calls:
+        ocm.defer_writes()
+        ocm.put_entry('Ceres', _entry(2.77))
+        disk = _on_disk()
+        disk['Vesta'] = _entry(2.36)
+        _rewrite_externally(disk)
+
+        cache = ocm.load_cache()
+        assert calls['read'] == 2
+        assert {'Mars', 'Ceres', 'Vesta'} <= set(cache)
+        ocm.flush_cache()
+        assert {'Mars', 'Ceres', 'Vesta'} <= set(_on_disk())
+
+
+# ============================================================
+# Writes
+# ============================================================
+
+def test_deferred_updates_one_save():
+    """A pre-fetch session's updates go to disk in one save, with a backup."""
+    with _cache_dir({'Mars': _entry(1.52)}) as calls:
+        with ocm.deferred_writes():
+            for k in range(5):
+                ocm.put_entry(f"Comet {k}", _entry(3.0 + k))
+            ocm.cache_solution_tp('Mars', 2460100.25)
+            assert calls['save'] == 0 and 'Comet 0' not in _on_disk()
+        assert calls['save'] == 1
+        disk = _on_disk()
+        assert disk['Comet 4']['elements']['a'] == 7.0
+        assert disk['Mars']['elements']['solution_TP'] == 2460100.25
+        assert ocm.BACKUP_FILE.exists()
+
+        assert ocm.resolve_tp('Mars')[1] == 'solution TP (cached)'
+        assert calls['read'] == 1                      # our own save is not re-read
+
+
+def test_immediate_write_without_session():
+    """Outside a session an update is saved at once, as before."""
+    with _cache_dir({}) as calls:
+        ocm.put_entry('Pluto@9', _entry(39.5))
+        assert calls['save'] == 1 and 'Pluto@9' in _on_disk()
+        assert not ocm.flush_cache()                   # nothing pending
+
+
+def test_failed_save_stays_pending():
+    """If the save fails the update is kept and written by the next flush."""
+    with _cache_dir({}) as calls:
+        ocm.defer_writes()
+        ocm.put_entry('Eris', _entry(67.8))
+        real_save = ocm.save_cache
+
+        def failing(cache):
+            raise OSError("disk full")
+        ocm.save_cache = failing
+        try:
+            ocm.flush_cache()
+        except OSError:
+            pass
+        else:
+            raise AssertionError("save failure swallowed")
+        finally:
+            ocm.save_cache = real_save
+        assert ocm._store['dirty'] == {'Eris'}
+        assert ocm.flush_cache() and 'Eris' in _on_disk()
+
+
+# ============================================================
+# Test runner
+# ============================================================
+
+def _collect_tests():
+    """Find every module-level function whose name starts with 'test_'."""
+    import inspect
+    tests = []
+    current_module = sys.modules[__name__]
+    for name, obj in inspect.getmembers(current_module):
+        if name.startswith('test_') and inspect.isfunction(obj):
+            tests.append((name, obj))
+    tests.sort(key=lambda pair: inspect.getsourcelines(pair[1])[1])
+    return tests
+
+
+def main():
+    """Run all tests. Print summary. Exit non-zero on any failure."""
+    tests = _collect_tests()
+    failures = []
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"  PASS  {name}")
+        except Exception as e:
+            failures.append((name, f"{type(e).__name__}: {e}"))
+            print(f"  FAIL  {name}")
+            traceback.print_exc()
+    print(f"\n{len(tests) - len(failures)} of {len(tests)} osculating store tests passed.")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,261 @@
+"""
+test_plot_jobs.py - Tests for the plot/animation job scheduler.
+
+Drives plot_jobs.PlotJobScheduler without Tk: a stand-in root collects
+after() callbacks and the test pumps them on the main thread, the way the
+Tk mainloop would. Checks that builds run one at a time in submit order,
+that the worker reads the GUI snapshot taken at submit time, that cancel
+stops a build at its next checkpoint and drops queued ones, and that
+call_on_main really runs on the main thread.
+
+Run from the project directory:
+    python test_plot_jobs.py
+
+Exits 0 if all tests pass, non-zero on any failure.
+
+Role: devtool
+Domain: dev_tools
+
+Module created: October 2026
+"""
+
+import queue
+import sys
+import threading
+import time
+import traceback
+
+import plot_jobs
+
+
+class _Root:
+    """Collects after() callbacks; pump() runs them on the calling thread."""
+
+    def __init__(self):
+        self.calls = queue.Queue()
+
+    def after(self, _ms, func, *args):
+        self.calls.put((func, args))
+
+    def pump(self, until, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not until():
+            if time.monotonic() > deadline:
+                raise AssertionError("timed out waiting for scheduler")
+            try:
+                func, args = self.calls.get(timeout=0.01)
+            except queue.Empty:
+                continue
+            func(*args)
+
+
+class _Handler:
+    """Just enough of PlotlyShutdownHandler for create_monitored_thread."""
+
+    def __init__(self):
+        self.is_shutting_down = False
+        self.active_threads = set()
+
+    def register_thread(self, thread):
+        self.active_threads.add(thread)
+
+    def remove_thread(self, thread):
+        self.active_threads.discard(thread)
+
+
+class _Var:
+    def __init__(self, value):
+        self.v = value
+
+    def get(self):
+        return self.v
+
+
+def _scheduler():
+    events = []
+    root = _Root()
+    sched = plot_jobs.PlotJobScheduler(
+        root, _Handler(), on_update=lambda job, ev: events.append((job.label, ev)))
+    return root, sched, events
+
+
+# ============================================================
+# Ordering and threads
+# ============================================================
+
+def test_prepare_on_main_work_on_worker():
+    """prepare() runs on the main thread; the work it returns does not."""
+    root, sched, events = _scheduler()
+    seen = {}
+
+    def prepare(job):
+        seen['prepare'] = threading.current_thread() is threading.main_thread()
+        return lambda: seen.setdefault('work', threading.current_thread())
+
+    job = sched.submit('plot', 'Plot', prepare)
+    root.pump(lambda: job.state == 'done')
+    assert seen['prepare'] is True
+    assert seen['work'] is not threading.main_thread()
+    assert events == [('Plot', 'started'), ('Plot', 'done')]
+
+
+def test_second_submit_is_queued_and_runs_after():
+    """A build submitted while one runs waits, then runs in order."""
+    root, sched, events = _scheduler()
+    release = threading.Event()
+    order = []
+
+    def slow(job):
+        return lambda: (release.wait(5), order.append('first'))
+
+    first = sched.submit('plot', 'first', slow)
+    second = sched.submit('animate', 'second', lambda job: lambda: order.append('second'))
+    assert second.state == 'queued'
+    assert sched.pending() == [second]
+    release.set()
+    root.pump(lambda: second.state == 'done')
+    assert order == ['first', 'second']
+    assert ('second', 'queued') in events
+    assert first.state == 'done'
+
+
+# ============================================================
+# Snapshot
+# ============================================================
+
+def test_worker_reads_snapshot_not_live_value():
+    """Changing a variable after submit does not change the queued build."""
+    root, sched, _events = _scheduler()
+    center = _Var('Sun')
+    seen = {}
+
+    def prepare(job):
+        seen['prepare'] = plot_jobs.value(center)
+        return lambda: seen.setdefault('work', plot_jobs.value(center))
+
+    job = sched.submit('plot', 'Plot', prepare, sources=[center])
+    center.v = 'Earth'
+    root.pump(lambda: job.state == 'done')
+    assert seen == {'prepare': 'Sun', 'work': 'Sun'}
+    # Outside a job, value() is the live .get()
+    assert plot_jobs.value(center) == 'Earth'
+
+
+# ============================================================
+# Cancellation
+# ============================================================
+
+def test_cancel_stops_at_checkpoint_and_next_job_runs():
+    """cancel_current() raises JobCancelled at the next checkpoint."""
+    root, sched, events = _scheduler()
+    at_stage = threading.Event()
+    go_on = threading.Event()
+    reached = []
+
+    def work():
+        try:
+            at_stage.set()
+            go_on.wait(5)
+            plot_jobs.checkpoint()
+            reached.append('after checkpoint')
+        except Exception:
+            reached.append('swallowed')   # JobCancelled must get past this
+
+    first = sched.submit('plot', 'first', lambda job: work)
+    second = sched.submit('plot', 'second', lambda job: lambda: None)
+    at_stage.wait(5)
+    assert sched.cancel_current() is first
+    go_on.set()
+    root.pump(lambda: second.state == 'done')
+    assert first.state == 'cancelled'
+    assert reached == []
+    assert ('first', 'cancelled') in events
+
+
+def test_cancel_all_drops_queue():
+    """cancel_all() cancels the running build and never starts queued ones."""
+    root, sched, events = _scheduler()
+    go_on = threading.Event()
+    ran = []
+
+    def work():
+        go_on.wait(5)
+        plot_jobs.checkpoint()
+
+    first = sched.submit('plot', 'first', lambda job: work)
+    queued = sched.submit('plot', 'queued', lambda job: lambda: ran.append(1))
+    running, dropped = sched.cancel_all()
+    assert running is first and dropped == [queued]
+    go_on.set()
+    root.pump(lambda: first.state == 'cancelled')
+    assert queued.state == 'cancelled' and queued.started is None
+    assert ran == []
+    assert not sched.is_busy()
+
+
+# ============================================================
+# Main-thread calls
+# ============================================================
+
+def test_call_on_main_runs_on_main_thread():
+    """A dialog requested by the worker runs on the main thread."""
+    root, sched, _events = _scheduler()
+    answer = {}
+
+    def dialog(n):
+        return (threading.current_thread() is threading.main_thread(), n * 2)
+
+    job = sched.submit('plot', 'Plot',
+                       lambda job: lambda: answer.setdefault('r', sched.call_on_main(dialog, 21)))
+    root.pump(lambda: job.state == 'done')
+    assert answer['r'] == (True, 42)
+
+
+def test_prepare_error_marks_failed():
+    """An exception in prepare() fails that job and the queue moves on."""
+    root, sched, events = _scheduler()
+
+    def bad(job):
+        raise ValueError("no objects selected")
+
+    first = sched.submit('plot', 'bad', bad)
+    second = sched.submit('plot', 'good', lambda job: lambda: None)
+    root.pump(lambda: second.state == 'done')
+    assert first.state == 'failed'
+    assert isinstance(first.error, ValueError)
+
+
+# ============================================================
+# Test runner
+# ============================================================
+
+def _collect_tests():
+    """Find every module-level function whose name starts with 'test_'."""
+    import inspect
+    tests = []
+    current_module = sys.modules[__name__]
+    for name, obj in inspect.getmembers(current_module):
+        if name.startswith('test_') and inspect.isfunction(obj):
+            tests.append((name, obj))
+    tests.sort(key=lambda pair: inspect.getsourcelines(pair[1])[1])
+    return tests
+
+
+def main():
+    """Run all tests. Print summary. Exit non-zero on any failure."""
+    tests = _collect_tests()
+    failures = []
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"  PASS  {name}")
+        except Exception as e:
+            failures.append((name, f"{type(e).__name__}: {e}"))
+            print(f"  FAIL  {name}")
+            traceback.print_exc()
+    print(f"\n{len(tests) - len(failures)} of {len(tests)} plot job tests passed.")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,170 @@
+"""
+test_plot_profiler.py - Tests for the opt-in plot build profiler.
+
+Checks that plot_profiler stays a no-op when profiling is off (the
+instrumented fetch helpers call count() on every Horizons query, so an
+inactive profiler must cost nothing and record nothing), and that an
+active profile attributes time, counters, traces and bytes to the stage
+that was open when they happened.
+
+Run from the project directory:
+    python test_plot_profiler.py
+
+Exits 0 if all tests pass, non-zero on any failure.
+
+Role: devtool
+Domain: dev_tools
+
+Module created: October 2026
+"""
+
+import json
+import os
+import sys
+import tempfile
+import traceback
+
+import plotly.graph_objs as go
+
+import plot_profiler
+
+
+def _clear_env():
+    os.environ.pop(plot_profiler.ENV_FLAG, None)
+
+
+# ============================================================
+# Opt-in behaviour
+# ============================================================
+
+def test_off_by_default():
+    """No checkbox, no env flag -> start() returns None, helpers no-op."""
+    _clear_env()
+    assert plot_profiler.start('plot', enabled=False) is None
+    plot_profiler.lap('anything')
+    plot_profiler.count(plot_profiler.HORIZONS_CALLS)
+    assert plot_profiler.active() is None
+    assert plot_profiler.finish() == (None, None)
+
+
+def test_env_flag_enables():
+    """ORRERY_PROFILE=1 turns profiling on without the checkbox."""
+    os.environ[plot_profiler.ENV_FLAG] = '1'
+    try:
+        prof = plot_profiler.start('plot', enabled=False)
+        assert prof is not None
+        assert plot_profiler.active() is prof
+    finally:
+        _clear_env()
+        plot_profiler._active = None
+
+
+# ============================================================
+# Attribution
+# ============================================================
+
+def test_counters_land_in_open_stage():
+    """count() bumps both the open stage and the run totals."""
+    _clear_env()
+    prof = plot_profiler.start('plot', enabled=True)
+    plot_profiler.lap('prefetch')
+    plot_profiler.count(plot_profiler.HORIZONS_CALLS)
+    plot_profiler.count(plot_profiler.OSCULATING_CACHE_HITS, 2)
+    plot_profiler.lap('positions')
+    plot_profiler.count(plot_profiler.HORIZONS_CALLS, 3)
+    report = prof.report()
+    plot_profiler._active = None
+
+    stages = {s['name']: s for s in report['stages']}
+    assert stages['prefetch']['counters'] == {'horizons_calls': 1,
+                                              'osculating_cache_hits': 2}
+    assert stages['positions']['counters'] == {'horizons_calls': 3}
+    assert report['totals']['horizons_calls'] == 4
+
+
+def test_traces_and_bytes_per_stage():
+    """Traces added between laps are attributed to the stage that added them."""
+    _clear_env()
+    prof = plot_profiler.start('plot', enabled=True)
+    fig = go.Figure()
+    plot_profiler.lap('shells', fig)
+    fig.add_trace(go.Scatter3d(x=[0, 1], y=[0, 1], z=[0, 1], name='a'))
+    fig.add_trace(go.Scatter3d(x=[0], y=[0], z=[0], name='b'))
+    plot_profiler.lap('orbits', fig)
+    fig.add_trace(go.Scatter3d(x=list(range(100)), y=[0] * 100, z=[0] * 100))
+    report = prof.report(fig)
+    plot_profiler._active = None
+
+    shells, orbits = report['stages']
+    assert shells['traces_added'] == 2
+    assert orbits['traces_added'] == 1
+    assert orbits['bytes_added'] > shells['bytes_added'] > 0
+    assert report['figure']['traces'] == 3
+
+
+def test_figure_created_inside_stage_counts_from_zero():
+    """A stage that builds a new Figure reports all of its traces."""
+    _clear_env()
+    prof = plot_profiler.start('plot', enabled=True)
+    plot_profiler.lap('positions')
+    fig = go.Figure()
+    fig.add_trace(go.Scatter3d(x=[0], y=[0], z=[0]))
+    plot_profiler.lap('trajectories', fig)
+    report = prof.report(fig)
+    plot_profiler._active = None
+    assert report['stages'][0]['traces_added'] == 1
+    assert report['stages'][1]['traces_added'] == 0
+
+
+def test_finish_writes_report_and_summary():
+    """finish() writes JSON, returns a status line, clears the active slot."""
+    _clear_env()
+    plot_profiler.start('animate', enabled=True, metadata={'center': 'Sun'})
+    plot_profiler.lap('frames')
+    plot_profiler.count(plot_profiler.HORIZONS_CALLS, 5)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'last_plot_profile.json')
+        report, line = plot_profiler.finish(path=path)
+        with open(path) as f:
+            saved = json.load(f)
+    assert plot_profiler.active() is None
+    assert saved['metadata']['label'] == 'animate'
+    assert saved['metadata']['center'] == 'Sun'
+    assert saved['totals']['horizons_calls'] == 5
+    assert 'frames' in line and 'Horizons 5' in line
+
+
+# ============================================================
+# Test runner
+# ============================================================
+
+def _collect_tests():
+    """Find every module-level function whose name starts with 'test_'."""
+    import inspect
+    tests = []
+    current_module = sys.modules[__name__]
+    for name, obj in inspect.getmembers(current_module):
+        if name.startswith('test_') and inspect.isfunction(obj):
+            tests.append((name, obj))
+    tests.sort(key=lambda pair: inspect.getsourcelines(pair[1])[1])
+    return tests
+
+
+def main():
+    """Run all tests. Print summary. Exit non-zero on any failure."""
+    tests = _collect_tests()
+    failures = []
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"  PASS  {name}")
+        except Exception as e:
+            failures.append((name, f"{type(e).__name__}: {e}"))
+            print(f"  FAIL  {name}")
+            traceback.print_exc()
+    print(f"\n{len(tests) - len(failures)} of {len(tests)} plot profiler tests passed.")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,163 @@
+"""
+test_render_lod.py - Tests for the level-of-detail presets.
+
+Checks that the standard level leaves every density and orbit path exactly
+as it was (so default builds are byte-identical to pre-LOD builds), that
+preview lowers the shared geometry helpers' point counts and publication
+raises them, and that the orbit decimator thins straight runs while
+keeping endpoints and bends.
+
+Run from the project directory:
+    python test_render_lod.py
+
+Exits 0 if all tests pass, non-zero on any failure.
+
+Role: devtool
+Domain: dev_tools
+
+Module created: October 2026
+"""
+
+import sys
+import traceback
+
+import numpy as np
+
+import render_lod
+from orrery_rendering import create_ring_points
+from planet_visualization_utilities import (
+    create_bow_shock_shape, create_magnetosphere_shape, create_sphere_points)
+
+_PARAMS = {'sunward_distance': 1.0, 'equatorial_radius': 1.0,
+           'polar_radius': 0.8, 'tail_length': 5.0, 'tail_base_radius': 1.0,
+           'tail_end_radius': 2.0}
+
+
+def _at(level, func, *args, **kwargs):
+    previous = render_lod.current()
+    render_lod.set_level(level)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        render_lod.set_level(previous)
+
+
+# ============================================================
+# Presets
+# ============================================================
+
+def test_standard_is_identity():
+    """Standard returns the historical counts and the orbit unchanged."""
+    render_lod.set_level('standard')
+    assert render_lod.linear(24) == 24
+    assert render_lod.count(50) == 50
+    x = [0.0, 1.0, 2.0, 3.0]
+    assert render_lod.decimate_path(x, x, x) == (x, x, x)
+    sx, _, _ = create_sphere_points(1.0, n_points=25)
+    assert len(sx) == 25 * 25
+
+
+def test_unknown_level_raises():
+    try:
+        render_lod.set_level('ultra')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown level accepted")
+    assert render_lod.current() == 'standard'
+
+
+def test_helpers_follow_level():
+    """Preview < standard < publication for every shared geometry helper."""
+    def sizes(level):
+        return (
+            len(_at(level, create_sphere_points, 1.0, n_points=25)[0]),
+            len(_at(level, create_magnetosphere_shape, _PARAMS)[0]),
+            len(_at(level, create_bow_shock_shape, 1.0, 2.0, eccentricity=1.05)[0]),
+            len(_at(level, create_ring_points, 1.0, 2.0, 200)[0]),
+        )
+    preview, standard, publication = (sizes(l) for l in render_lod.LEVELS)
+    for p, s, b in zip(preview, standard, publication):
+        assert p < s < b, (p, s, b)
+
+
+def test_small_counts_keep_minimum():
+    """Scaling never drops a resolution below its minimum."""
+    render_lod.set_level('preview')
+    try:
+        assert render_lod.linear(4) == 4
+        assert render_lod.linear(10, minimum=2) == 5
+        assert render_lod.count(8) == 8
+    finally:
+        render_lod.set_level('standard')
+
+
+# ============================================================
+# Orbit decimation
+# ============================================================
+
+def test_decimation_thins_oversampled_orbit():
+    """A 3600-sample circle keeps roughly one vertex per tolerance of turn."""
+    theta = np.linspace(0, 2 * np.pi, 3601)
+    x, y, z = list(np.cos(theta)), list(np.sin(theta)), [0.0] * len(theta)
+    dx, dy, dz = render_lod.decimate_path(x, y, z, level='preview')
+    assert isinstance(dx, list)
+    assert 150 < len(dx) < 400, len(dx)
+    assert (dx[0], dy[0]) == (x[0], y[0])
+    assert (dx[-1], dy[-1]) == (x[-1], y[-1])
+
+
+def test_decimation_keeps_corners_drops_straight_runs():
+    """An L-shaped path reduces to its endpoints, its corner and gap fillers."""
+    leg = np.linspace(0.0, 1.0, 101)
+    x = np.concatenate((leg, np.ones(100)))
+    y = np.concatenate((np.zeros(101), leg[1:]))
+    z = np.zeros_like(x)
+    idx = render_lod.decimate_indices(x, y, z, tolerance_deg=2.0)
+    assert list(idx) == [0, 100, 200]
+    gap = render_lod.decimate_indices(x, y, z, tolerance_deg=2.0, max_gap=24)
+    assert 100 in gap and np.all(np.diff(gap) <= 24)
+
+
+def test_decimation_ignores_repeated_samples():
+    """Zero-length segments (repeated positions) do not count as turns."""
+    x = np.array([0.0, 1.0, 1.0, 2.0, 3.0])
+    y = np.zeros(5)
+    idx = render_lod.decimate_indices(x, y, y, tolerance_deg=2.0)
+    assert list(idx) == [0, 4]
+
+
+# ============================================================
+# Test runner
+# ============================================================
+
+def _collect_tests():
+    """Find every module-level function whose name starts with 'test_'."""
+    import inspect
+    tests = []
+    current_module = sys.modules[__name__]
+    for name, obj in inspect.getmembers(current_module):
+        if name.startswith('test_') and inspect.isfunction(obj):
+            tests.append((name, obj))
+    tests.sort(key=lambda pair: inspect.getsourcelines(pair[1])[1])
+    return tests
+
+
+def main():
+    """Run all tests. Print summary. Exit non-zero on any failure."""
+    tests = _collect_tests()
+    failures = []
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"  PASS  {name}")
+        except Exception as e:
+            failures.append((name, f"{type(e).__name__}: {e}"))
+            print(f"  FAIL  {name}")
+            traceback.print_exc()
+    print(f"\n{len(tests) - len(failures)} of {len(tests)} render LOD tests passed.")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,299 @@
+"""
+test_star_properties_store.py - Tests for the columnar star properties store.
+
+Builds small legacy-format star_properties PKLs in a temporary directory
+and checks that the store imports them, answers lookups for many IDs in
+one join with the same values the per-star dict loop produced, appends
+only changed rows, survives an interrupted write, and keeps the
+massive-loss safety check of the PKL era. The catalog rebuild is checked
+against the old per-row formulas, and must send SIMBAD only the IDs the
+store has never seen.
+
+Run from the project directory:
+    python test_star_properties_store.py
+
+Exits 0 if all tests pass, non-zero on any failure.
+
+Role: devtool
+Domain: dev_tools
+
+Module created: October 2026
+"""
+
+import json
+import os
+import pickle
+import sys
+import tempfile
+import traceback
+
+import numpy as np
+from astropy.table import MaskedColumn, Table
+
+import star_properties_store as sps
+from star_properties import assign_properties_to_data, missing_property_ids
+from vot_cache_manager import VOTCacheManager, catalog_properties
+
+
+def _legacy(n=300, messier=('HIP 3',)):
+    uids = [f"HIP {i}" for i in range(1, n + 1)]
+    return {
+        'unique_ids': uids,
+        'star_names': [f"* star {i}" if i % 7 else None for i in range(1, n + 1)],
+        'spectral_types': ['G2V' if i % 2 else None for i in range(1, n + 1)],
+        'V_magnitudes': [i / 10 if i % 5 else None for i in range(1, n + 1)],
+        'B_magnitudes': [i / 9 for i in range(1, n + 1)],
+        'object_types': ['*'] * n,
+        'is_messier': [uid in messier for uid in uids],
+        'distance_ly': [float(i) for i in range(1, n + 1)],
+        'notes': ['note' if uid in messier else '' for uid in uids],
+    }
+
+
+def _pkl(tmp, data=None, name='star_properties_distance.pkl'):
+    path = os.path.join(tmp, name)
+    with open(path, 'wb') as f:
+        pickle.dump(_legacy() if data is None else data, f)
+    return path
+
+
+def _dict_from_legacy(data):
+    """The per-star dict star_properties used to build from the PKL."""
+    props = {}
+    for i, uid in enumerate(data['unique_ids']):
+        p = {'star_name': data['star_names'][i], 'spectral_type': data['spectral_types'][i],
+             'V_magnitude': data['V_magnitudes'][i], 'B_magnitude': data['B_magnitudes'][i],
+             'object_type': data['object_types'][i], 'is_messier': data['is_messier'][i]}
+        if data['is_messier'][i]:
+            p['distance_ly'] = data['distance_ly'][i]
+            p['notes'] = data['notes'][i]
+        props[uid] = p
+    return props
+
+
+# ============================================================
+# Import and joins
+# ============================================================
+
+def test_import_roundtrip():
+    """The legacy PKL is imported once; rows read back as the legacy values."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _pkl(tmp)
+        store = sps.open_store(path)
+        assert len(store) == 300
+        assert os.path.exists(os.path.join(sps.store_dir_for(path), 'MANIFEST.json'))
+        again = sps.open_store(path)
+        assert again['HIP 5'] == store['HIP 5']
+        assert again['HIP 5']['V_magnitude'] is None
+        assert again['HIP 7']['star_name'] is None
+        assert again['HIP 8']['spectral_type'] is None
+        assert again['HIP 3']['is_messier'] is True and again['HIP 3']['notes'] == 'note'
+        assert 'HIP 301' not in again and 'HIP 300' in again
+
+
+def test_join_matches_dict_path():
+    """assign_properties_to_data gives the same columns from a store and a dict."""
+    with tempfile.TemporaryDirectory() as tmp:
+        data = _legacy()
+        store = sps.open_store(_pkl(tmp, data))
+        legacy = _dict_from_legacy(data)
+        uids = [f"HIP {i}" for i in range(0, 320, 3)] + [None]
+
+        a = assign_properties_to_data(Table({'x': np.zeros(len(uids))}), store, uids)
+        b = assign_properties_to_data(Table({'x': np.zeros(len(uids))}), legacy, uids)
+        for col in ('Star_Name', 'Spectral_Type', 'Object_Type', 'Is_Messier',
+                    'Distance_ly', 'Notes'):
+            assert list(a[col]) == list(b[col]), col
+        for col in ('V_mag', 'B_mag'):
+            assert np.array_equal(np.asarray(a[col], float), np.asarray(b[col], float),
+                                  equal_nan=True), col
+        assert missing_property_ids(uids, store) == missing_property_ids(uids, legacy)
+
+
+# ============================================================
+# Writes
+# ============================================================
+
+def test_append_writes_only_changed_rows():
+    """store[uid] = props then a save adds one segment holding just that row."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _pkl(tmp)
+        store = sps.open_store(path)
+        store['Gaia DR3 42'] = {'star_name': 'new', 'V_magnitude': 11.5}
+        store['HIP 2'] = {**store['HIP 2'], 'Temperature': 5800.0}
+        sps.save_properties(store, path)
+
+        with open(os.path.join(sps.store_dir_for(path), 'MANIFEST.json')) as f:
+            manifest = json.load(f)
+        assert len(manifest['segments']) == 1 and manifest['rows'] == 301
+        with np.load(os.path.join(sps.store_dir_for(path), manifest['segments'][0])) as seg:
+            assert sorted(seg['ids']) == ['Gaia DR3 42', 'HIP 2']
+
+        reloaded = sps.open_store(path)
+        assert reloaded['Gaia DR3 42']['V_magnitude'] == 11.5
+        assert reloaded['HIP 2']['Temperature'] == 5800.0
+        assert reloaded['HIP 2']['B_magnitude'] == store['HIP 2']['B_magnitude']
+
+
+def test_segments_compact():
+    """More than MAX_SEGMENTS appends fold into a new base; backup kept."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _pkl(tmp)
+        store = sps.open_store(path)
+        for i in range(sps.MAX_SEGMENTS + 1):
+            store[f"HIP {1000 + i}"] = {'star_name': f"extra {i}"}
+            store.flush()
+        directory = sps.store_dir_for(path)
+        with open(os.path.join(directory, 'MANIFEST.json')) as f:
+            manifest = json.load(f)
+        assert manifest['generation'] == 2 and manifest['segments'] == []
+        assert os.path.exists(os.path.join(directory, 'backup.npz'))
+        assert len(sps.open_store(path)) == 300 + sps.MAX_SEGMENTS + 1
+
+
+def test_interrupted_write_leaves_store_intact():
+    """Files not named by the manifest (a crash mid-write) are ignored."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _pkl(tmp)
+        sps.open_store(path)
+        directory = sps.store_dir_for(path)
+        with open(os.path.join(directory, 'seg-1-1.npz.tmp'), 'wb') as f:
+            f.write(b'half written')
+        with open(os.path.join(directory, 'MANIFEST.json.tmp'), 'w') as f:
+            f.write('{"version": 1, "gen')
+        store = sps.open_store(path)
+        assert len(store) == 300
+        store['HIP 999'] = {'star_name': 'after crash'}
+        store.flush()
+        assert sps.open_store(path)['HIP 999']['star_name'] == 'after crash'
+
+
+def test_massive_loss_blocked():
+    """Replacing 300 stars with 10 is refused and an emergency copy made."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _pkl(tmp)
+        sps.open_store(path)
+        try:
+            sps.save_properties({f"HIP {i}": {'star_name': 'x'} for i in range(10)}, path)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("massive loss was not blocked")
+        assert any('.emergency_' in name for name in os.listdir(tmp))
+        assert len(sps.open_store(path)) == 300
+
+
+def test_changed_pkl_is_reimported():
+    """A PKL rewritten by an older tool is merged in as a segment."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _pkl(tmp)
+        sps.open_store(path)
+        data = _legacy(n=310)
+        data['star_names'][0] = 'renamed'
+        _pkl(tmp, data)
+        store = sps.open_store(path)
+        assert len(store) == 310 and store['HIP 1']['star_name'] == 'renamed'
+
+
+# ============================================================
+# Catalog rebuild
+# ============================================================
+
+def _hipparcos(n=400):
+    rng = np.random.default_rng(1)
+    table = Table()
+    table['HIP'] = np.arange(1, n + 1, dtype=np.int32)
+    table['Plx'] = rng.uniform(-2, 50, n)
+    table['Vmag'] = MaskedColumn(rng.uniform(0, 9, n), mask=rng.random(n) < 0.05)
+    table['B-V'] = rng.uniform(-0.2, 1.8, n)
+    return table
+
+
+class _RecordingSimbad:
+    """Stands in for SimbadQueryManager.query_objects; records the IDs asked for."""
+    def __init__(self):
+        self.asked = []
+
+    def query_objects(self, object_names, existing_properties, properties_file):
+        self.asked.extend(object_names)
+        for name in object_names:
+            existing_properties[name] = {'star_name': f"SIMBAD {name}", 'V_magnitude': 99.0}
+        return existing_properties
+
+
+def test_catalog_columns_match_row_formulas():
+    """distance, V and B per star equal the old per-row expressions."""
+    table = _hipparcos()
+    cat = catalog_properties(table, 'hipparcos')
+    for row in table[:60]:
+        props = cat[f"HIP {row['HIP']}"]
+        if row['Plx'] > 0:
+            assert np.isclose(props['distance_pc'], 1000.0 / row['Plx'])
+            assert np.isclose(props['distance_ly'], 1000.0 / row['Plx'] * 3.26156)
+        else:
+            assert props['distance_pc'] is None
+        if np.ma.is_masked(row['Vmag']):
+            assert props['V_magnitude'] is None and props['B_magnitude'] is None
+        else:
+            assert np.isclose(props['V_magnitude'], row['Vmag'])
+            assert np.isclose(props['B_magnitude'], row['Vmag'] + row['B-V'])
+        assert props['Source_Catalog'] == 'Hipparcos'
+
+
+def test_rebuild_queries_only_unresolved():
+    """Stars already in the store keep their SIMBAD data and are not re-queried."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _pkl(tmp)                       # HIP 1..300 already resolved
+        vot = os.path.join(tmp, 'hipparcos_data_distance.vot')
+        _hipparcos().write(vot, format='votable')
+        simbad = _RecordingSimbad()
+        store = VOTCacheManager(cache_dir=tmp).rebuild_pkl_from_caches(
+            path, {'hipparcos': vot}, simbad)
+
+        assert sorted(simbad.asked) == sorted(f"HIP {i}" for i in range(301, 401))
+        reloaded = sps.open_store(path)
+        assert len(reloaded) == len(store) == 400
+        assert reloaded['HIP 350']['star_name'] == 'SIMBAD HIP 350'
+        assert reloaded['HIP 10']['star_name'] == '* star 10'
+        assert reloaded['HIP 10']['Source_Catalog'] == 'Hipparcos'
+
+        # A second rebuild has nothing left to ask SIMBAD
+        again = _RecordingSimbad()
+        VOTCacheManager(cache_dir=tmp).rebuild_pkl_from_caches(path, {'hipparcos': vot}, again)
+        assert again.asked == []
+
+
+# ============================================================
+# Test runner
+# ============================================================
+
+def _collect_tests():
+    """Find every module-level function whose name starts with 'test_'."""
+    import inspect
+    tests = []
+    current_module = sys.modules[__name__]
+    for name, obj in inspect.getmembers(current_module):
+        if name.startswith('test_') and inspect.isfunction(obj):
+            tests.append((name, obj))
+    tests.sort(key=lambda pair: inspect.getsourcelines(pair[1])[1])
+    return tests
+
+
+def main():
+    """Run all tests. Print summary. Exit non-zero on any failure."""
+    tests = _collect_tests()
+    failures = []
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"  PASS  {name}")
+        except Exception as e:
+            failures.append((name, f"{type(e).__name__}: {e}"))
+            print(f"  FAIL  {name}")
+            traceback.print_exc()
+    print(f"\n{len(tests) - len(failures)} of {len(tests)} star properties store tests passed.")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,189 @@
+"""
+test_star_sphere_tiles.py - Tests for the magnitude-tiered star sphere tiles.
+
+Builds tiles from a synthetic star list in a temporary directory and
+checks that every star lands in exactly one tier and one sky region, that
+a load opens only the tiers its limit needs and reads designations only
+when asked, that a sky-window load returns just that window's stars, and
+that the renderer keeps the vmag 3.5 background on the JSON while a
+deeper Star Depth is drawn from the tiles.
+
+Run from the project directory:
+    python test_star_sphere_tiles.py
+
+Exits 0 if all tests pass, non-zero on any failure.
+
+Role: devtool
+Domain: dev_tools
+
+Module created: October 2026
+"""
+
+import os
+import sys
+import tempfile
+import traceback
+
+import numpy as np
+
+import star_sphere_builder as ssb
+
+
+def _stars(n=2000, seed=0):
+    """build_star_data-shaped list: [x, y, z, vmag, designation], brightest first."""
+    rng = np.random.default_rng(seed)
+    z = rng.uniform(-1, 1, n)
+    lon = rng.uniform(0, 2 * np.pi, n)
+    r = np.sqrt(1 - z ** 2)
+    vmag = np.round(rng.uniform(-1.5, 8.0, n), 2)
+    stars = [[round(float(r[i] * np.cos(lon[i])), 6), round(float(r[i] * np.sin(lon[i])), 6),
+              round(float(z[i]), 6), float(vmag[i]), f"HIP {i}"] for i in range(n)]
+    stars.sort(key=lambda s: s[3])
+    return stars
+
+
+def _build(tmp, stars=None):
+    stars = _stars() if stars is None else stars
+    manifest = ssb.build_tiles(stars, tile_dir=tmp)
+    return stars, manifest
+
+
+# ============================================================
+# Build
+# ============================================================
+
+def test_every_star_in_one_tier_and_region():
+    """Tier counts add up; region offsets partition each tier file."""
+    with tempfile.TemporaryDirectory() as tmp:
+        stars, manifest = _build(tmp)
+        assert sum(t['star_count'] for t in manifest['tiers']) == len(stars)
+        for tier in manifest['tiers']:
+            rows = np.load(os.path.join(tmp, tier['file']))
+            offsets = tier['region_offsets']
+            assert offsets[0] == 0 and offsets[-1] == len(rows)
+            regions = ssb.sky_region(rows['xyz'])
+            for r in range(len(offsets) - 1):
+                assert np.all(regions[offsets[r]:offsets[r + 1]] == r)
+            lo = -np.inf if tier['vmag_min'] is None else tier['vmag_min']
+            assert np.all((rows['vmag'] > lo) & (rows['vmag'] <= tier['vmag_max']))
+            assert rows.dtype.itemsize == 16
+
+
+def test_regions_are_equal_area():
+    """Uniform sky: every region holds about the same number of stars."""
+    rng = np.random.default_rng(3)
+    z = rng.uniform(-1, 1, 72000)
+    lon = rng.uniform(0, 2 * np.pi, 72000)
+    r = np.sqrt(1 - z ** 2)
+    counts = np.bincount(ssb.sky_region(np.column_stack([r * np.cos(lon), r * np.sin(lon), z])),
+                         minlength=ssb.REGION_LON_BINS * ssb.REGION_LAT_BINS)
+    assert counts.min() > 800 and counts.max() < 1200
+
+
+# ============================================================
+# Load
+# ============================================================
+
+def test_load_opens_only_needed_tiers():
+    """vmag 5 reads tiers 3.5 and 5 only; the names file only with names=True."""
+    with tempfile.TemporaryDirectory() as tmp:
+        stars, _ = _build(tmp)
+        got = ssb.load_star_tiles(5.0, tile_dir=tmp)
+        assert sorted(ssb._tile_cache['rows']) == ['tier_35.npy', 'tier_50.npy']
+        assert got['names'] is None and not ssb._tile_cache['names']
+        want = [s for s in stars if s[3] <= 5.0]
+        assert len(got['vmag']) == len(want)
+        assert np.isclose(sorted(got['vmag']), [s[3] for s in want], atol=1e-5).all()
+
+        named = ssb.load_star_tiles(4.2, names=True, tile_dir=tmp)
+        assert len(named['names']) == len(named['vmag']) == sum(s[3] <= 4.2 for s in stars)
+        by_name = {s[4]: s[3] for s in stars}
+        assert all(abs(by_name[n] - v) < 1e-5 for n, v in zip(named['names'], named['vmag']))
+
+
+def test_sky_window_load():
+    """A window load returns exactly the stars of the regions it overlaps."""
+    with tempfile.TemporaryDirectory() as tmp:
+        stars, _ = _build(tmp)
+        regions = ssb.regions_in_window((330, 30), (-10, 40))
+        assert len(regions) == 2 * 3
+        got = ssb.load_star_tiles(8.0, regions=regions, tile_dir=tmp)
+        xyz = np.array([s[:3] for s in stars])
+        assert len(got['vmag']) == np.isin(ssb.sky_region(xyz), regions).sum()
+        assert np.isin(ssb.sky_region(got['xyz']), regions).all()
+
+
+def test_rebuilt_tiles_are_reloaded():
+    """A new manifest drops the cached tier files."""
+    with tempfile.TemporaryDirectory() as tmp:
+        _build(tmp)
+        first = len(ssb.load_star_tiles(8.0, tile_dir=tmp)['vmag'])
+        _build(tmp, _stars(n=500, seed=1))
+        path = os.path.join(tmp, ssb.TILE_MANIFEST)
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert first == 2000 and len(ssb.load_star_tiles(8.0, tile_dir=tmp)['vmag']) == 500
+
+
+# ============================================================
+# Renderer
+# ============================================================
+
+def test_renderer_depth():
+    """3.5 draws the JSON stars; a deeper limit draws the tiles; no tiles falls back."""
+    sphere = {'meta': {'vmag_limit': 3.5},
+              'stars': [s for s in _stars() if s[3] <= 3.5]}
+    with tempfile.TemporaryDirectory() as tmp:
+        _build(tmp)
+        saved = ssb.TILE_DIR
+        ssb.TILE_DIR = tmp
+        try:
+            shallow = ssb._sphere_stars(sphere, 3.5, names=False)
+            assert len(shallow['vmag']) == len(sphere['stars']) and shallow['names'] is None
+            deep = ssb._sphere_stars(sphere, 6.5, names=True)
+            assert len(deep['vmag']) > len(sphere['stars'])
+            assert len(deep['names']) == len(deep['vmag'])
+        finally:
+            ssb.TILE_DIR = saved
+        ssb.TILE_DIR = os.path.join(tmp, 'missing')
+        try:
+            fallback = ssb._sphere_stars(sphere, 6.5, names=False)
+            assert len(fallback['vmag']) == len(sphere['stars'])
+        finally:
+            ssb.TILE_DIR = saved
+
+
+# ============================================================
+# Test runner
+# ============================================================
+
+def _collect_tests():
+    """Find every module-level function whose name starts with 'test_'."""
+    import inspect
+    tests = []
+    current_module = sys.modules[__name__]
+    for name, obj in inspect.getmembers(current_module):
+        if name.startswith('test_') and inspect.isfunction(obj):
+            tests.append((name, obj))
+    tests.sort(key=lambda pair: inspect.getsourcelines(pair[1])[1])
+    return tests
+
+
+def main():
+    """Run all tests. Print summary. Exit non-zero on any failure."""
+    tests = _collect_tests()
+    failures = []
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"  PASS  {name}")
+        except Exception as e:
+            failures.append((name, f"{type(e).__name__}: {e}"))
+            print(f"  FAIL  {name}")
+            traceback.print_exc()
+    print(f"\n{len(tests) - len(failures)} of {len(tests)} star sphere tile tests passed.")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,189 @@
+"""
+test_vizier_bands.py - Tests for the banded, resumable VizieR cache expansion.
+
+Plans bands for distance and magnitude expansions and checks they tile the
+new range with no overlap. Then widens a temporary Hipparcos-shaped cache
+against an in-memory catalogue (no network): one band fails on the first
+run, and the second run must fetch only that band and end with exactly
+the stars a single full query would have returned.
+
+Run from the project directory:
+    python test_vizier_bands.py
+
+Exits 0 if all tests pass, non-zero on any failure.
+
+Role: devtool
+Domain: dev_tools
+
+Module created: October 2026
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import traceback
+import warnings
+
+import numpy as np
+from astropy.table import Table
+
+import vizier_bands
+from incremental_cache_manager import IncrementalCacheManager
+
+warnings.simplefilter('ignore')
+
+
+def _catalogue(rows=3000, seed=0):
+    """Stars uniform in volume out to 800 ly, with Hipparcos column names."""
+    rng = np.random.default_rng(seed)
+    distance = 800.0 * rng.random(rows) ** (1.0 / 3.0)
+    table = Table()
+    table['HIP'] = np.arange(1, rows + 1, dtype=np.int32)
+    table['Plx'] = 1000.0 * vizier_bands.LY_PER_PC / distance
+    table['Vmag'] = rng.uniform(0, 12, rows)
+    return table
+
+
+def _in_range(table, band):
+    lo, hi = (float(x) for x in band.constraint.split('..'))
+    col = np.asarray(table[band.column])
+    return table[(col >= lo) & (col <= hi)]
+
+
+def _within(table, light_years):
+    return table[np.asarray(table['Plx']) >= 1000.0 * vizier_bands.LY_PER_PC / light_years]
+
+
+# ============================================================
+# Planning
+# ============================================================
+
+def test_distance_bands_tile_range():
+    """Shells run contiguously from the old limit to the new, equal in volume."""
+    bands = vizier_bands.plan_bands('hipparcos', 'distance', 100.0, 500.0)
+    assert len(bands) == vizier_bands.MAX_BANDS
+    assert bands[0].lo == 100.0 and bands[-1].hi == 500.0
+    for a, b in zip(bands[:-1], bands[1:]):
+        assert a.hi == b.lo
+    volumes = [b.hi ** 3 - b.lo ** 3 for b in bands]
+    assert np.allclose(volumes, volumes[0])
+    lo, hi = (float(x) for x in bands[0].constraint.split('..'))
+    assert bands[0].column == 'Plx' and lo < hi
+
+
+def test_small_expansion_is_one_band():
+    assert len(vizier_bands.plan_bands('hipparcos', 'distance', 100.0, 105.0)) == 1
+    assert vizier_bands.plan_bands('hipparcos', 'distance', 100.0, 90.0) == []
+
+
+def test_magnitude_bands_use_catalogue_column():
+    """Gaia bands are in Gmag with the +0.5 offset and the 11.0 ceiling."""
+    bands = vizier_bands.plan_bands('gaia', 'magnitude', 8.0, 11.0)
+    assert all(b.column == 'Gmag' for b in bands)
+    assert bands[0].constraint.startswith('8.5000..')
+    assert bands[-1].constraint.endswith('..11.0000')
+    hip = vizier_bands.plan_bands('hipparcos', 'magnitude', 6.0, 6.4)
+    assert [b.constraint for b in hip] == ['6.0000..6.4000']
+
+
+def test_gaia_bands_stop_at_ceiling():
+    """No Gaia band starts at or above the Gmag ceiling."""
+    assert vizier_bands.plan_bands('gaia', 'magnitude', 10.6, 12.0) == []
+    assert vizier_bands.plan_bands('gaia', 'magnitude', 10.5, 12.0) == []
+    bands = vizier_bands.plan_bands('gaia', 'magnitude', 8.0, 14.0)
+    for band in bands:
+        lo, hi = (float(v) for v in band.constraint.split('..'))
+        assert lo < hi <= vizier_bands.GAIA_GMAG_CEILING
+    assert bands[-1].hi == 10.5
+
+
+def test_completed_bands_leave_only_gaps():
+    done = [{'lo': 100.0, 'hi': 300.0, 'file': None, 'rows': 0}]
+    bands = vizier_bands.plan_bands('hipparcos', 'distance', 100.0, 500.0, done)
+    assert bands[0].lo == 300.0 and bands[-1].hi == 500.0
+    assert len(bands) < vizier_bands.MAX_BANDS
+
+
+# ============================================================
+# Expansion
+# ============================================================
+
+def test_interrupted_expansion_resumes():
+    """A failed band is refetched alone; the result equals one full query."""
+    catalogue = _catalogue()
+    saved_rate = vizier_bands.QUERIES_PER_SECOND
+    vizier_bands.QUERIES_PER_SECOND = 1000.0
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            mgr = IncrementalCacheManager(cache_dir=tmp)
+            name = 'hipparcos_data_distance.vot'
+            mgr.save_data_with_metadata(_within(catalogue, 100.0), name,
+                                        'hipparcos', 'distance', 100.0)
+            calls = []
+            lock = threading.Lock()
+
+            def flaky(band):
+                with lock:
+                    calls.append(band.band_id)
+                if band.lo > 400.0 and len(calls) <= vizier_bands.MAX_BANDS:
+                    raise ConnectionError("connection closed by VizieR")
+                return _in_range(catalogue, band)
+
+            _, metadata = mgr.check_cache_validity(name, 'distance', 500.0)
+            assert mgr.expand_in_bands(None, name, 'hipparcos', 'distance',
+                                       metadata, 500.0, fetch_band=flaky) is None
+            metadata = mgr.load_metadata(name)
+            assert metadata.limit_value == 100.0
+            saved = len(metadata.bands)
+            assert 0 < saved < vizier_bands.MAX_BANDS
+
+            first_run = len(calls)
+            status, metadata = mgr.check_cache_validity(name, 'distance', 500.0)
+            assert status == 'expand'
+            combined = mgr.expand_in_bands(None, name, 'hipparcos', 'distance',
+                                           metadata, 500.0, fetch_band=flaky)
+            assert len(calls) - first_run == vizier_bands.MAX_BANDS - saved
+            assert sorted(combined['HIP']) == sorted(_within(catalogue, 500.0)['HIP'])
+
+            metadata = mgr.load_metadata(name)
+            assert metadata.limit_value == 500.0 and metadata.bands is None
+            assert not os.path.exists(os.path.join(tmp, 'hipparcos_data_distance.bands'))
+    finally:
+        vizier_bands.QUERIES_PER_SECOND = saved_rate
+
+
+# ============================================================
+# Test runner
+# ============================================================
+
+def _collect_tests():
+    """Find every module-level function whose name starts with 'test_'."""
+    import inspect
+    tests = []
+    current_module = sys.modules[__name__]
+    for name, obj in inspect.getmembers(current_module):
+        if name.startswith('test_') and inspect.isfunction(obj):
+            tests.append((name, obj))
+    tests.sort(key=lambda pair: inspect.getsourcelines(pair[1])[1])
+    return tests
+
+
+def main():
+    """Run all tests. Print summary. Exit non-zero on any failure."""
+    tests = _collect_tests()
+    failures = []
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"  PASS  {name}")
+        except Exception as e:
+            failures.append((name, f"{type(e).__name__}: {e}"))
+            print(f"  FAIL  {name}")
+            traceback.print_exc()
+    print(f"\n{len(tests) - len(failures)} of {len(tests)} VizieR band tests passed.")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""
+test_vot_sidecar.py - Tests for the columnar sidecar of the VOT star caches.
+
+Writes small Hipparcos-shaped VOTs to a temporary directory and checks that
+vot_sidecar serves the same rows, in the same order, with the same units
+and masks as Table.read plus a boolean mask; that a changed VOT is never
+served from a stale sidecar while a merely touched one is; and that the
+IncrementalCacheManager subset path goes through the sidecar.
+
+Run from the project directory:
+    python test_vot_sidecar.py
+
+Exits 0 if all tests pass, non-zero on any failure.
+
+Role: devtool
+Domain: dev_tools
+
+Module created: October 2026
+"""
+
+import json
+import os
+import sys
+import tempfile
+import traceback
+import warnings
+
+import numpy as np
+from astropy.table import MaskedColumn, Table
+
+import vot_sidecar
+from incremental_cache_manager import CacheMetadata, IncrementalCacheManager
+
+warnings.simplefilter('ignore')
+
+
+def _table(rows=500, seed=0):
+    rng = np.random.default_rng(seed)
+    table = Table()
+    table['HIP'] = np.arange(1, rows + 1, dtype=np.int32)
+    table['Vmag'] = MaskedColumn(rng.uniform(-1, 12, rows), mask=rng.random(rows) < 0.05,
+                                 unit='mag', description='V magnitude')
+    table['Distance_ly'] = rng.uniform(1, 1000, rows)
+    table['Distance_ly'].unit = 'lyr'
+    table['SpType'] = np.array(['G2V', 'K1III', 'M0V'], dtype=object)[rng.integers(0, 3, rows)]
+    return table
+
+
+def _write(tmp, table, name='hipparcos_data_distance.vot'):
+    path = os.path.join(tmp, name)
+    table.write(path, format='votable', overwrite=True)
+    return path
+
+
+def _xml_filter(path, key, limit):
+    table = Table.read(path, format='votable')
+    return table[np.ma.filled(np.ma.asarray(table[key], dtype=float), np.nan) <= limit]
+
+
+# ============================================================
+# Same table as the XML path
+# ============================================================
+
+def test_subset_matches_xml_in_vot_order():
+    """A sort-key subset is the XML-plus-mask rows, in VOT order."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write(tmp, _table())
+        vot_sidecar.read_vot(path, 'Distance_ly', 200.0)       # builds the sidecar
+        assert os.path.exists(vot_sidecar.sidecar_paths(path)['manifest'])
+        got = vot_sidecar.read_vot(path, 'Distance_ly', 200.0)
+        want = _xml_filter(path, 'Distance_ly', 200.0)
+        assert list(got['HIP']) == list(want['HIP'])
+        assert list(got['SpType']) == list(want['SpType'])
+        assert np.array_equal(got['Vmag'].mask, want['Vmag'].mask)
+        assert str(got['Vmag'].unit) == 'mag'
+        assert got['Vmag'].description == 'V magnitude'
+
+
+def test_other_key_and_missing_key():
+    """Filtering on a non-sort key still works; an absent key means no filter."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write(tmp, _table())
+        vot_sidecar.read_vot(path, 'Distance_ly', 100.0)
+        got = vot_sidecar.read_vot(path, ('Gmag', 'Vmag'), 6.0)
+        want = _xml_filter(path, 'Vmag', 6.0)
+        assert list(got['HIP']) == list(want['HIP'])
+        assert len(vot_sidecar.read_vot(path, 'Gmag', 6.0)) == 500
+
+
+def test_sorted_slice_without_reorder():
+    """keep_order=False returns the contiguous slice, sorted by the key."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write(tmp, _table())
+        vot_sidecar.read_vot(path, 'Distance_ly', 300.0)
+        got = vot_sidecar.read_vot(path, 'Distance_ly', 300.0, keep_order=False)
+        d = np.asarray(got['Distance_ly'])
+        assert np.all(np.diff(d) >= 0) and d[-1] <= 300.0
+
+
+# ============================================================
+# Validation
+# ============================================================
+
+def test_changed_vot_is_not_served_stale():
+    """Rewriting the VOT with other rows rebuilds the sidecar."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write(tmp, _table(seed=0))
+        vot_sidecar.read_vot(path)
+        _write(tmp, _table(rows=300, seed=1))
+        assert not vot_sidecar.sidecar_is_fresh(path)
+        assert len(vot_sidecar.read_vot(path)) == 300
+        assert vot_sidecar.sidecar_is_fresh(path)
+
+
+def test_touched_vot_validated_by_hash():
+    """Same bytes, new mtime: still fresh, manifest mtime refreshed."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write(tmp, _table())
+        vot_sidecar.read_vot(path)
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+        assert vot_sidecar.sidecar_is_fresh(path)
+        with open(vot_sidecar.sidecar_paths(path)['manifest']) as f:
+            assert json.load(f)['source_mtime_ns'] == os.stat(path).st_mtime_ns
+
+
+def test_corrupt_sidecar_falls_back_to_xml():
+    """An unreadable .npy is ignored and the XML answers."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write(tmp, _table())
+        vot_sidecar.read_vot(path)
+        with open(vot_sidecar.sidecar_paths(path)['cols'], 'wb') as f:
+            f.write(b'not numpy')
+        assert len(vot_sidecar.read_vot(path, 'Distance_ly', 100.0)) == \
+            len(_xml_filter(path, 'Distance_ly', 100.0))
+
+
+# ============================================================
+# Cache manager integration
+# ============================================================
+
+def test_cache_manager_subset_uses_sidecar():
+    """save_data_with_metadata writes the sidecar; a subset load reads it."""
+    with tempfile.TemporaryDirectory() as tmp:
+        mgr = IncrementalCacheManager(cache_dir=tmp)
+        table = _table()
+        mgr.save_data_with_metadata(table, 'hipparcos_data_distance.vot',
+                                    'hipparcos', 'distance', 1000.0)
+        path = os.path.join(tmp, 'hipparcos_data_distance.vot')
+        with open(vot_sidecar.sidecar_paths(path)['manifest']) as f:
+            assert json.load(f)['sort_key'] == 'Distance_ly'
+
+        status, metadata = mgr.check_cache_validity('hipparcos_data_distance.vot',
+                                                    'distance', 150.0)
+        assert status == 'subset'
+        got = mgr.load_and_filter_cache('hipparcos_data_distance.vot', metadata,
+                                        'distance', 150.0)
+        assert list(got['HIP']) == list(_xml_filter(path, 'Distance_ly', 150.0)['HIP'])
+
+
+# ============================================================
+# Test runner
+# ============================================================
+
+def _collect_tests():
+    """Find every module-level function whose name starts with 'test_'."""
+    import inspect
+    tests = []
+    current_module = sys.modules[__name__]
+    for name, obj in inspect.getmembers(current_module):
+        if name.startswith('test_') and inspect.isfunction(obj):
+            tests.append((name, obj))
+    tests.sort(key=lambda pair: inspect.getsourcelines(pair[1])[1])
+    return tests
+
+
+def main():
+    """Run all tests. Print summary. Exit non-zero on any failure."""
+    tests = _collect_tests()
+    failures = []
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"  PASS  {name}")
+        except Exception as e:
+            failures.append((name, f"{type(e).__name__}: {e}"))
+            print(f"  FAIL  {name}")
+            traceback.print_exc()
+    print(f"\n{len(tests) - len(failures)} of {len(tests)} VOT sidecar tests passed.")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
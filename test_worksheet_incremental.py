@@ -0,0 +1,234 @@
+"""
+test_worksheet_incremental.py - Tests for worksheet_checker's incremental runs.
+
+Builds a small project with two annotated modules and two worksheets in
+a temporary folder and runs the checker over it. Checks that a second
+run in a new process re-checks nothing and writes the same reports, that
+editing a module re-checks only its annotations and editing a worksheet
+only the annotations citing it, that renaming a function a worksheet key
+names re-checks the annotations reading that worksheet and finds the key
+stale, and that --full re-checks everything and agrees with the carried
+results.
+
+Needs no network access.
+
+Run from the project directory:
+    python test_worksheet_incremental.py
+
+Exits 0 if all tests pass, non-zero on any failure.
+
+Role: devtool
+Domain: dev_tools
+
+Module created: October 2026
+"""
+
+import contextlib
+import os
+import sys
+import tempfile
+import traceback
+
+import ast_index
+import worksheet_checker as wc
+
+FILES = {
+    'constants_new.py': (
+        '"""Fixture constants.\n\nRole: data\nDomain: orrery\n"""\n\n'
+        '# Source: IUGG mean radius\n'
+        '# Cross-checked: Claude 2026-10-01 -- IUGG (worksheet_claude_fixture.md)\n'
+        'EARTH_RADIUS_KM = 6371.0\n\n'
+        '# Source: IAU 2015 nominal\n'
+        '# Cross-checked: Claude 2026-10-01 -- IAU (worksheet_claude_fixture.md)\n'
+        'SUN_RADIUS_KM = 695700.0\n'),
+    'fixture_catalog.py': (
+        '"""Fixture catalog.\n\nRole: data\nDomain: orrery\n"""\n\n'
+        '# Source: IAU lunar radius\n'
+        '# Cross-checked: Claude 2026-10-01 -- IAU (worksheet_claude_keys.md)\n'
+        'MOON_RADIUS_KM = 1737.4\n'),
+    'fixture_keys.py': (
+        '"""Fixture module a worksheet key names.\n\nRole: devtool\n'
+        'Domain: dev_tools\n"""\n\n\n'
+        'def lunar_radius():\n'
+        '    return 1737.4\n'),
+    os.path.join(wc.WORKSHEET_DIR, 'worksheet_claude_fixture.md'): (
+        '| Constant | Value | Your value | Value correct? | Notes |\n'
+        '|---|---|---|---|---|\n'
+        '| EARTH_RADIUS_KM | 6371.0 | 6371.0 | CONFIRMED | mean radius |\n'
+        '| SUN_RADIUS_KM | 695700.0 | 695700.0 | CONFIRMED | nominal |\n'),
+    os.path.join(wc.WORKSHEET_DIR, 'worksheet_claude_keys.md'): (
+        '| Key | Constant | Value | Your value | Value correct? |\n'
+        '|---|---|---|---|---|\n'
+        '| `fixture_keys.py::lunar_radius` | lunar radius | 1737.4 '
+        '| 1737.4 | CONFIRMED |\n'),
+}
+
+REPORTS = (wc.REPORT_PATH, wc.ROUTED_PATH, wc.CITATION_PROMPT_PATH)
+
+
+@contextlib.contextmanager
+def _project():
+    """Temporary project as the working directory; caches restored after."""
+    saved = dict(ast_index._INDEXES), dict(ast_index._CODE_VERSIONS)
+    saved_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, text in FILES.items():
+            path = os.path.join(tmp, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8', newline='\n') as handle:
+                handle.write(text)
+        # key_sources() reads the working directory.
+        os.chdir(tmp)
+        try:
+            yield tmp
+        finally:
+            os.chdir(saved_cwd)
+            _new_process()
+            ast_index._INDEXES.update(saved[0])
+            ast_index._CODE_VERSIONS.update(saved[1])
+
+
+def _new_process():
+    """Forget everything held in memory, as a fresh interpreter would."""
+    ast_index._INDEXES.clear()
+    wc._SOURCE_CACHE.clear()
+    wc._KEY_SOURCES.clear()
+
+
+def _edit(tmp, name, old, new):
+    path = os.path.join(tmp, name)
+    with open(path, encoding='utf-8') as handle:
+        text = handle.read()
+    assert old in text
+    with open(path, 'w', encoding='utf-8', newline='\n') as handle:
+        handle.write(text.replace(old, new))
+
+
+def _run(tmp, full=False):
+    """(counts, {label: findings codes}, report texts) in a new process."""
+    _new_process()
+    counts = wc.run(tmp, '2026-10-18', full)[2]
+    claims = wc.collect_claims(tmp)[0]
+    wc.check_claims(tmp, claims, wc.load_worksheets(tmp), set())
+    codes = {claim.unit.name: [code for _layer, code, _detail
+                               in claim.findings] for claim in claims}
+    texts = []
+    for name in REPORTS:
+        with open(os.path.join(tmp, name), encoding='utf-8') as handle:
+            texts.append(handle.read())
+    return counts, codes, texts
+
+
+# ============================================================
+# Carrying forward
+# ============================================================
+
+def test_warm_run_rechecks_nothing():
+    """A second run carries every verdict and writes the same reports."""
+    with _project() as tmp:
+        cold, codes, texts = _run(tmp)
+        warm, again, warm_texts = _run(tmp)
+    assert (cold['rechecked'], cold['carried']) == (3, 0)
+    assert (warm['rechecked'], warm['carried']) == (0, 3)
+    # The first run's report also notes that the uncited set was new.
+    assert again == codes and warm_texts[1:] == texts[1:]
+    assert codes['EARTH_RADIUS_KM'] == [] and codes['MOON_RADIUS_KM'] == ['UNMATCHED']
+
+
+def test_carried_result_equals_fresh_check():
+    """Every attribute check_claim() sets comes back on a carried claim."""
+    with _project() as tmp:
+        _run(tmp)
+        _new_process()
+        carried = wc.collect_claims(tmp)[0]
+        worksheets = wc.load_worksheets(tmp)
+        assert wc.check_claims(tmp, carried, worksheets, set()) == (0, 3)
+        fresh = wc.collect_claims(tmp, refresh=True)[0]
+        for claim in fresh:
+            wc.check_claim(claim, worksheets, set())
+    for old, new in zip(carried, fresh):
+        left = {k: v for k, v in vars(old).items() if k != 'unit'}
+        right = {k: v for k, v in vars(new).items() if k != 'unit'}
+        assert left == right
+
+
+# ============================================================
+# What re-checks
+# ============================================================
+
+def test_module_edit_rechecks_its_annotations():
+    """A moved value re-checks its module's two annotations, not the third."""
+    with _project() as tmp:
+        _run(tmp)
+        _edit(tmp, 'constants_new.py', '6371.0', '6378.1')
+        counts, codes, _ = _run(tmp)
+    assert (counts['rechecked'], counts['carried']) == (2, 1)
+    assert 'MISMATCH' in codes['EARTH_RADIUS_KM']
+    assert codes['SUN_RADIUS_KM'] == []
+
+
+def test_worksheet_edit_rechecks_its_citers():
+    """A verdict changed in one worksheet re-checks only its annotations."""
+    with _project() as tmp:
+        _run(tmp)
+        _edit(tmp, os.path.join(wc.WORKSHEET_DIR, 'worksheet_claude_fixture.md'),
+              '| 695700.0 | CONFIRMED |', '| 695700.0 | PARTIAL |')
+        counts, codes, _ = _run(tmp)
+    assert (counts['rechecked'], counts['carried']) == (2, 1)
+    assert codes['SUN_RADIUS_KM'] != [] and codes['EARTH_RADIUS_KM'] == []
+
+
+def test_key_module_edit_rechecks_worksheet_readers():
+    """Renaming what a recorded key names re-checks and finds the key stale."""
+    with _project() as tmp:
+        _run(tmp)
+        _edit(tmp, 'fixture_keys.py', 'def lunar_radius', 'def moon_radius')
+        counts, codes, _ = _run(tmp)
+    assert (counts['rechecked'], counts['carried']) == (1, 2)
+    assert codes['MOON_RADIUS_KM'] == ['KEY_STALE']
+
+
+def test_full_rechecks_everything():
+    """--full ignores what is stored and reaches the same verdicts."""
+    with _project() as tmp:
+        _run(tmp)
+        _, codes, texts = _run(tmp)
+        counts, again, full_texts = _run(tmp, full=True)
+    assert (counts['rechecked'], counts['carried']) == (3, 0)
+    assert again == codes and full_texts == texts
+
+
+# ============================================================
+# Test runner
+# ============================================================
+
+def _collect_tests():
+    """Find every module-level function whose name starts with 'test_'."""
+    import inspect
+    tests = []
+    current_module = sys.modules[__name__]
+    for name, obj in inspect.getmembers(current_module):
+        if name.startswith('test_') and inspect.isfunction(obj):
+            tests.append((name, obj))
+    tests.sort(key=lambda pair: inspect.getsourcelines(pair[1])[1])
+    return tests
+
+
+def main():
+    """Run all tests. Print summary. Exit non-zero on any failure."""
+    tests = _collect_tests()
+    failures = []
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"  PASS  {name}")
+        except Exception as e:
+            failures.append((name, f"{type(e).__name__}: {e}"))
+            print(f"  FAIL  {name}")
+            traceback.print_exc()
+    print(f"\n{len(tests) - len(failures)} of {len(tests)} worksheet incremental tests passed.")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -18,6 +18,10 @@ Module updated: June 2026 with Anthropic's Claude Opus 4.8. Added
     build_scene/build_scene_axes/build_scene_axis -- single source of truth
     for the static and animation main scene dicts (item 19.3 Phase 1);
     Phase 2 adds auto_dtick + autorange suppression for close-approach grids.
+Module updated: October 2026. Look-at and fly-to buttons now carry only a
+    waypoint index into one shared table (fig._camera_waypoints); the
+    relayout is built and eased client-side by save_utils'
+    camera-waypoint script, so the layout no longer grows with targets.
 
 Role: rendering
 Domain: stars
@@ -163,10 +167,53 @@ def add_camera_center_button(fig, center_object_name='Sun'):
     
     return fig
 
+# Camera waypoints shared by the look-at and fly-to dropdowns. Each button
+# used to carry its own relayout dict (camera, three axis ranges, dticks,
+# titles), so the layout grew with targets x menus. Now a button carries
+# only its label and ('look' | 'fly', waypoint index); the positions live
+# once in fig._camera_waypoints, and save_utils injects a small script that
+# builds the relayout from the table and eases the camera there. Index -1
+# is each menu's fixed first entry (+X axis view / Return to Full View).
+CAMERA_TRANSITION_STEPS = 8
+
+
+def _camera_waypoint_store(fig, center_pos):
+    """The figure's shared waypoint table, created on first use."""
+    store = getattr(fig, '_camera_waypoints', None)
+    if store is None:
+        store = {
+            'center': [float(c) for c in center_pos],
+            'names': [],
+            'xyz': [],          # flat [x0, y0, z0, x1, ...]
+            'flyR': [],         # fly-to half-window per waypoint (AU)
+            'dtick': [],        # fly-to grid spacing per waypoint (AU)
+            'lookRanges': None,
+            'full': None,
+            'steps': CAMERA_TRANSITION_STEPS,
+        }
+        fig._camera_waypoints = store
+    return store
+
+
+def _camera_waypoint(store, name, pos):
+    """Index of name's waypoint in store, appending it if new."""
+    names = store['names']
+    if name in names:
+        return names.index(name)
+    names.append(name)
+    store['xyz'].extend(float(v) for v in pos)
+    store['flyR'].append(None)
+    store['dtick'].append(None)
+    return len(names) - 1
+
+
 def add_look_at_object_buttons(fig, positions, center_object_name='Sun', target_objects=None,
                                show_target_marker=True):
     """
     Add buttons to point camera from center toward specific target objects.
+
+    Buttons reference the shared camera waypoint table (see
+    _camera_waypoint_store); the relayout is built client-side.
     
     Parameters:
         fig (plotly.graph_objects.Figure): The figure to add buttons to
@@ -210,26 +257,18 @@ def add_look_at_object_buttons(fig, positions, center_object_name='Sun', target_
         if isinstance(center_data, dict) and 'x' in center_data:
             center_pos = [center_data['x'], center_data['y'], center_data['z']]
     
+    store = _camera_waypoint_store(fig, center_pos)
+    if has_ranges:
+        store['lookRanges'] = [x_range, y_range, z_range]
+
     # Create list of buttons
     buttons = []
     
     # First button: Look along +X axis (original behavior)
-    button_args_x = {
-        "scene.camera": {
-            "eye": {"x": 0.001, "y": 0, "z": 0},
-            "center": {"x": 1, "y": 0, "z": 0},
-            "up": {"x": 0, "y": 0, "z": 1}
-        }
-    }
-    if has_ranges:
-        button_args_x["scene.xaxis.range"] = x_range
-        button_args_x["scene.yaxis.range"] = y_range
-        button_args_x["scene.zaxis.range"] = z_range
-    
     buttons.append(dict(
         label=f"View +X axis (Aries) from {center_object_name}",
-        method="relayout",
-        args=[button_args_x]
+        method="skip",
+        args=['look', -1]
     ))
     
     # Add buttons for each target object
@@ -250,44 +289,14 @@ def add_look_at_object_buttons(fig, positions, center_object_name='Sun', target_
         if distance < 1e-10:  # Too close, skip
             continue
         
-        # Normalize the direction
-        direction_norm = direction / distance
-        
-        # Place camera at center, looking toward target
-        # Use a small offset to avoid singularity at origin
-        camera_offset = 0.001
-        
-        # Camera position
-        eye_pos = {
-            'x': center_pos[0] + direction_norm[0] * camera_offset,
-            'y': center_pos[1] + direction_norm[1] * camera_offset,
-            'z': center_pos[2] + direction_norm[2] * camera_offset
-        }
-        
-        # Look at the target position
-        center_look = {
-            'x': target_pos[0],
-            'y': target_pos[1],
-            'z': target_pos[2]
-        }
-        
-        button_args = {
-            "scene.camera": {
-                "eye": eye_pos,
-                "center": center_look,
-                "up": {"x": 0, "y": 0, "z": 1}
-            }
-        }
-        
-        if has_ranges:
-            button_args["scene.xaxis.range"] = x_range
-            button_args["scene.yaxis.range"] = y_range
-            button_args["scene.zaxis.range"] = z_range
+        # The script places the camera at center (0.001 offset toward the
+        # target, avoiding the singularity at origin) looking at the target
+        waypoint = _camera_waypoint(store, target_name, target_pos)
         
         buttons.append(dict(
             label=f"View {target_name} from {center_object_name}",
-            method="relayout",
-            args=[button_args]
+            method="skip",
+            args=['look', waypoint]
         ))
     
     # Create dropdown menu with all buttons
@@ -502,6 +511,10 @@ def add_fly_to_object_buttons(fig, positions, center_object_name='Sun', target_o
     
     Unlike add_look_at_object_buttons (which views FROM center TOWARD target),
     this places the camera NEAR the target looking AT the target.
+
+    Like the look-at dropdown, buttons reference the shared camera
+    waypoint table; each waypoint stores its window half-width and grid
+    spacing, and the axis titles are derived client-side.
     
     Parameters:
         fig (plotly.graph_objects.Figure): The figure to add buttons to
@@ -532,6 +545,8 @@ def add_fly_to_object_buttons(fig, positions, center_object_name='Sun', target_o
         if isinstance(center_data, dict) and 'x' in center_data:
             center_pos = np.array([center_data['x'], center_data['y'], center_data['z']])
     
+    store = _camera_waypoint_store(fig, center_pos)
+
     # Create list of buttons
     buttons = []
         
@@ -549,27 +564,14 @@ def add_fly_to_object_buttons(fig, positions, center_object_name='Sun', target_o
         orig_span = orig_x_range[1] - orig_x_range[0]
         orig_dtick = _calculate_grid_dtick(orig_span)
         
+        store['full'] = {
+            'ranges': [orig_x_range, orig_y_range, orig_z_range],
+            'dtick': orig_dtick,
+        }
         buttons.append(dict(
             label="Return to Full View",
-            method="relayout",
-            args=[{
-                "scene.camera": {
-                    "eye": {"x": 1.5, "y": 1.5, "z": 1.2},
-                    "center": {"x": 0, "y": 0, "z": 0},
-                    "up": {"x": 0, "y": 0, "z": 1}
-                },
-                "scene.xaxis.range": orig_x_range,
-                "scene.yaxis.range": orig_y_range,
-                "scene.zaxis.range": orig_z_range,
-                "scene.xaxis.dtick": orig_dtick,
-                "scene.yaxis.dtick": orig_dtick,
-                "scene.zaxis.dtick": orig_dtick,
-                "scene.xaxis.title": "X (AU)",
-                "scene.yaxis.title": "Y (AU)",
-                "scene.zaxis.title": "Z (AU)",
-                "scene.aspectmode": "cube",
-                "scene.aspectratio": {"x": 1, "y": 1, "z": 1}
-            }]
+            method="skip",
+            args=['fly', -1]
         ))
     
     # Add buttons for each target object
@@ -608,43 +610,12 @@ def add_fly_to_object_buttons(fig, positions, center_object_name='Sun', target_o
         else:
             view_radius = fly_distance + (distance_from_center * distance_scale_factor)
 
-        # Zoom axis ranges to target area
-        new_x_range = [float(target_pos[0]) - view_radius, float(target_pos[0]) + view_radius]
-        new_y_range = [float(target_pos[1]) - view_radius, float(target_pos[1]) + view_radius]
-        new_z_range = [float(target_pos[2]) - view_radius, float(target_pos[2]) + view_radius]
-        
-        # Adaptive grid: pick dtick so ~5-8 gridlines appear across the view
-        zoom_dtick = _calculate_grid_dtick(view_radius * 2)
-        
-        # Format tick labels: show km equivalent when zoomed in close
-        # At small scales (< 0.1 AU), AU values like 1.357 are hard to interpret
-        zoom_dtick_km = zoom_dtick * 149597870.7
-        if zoom_dtick < 0.01:
-            # Very close: show grid spacing in km in axis title
-            axis_title_suffix = f" (grid: {zoom_dtick_km:,.0f} km)"
-        elif zoom_dtick < 0.1:
-            axis_title_suffix = f" (grid: {zoom_dtick_km/1e6:.1f}M km)"
-        else:
-            axis_title_suffix = ""
-        
-        button_args = {
-            "scene.camera": {
-                "eye": {"x": 1.5, "y": 1.5, "z": 1.2},
-                "center": {"x": 0, "y": 0, "z": 0},
-                "up": {"x": 0, "y": 0, "z": 1}
-            },
-            "scene.xaxis.range": new_x_range,
-            "scene.yaxis.range": new_y_range,
-            "scene.zaxis.range": new_z_range,
-            "scene.xaxis.dtick": zoom_dtick,
-            "scene.yaxis.dtick": zoom_dtick,
-            "scene.zaxis.dtick": zoom_dtick,
-            "scene.xaxis.title": f"X (AU){axis_title_suffix}",
-            "scene.yaxis.title": f"Y (AU){axis_title_suffix}",
-            "scene.zaxis.title": f"Z (AU){axis_title_suffix}",
-            "scene.aspectmode": "cube",
-            "scene.aspectratio": {"x": 1, "y": 1, "z": 1}            
-        }
+        # Zoom window: target +/- view_radius on each axis. Adaptive grid:
+        # pick dtick so ~5-8 gridlines appear across the view. The script
+        # adds the km grid spacing to the axis titles when zoomed in close.
+        waypoint = _camera_waypoint(store, target_name, target_pos)
+        store['flyR'][waypoint] = float(view_radius)
+        store['dtick'][waypoint] = _calculate_grid_dtick(view_radius * 2)
         
         # Format distance for label
         if distance_from_center < 0.01:
@@ -656,8 +627,8 @@ def add_fly_to_object_buttons(fig, positions, center_object_name='Sun', target_o
         
         buttons.append(dict(
             label=f"Fly to {target_name} ({dist_str})",
-            method="relayout",
-            args=[button_args]
+            method="skip",
+            args=['fly', waypoint]
         ))
     
     # Sort buttons by distance for easier navigation
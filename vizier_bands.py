@@ -0,0 +1,237 @@
+"""
+vizier_bands.py - Banded, resumable VizieR fetch for widening a star cache.
+
+When a Hipparcos or Gaia cache has to grow (100 -> 500 ly, mag 6 -> 9),
+smart_load_or_fetch_* used to issue one query for the whole new range. A
+large widening is a long single request that VizieR may drop, and an
+interruption threw the whole download away. This module splits the range
+between the cached limit and the new one into bands and fetches them
+concurrently:
+
+    - distance: spherical shells of equal volume, each sent as one
+      parallax range (Plx lo..hi), so every band holds a similar number
+      of stars
+    - magnitude: equal-count bands assuming N(<m) ~ 10^(0.6 m), sent as
+      a Vmag (Hipparcos) or Gmag + 0.5 (Gaia) range
+
+At most MAX_WORKERS queries run at once, and a shared token-bucket
+RateLimiter (the one simbad_manager uses) paces their start. Each band is
+written as its own VOT under <cache>.bands/ as soon as it arrives, and
+recorded in CacheMetadata.bands. After an interrupted expansion the next
+run plans only the gaps, so it resumes rather than restarts. When every
+band is in, the caller merges base plus segments into the cache file and
+the band directory is removed.
+
+Key classes:
+    Band - one range: limits in ly or mag plus the VizieR constraint
+    BandedFetch - fetches a plan concurrently, persisting each segment
+
+Key functions:
+    plan_bands() - split an expansion (minus completed bands) into bands
+
+Consumed by: incremental_cache_manager.py (smart_load_or_fetch_hipparcos/gaia)
+
+Role: cache
+Domain: stars
+
+Module created: October 2026
+"""
+
+import logging
+import math
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+
+from astropy.table import Table, vstack
+
+logger = logging.getLogger(__name__)
+
+LY_PER_PC = 3.26156
+MAX_BANDS = 8
+MAX_WORKERS = 4
+QUERIES_PER_SECOND = 2.0
+BAND_DIR_SUFFIX = '.bands'
+
+# catalog -> magnitude column and the offset applied to the limit for that column
+MAGNITUDE_COLUMNS = {
+    'hipparcos': ('Vmag', 0.0),
+    'gaia': ('Gmag', 0.5),
+}
+GAIA_GMAG_CEILING = 11.0
+
+
+@dataclass
+class Band:
+    """One slab of an expansion; lo/hi in ly (distance) or mag (magnitude)."""
+    lo: float
+    hi: float
+    column: str
+    constraint: str
+
+    @property
+    def band_id(self) -> str:
+        return f"{self.lo:.4f}-{self.hi:.4f}"
+
+
+def _parallax_mas(light_years: float) -> float:
+    return 1000.0 * LY_PER_PC / light_years
+
+
+def _weight(mode: str, limit: float) -> float:
+    """Expected star count below limit, up to a constant."""
+    if mode == 'distance':
+        return limit ** 3
+    return 10.0 ** (0.6 * limit)
+
+
+def _inverse_weight(mode: str, weight: float) -> float:
+    if mode == 'distance':
+        return weight ** (1.0 / 3.0)
+    return math.log10(weight) / 0.6
+
+
+def _gaps(lo: float, hi: float, completed: Sequence[Dict]) -> List[tuple]:
+    """Parts of [lo, hi] not covered by completed band records."""
+    gaps = []
+    cursor = lo
+    for band in sorted(completed, key=lambda b: b['lo']):
+        if band['hi'] <= cursor or band['lo'] >= hi:
+            continue
+        if band['lo'] > cursor:
+            gaps.append((cursor, band['lo']))
+        cursor = max(cursor, band['hi'])
+    if cursor < hi:
+        gaps.append((cursor, hi))
+    return gaps
+
+
+def _make_band(catalog: str, mode: str, lo: float, hi: float) -> Band:
+    if mode == 'distance':
+        return Band(lo, hi, 'Plx', f"{_parallax_mas(hi):.6f}..{_parallax_mas(lo):.6f}")
+    column, offset = MAGNITUDE_COLUMNS[catalog]
+    top = hi + offset
+    if catalog == 'gaia':
+        top = min(GAIA_GMAG_CEILING, top)
+    return Band(lo, hi, column, f"{lo + offset:.4f}..{top:.4f}")
+
+
+def plan_bands(catalog: str, mode: str, old_limit: float, new_limit: float,
+               completed: Sequence[Dict] = (), max_bands: int = MAX_BANDS) -> List[Band]:
+    """
+    Bands covering (old_limit, new_limit] minus the completed band records.
+
+    The band count follows the expected growth of the cache: widening
+    100 -> 105 ly (16% more stars) is one band, 100 -> 500 ly is
+    max_bands. A gap left by completed bands gets the share of those bands
+    matching its share of the expected new stars, at least one. Gaia
+    magnitude limits are clamped to GAIA_GMAG_CEILING first, so no band
+    starts above the ceiling.
+    """
+    if catalog == 'gaia' and mode == 'magnitude':
+        new_limit = min(new_limit, GAIA_GMAG_CEILING - MAGNITUDE_COLUMNS['gaia'][1])
+    if new_limit <= old_limit:
+        return []
+    w_old = _weight(mode, old_limit)
+    growth = (_weight(mode, new_limit) - w_old) / w_old
+    total = max(1, min(max_bands, math.ceil(growth)))
+
+    full_weight = _weight(mode, new_limit) - w_old
+    bands = []
+    for lo, hi in _gaps(old_limit, new_limit, completed):
+        weight = _weight(mode, hi) - _weight(mode, lo)
+        n = max(1, round(total * weight / full_weight))
+        w_lo, w_hi = _weight(mode, lo), _weight(mode, hi)
+        edges = [lo] + [_inverse_weight(mode, w_lo + (w_hi - w_lo) * i / n)
+                        for i in range(1, n)] + [hi]
+        bands.extend(_make_band(catalog, mode, a, b) for a, b in zip(edges[:-1], edges[1:]))
+    return bands
+
+
+class BandedFetch:
+    """
+    Fetch a plan of bands concurrently, persisting each as it completes.
+
+    fetch_band(band) -> Table performs one query (it must be safe to call
+    from worker threads). on_progress(records) is called from the calling
+    thread after each band is saved, with every completed band record so
+    far; the cache manager stores them in CacheMetadata.bands.
+    """
+
+    def __init__(self, cache_dir: str, data_filename: str,
+                 fetch_band: Callable[[Band], Table],
+                 max_workers: int = MAX_WORKERS,
+                 queries_per_second: Optional[float] = None):
+        from simbad_manager import RateLimiter
+
+        self.segment_dir = os.path.join(
+            cache_dir, os.path.splitext(data_filename)[0] + BAND_DIR_SUFFIX)
+        self.fetch_band = fetch_band
+        self.max_workers = max_workers
+        self._limiter = RateLimiter(queries_per_second or QUERIES_PER_SECOND)
+        self._lock = threading.Lock()
+
+    def completed(self, records: Optional[Sequence[Dict]]) -> List[Dict]:
+        """Recorded bands whose segment file is still on disk (or that were empty)."""
+        return [r for r in (records or [])
+                if r['file'] is None or os.path.exists(os.path.join(self.segment_dir, r['file']))]
+
+    def _fetch(self, band: Band) -> Table:
+        with self._lock:
+            self._limiter.wait_if_needed()
+        return self.fetch_band(band)
+
+    def _save(self, band: Band, table: Table) -> Dict:
+        if len(table) == 0:
+            return {'lo': band.lo, 'hi': band.hi, 'file': None, 'rows': 0}
+        os.makedirs(self.segment_dir, exist_ok=True)
+        name = f"band_{band.band_id}.vot"
+        path = os.path.join(self.segment_dir, name)
+        tmp = path + '.tmp'
+        table.write(tmp, format='votable', overwrite=True)
+        os.replace(tmp, path)
+        return {'lo': band.lo, 'hi': band.hi, 'file': name, 'rows': len(table)}
+
+    def run(self, bands: Sequence[Band], records: Sequence[Dict],
+            on_progress: Optional[Callable[[List[Dict]], None]] = None):
+        """
+        Fetch bands on top of the completed records.
+
+        Returns (complete, records): complete is True when every band was
+        saved; records lists all saved bands. Failed bands stay unrecorded
+        so the next plan covers them again.
+        """
+        records = list(records)
+        if not bands:
+            return True, records
+        failed = 0
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(bands))) as pool:
+            futures = {pool.submit(self._fetch, band): band for band in bands}
+            for future in as_completed(futures):
+                band = futures[future]
+                try:
+                    table = future.result()
+                    records.append(self._save(band, table))
+                    logger.info(f"Band {band.column} {band.constraint}: {len(table)} rows")
+                except Exception as e:
+                    failed += 1
+                    logger.warning(f"Band {band.column} {band.constraint} failed: {e}")
+                    continue
+                if on_progress is not None:
+                    on_progress(sorted(records, key=lambda r: r['lo']))
+        return failed == 0, sorted(records, key=lambda r: r['lo'])
+
+    def load_segments(self, records: Sequence[Dict]) -> Optional[Table]:
+        """All saved band segments stacked into one table (None if none)."""
+        tables = [Table.read(os.path.join(self.segment_dir, r['file']), format='votable')
+                  for r in sorted(records, key=lambda r: r['lo']) if r['file']]
+        tables = [t for t in tables if len(t)]
+        if not tables:
+            return None
+        return vstack(tables) if len(tables) > 1 else tables[0]
+
+    def cleanup(self):
+        shutil.rmtree(self.segment_dir, ignore_errors=True)
@@ -3,8 +3,19 @@
 VOT Cache Manager - Safe management of VizieR VOT cache files
 Similar protection protocols as PKL files in simbad_manager.py
 
+Loads go through vot_sidecar (binary columnar copy, validated by hash);
+saves refresh the sidecar alongside the VOT.
+
+catalog_properties() derives distance, V/B magnitude and source catalog
+for a whole Hipparcos or Gaia table as array operations; the properties
+rebuild merges those columns into star_properties_store and sends only
+IDs the store has never seen to SIMBAD.
+
 Role: cache
 Domain: stars
+
+Module updated: October 2026 (columnar sidecar for VOT loads and saves)
+Module updated: October 2026 (column-wise properties rebuild against the store)
 """
 
 import os
@@ -20,6 +31,9 @@ from datetime import datetime
 import numpy as np
 import pandas as pd
 
+import vot_sidecar
+from star_properties_store import StarPropertyStore, open_store, save_properties
+
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +58,66 @@ class VOTCacheMetadata:
         return cls(**data)
 
 
+# catalog name fragment -> (ID column, unique_id prefix, Source_Catalog label)
+CATALOG_IDS = {
+    'hipparcos': ('HIP', 'HIP ', 'Hipparcos'),
+    'gaia': ('Source', 'Gaia DR3 ', 'Gaia'),
+}
+
+
+def _float_column(table: Table, name: str) -> Optional[np.ndarray]:
+    """Column as float64 with masked cells as NaN, or None if absent."""
+    if name not in table.colnames:
+        return None
+    return np.ma.filled(np.ma.asarray(table[name], dtype=float), np.nan)
+
+
+def catalog_properties(table: Table, catalog: str) -> StarPropertyStore:
+    """
+    Catalog-derived properties for every row of a Hipparcos or Gaia table.
+
+    Column-wise equivalent of the per-row rebuild: unique_id from HIP or
+    Source, distance_pc/distance_ly from positive parallaxes, V from Vmag
+    (Hipparcos) or Gmag - 0.2 (Gaia, rough), B = Vmag + (B-V), and the
+    Source_Catalog label. Rows without an ID are dropped.
+    """
+    key = next((k for k in CATALOG_IDS if k in catalog.lower()), None)
+    if key is None or CATALOG_IDS[key][0] not in table.colnames:
+        return StarPropertyStore()
+    id_col, prefix, label = CATALOG_IDS[key]
+
+    raw = table[id_col]
+    keep = ~np.ma.getmaskarray(raw)
+    ids = np.char.add(prefix, np.asarray(np.ma.filled(raw, 0))[keep].astype(np.int64).astype(str))
+    n = len(ids)
+
+    columns = {}
+    plx = _float_column(table, 'Plx')
+    if plx is not None:
+        plx = plx[keep]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            distance_pc = np.where(plx > 0, 1000.0 / plx, np.nan)
+        columns['distance_pc'] = distance_pc
+        columns['distance_ly'] = distance_pc * 3.26156
+
+    if key == 'hipparcos':
+        vmag = _float_column(table, 'Vmag')
+        bv = _float_column(table, 'B-V')
+        if vmag is not None:
+            columns['V_magnitude'] = vmag[keep]
+            if bv is not None:
+                columns['B_magnitude'] = vmag[keep] + bv[keep]
+    else:
+        gmag = _float_column(table, 'Gmag')
+        if gmag is not None:
+            columns['V_magnitude'] = gmag[keep] - 0.2
+
+    source = np.empty(n, dtype=object)
+    source[:] = label
+    columns['Source_Catalog'] = source
+    return StarPropertyStore(ids, columns)._sorted_unique()
+
+
 class VOTCacheManager:
     """Manager for safe VOT cache file operations"""
     
@@ -145,7 +219,7 @@ class VOTCacheManager:
             return None
         
         try:
-            table = Table.read(filepath, format='votable')
+            table = vot_sidecar.read_vot(filepath)
             
             # Basic validation
             if len(table) == 0:
@@ -230,6 +304,10 @@ class VOTCacheManager:
             
             # Move temp to final
             shutil.move(temp_file, filepath)
+            vot_sidecar.write_sidecar(
+                table, filepath,
+                vot_sidecar.default_sort_key(table.colnames,
+                                             metadata.query_type if metadata else None))
             
             # Save metadata if provided
             if metadata:
@@ -299,88 +377,56 @@ class VOTCacheManager:
             logger.info("No new unique entries to add")
             return existing_table
     
-    def rebuild_pkl_from_caches(self, properties_file: str, 
-                               vot_files: Dict[str, str],
-                               simbad_manager_instance: Any) -> Dict:
-        """
-        Rebuild PKL properties file from existing VOT and PKL caches.
-        This merges VizieR catalog data with SIMBAD properties.
-        """
-        logger.info(f"Rebuilding {properties_file} from VOT and existing caches...")
-        
-        all_properties = {}
-        
-        # Load data from each VOT file
+    def load_catalog_properties(self, vot_files: Dict[str, str]) -> StarPropertyStore:
+        """Catalog-derived properties of every star in vot_files, as one store."""
+        combined = StarPropertyStore()
         for catalog, vot_file in vot_files.items():
-            if not os.path.exists(vot_file):
+            path = vot_file
+            if not os.path.exists(path):
+                path = os.path.join(self.cache_dir, vot_file)
+            if not os.path.exists(path):
                 logger.warning(f"VOT file not found: {vot_file}")
                 continue
             
-            table = self.safe_load_vot(vot_file)
+            table = self.safe_load_vot(path)
             if table is None:
                 continue
             
             logger.info(f"Processing {len(table)} entries from {catalog}")
-            
-            # Extract star identifiers and basic properties
-            if 'hipparcos' in catalog.lower():
-                for row in table:
-                    hip_id = f"HIP {row['HIP']}"
-                    
-                    # Initialize property dict
-                    props = {
-                        'unique_id': hip_id,
-                        'Source_Catalog': 'Hipparcos',
-                        'distance_pc': 1000.0 / row['Plx'] if row['Plx'] > 0 else None,
-                        'distance_ly': (1000.0 / row['Plx']) * 3.26156 if row['Plx'] > 0 else None
-                    }
-                    
-                    # Add magnitude data if available
-                    if 'Vmag' in row.colnames and not np.isnan(row['Vmag']):
-                        props['V_magnitude'] = float(row['Vmag'])
-                    if 'B-V' in row.colnames and not np.isnan(row['B-V']):
-                        props['B_magnitude'] = float(row['Vmag'] + row['B-V'])
-                    
-                    all_properties[hip_id] = props
-            
-            elif 'gaia' in catalog.lower():
-                for row in table:
-                    gaia_id = f"Gaia DR3 {row['Source']}"
-                    
-                    props = {
-                        'unique_id': gaia_id,
-                        'Source_Catalog': 'Gaia',
-                        'distance_pc': 1000.0 / row['Plx'] if row['Plx'] > 0 else None,
-                        'distance_ly': (1000.0 / row['Plx']) * 3.26156 if row['Plx'] > 0 else None
-                    }
-                    
-                    # Convert Gaia magnitude to V magnitude (approximate)
-                    if 'Gmag' in row.colnames and not np.isnan(row['Gmag']):
-                        # Rough conversion: V ~ G - 0.2
-                        props['V_magnitude'] = float(row['Gmag']) - 0.2
-                    
-                    all_properties[gaia_id] = props
+            combined.merge(catalog_properties(table, catalog))
+        return combined
+    
+    def rebuild_pkl_from_caches(self, properties_file: str, 
+                               vot_files: Dict[str, str],
+                               simbad_manager_instance: Any) -> StarPropertyStore:
+        """
+        Rebuild PKL properties file from existing VOT and PKL caches.
+        This merges VizieR catalog data with SIMBAD properties.
+        
+        Only IDs absent from the properties store are sent to SIMBAD; the
+        catalog columns are then merged into every row and the changed
+        rows appended to the store.
+        """
+        logger.info(f"Rebuilding {properties_file} from VOT and existing caches...")
         
-        # Now query SIMBAD for additional properties
-        missing_ids = list(all_properties.keys())
+        catalog = self.load_catalog_properties(vot_files)
+        store = open_store(properties_file)
+        
+        # Query SIMBAD only for stars it has never resolved
+        missing_ids = store.missing(catalog.ids)
         
         if missing_ids and simbad_manager_instance:
-            logger.info(f"Querying SIMBAD for {len(missing_ids)} stars...")
-            
-            # Use existing SIMBAD query function with rate limiting
-            updated_properties = simbad_manager_instance.query_simbad_for_star_properties(
-                missing_ids, 
-                all_properties, 
-                properties_file
-            )
-            
-            return updated_properties
+            logger.info(f"Querying SIMBAD for {len(missing_ids)} stars "
+                        f"({len(catalog.ids) - len(missing_ids)} already resolved)...")
+            simbad_manager_instance.query_objects(missing_ids, store, properties_file)
+        
+        changed = store.merge(catalog)
+        logger.info(f"Catalog data updated {changed} of {len(catalog.ids)} stars")
         
-        # Save properties even without SIMBAD data
-        if all_properties:
-            simbad_manager_instance.safe_save_properties(all_properties, properties_file)
+        if len(store):
+            save_properties(store, properties_file)
         
-        return all_properties
+        return store
 
 
 # Integration functions for existing code
@@ -0,0 +1,343 @@
+"""
+vot_sidecar.py - Binary columnar sidecar for the VizieR VOTable star caches.
+
+The Hipparcos and Gaia caches in star_data/ are VOTable XML. Every
+planetarium, HR diagram and star-sphere build used to parse the whole file
+with Table.read(..., format='votable') and then throw most of it away with
+a boolean mask. This module keeps a binary copy of each VOT beside it:
+
+    X.vot.cols.npy   - every column as one numpy structured array, rows
+                       sorted by the sort key (Distance_ly or a magnitude)
+    X.vot.mask.npy   - per-column masks, only when the table has masked cells
+    X.vot.index.npy  - (row, key): original VOT row and sort-key value per
+                       stored row (NaN for masked/missing keys, sorted last)
+    X.vot.cols.json  - manifest: SHA-256, size and mtime of the VOT it was
+                       built from, sort key, column units/descriptions/meta
+
+The .npy files are opened with mmap_mode='r'. A "stars within L ly" or
+"stars brighter than m" read is a searchsorted on the index plus one
+contiguous slice; rows are then put back into VOT order, so callers get the
+same table the XML parse plus mask gave them (string columns come back as
+fixed-width str rather than object).
+
+A sidecar is trusted only while it matches its VOT: same size, and either
+the same mtime or the same SHA-256 (a touched but unchanged file is
+re-hashed once and the manifest refreshed). Anything else rebuilds it from
+the XML. Sidecars are written when a cache is saved and lazily on the first
+read of a VOT that has none; a failure to write one is logged and never
+stops the caller, which simply keeps using the XML.
+
+Key functions:
+    read_vot() - drop-in for Table.read(..., format='votable') plus an
+                 optional "key <= limit" filter
+    write_sidecar() - build/refresh the sidecar for a table just saved
+    default_sort_key() - Distance_ly for distance caches, magnitude otherwise
+    sidecar_is_fresh() - whether a VOT's sidecar can be used as-is
+
+Consumed by: incremental_cache_manager.py, vot_cache_manager.py,
+             star_sphere_builder.py, measure_vot_sidecar.py
+
+Role: cache
+Domain: stars
+
+Module created: October 2026
+"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Optional
+
+import numpy as np
+from astropy import units as u
+from astropy.table import Column, MaskedColumn, Table
+
+logger = logging.getLogger(__name__)
+
+SIDECAR_VERSION = 1
+
+DISTANCE_COLUMN = 'Distance_ly'
+MAGNITUDE_COLUMNS = ('Vmag', 'Gmag', 'Estimated_Vmag')
+
+
+def sidecar_paths(vot_path: str) -> dict:
+    """Paths of the sidecar files for vot_path."""
+    return {
+        'cols': vot_path + '.cols.npy',
+        'mask': vot_path + '.mask.npy',
+        'index': vot_path + '.index.npy',
+        'manifest': vot_path + '.cols.json',
+    }
+
+
+def default_sort_key(colnames, mode: Optional[str]) -> Optional[str]:
+    """Column a cache is sorted by: Distance_ly in distance mode, else a magnitude."""
+    if mode == 'distance' and DISTANCE_COLUMN in colnames:
+        return DISTANCE_COLUMN
+    for col in MAGNITUDE_COLUMNS:
+        if col in colnames:
+            return col
+    if DISTANCE_COLUMN in colnames:
+        return DISTANCE_COLUMN
+    return None
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _jsonable(value):
+    try:
+        json.dumps(value)
+        return value
+    except (TypeError, ValueError):
+        return None
+
+
+def _load_manifest(vot_path: str) -> Optional[dict]:
+    path = sidecar_paths(vot_path)['manifest']
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r') as f:
+            manifest = json.load(f)
+    except Exception as e:
+        logger.warning(f"Unreadable sidecar manifest {path}: {e}")
+        return None
+    if manifest.get('version') != SIDECAR_VERSION:
+        return None
+    return manifest
+
+
+def _save_manifest(vot_path: str, manifest: dict):
+    path = sidecar_paths(vot_path)['manifest']
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp, path)
+
+
+def sidecar_is_fresh(vot_path: str, manifest: Optional[dict] = None) -> bool:
+    """True if the sidecar was built from the VOT as it is on disk now."""
+    if manifest is None:
+        manifest = _load_manifest(vot_path)
+    if manifest is None or not os.path.exists(vot_path):
+        return False
+    paths = sidecar_paths(vot_path)
+    if not (os.path.exists(paths['cols']) and os.path.exists(paths['index'])):
+        return False
+    if manifest.get('has_mask') and not os.path.exists(paths['mask']):
+        return False
+
+    st = os.stat(vot_path)
+    if st.st_size != manifest.get('source_size'):
+        return False
+    if st.st_mtime_ns == manifest.get('source_mtime_ns'):
+        return True
+
+    # Same size, different mtime: trust the content hash, not the clock.
+    if _sha256(vot_path) != manifest.get('source_sha256'):
+        return False
+    manifest['source_mtime_ns'] = st.st_mtime_ns
+    try:
+        _save_manifest(vot_path, manifest)
+    except Exception as e:
+        logger.warning(f"Could not refresh sidecar manifest for {vot_path}: {e}")
+    return True
+
+
+def _storable(col):
+    """Column values as a fixed-width numpy array (object/str -> 'U')."""
+    values = np.asarray(col)          # MaskedColumn -> underlying data
+    if values.dtype.kind == 'O':
+        values = np.asarray([('' if v is None else str(v)) for v in values], dtype=str)
+    return values
+
+
+def write_sidecar(table: Table, vot_path: str, sort_key: Optional[str] = None) -> bool:
+    """Write the sidecar for table, which must be the content of vot_path.
+
+    sort_key defaults to default_sort_key(table.colnames, None). Returns
+    True on success; failures are logged and leave no usable sidecar.
+    """
+    paths = sidecar_paths(vot_path)
+    try:
+        if sort_key is not None and sort_key not in table.colnames:
+            sort_key = None
+        if sort_key is None:
+            sort_key = default_sort_key(table.colnames, None)
+
+        n = len(table)
+        if sort_key is not None:
+            key_col = table[sort_key]
+            keys = np.ma.filled(np.ma.asarray(key_col, dtype=float), np.nan)
+            order = np.argsort(keys, kind='stable')
+        else:
+            keys = np.full(n, np.nan)
+            order = np.arange(n)
+
+        stored = {name: _storable(table[name]) for name in table.colnames}
+        dtype = [(name, arr.dtype, arr.shape[1:]) for name, arr in stored.items()]
+        cols = np.empty(n, dtype=dtype)
+        for name, arr in stored.items():
+            cols[name] = arr[order]
+
+        masked = [name for name in table.colnames
+                  if getattr(table[name], 'mask', None) is not None
+                  and np.any(table[name].mask)]
+        if masked:
+            mask = np.zeros(n, dtype=[(name, bool, stored[name].shape[1:]) for name in masked])
+            for name in masked:
+                mask[name] = np.asarray(table[name].mask)[order]
+
+        index = np.empty(n, dtype=[('row', '<i8'), ('key', '<f8')])
+        index['row'] = order
+        index['key'] = keys[order]
+
+        # Manifest last: without it (or with a stale one) the .npy files are ignored.
+        if os.path.exists(paths['manifest']):
+            os.remove(paths['manifest'])
+        np.save(paths['cols'], cols)
+        np.save(paths['index'], index)
+        if masked:
+            np.save(paths['mask'], mask)
+        elif os.path.exists(paths['mask']):
+            os.remove(paths['mask'])
+
+        st = os.stat(vot_path)
+        manifest = {
+            'version': SIDECAR_VERSION,
+            'source': os.path.basename(vot_path),
+            'source_size': st.st_size,
+            'source_mtime_ns': st.st_mtime_ns,
+            'source_sha256': _sha256(vot_path),
+            'rows': n,
+            'sort_key': sort_key,
+            'has_mask': bool(masked),
+            'meta': {k: v for k, v in table.meta.items() if _jsonable(v) is not None},
+            'columns': [
+                {
+                    'name': name,
+                    'unit': None if table[name].unit is None else table[name].unit.to_string(),
+                    'description': table[name].description,
+                    'format': _jsonable(table[name].format),
+                    'meta': {k: v for k, v in table[name].meta.items()
+                             if _jsonable(v) is not None},
+                    'masked': isinstance(table[name], MaskedColumn),
+                }
+                for name in table.colnames
+            ],
+        }
+        _save_manifest(vot_path, manifest)
+        logger.info(f"Wrote columnar sidecar for {os.path.basename(vot_path)} "
+                    f"({n} rows, sorted by {sort_key})")
+        return True
+
+    except Exception as e:
+        logger.warning(f"Could not write columnar sidecar for {vot_path}: {e}")
+        return False
+
+
+def _rows_to_table(manifest, cols, mask, index, sel, keep_order):
+    """Build a Table from stored rows sel (slice or index array)."""
+    data = cols[sel]
+    mask_rows = mask[sel] if mask is not None else None
+    if keep_order:
+        perm = np.argsort(index['row'][sel], kind='stable')
+        data = data[perm]
+        if mask_rows is not None:
+            mask_rows = mask_rows[perm]
+
+    columns = []
+    for info in manifest['columns']:
+        name = info['name']
+        unit = None
+        if info['unit'] is not None:
+            unit = u.Unit(info['unit'], parse_strict='silent')
+        kwargs = dict(name=name, unit=unit, description=info['description'],
+                      format=info['format'], meta=info['meta'])
+        values = np.array(data[name])
+        if info['masked']:
+            col_mask = (np.array(mask_rows[name])
+                        if mask_rows is not None and name in mask_rows.dtype.names
+                        else np.zeros(values.shape, dtype=bool))
+            columns.append(MaskedColumn(values, mask=col_mask, **kwargs))
+        else:
+            columns.append(Column(values, **kwargs))
+    return Table(columns, meta=manifest['meta'])
+
+
+def _read_sidecar(vot_path, manifest, key, max_value, keep_order):
+    paths = sidecar_paths(vot_path)
+    cols = np.load(paths['cols'], mmap_mode='r')
+    index = np.load(paths['index'], mmap_mode='r')
+    mask = np.load(paths['mask'], mmap_mode='r') if manifest['has_mask'] else None
+    if len(cols) != manifest['rows'] or len(index) != manifest['rows']:
+        raise ValueError("sidecar row count does not match manifest")
+
+    if max_value is None or key is None:
+        sel = slice(0, len(cols))
+    elif key == manifest['sort_key']:
+        # Sorted, NaN last: the wanted rows are one contiguous slice.
+        sel = slice(0, int(np.searchsorted(index['key'], max_value, side='right')))
+    else:
+        values = np.asarray(cols[key], dtype=float)
+        keep = values <= max_value
+        if mask is not None and key in mask.dtype.names:
+            keep &= ~np.asarray(mask[key])
+        sel = np.flatnonzero(keep)
+    return _rows_to_table(manifest, cols, mask, index, sel, keep_order)
+
+
+def _resolve_key(key, colnames):
+    """First of key (a name or a sequence of candidate names) in colnames."""
+    if key is None:
+        return None
+    candidates = (key,) if isinstance(key, str) else tuple(key)
+    for name in candidates:
+        if name in colnames:
+            return name
+    return None
+
+
+def read_vot(vot_path: str, key=None, max_value: Optional[float] = None,
+             mode: Optional[str] = None, keep_order: bool = True,
+             build: bool = True) -> Table:
+    """Table.read(vot_path, format='votable'), optionally keeping key <= max_value.
+
+    key is a column name or a sequence of candidates (the first one present
+    is used); when none is present the table is returned unfiltered, as the
+    old mask code did. mode ('distance' / 'magnitude') picks the sort key of
+    a sidecar built here when there is no key.
+
+    Served from the columnar sidecar when it is fresh. Otherwise the XML is
+    parsed (and, if build is set, a sidecar written for next time). Rows
+    are returned in VOT order; keep_order=False skips that reordering on
+    sidecar reads, leaving them sorted by the sort key. Rows whose key is
+    masked or NaN are never kept by a filter.
+
+    Raises whatever Table.read raises when the XML itself is unreadable.
+    """
+    manifest = _load_manifest(vot_path)
+    if manifest is not None and sidecar_is_fresh(vot_path, manifest):
+        column = _resolve_key(key, [c['name'] for c in manifest['columns']])
+        try:
+            return _read_sidecar(vot_path, manifest, column, max_value, keep_order)
+        except Exception as e:
+            logger.warning(f"Columnar sidecar for {vot_path} unusable, "
+                           f"reading XML: {e}")
+
+    table = Table.read(vot_path, format='votable')
+    column = _resolve_key(key, table.colnames)
+    if build:
+        write_sidecar(table, vot_path,
+                      sort_key=column or default_sort_key(table.colnames, mode))
+    if column is not None and max_value is not None:
+        values = np.ma.filled(np.ma.asarray(table[column], dtype=float), np.nan)
+        table = table[values <= max_value]
+    return table
@@ -6,6 +6,11 @@ RUN COMMAND
 Open this file in VS Code and click Run. It takes no arguments.
 
     python worksheet_checker.py
+    python worksheet_checker.py --full
+
+A run re-checks only the annotations whose module or worksheet changed
+since the last one and carries every other verdict forward (see
+INCREMENTAL RUNS below). --full re-checks everything.
 
 It is also the last CHECKERS row in maintenance_run.py, so a normal
 maintenance run includes it.
@@ -91,20 +96,37 @@ Every run prints these rather than leaving them silent:
   - Header sets the registry does not recognise. Reported with file
     and line, never skipped quietly.
 
+INCREMENTAL RUNS
+----------------
+Reading the claims means extracting units from every module, and
+that, not the checking, was most of a run. The claims a module makes,
+the tables a worksheet holds, and each annotation's checked result are
+kept in the shared AST index (ast_index.py, data/ast_index.pkl), keyed
+by the content hash of the files they were read from. A result is
+carried forward only while its module, its worksheet, every module a
+key in that worksheet names, and this tool's own code are unchanged --
+everything check_claim() reads. The three reports are rebuilt from
+all the results on every run, carried or not, so they read the same
+either way.
+
 Role: devtool
 Domain: dev_tools
 
 Module created: August 2026 with Anthropic's Claude Opus 5.
 Module updated: August 18, 2026 with Anthropic's Claude Opus 5 (L-207).
 Module updated: August 21, 2026 with Anthropic's Claude Opus 5 (L-214).
+Module updated: October 2026 (incremental runs through ast_index; --full).
 """
 
+import argparse
+import copy
 import hashlib
 import json
 import os
 import re
 import sys
 
+import ast_index
 import provenance_scanner as ps
 import worksheet_keys as wk
 
@@ -1118,9 +1140,21 @@ class Claim(object):
         Minted by worksheet_keys, never composed here. Two spellings
         of the enclosing name would let a key be born stale -- correct
         when written, unresolvable forever, with nothing to say so.
+
+        Minting parses the module, so the key is kept in the AST index
+        against the module's content. A module that cannot be read is
+        minted from the empty source, as module_source() gives it.
         """
-        return wk.key_for_site(self.path, module_source(self.path),
-                               self.unit.line_start, self.label, ordinal)
+        def mint(_src):
+            return wk.key_for_site(self.path, module_source(self.path),
+                                   self.unit.line_start, self.label, ordinal)
+
+        try:
+            return ast_index.fact(
+                self.path, 'worksheet_key %r'
+                % ((self.unit.line_start, self.label, ordinal),), mint)
+        except OSError:
+            return mint(None)
 
     @property
     def claim_values(self):
@@ -1148,12 +1182,52 @@ class Claim(object):
                 self.routed_ordinals.append(self.current_ordinal)
 
 
-def collect_claims(project_dir):
+def module_claims(src):
+    """(claimed, unreached, error) for one module, as plain data.
+
+    `claimed` is (unit fields, records, label) per unit carrying an
+    annotation; `unreached` is (line, text) per annotation line no unit
+    took. Stored in the AST index, so it holds no objects.
+    """
+    fname = os.path.basename(src.path)
+    module = fname[:-3]
+    try:
+        role = ps.classify_role(module, src.path)
+        units = ps.indexed_units(src.path, module, role)
+        lines = ''.join(src.lines).splitlines(True)
+        anchors = ps.entry_anchor_map(src.tree)
+    except Exception as exc:                              # noqa: BLE001
+        return [], [], '%s' % exc
+
+    claimed = []
+    seen = set()
+    for unit in units:
+        records, _issues = ps.parse_cross_checks(unit.attached_text or '')
+        if not records:
+            continue
+        label = anchor_label(lines, anchors, unit.line_start)
+        for line_no in (unit.attached_lines or ()):
+            seen.add(line_no)
+        claimed.append(({k: getattr(unit, k)
+                         for k in ps.ProvenanceUnit.__slots__},
+                        records, label))
+
+    unreached = [(index + 1, line.strip())
+                 for index, line in enumerate(lines)
+                 if ps.CROSS_CHECK_LINE_RE.match(line)
+                 and (index + 1) not in seen]
+    return claimed, unreached, None
+
+
+def collect_claims(project_dir, refresh=False):
     """Every annotation attached to a scored unit, plus what is not.
 
     The scanner owns attachment. Two definitions of which annotations
     belong to a value would drift apart by construction, so this reads
     the scanner's answer rather than computing a second one.
+
+    What each module claims is kept in the AST index against the
+    module's content; `refresh` reads every module again.
     """
     claims = []
     unreached = []
@@ -1164,32 +1238,21 @@ def collect_claims(project_dir):
         path = os.path.join(project_dir, fname)
         module = fname[:-3]
         try:
-            role = ps.classify_role(module, path)
-            units = ps.extract_units_from_file(path, module, role)
-            with open(path, encoding='utf-8', errors='replace') as handle:
-                lines = handle.read().splitlines(True)
-            tree = ps.ast.parse(''.join(lines))
-            anchors = ps.entry_anchor_map(tree)
+            claimed, missed, error = ast_index.fact(
+                path, 'worksheet_claims', module_claims, refresh)
         except Exception as exc:                          # noqa: BLE001
-            unreached.append((fname, 0, 'file could not be read: %s' % exc))
+            claimed, missed, error = [], [], '%s' % exc
+        if error is not None:
+            unreached.append((fname, 0, 'file could not be read: %s' % error))
             continue
         files += 1
 
-        seen = set()
-        for unit in units:
-            records, _issues = ps.parse_cross_checks(unit.attached_text or '')
-            if not records:
-                continue
-            label = anchor_label(lines, anchors, unit.line_start)
-            for line_no in (unit.attached_lines or ()):
-                seen.add(line_no)
+        for fields, records, label in claimed:
+            unit = ps.ProvenanceUnit(**copy.deepcopy(fields))
             for checker, date, worksheet in records:
                 claims.append(Claim(module, path, unit, checker, date,
                                     worksheet, label))
-
-        for index, line in enumerate(lines):
-            if ps.CROSS_CHECK_LINE_RE.match(line) and (index + 1) not in seen:
-                unreached.append((fname, index + 1, line.strip()))
+        unreached.extend((fname, line_no, text) for line_no, text in missed)
 
     return claims, unreached, files
 
@@ -1925,7 +1988,24 @@ def write_report(project_dir, claims, unreached, unregistered,
 # MAIN
 # ============================================================
 
-def load_worksheets(project_dir):
+def worksheet_tables(src):
+    """(tables, integrity, unreadable) for one worksheet, as plain data.
+
+    A table is (header_line, headers, rows, integrity), the arguments
+    Table() is rebuilt from. Stored in the AST index, so it holds no
+    objects.
+    """
+    name = os.path.basename(src.path)
+    text = ''.join(src.lines)
+    if name.endswith('.md'):
+        tables, integrity, unreadable = parse_tables(name, text), {}, []
+    else:
+        tables, integrity, unreadable = parse_json_worksheet(name, text)
+    return ([(t.header_line, t.headers, t.rows, t.integrity) for t in tables],
+            integrity, unreadable)
+
+
+def load_worksheets(project_dir, refresh=False):
     """Every worksheet on disk, parsed into tables.
 
     Markdown and JSON both land here as Tables, so nothing downstream
@@ -1933,33 +2013,121 @@ def load_worksheets(project_dir):
     carried per sheet so the run can REPORT what it examined -- a run
     that says only "no problems" cannot be told from one that read
     nothing.
+
+    The parse is kept in the AST index against the worksheet's content;
+    `refresh` parses every worksheet again.
     """
     directory = os.path.join(project_dir, WORKSHEET_DIR)
     sheets = {}
     for name in sorted(os.listdir(directory)):
         path = os.path.join(directory, name)
         if name.endswith('.md'):
-            with open(path, encoding='utf-8', errors='replace') as handle:
-                text = handle.read()
-            sheets[name] = {'path': path,
-                            'tables': parse_tables(name, text),
-                            'format': 'markdown',
-                            'hashes': {},
-                            'unreadable': []}
-            continue
-        if not name.endswith(JSON_SUFFIXES):
+            sheet_format = 'markdown'
+        elif name.endswith(JSON_SUFFIXES):
+            sheet_format = 'json'
+        else:
             continue
-        with open(path, encoding='utf-8', errors='replace') as handle:
-            text = handle.read()
-        tables, integrity, unreadable = parse_json_worksheet(name, text)
+        tables, integrity, unreadable = ast_index.fact(
+            path, 'worksheet_tables', worksheet_tables, refresh)
         sheets[name] = {'path': path,
-                        'tables': tables,
-                        'format': 'json',
+                        'tables': [Table(name, *fields) for fields in tables],
+                        'format': sheet_format,
                         'hashes': integrity,
                         'unreadable': unreadable}
     return sheets
 
 
+def key_modules(sheet):
+    """Module files the keys recorded in one worksheet name.
+
+    match_row() resolves those keys against today's source, so a
+    verdict read from this worksheet can move when one of these
+    modules does. A retired key counts every module along its alias
+    chain.
+    """
+    modules = set()
+    for table in sheet['tables']:
+        index = table.column(ROLE_KEY)
+        if index is None:
+            continue
+        for _line_no, cells in table.rows:
+            if index >= len(cells):
+                continue
+            key = strip_cell(cells[index]).strip('`')
+            hops = []
+            while key and key not in hops:
+                hops.append(key)
+                try:
+                    modules.add(wk.parse(key).module)
+                except wk.KeyError_:
+                    pass
+                key = wk.INSTALLED_ALIASES.get(key)
+    return sorted(modules)
+
+
+def check_inputs(project_dir, worksheets):
+    """worksheet name -> digest of everything a check against it reads.
+
+    That is the worksheet itself, the modules its keys name, and this
+    tool's code. The annotation's own module is the fourth input and
+    needs no entry here: a result is stored against it in the AST index.
+    A worksheet that is not on disk still gets an entry, since MISSING
+    is a verdict too.
+    """
+    version = ast_index.code_version(__name__)
+    inputs = {}
+    for name, sheet in worksheets.items():
+        parts = [version, name, ast_index.source(sheet['path']).digest]
+        for module in key_modules(sheet):
+            path = os.path.join(project_dir, module)
+            parts.append('%s %s' % (module,
+                                    ast_index.source(path).digest
+                                    if os.path.isfile(path) else 'absent'))
+        inputs[name] = hashlib.md5(
+            '\n'.join(parts).encode('utf-8')).hexdigest()
+    inputs[None] = version
+    return inputs
+
+
+# The arguments a Claim is built from. Everything else on it is what
+# check_claim() found, and that is what a carried-forward result restores.
+CLAIM_ARGUMENTS = ('module', 'path', 'unit', 'checker', 'date', 'worksheet',
+                   'label')
+
+
+def check_claims(project_dir, claims, worksheets, unregistered, full=False):
+    """check_claim() over every claim, reusing unchanged results.
+
+    A claim's result is stored in the AST index against its module,
+    under the claim's position in that module and the digest of its
+    worksheet's inputs (check_inputs). Returns (rechecked, carried).
+    """
+    index = ast_index.open_index(project_dir)
+    inputs = check_inputs(project_dir, worksheets)
+    rechecked = []
+    ordinals = {}
+    for claim in claims:
+        ordinal = ordinals[claim.path] = ordinals.get(claim.path, -1) + 1
+
+        def check(_src, claim=claim):
+            own = set()
+            check_claim(claim, worksheets, own)
+            rechecked.append(claim)
+            return (copy.deepcopy({name: value
+                                   for name, value in vars(claim).items()
+                                   if name not in CLAIM_ARGUMENTS}),
+                    sorted(own))
+
+        before = len(rechecked)
+        found, own = index.fact(
+            claim.path, 'worksheet_check %d' % ordinal, check,
+            inputs.get(claim.worksheet, inputs[None]), full)
+        if len(rechecked) == before:
+            vars(claim).update(copy.deepcopy(found))
+        unregistered.update(own)
+    return len(rechecked), len(claims) - len(rechecked)
+
+
 def integrity_summary(worksheets):
     """(examined, ok, missing, mismatch, unreadable_lines) over JSON."""
     examined = ok = missing = mismatch = 0
@@ -2269,18 +2437,23 @@ def write_citation_prompt(project_dir, claims):
     return count, not_included, ''
 
 
-def run(project_dir, today):
-    """Returns (summary_line, report_path, counts)."""
-    worksheets = load_worksheets(project_dir)
-    claims, unreached, files = collect_claims(project_dir)
+def run(project_dir, today, full=False):
+    """Returns (summary_line, report_path, counts).
+
+    `full` re-checks every annotation rather than carrying forward the
+    results whose inputs have not changed.
+    """
+    index = ast_index.open_index(project_dir)
+    worksheets = load_worksheets(project_dir, full)
+    claims, unreached, files = collect_claims(project_dir, full)
 
     resolved = collect_resolved(project_dir)
     for leg in resolved:
         check_resolved(leg, worksheets)
 
     unregistered = set()
-    for claim in claims:
-        check_claim(claim, worksheets, unregistered)
+    rechecked, carried = check_claims(project_dir, claims, worksheets,
+                                      unregistered, full)
 
     cited = set(claim.worksheet for claim in claims)
     headline, changed, state, uncited = uncited_report(
@@ -2294,6 +2467,7 @@ def run(project_dir, today):
     routed_written, routing_error = write_routing_file(project_dir, claims)
     prompt_rows, prompt_excluded, prompt_error = write_citation_prompt(
         project_dir, claims)
+    index.save()
     examined, ok, missing, mismatch, unreadable = integrity_summary(
         worksheets)
 
@@ -2316,6 +2490,8 @@ def run(project_dir, today):
         'resolved_legs': len(resolved),
         'resolved_problems': sum(1 for leg in resolved if leg.findings),
         'citation_prompt_rows': prompt_rows,
+        'rechecked': rechecked,
+        'carried': carried,
     }
 
     # The summary line carries its denominator on purpose. A line that
@@ -2333,6 +2509,9 @@ def run(project_dir, today):
               '%d not scanner-reachable'
               % (send_back, conversation,
                  len(claims) - routed - clean, len(unreached)))
+    detail += ('\n  %d annotation(s) re-checked, %d carried forward '
+               'unchanged%s' % (rechecked, carried,
+                                ' (--full)' if full else ''))
 
     # Printed every run, including zero. "N row hashes verified" cannot
     # print unless the rows were read; silence about it could mean
@@ -2374,7 +2553,14 @@ def run(project_dir, today):
     return summary, report, counts, headline, changed, detail
 
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Does the worksheet say what the annotation claims?')
+    parser.add_argument('--full', action='store_true',
+                        help='re-check every annotation, carrying nothing '
+                             'forward from the last run')
+    args = parser.parse_args(argv)
+
     project_dir = os.path.dirname(os.path.abspath(__file__))
     os.chdir(project_dir)
 
@@ -2387,7 +2573,7 @@ def main():
         import datetime
         today = datetime.date.today().isoformat()
         summary, report, counts, headline, changed, detail = run(
-            project_dir, today)
+            project_dir, today, args.full)
     except Exception as exc:                              # noqa: BLE001
         import traceback
         print('Worksheet checker DID NOT RUN: %s' % exc)